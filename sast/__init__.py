@@ -0,0 +1,6 @@
+"""
+Πακέτο πυρήνα του AST-based εργαλείου SAST για κώδικα Python.
+
+Τα modules του πακέτου δεν εξαρτώνται από το Streamlit, ώστε να χρησιμοποιούνται τόσο από τη
+διεπαφή (sast_tool_latest_version.py) όσο και από άλλα σημεία εισόδου.
+"""
@@ -0,0 +1,9 @@
+"""
+Εκτέλεση του headless CLI μέσω: python -m sast <φάκελος> [επιλογές]
+"""
+
+import sys
+
+from sast.cli import main
+
+sys.exit(main())
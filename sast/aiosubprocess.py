@@ -0,0 +1,369 @@
+"""
+Ασύγχρονη (asyncio) εκτέλεση των εργαλείων CLI με έξοδο JSON.
+
+Η run_subprocess_json_async εκτελεί μια εντολή μέσα σε event loop: οι stdout/stderr διαβάζονται
+από pipes του loop (χωρίς νήμα ανά θυγατρική διεργασία), η stdout αναλύεται σταδιακά καθώς φτάνει
+(sast.jsonstream) και ο τερματισμός της διεργασίας αναμένεται μέσω pidfd, ώστε να συλλέγεται με το
+os.wait4 και να διατηρούνται οι μετρήσεις CPU/μνήμης της (sast.metrics). Έτσι πολλά εργαλεία και
+πολλές παρτίδες αρχείων μοιράζονται ένα event loop, με το πλήθος των ταυτόχρονων διεργασιών να
+περιορίζεται από έναν semaphore ανά loop (SAST_SUBPROCESS_CONCURRENCY).
+
+Η σύγχρονη run_subprocess_json (sast.analyzers) είναι λεπτό περίβλημα γύρω από αυτήν (run_sync). Όλες
+οι σύγχρονες κλήσεις της διεργασίας (νήματα του orchestrator, batch mode) εκτελούνται σε ένα κοινό,
+μόνιμο loop σε νήμα παρασκηνίου, οπότε το όριο ταυτόχρονων διεργασιών ισχύει για ολόκληρη τη διεργασία.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import json
+import time
+import asyncio
+import logging
+import contextlib
+import threading
+import subprocess
+import contextvars
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+
+from sast.budget import (child_popen_kwargs,
+                         current_timeout,
+                         describe_signal_exit,
+                         kill_process_group,
+                         timeout_result)
+from sast.jsonstream import DEFAULT_CHUNK_SIZE, JsonRecordParser, JsonStreamError
+from sast.metrics import RSS_SAMPLE_INTERVAL_S, child_peak_rss_mb, wait_with_rusage
+
+logger = logging.getLogger("sast_tool")
+
+# Μέγιστο πλήθος θυγατρικών διεργασιών που εκτελούνται ταυτόχρονα μέσα σε ένα event loop.
+SUBPROCESS_CONCURRENCY: int = max(1, int(os.getenv("SAST_SUBPROCESS_CONCURRENCY", "0"))
+                                  or 2 * (os.cpu_count() or 1))
+
+_T = TypeVar("_T")
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+# ---------------------------------------------------------------
+# 2. Event loop, semaphore ταυτόχρονων διεργασιών και σύγχρονη κλήση.
+# ---------------------------------------------------------------
+
+def loop_semaphore() -> asyncio.Semaphore:
+    """
+    Ο κοινός semaphore (SUBPROCESS_CONCURRENCY θέσεις) του τρέχοντος event loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(SUBPROCESS_CONCURRENCY)
+    return semaphore
+
+# Κοινό loop της διεργασίας για τη run_sync (δημιουργείται την πρώτη φορά που χρειάζεται).
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_thread: threading.Thread | None = None
+_shared_lock = threading.Lock()
+
+def _reset_shared_loop() -> None:
+    """
+    Μετά από fork το νήμα του κοινού loop δεν υπάρχει στη θυγατρική διεργασία, οπότε δημιουργείται νέο.
+    """
+    global _shared_loop, _shared_thread, _shared_lock
+    _shared_loop = _shared_thread = None
+    _shared_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_loop)
+
+def shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Το κοινό event loop της διεργασίας, που εκτελείται σε νήμα παρασκηνίου (daemon). Ο executor του
+    (αναμονή διεργασιών χωρίς pidfd, pipes εκτός POSIX) έχει θέσεις για όλες τις ταυτόχρονες διεργασίες.
+    """
+    global _shared_loop, _shared_thread
+    with _shared_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=3 * SUBPROCESS_CONCURRENCY,
+                                                         thread_name_prefix="sast-asyncio-executor"))
+            thread = threading.Thread(target=loop.run_forever, name="sast-asyncio", daemon=True)
+            thread.start()
+            _shared_loop, _shared_thread = loop, thread
+        return _shared_loop
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Εκτελεί μια coroutine από σύγχρονο κώδικα στο κοινό loop της διεργασίας (shared_loop) και επιστρέφει
+    το αποτέλεσμά της, ώστε όλες οι κλήσεις να μοιράζονται τον ίδιο semaphore. Μεταφέρεται το context
+    του καλούντος (π.χ. η προθεσμία του εργαλείου, sast.budget). Αν το κοινό loop είναι αυτό που
+    καλεί, η coroutine εκτελείται σε νέο loop σε βοηθητικό νήμα (αλλιώς το loop θα περίμενε τον εαυτό του).
+    """
+    loop = shared_loop()
+    if threading.current_thread() is _shared_thread:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sast-asyncio") as executor:
+            return executor.submit(contextvars.copy_context().run, asyncio.run, coro).result()
+    # Η εργασία δημιουργείται με αντίγραφο του context του τρέχοντος νήματος (call_soon_threadsafe).
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()                                     # Π.χ. KeyboardInterrupt: ακύρωση και της εντολής.
+        raise
+
+# ---------------------------------------------------------------
+# 3. Ανάγνωση pipes και αναμονή τερματισμού μέσα στο event loop.
+# ---------------------------------------------------------------
+
+async def _pipe_reader(pipe: Any) -> tuple[Callable[[int], Awaitable[bytes]], Callable[[], None]]:
+    """
+    Επιστρέφει (read(n), close) για ένα pipe της θυγατρικής διεργασίας. Σε POSIX το pipe συνδέεται
+    στο event loop· αλλού (π.χ. Windows, όπου το loop δεν δέχεται τα pipes του subprocess) κάθε
+    ανάγνωση γίνεται στον executor του loop.
+    """
+    loop = asyncio.get_running_loop()
+    if os.name == "posix":
+        reader = asyncio.StreamReader(limit=DEFAULT_CHUNK_SIZE, loop=loop)
+        transport, _protocol = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop), pipe)
+        return reader.read, transport.close
+    read = getattr(pipe, "read1", pipe.read)
+    return (lambda size: loop.run_in_executor(None, read, size)), pipe.close
+
+class _StdinProtocol(asyncio.Protocol):
+    """
+    Protocol της stdin: καταγράφει πότε έκλεισε το pipe (όλα τα δεδομένα στάλθηκαν ή απορρίφθηκαν).
+    """
+    closed = False
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.closed = True
+
+async def _stdin_writer(pipe: Any, data: bytes) -> Callable[[], None]:
+    """
+    Στέλνει τα data στην stdin της διεργασίας και την κλείνει (EOF) μόλις σταλούν, χωρίς αναμονή: σε
+    POSIX τα δεδομένα που δεν χωρούν στο pipe γράφονται από το loop καθώς η διεργασία τα διαβάζει,
+    αλλού από τον executor του loop. Επιστρέφει συνάρτηση που εγκαταλείπει ό,τι δεν έχει σταλεί.
+    """
+    loop = asyncio.get_running_loop()
+    if os.name == "posix":
+        transport, protocol = await loop.connect_write_pipe(_StdinProtocol, pipe)
+        transport.write(data)
+        transport.close()
+        return lambda: protocol.closed or transport.abort()
+
+    def write() -> None:
+        try:
+            pipe.write(data)
+            pipe.close()
+        except OSError:                 # Η διεργασία τερμάτισε χωρίς να διαβάσει όλη την είσοδο.
+            pass
+    loop.run_in_executor(None, write)
+    return lambda: None
+
+async def _read_all(read: Callable[[int], Awaitable[bytes]]) -> bytes:
+    chunks = []
+    while chunk := await read(DEFAULT_CHUNK_SIZE):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+async def _consume_records(read: Callable[[int], Awaitable[bytes]], parser: JsonRecordParser,
+                           on_record: Callable[[str, Any], None]) -> JsonStreamError | None:
+    """
+    Τροφοδοτεί τον parser με την stdout καθώς φτάνει και δίνει κάθε εγγραφή στο on_record. Σφάλμα
+    της εξόδου επιστρέφεται (και η ροή διαβάζεται ως το τέλος, ώστε η εντολή να μη μπλοκάρει σε
+    γεμάτο pipe), ενώ σφάλμα του on_record διαδίδεται.
+    """
+    error: JsonStreamError | None = None
+    while chunk := await read(DEFAULT_CHUNK_SIZE):
+        if error is None:
+            try:
+                for key, record in parser.feed(chunk):
+                    on_record(key, record)
+            except JsonStreamError as exc:
+                error = exc
+    if error is None:
+        try:
+            for key, record in parser.close():
+                on_record(key, record)
+        except JsonStreamError as exc:
+            error = exc
+    return error
+
+async def wait_process(process: subprocess.Popen) -> dict[str, float]:
+    """
+    Περιμένει τον τερματισμό της διεργασίας χωρίς να μπλοκάρει το loop και τη συλλέγει με τη
+    wait_with_rusage. Με os.pidfd_open (Linux) αρκεί ένας file descriptor στο loop και η μέγιστη μνήμη
+    της διεργασίας δειγματοληπτείται ανά RSS_SAMPLE_INTERVAL_S όσο εκτελείται· αλλιώς η αναμονή γίνεται
+    στον executor του loop, χωρίς μέτρηση μνήμης. Καλείται μία φορά ανά διεργασία: η αναμονή στον executor
+    δεν ακυρώνεται, οπότε όποιος άλλος χρειάζεται τον τερματισμό περιμένει την ίδια εργασία.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        return await loop.run_in_executor(None, wait_with_rusage, process)
+    exited = loop.create_future()
+    loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+    peak_rss_mb: float | None = None
+    try:
+        # Η μνήμη της διεργασίας διαβάζεται όσο εκτελείται· μετά τον τερματισμό της δεν είναι διαθέσιμη,
+        # ενώ το pid της δεν επαναχρησιμοποιείται πριν από τη συλλογή της με τη wait_with_rusage.
+        while not exited.done():
+            sample = child_peak_rss_mb(process.pid)
+            if sample is not None:
+                peak_rss_mb = max(peak_rss_mb or 0.0, sample)
+            await asyncio.wait({exited}, timeout=RSS_SAMPLE_INTERVAL_S)
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+    return wait_with_rusage(process, peak_rss_mb)
+
+# ---------------------------------------------------------------
+# 4. Εκτέλεση εντολής CLI με έξοδο JSON.
+# ---------------------------------------------------------------
+
+async def run_subprocess_json_async(cmd: list[str],
+                                    tool_label: str,
+                                    ok_returncodes: tuple[int, ...] = (0, 1),
+                                    install_hint: str | None = None,
+                                    cwd: str | None = None,
+                                    timeout: float | None = None,
+                                    on_record: Callable[[str, Any], None] | None = None,
+                                    record_keys: tuple[str, ...] = ("results",),
+                                    stdin_data: bytes | None = None,
+                                    semaphore: asyncio.Semaphore | None = None) -> dict[str, Any]:
+    """
+    Ασύγχρονη εκδοχή της run_subprocess_json (ίδια ορίσματα και ίδια μορφή αποτελέσματος).
+    timeout: Όριο χρόνου της κλήσης. Αν δεν δοθεί, ισχύει η προθεσμία του εργαλείου (sast.budget)
+             τη στιγμή της κλήσης. Μετρά από την εκκίνηση της διεργασίας, όχι από την αναμονή στον semaphore.
+    stdin_data: Προαιρετική είσοδος της εντολής (π.χ. ο κώδικας για `bandit -`), αντί για αρχείο.
+    semaphore: Όριο ταυτόχρονων διεργασιών (προεπιλογή: ο κοινός semaphore του loop).
+    """
+    timeout = current_timeout() if timeout is None else timeout
+    async with semaphore or loop_semaphore():
+        return await _run(cmd, tool_label, ok_returncodes, install_hint, cwd, timeout, on_record, record_keys,
+                          stdin_data)
+
+async def _run(cmd: list[str],
+               tool_label: str,
+               ok_returncodes: tuple[int, ...],
+               install_hint: str | None,
+               cwd: str | None,
+               timeout: float | None,
+               on_record: Callable[[str, Any], None] | None,
+               record_keys: tuple[str, ...],
+               stdin_data: bytes | None) -> dict[str, Any]:
+    extras: dict[str, Any] = {"wall_time_s": 0.0, "stdout_bytes": 0, "json_decode_s": 0.0}
+    started = time.perf_counter()
+
+    # Εκτέλεση της εντολής cmd σε νέα ομάδα διεργασιών (με τα προαιρετικά όρια CPU/μνήμης).
+    try:
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL if stdin_data is None else subprocess.PIPE,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, cwd=cwd, **child_popen_kwargs())
+    except FileNotFoundError:           # Σε περίπτωση που η εντολή δεν βρεθεί στο PATH.
+        error_msg = f"Το εργαλείο {tool_label} δεν βρέθηκε στο σύστημα."
+        if install_hint:
+            error_msg += f"Εγκαταστήστε το με την εντολή: {install_hint}"
+        return {"ok": False, "error": error_msg, "results": [], "extras": extras}
+    except Exception as exc:            # Οποιοδήποτε άλλο απρόοπτο σφάλμα κατά την εκκίνηση.
+        logger.exception("Σφάλμα κατά την εκτέλεση subprocess για %s: %s", tool_label, cmd)
+        return {"ok": False, "error": f"Σφάλμα κατά την εκτέλεση του {tool_label}: {exc}",
+                "results": [], "extras": extras}
+
+    # Η διεργασία συλλέγεται (reap) μόνο από αυτή την εργασία. Οι υπόλοιποι δρόμοι (λήξη ορίου, σφάλμα)
+    # τερματίζουν την εντολή και την περιμένουν, ώστε το wait4 του executor (χωρίς pidfd) να μην
+    # ανταγωνίζεται δεύτερη συλλογή του ίδιου pid.
+    exit_task = asyncio.ensure_future(wait_process(process))
+    parser = JsonRecordParser(record_keys) if on_record is not None else None
+    closers: list[Callable[[], None]] = []
+    try:
+        if stdin_data is not None:
+            closers.append(await _stdin_writer(process.stdin, stdin_data))
+        read_stdout, close_stdout = await _pipe_reader(process.stdout)
+        closers.append(close_stdout)
+        read_stderr, close_stderr = await _pipe_reader(process.stderr)
+        closers.append(close_stderr)
+        stdout_task = (_read_all(read_stdout) if parser is None
+                       else _consume_records(read_stdout, parser, on_record))
+        try:
+            stdout_value, stderr_bytes, usage = await asyncio.wait_for(
+                asyncio.gather(stdout_task, _read_all(read_stderr), asyncio.shield(exit_task)), timeout)
+        except asyncio.TimeoutError:
+            # Λήξη του ορίου: τερματισμός της εντολής και όσων διεργασιών ξεκίνησε.
+            if not exit_task.done():
+                kill_process_group(process)
+            extras.update(await exit_task)
+            extras["wall_time_s"] = time.perf_counter() - started
+            logger.warning("Το %s ξεπέρασε το όριο των %.1fs και τερματίστηκε.", tool_label, timeout)
+            return timeout_result(tool_label, timeout, extras=extras)
+        extras.update(usage)
+    except BaseException:
+        # Π.χ. ακύρωση της εργασίας ή σφάλμα του on_record: να μη μείνει η εντολή να εκτελείται.
+        if not exit_task.done():
+            kill_process_group(process)
+        with contextlib.suppress(BaseException):
+            await asyncio.shield(exit_task)
+        raise
+    finally:
+        for close in closers:
+            close()
+        process.stdout.close()
+        process.stderr.close()
+    extras["wall_time_s"] = time.perf_counter() - started
+    extras["stdout_bytes"] = len(stdout_value) if parser is None else parser.bytes_read
+    return _json_result(tool_label, process.returncode, ok_returncodes, stdout_value, stderr_bytes, parser, extras)
+
+def _json_result(tool_label: str,
+                 returncode: int,
+                 ok_returncodes: tuple[int, ...],
+                 stdout_value: bytes | JsonStreamError | None,
+                 stderr_bytes: bytes,
+                 parser: JsonRecordParser | None,
+                 extras: dict[str, Any]) -> dict[str, Any]:
+    """
+    Το αποτέλεσμα μιας εντολής που ολοκληρώθηκε: έλεγχος του κωδικού επιστροφής και αποκωδικοποίηση
+    της JSON εξόδου (ή, στο streaming mode, το υπόλοιπο έγγραφο του parser).
+    """
+    stderr_str: str = stderr_bytes.decode("utf-8", errors="replace").strip()
+
+    # Επιτρεπτοί κωδικοί επιστροφής (π.χ. 0 επιτυχία και 1 ευρήματα).
+    if returncode not in ok_returncodes:
+        # Τερματισμός από σήμα (π.χ. SIGXCPU από το όριο CPU ή SIGKILL από το όριο μνήμης).
+        signal_exit = describe_signal_exit(returncode)
+        err = f"Το {tool_label} {signal_exit}." if signal_exit else (
+            stderr_str or f"Μη αναμενόμενος κωδικός επιστροφής από {tool_label}: {returncode}")
+        return {"ok": False, "error": err, "results": [], "extras": extras}
+
+    # Στο streaming mode οι εγγραφές έχουν ήδη δοθεί στο on_record· απομένει το υπόλοιπο έγγραφο.
+    if parser is not None:
+        extras["json_decode_s"] = parser.decode_s
+        if stdout_value is not None:
+            logger.error("Αδυναμία ανάγνωσης της JSON εξόδου από %s: %s", tool_label, stdout_value)
+            return {"ok": False,
+                    "error": f"Αδυναμία ανάγνωσης της JSON εξόδου του {tool_label}: {stdout_value}",
+                    "results": [], "extras": extras}
+        if parser.document is None:
+            return {"ok": False, "error": stderr_str or f"Κενή έξοδος από το εργαλείο {tool_label}.",
+                    "results": [], "extras": extras}
+        return {"ok": True, "error": None, "results": parser.document, "extras": extras}
+
+    # Εάν δεν υπάρχει καθόλου έξοδος στο stdout, αυτό είναι ένδειξη κάποιου προβλήματος.
+    stdout_str: str = stdout_value.decode("utf-8", errors="replace").strip()
+    if not stdout_str:
+        return {"ok": False, "error": stderr_str or f"Κενή έξοδος από το εργαλείο {tool_label}.",
+                "results": [], "extras": extras}
+
+    decode_started = time.perf_counter()
+    try:
+        data = json.loads(stdout_str)
+    except json.JSONDecodeError as exc:
+        logger.exception("Αδυναμία ανάγνωσης της JSON εξόδου από %s: %s", tool_label, stdout_str[:200])
+        return {"ok": False, "error": f"Αδυναμία ανάγνωσης της JSON εξόδου του {tool_label}: {exc}",
+                "results": [], "extras": extras}
+    finally:
+        extras["json_decode_s"] = time.perf_counter() - decode_started
+    return {"ok": True, "error": None, "results": data, "extras": extras}
@@ -0,0 +1,417 @@
+"""
+Πυρήνας αναλυτών του εργαλείου SAST.
+
+Περιέχει τις συναρτήσεις εκτέλεσης των βιβλιοθηκών (Bandit, Semgrep, Pylint, Radon) και τον
+προσαρμοσμένο AST αναλυτή (SecurityVisitor), ανεξάρτητα από τη διεπαφή Streamlit, ώστε να
+μπορούν να χρησιμοποιηθούν και από άλλα σημεία εισόδου (π.χ. orchestrator, CLI).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations  # Για χρήση μοντέρων λειτουργιών στα type hints.
+import ast                          # Για ανάλυση και επεξεργασία Python κώδικα μέσω AST (Abstract Syntax Tree).
+import logging                      # Για καταγραφή συμβάντων, σφαλμάτων και παρακολούθηση της ροής εκτέλεσης.
+from typing import Any, Callable, Iterable    # Type hints για καλύτερη αναγνωσιμότητα κώδικα.
+from radon.visitors import ComplexityVisitor    # Αφορά στον εντοπισμό μπλοκ κώδικα και στην κυκλική πολυπλοκότητα (Cyclomatic Complexity).
+from radon.metrics import h_visit_ast, mi_compute   # Αφορά στον υπολογισμό του δείκτη συντηρησιμότητας (Maintainability Index).
+from radon.raw import analyze as raw_analyze    # Raw μετρικές (LLOC, SLOC, σχόλια) για τον δείκτη συντηρησιμότητας.
+
+from sast.context import AnalysisContext        # Κοινό πλαίσιο ανάλυσης (ένα AST ανά αρχείο).
+from sast.rules import (SUSPECT_SECRET_KEYWORDS,  # Λέξεις-κλειδιά και κανόνες του custom AST αναλυτή.
+                        LOGGING_FUNCTION_NAMES,
+                        DEFAULT_RULE_ENGINE,
+                        RuleEngine)
+from sast.traversal import TraversalDriver, RuleHandler     # Ενιαία, επαναληπτική διάσχιση του AST.
+from sast.inprocess import (ANALYZER_BACKEND,              # In-process backend για Bandit/Pylint.
+                            bandit_reads_file,
+                            run_bandit_inprocess,
+                            run_pylint_inprocess)
+from sast.findings import (bandit_findings,                 # Κανονικοποίηση των ευρημάτων σε Finding.
+                           semgrep_findings,
+                           pylint_findings,
+                           radon_findings,
+                           custom_ast_findings)
+from sast.metrics import instrumented                       # Μετρήσεις χρόνου, CPU και μνήμης ανά εργαλείο.
+from sast.budget import PARTIAL_STATUS                      # Μερικά αποτελέσματα (εσωτερικό timeout της Semgrep).
+from sast.aiosubprocess import run_subprocess_json_async, run_sync    # Ασύγχρονη εκτέλεση των εργαλείων CLI.
+from sast.semgrep_rules import RulePackError, restore_rule_ids, semgrep_config_args   # Τοπικοί (offline) κανόνες της Semgrep.
+from sast.workspace import SOURCE_FILENAME, ScanWorkspace   # Κοινό αρχείο του κώδικα για όλα τα εργαλεία.
+
+# Κοινός logger με τη διεπαφή Streamlit (η ρύθμιση του logging γίνεται από το σημείο εισόδου).
+logger = logging.getLogger("sast_tool")
+
+# Ρυθμίσεις (flags) των CLI εργαλείων. Ορίζονται σε ένα σημείο ώστε να αποτελούν και μέρος
+# του κλειδιού της cache αποτελεσμάτων (αλλαγή ρυθμίσεων => νέα εκτέλεση του εργαλείου).
+# Τα SEMGREP_CONFIGS αντικαθίστανται από το συγχωνευμένο τοπικό αρχείο τους, αν έχουν γίνει vendor (sast.semgrep_rules).
+BANDIT_ARGS: list[str] = ["-f", "json", "-q"]
+SEMGREP_CONFIGS: list[str] = ["p/security-audit", "p/owasp-top-ten", "p/python"]
+PYLINT_ARGS: list[str] = ["-f", "json", "--score=y"]
+
+# Ο κωδικός εξόδου της Pylint είναι bitmask (1 fatal, 2 error, 4 warning, 8 refactor, 16 convention),
+# οπότε κάθε συνδυασμός των τιμών αυτών σημαίνει επιτυχή εκτέλεση με ευρήματα (32 = σφάλμα χρήσης).
+PYLINT_OK_RETURNCODES: tuple[int, ...] = tuple(range(32))
+
+# ---------------------------------------------------
+# 2. Βοηθητική συνάρτηση για τα CLI-based εργαλεία
+# ---------------------------------------------------
+
+def run_subprocess_json(cmd: list[str],
+                         tool_label: str,
+                         ok_returncodes: tuple[int, ...] = (0,1),
+                         install_hint: str | None = None,
+                         cwd: str | None = None,
+                         timeout: float | None = None,
+                         on_record: Callable[[str, Any], None] | None = None,
+                         record_keys: tuple[str, ...] = ("results",),
+                         stdin_data: bytes | None = None) -> dict[str,Any]:
+    """
+    Εκτελεί μια εντολή CLI και αναλύει την έξοδο JSON. Η συνάρτηση διαχειρίζεται αυτόματα
+    τα σφάλματα εκτέλεσης  και αποκωδικοποίησης JSON. Επιστρέφει ένα τυποποιημένο λεξικό
+    με τη μορφή:
+    {"ok": boolean, αν η εκτέλεση του εργαλείου ήταν επιτυχής.
+     "error": μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
+     "results": Any, καθώς πρόκειται για τα ευρήματα ως raw δεδομένα JSON  του εργαλείου.
+     "status": "timeout" μόνο αν η εντολή τερματίστηκε λόγω ορίου χρόνου.
+     "extras": Μετρήσεις της εκτέλεσης: wall_time_s, cpu_user_s/cpu_system_s και peak_rss_mb της
+               θυγατρικής διεργασίας (όπου υποστηρίζεται το os.wait4), stdout_bytes και json_decode_s.
+    }
+    tool_label: Όνομα του εργαλείου για την εμφάνιση των μηνυμάτων (π.χ. "Bandit")
+    install_hint: Προαιρετική οδηγία εγκατάστασης (π.χ. "pip install bandit")
+    cwd: Προαιρετικός φάκελος εργασίας της εντολής (π.χ. φάκελος με πολλά αρχεία σε batch mode).
+    timeout: Όριο χρόνου σε δευτερόλεπτα. Αν δεν δοθεί, ισχύει η προθεσμία του εργαλείου που ορίζει
+             ο orchestrator (sast.budget). Με τη λήξη του τερματίζεται όλη η ομάδα διεργασιών της εντολής.
+    on_record: Προαιρετικά, streaming mode: η stdout αναλύεται σταδιακά (sast.jsonstream) καθώς
+               παράγεται και κάθε στοιχείο των πινάκων record_keys (ή του πίνακα της εξόδου) δίνεται
+               στο on_record(κλειδί, εγγραφή) αμέσως, χωρίς να κρατείται ολόκληρη η έξοδος στη μνήμη.
+               Το "results" περιέχει τότε το υπόλοιπο έγγραφο, με κενούς τους πίνακες των εγγραφών.
+    stdin_data: Προαιρετική είσοδος της εντολής (π.χ. ο κώδικας για `bandit -`), αντί για αρχείο.
+    Κώδικας που εκτελείται ήδη σε event loop (π.χ. πολλές παρτίδες ή εργαλεία ταυτόχρονα) καλεί
+    απευθείας τη run_subprocess_json_async.
+    """
+    # Η εκτέλεση γίνεται από την ασύγχρονη εκδοχή (sast.aiosubprocess) σε ένα event loop: οι stdout/stderr
+    # διαβάζονται από το loop χωρίς νήματα ανάγνωσης και η διεργασία συλλέγεται με τη δική της κατανάλωση πόρων.
+    return run_sync(run_subprocess_json_async(cmd, tool_label, ok_returncodes, install_hint, cwd,
+                                              timeout, on_record, record_keys, stdin_data))
+
+# ---------------------------------------------------------------------------
+# 3. Ορισμός συνάρτησης για εκτέλεση βιβλιοθήκης Bandit σε κώδικα Python.
+# ---------------------------------------------------------------------------
+
+@instrumented("bandit")
+def run_bandit_on_code(code: str, workspace: ScanWorkspace | None = None) -> dict[str, Any]:
+    """
+    Τρέχει τη βιβλιοθήκη Bandit σε string Python κώδικα και επιστρέφει λεξικό (dict) 
+    με τα ακόλουθα κλειδιά (αποτελέσματα):
+         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
+         2. error: μήνυμα σφάλματος σε μορφή string ή None αν προκύψει πρόβλημα.
+         3. results: λίστα με τα ευρήματα της ανάλυσης (list[Finding]).
+         4. metrics: Λεξικο με τυχόν μετρικές που δίνει το Bandit (dict).
+    Με το προεπιλεγμένο backend (SAST_ANALYZER_BACKEND=inprocess) η Bandit εκτελείται ως βιβλιοθήκη
+    μέσα στην ίδια διεργασία. Το CLI χρησιμοποιείται αν αυτό δεν είναι δυνατό ή αν ζητηθεί "subprocess".
+    workspace: Προαιρετικό κοινό workspace της σάρωσης (χρειάζεται μόνο για κώδικα με χαρακτήρες bidi).
+    """
+    if ANALYZER_BACKEND == "inprocess":
+        inprocess_result = run_bandit_inprocess(code)
+        if inprocess_result is not None:
+            return inprocess_result
+
+    # Ο κώδικας δίνεται στη Bandit από το stdin (`bandit -`), χωρίς προσωρινό αρχείο. Εξαίρεση ο κώδικας με
+    # χαρακτήρες bidi, για τον οποίο ο έλεγχος B613 ξαναδιαβάζει το αρχείο: τότε γράφεται στο workspace.
+    own_workspace = workspace is None
+    workspace = workspace or ScanWorkspace(code)
+    reads_file = bandit_reads_file(code)
+
+    try:
+        # Ορισμός εντολής CLI για τη Bandit με:
+        # -f json: μορφή εξόδου JSON
+        # -q: Quiet mode για λιγότερα μηνύματα στην κονσόλα.
+        cmd = ["bandit", *BANDIT_ARGS, workspace.source_path() if reads_file else "-"]
+
+        # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
+        result = run_subprocess_json(cmd,
+                                     tool_label="Bandit",
+                                     install_hint="pip install Bandit", 
+                                     ok_returncodes=(0, 1),
+                                     stdin_data=None if reads_file else code.encode("utf-8"))
+
+        # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
+        if not result["ok"]:
+            return{
+                "ok": False,
+                "error": result["error"],
+                "status": result.get("status", "error"),
+                "results": [],
+                "metrics": {},
+                "resources": result["extras"]}
+        # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Bandit.
+        data = result["results"] or {}
+        return {
+            "ok": True,
+            "error": None,
+            "results": bandit_findings(data.get("results", []), code),
+            "metrics": data.get("metrics", {}),
+            "resources": result["extras"]}
+    # Αυτό το μπλοκ εκτελείται πάντα ώστε να διαγραφεί το workspace, αν δημιουργήθηκε μόνο για αυτή την κλήση.
+    finally:
+        if own_workspace:
+            workspace.close()
+                                     
+# ----------------------------------------------------------------------------
+# 4. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Semgrep σε κώδικα Python.
+# ----------------------------------------------------------------------------
+
+def semgrep_timeout_errors(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Τα σφάλματα λήξης κανόνων (εσωτερικό timeout της Semgrep) του πίνακα "errors" της εξόδου JSON.
+    Όσα έχουν "path" αφορούν το συγκεκριμένο αρχείο· τα ευρήματά του είναι μερικά.
+    """
+    return [error for error in data.get("errors") or []
+            if isinstance(error, dict) and "Timeout" in str(error.get("type", ""))]
+
+@instrumented("semgrep")
+def run_semgrep_on_code(code: str, workspace: ScanWorkspace | None = None) -> dict[str, Any]:
+    """
+    Τρέχει τη βιβλιοθήκη Semgrep σε string Python κώδικα χρησιμοποιώντας το ruleset p/python
+    και επιστρέφει λεξικό (dict) με τα ακόλουθα κλειδιά (αποτελέσματα):
+         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
+         2. error: μήνυμα σφάλματος ή None αν υπήρξε πρόβλημα.
+         3. results: λίστα με τα ευρήματα της ανάλυσης (list[Finding]).
+    workspace: Προαιρετικό κοινό workspace της σάρωσης, ώστε ο κώδικας να γράφεται μία φορά για όλα τα
+               εργαλεία (αν δεν δοθεί, δημιουργείται ένα μόνο για αυτή την κλήση).
+    """
+    # Επιλογή κανόνων: τα rulesets του registry ή, με τοπικούς κανόνες, μόνο όσοι μπορούν να ταιριάξουν
+    # στα ονόματα του κώδικα (prefilter). Αν δεν ταιριάζει κανένας, η Semgrep δεν εκτελείται καθόλου.
+    try:
+        config_args = semgrep_config_args(SEMGREP_CONFIGS, sources=[code])
+    except RulePackError as exc:                                # SAST_SEMGREP_RULES=local χωρίς τοπικούς κανόνες.
+        return {"ok": False, "error": str(exc), "status": "error", "results": [], "resources": {"backend": "skipped"}}
+    if config_args is None:
+        logger.debug("Semgrep: κανένας κανόνας δεν αφορά τον κώδικα, η σάρωση παραλείπεται.")
+        return {"ok": True, "error": None, "status": "ok", "results": [], "resources": {"backend": "skipped"}}
+
+    # Η Semgrep διαβάζει τον κώδικα από το αρχείο του κοινού workspace (γράφεται μία φορά ανά σάρωση).
+    own_workspace = workspace is None
+    workspace = workspace or ScanWorkspace(code)
+
+    try:
+        # Ορισμός εντολής CLI για τη Semgrep με:
+        # --config: τα rulesets του registry ή το τοπικό αρχείο (υποσύνολο) των κανόνων (offline).
+        # --json: μορφή εξόδου JSON        
+        cmd = ["semgrep", "scan", *config_args, "--json", workspace.source_path()]
+
+        # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
+        result = run_subprocess_json(cmd,
+                                     tool_label="Semgrep",
+                                     install_hint="pip install Semgrep",
+                                     ok_returncodes=(0, 1)) 
+
+        # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
+        if not result["ok"]:
+            return{
+                "ok": False,
+                "error": result["error"],
+                "status": result.get("status", "error"),
+                "results": [],
+                "resources": result["extras"]}
+        
+        # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Semgrep.
+        data = result["results"] or {}
+        # Κανόνες που έληξαν (εσωτερικό timeout της Semgrep) σημαίνουν μερικά αποτελέσματα.
+        timed_out = bool(semgrep_timeout_errors(data))
+        return {
+            "ok": True,
+            "error": None,
+            "status": PARTIAL_STATUS if timed_out else "ok",
+            "results": semgrep_findings(restore_rule_ids(data.get("results", []), config_args), code),
+            "resources": result["extras"]}
+    # Αυτό το μπλοκ εκτελείται πάντα ώστε να διαγραφεί το workspace, αν δημιουργήθηκε μόνο για αυτή την κλήση.
+    finally:
+        if own_workspace:
+            workspace.close()
+
+# ------------------------------------------------------------------------------------------------------
+# 5. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Pylint - στατικής ανάλυσης ποιότητας κώδικα Python.
+# ------------------------------------------------------------------------------------------------------
+
+@instrumented("pylint")
+def run_pylint_on_code(code: str, workspace: ScanWorkspace | None = None) -> dict[str, Any]:
+    """
+    Τρέχει τη βιβλιοθήκη Pylint σε string Python κώδικα και επιστρέφει λεξικό (dict) 
+    με τα ακόλουθα κλειδιά (αποτελέσματα):
+         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
+         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
+         3. results: λίστα με μηνύματα της Pylint (list[Finding]).
+         4. score: συνολική αξιολόγηση κώδικα (string ή None).
+    Με το προεπιλεγμένο backend (SAST_ANALYZER_BACKEND=inprocess) η Pylint εκτελείται ως βιβλιοθήκη
+    μέσα στην ίδια διεργασία (με τον κώδικα στο κοινό workspace). Διαφορετικά χρησιμοποιείται το CLI
+    της με έξοδο σε μορφή JSON, στο οποίο ο κώδικας δίνεται από το stdin (--from-stdin).
+    workspace: Προαιρετικό κοινό workspace της σάρωσης (για το in-process backend).
+    """
+    if ANALYZER_BACKEND == "inprocess":
+        inprocess_result = run_pylint_inprocess(code, PYLINT_ARGS, workspace)
+        if inprocess_result is not None:
+            return inprocess_result
+
+    # Ορισμός εντολής CLI για την Pylint με:
+    # -f json: μορφή εξόδου JSON
+    # --score: υπολογισμός βαθμολογίας κώδικα.
+    # --from-stdin: ο κώδικας διαβάζεται από το stdin, με το όνομα αρχείου του workspace για το module.
+    cmd = ["pylint", *PYLINT_ARGS, "--from-stdin", SOURCE_FILENAME]
+
+    # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
+    result = run_subprocess_json(cmd,
+                                 tool_label="Pylint",
+                                 install_hint="pip install Pylint",
+                                 ok_returncodes=PYLINT_OK_RETURNCODES,
+                                 stdin_data=code.encode("utf-8"))
+
+    # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
+    if not result["ok"]:
+        return{
+            "ok": False,
+            "error": result["error"],
+            "status": result.get("status", "error"),
+            "results": [],
+            "score": None,
+            "resources": result["extras"]}
+    
+    # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Semgrep.
+    data = result["results"]
+    messages: list[dict[str, Any]] = []          # Λίστα για αποθήκευση των επιμέρους μηνυμάτων του Pylint (warnings, errors).
+    score_text: str | None = None                # Κείμενο ή αριθμός με τη συνολική βαθμολογία.
+
+    # Η μορφή εξόδου του JSON της Pylint ανάλογα με την έκδοση μπορεί να επιστρέψει είτε λίστα, είτε λεξικό.
+    # Αν η έξοδος είναι λίστα JSON αντικειμένων.
+    if isinstance(data, list):
+        for item in data:
+            if not isinstance(item, dict):                  # Αν το στοιχείο δεν είναι λεξικό, παραλείπεται για να αποφευχθεί σφάλμα.
+                continue
+            if "type" in item and "message" in item:        # Αν το λεξικό έχει τα κλειδιά "type" και "message", θεωρείται κανονικό 
+                messages.append(item)                       # μήνυμα Pylint, οπότε προστίθεται στη λίστα των μηνυμάτων.
+            if "score" in item and score_text is None:      # Αν το λεξικό περιέχει κλειδί "score" και δεν έχει ήδη οριστεί τιμή στο score_text,
+                score_text = str(item.get("score"))         # τότε αποθηκεύεται στο score_text η βαθμολογία ως string.
+
+    # Αν η έξοδος είναι λεξικό με κλειδί messages (πιθανή περίπτωση σε κάποιες εκδόσεις).
+    elif isinstance(data, dict):
+        for msg in data.get("messages", []):                # Λήψη της λίστας μηνυμάτων από το κλειδί "messages" (αν δεν υπάρχει, λαμβάνεται κενή λίστα).
+            if isinstance(msg, dict):                       # Προστίθενται μόνο τα μηνύματα που είναι λεξικά.
+                messages.append(msg)
+        if "score" in data:                                 # Αν το λεξικό περιέχει κλειδί "score",
+            score_text = str(data.get("score"))             # τότε αποθηκεύεται στο score_text η βαθμολογία ως string.
+
+    # Επιστροφή των αποτελεσμάτων.
+    return {
+        "ok": True,
+        "error": None,
+        "results": pylint_findings(messages, code),
+        "score": score_text,
+        "resources": result["extras"]}
+
+
+# ---------------------------------------------------------------------------
+# 6. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Radon ως προς τον έλεγχο 
+# της κυκλωματικής πολυπλοκότητας (CC) και δείκτη συντηρησιμότητας (ΜΙ).
+# ---------------------------------------------------------------------------
+
+@instrumented("radon")
+def run_radon_on_code(code: str, context: AnalysisContext | None = None) -> dict[str,Any]:
+    """
+    Τρέχει τη βιβλιοθήκη Radon σε string Python κώδικα και επιστρέφει λεξικό (dict) 
+    με τα ακόλουθα κλειδιά (αποτελέσματα):
+         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
+         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
+         3. results: λίστα με μπλοκ κώδικα και την κυκλωματική πολυπλοκότητά τους (list[Finding],
+            με τη βαθμίδα A-F ως severity και την πολυπλοκότητα CC ως value).
+         4. mi: δείκτης συντηρησιμότητας (float ή None).
+    Χρησιμοποιεί τα AST-level σημεία εισόδου του Radon (ComplexityVisitor.from_ast, h_visit_ast,
+    mi_compute) πάνω στο κοινό AST του context, αντί των cc_visit/mi_visit που αναλύουν ξανά τον κώδικα.
+    context: Προαιρετικό κοινό πλαίσιο ανάλυσης (αν δεν δοθεί, δημιουργείται από τον code).
+    """
+    context = context or AnalysisContext(code)
+    try:        
+        tree = context.tree                                         # Κοινό AST (ένα parse ανά αρχείο).
+        with context.stage("radon"):
+            cc_visitor = ComplexityVisitor.from_ast(tree)           # Μπλοκ κώδικα (functions, methods, classes) και η κυκλωματική πολυπλοκότητά τους.
+            cc_blocks = cc_visitor.blocks
+            # Υπολογισμός του δείκτη συντηρησιμότητας (Maintainability Index) όπως η mi_visit(code, multi=False).
+            raw = raw_analyze(context.source)
+            comments = raw.comments / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+            mi_score = mi_compute(h_visit_ast(tree).total.volume, cc_visitor.total_complexity, raw.lloc, comments)
+    except Exception as exc:
+        return {                           
+            "ok": False,
+            "error": f"Σφάλμα κατά την ανάλυση με τη βιβλιοθήκη Radon: {exc}",
+            "results": [],
+            "mi": None
+        }
+    # Για κάθε μπλοκ επιστρέφονται name, type, lineno, complexity (CC) και rank (A-F) ως Finding.
+    return {
+        "ok": True,
+        "error": None,
+        "results": radon_findings(cc_blocks, context.source),
+        "mi": float(mi_score) if mi_score is not None else None}
+
+# --------------------------------------------------------------------------------
+# 7. Ορισμός συνάρτησης εκτέλεσης custom AST αναλυτή κώδικα με χρήση SecurityVisitor.
+# --------------------------------------------------------------------------------
+
+class SecurityVisitor(ast.NodeVisitor):
+    """
+    Προσαρμοσμένος επισκέπτης (Visitor) AST για ανίχνευση:        
+        1. hard-coded μυστικών σε μεταβλητές με ύποπτα ονόματα,
+        2. logging ενδεχομένως ευαίσθητων μεταβλητών που μοιάζουν με μυστικά (π.χ. password),
+        3. χρήση επικίνδυνων συναρτήσεων όπως eval/exec,
+        4. κλήσεων subprocess χωρίς κατάλληλο χειρισμό εισόδο, π.χ. χρήση shell=True (πιθανό command injection).
+    Οι έλεγχοι ορίζονται ως δηλωτικοί κανόνες στο sast.rules και εφαρμόζονται μέσω της
+    μεταγλωττισμένης RuleEngine, η οποία εκτελεί για κάθε κόμβο μόνο τους σχετικούς κανόνες.
+    Η διάσχιση γίνεται μία φορά, επαναληπτικά, από τον TraversalDriver για την engine και για
+    όλους τους επιπλέον handlers (π.χ. άλλα σύνολα κανόνων μέσω VisitorRuleSet).
+    engine: Προαιρετική RuleEngine με επιπλέον κανόνες (προεπιλογή DEFAULT_RULE_ENGINE).
+    handlers: Προαιρετικοί επιπλέον rule handlers που εκτελούνται στην ίδια διάσχιση.
+    """
+    def __init__(self, engine: RuleEngine | None = None, handlers: Iterable[RuleHandler] = ())-> None:
+        super().__init__()
+        self.engine = engine or DEFAULT_RULE_ENGINE
+        self.driver = TraversalDriver([self.engine, *handlers])
+        self.issues: list[dict[str, Any]] = []              # Λίστα για αποθήκευση των ευρημάτων ασφαλείας.
+
+    def visit(self, node: ast.AST) -> None:
+        """
+        Διατρέχει μία φορά το δέντρο με ρίζα τον κόμβο και καταγράφει τα ευρήματα όλων των handlers.
+        """
+        self.issues.extend(self.driver.walk(node))
+        
+# Ορισμός συνάρτησης για εκτέλεση του custom AST αναλυτή.
+@instrumented("custom_ast")
+def run_custom_ast_analysis(code: str,
+                            context: AnalysisContext | None = None,
+                            handlers: Iterable[RuleHandler] = ()) -> dict[str, Any]:
+    """
+    Εκτελεί τον προσαρμοσμένο AST αναλυτή (SecurityVisitor) σε string Python κώδικα και 
+    επιστρέφει λεξικό (dict) με τα ακόλουθα κλειδιά (αποτελέσματα):
+         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
+         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
+         3. results: λίστα με τα ευρήματα της ανάλυσης (list[Finding]).
+    context: Προαιρετικό κοινό πλαίσιο ανάλυσης, ώστε το AST να μοιράζεται με τη Radon.
+    handlers: Προαιρετικά επιπλέον σύνολα κανόνων, που εκτελούνται στην ίδια διάσχιση του δέντρου.
+    """
+    context = context or AnalysisContext(code)
+    try:
+        tree = context.tree                     # Μετατροπή του κώδικα σε AST tree (ή επαναχρησιμοποίηση του κοινού).
+    except SyntaxError as exc:                  # Σε περίπτωση σφάλματος σύνταξης στον κώδικα.
+            return {
+                "ok": False,
+                "error": f"Σφάλμα σύνταξης κατά την ανάλυση AST: {exc}",
+                "results": []}
+    
+    visitor = SecurityVisitor(handlers=handlers)    # Δημιουργία instance του επισκέπτη.
+    with context.stage("custom_ast"):
+        visitor.visit(tree)                    # Επίσκεψη του AST με τον επισκέπτη.
+
+    # Επιστροφή των αποτελεσμάτων.
+    return {
+        "ok": True,
+        "error": None,
+        "results": custom_ast_findings(visitor.issues, context.source)}
@@ -0,0 +1,196 @@
+"""
+Ασφαλής, σταδιακή αποσυμπίεση αρχείων zip/tar σε workspace για σάρωση πολλών αρχείων.
+
+Τα αρχεία που ανεβαίνουν στη διεπαφή (μεμονωμένα .py/.txt ή archives) γράφονται σε έναν
+ScanWorkspace και σαρώνονται όλα μαζί με τη scan_directory. Τα archives δεν διαβάζονται ποτέ
+ολόκληρα στη μνήμη: τα tar (και .tar.gz/.bz2/.xz) διαβάζονται ως ροή (tarfile "r|*"), ενώ τα zip
+διαβάζονται εγγραφή προς εγγραφή από τον κατάλογο στο τέλος του αρχείου. Κάθε αρχείο αντιγράφεται
+σε τμήματα και μόνο όσα θα σαρώνονταν (discovery.is_selected) γράφονται στο δίσκο.
+
+Όρια (ώστε ένα "zip bomb" ή ένα archive με εκατομμύρια εγγραφές να μην εξαντλεί δίσκο ή χρόνο):
+    SAST_ARCHIVE_MAX_ENTRIES: Μέγιστο πλήθος εγγραφών ανά archive (προεπιλογή 10000).
+    SAST_ARCHIVE_MAX_MB: Μέγιστο συνολικό μέγεθος των αρχείων που αποσυμπιέζονται (προεπιλογή 200 MB).
+    SAST_ARCHIVE_MAX_FILE_MB: Μέγιστο μέγεθος ενός αρχείου· μεγαλύτερα αρχεία παραλείπονται (προεπιλογή 5 MB).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import shutil
+import logging
+import tarfile
+import zipfile
+import posixpath
+from typing import IO, Any
+
+from sast.discovery import DEFAULT_INCLUDE, is_selected
+from sast.workspace import ScanWorkspace
+
+logger = logging.getLogger("sast_tool")
+
+ARCHIVE_MAX_ENTRIES: int = int(os.getenv("SAST_ARCHIVE_MAX_ENTRIES", "10000"))
+ARCHIVE_MAX_BYTES: int = int(float(os.getenv("SAST_ARCHIVE_MAX_MB", "200")) * 1024 * 1024)
+ARCHIVE_MAX_FILE_BYTES: int = int(float(os.getenv("SAST_ARCHIVE_MAX_FILE_MB", "5")) * 1024 * 1024)
+
+# Μέγεθος κάθε τμήματος αντιγραφής.
+COPY_CHUNK_SIZE: int = 64 * 1024
+
+# Καταλήξεις archives ανά μορφή (για το file_uploader και την αναγνώριση του τύπου).
+ZIP_SUFFIXES: tuple[str, ...] = (".zip",)
+TAR_SUFFIXES: tuple[str, ...] = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+UPLOAD_TYPES: list[str] = ["py", "txt", "zip", "tar", "gz", "tgz", "bz2", "tbz2", "xz", "txz"]
+
+# Αρχεία που σαρώνονται από ένα upload: τα .py των archives και τα μεμονωμένα .py/.txt.
+UPLOAD_INCLUDE: list[str] = ["*.py", "*.txt"]
+
+class ArchiveLimitError(ValueError):
+    """
+    Το archive ξεπερνά κάποιο από τα όρια πλήθους εγγραφών ή συνολικού μεγέθους.
+    """
+
+# ---------------------------------------------
+# 2. Βοηθητικές συναρτήσεις διαδρομών και αντιγραφής.
+# ---------------------------------------------
+
+def is_archive(name: str) -> bool:
+    """
+    Ελέγχει από την κατάληξη αν το αρχείο είναι archive (zip ή tar).
+    """
+    return name.lower().endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+def safe_member_path(name: str) -> str | None:
+    """
+    Κανονικοποιεί τη διαδρομή μιας εγγραφής του archive σε σχετική διαδρομή posix. Επιστρέφει None για
+    διαδρομές που θα έγραφαν εκτός του φακέλου προορισμού (απόλυτες, με "..", με γράμμα δίσκου).
+    """
+    path = posixpath.normpath(name.replace("\\", "/"))
+    if (not path or path == "." or path.startswith(("/", "../")) or path == ".."
+            or ":" in path.split("/", 1)[0]):
+        return None
+    return path
+
+def _unique_path(rel_path: str, used: set[str]) -> str:
+    """
+    Διαδρομή που δεν έχει ήδη χρησιμοποιηθεί στο workspace (π.χ. δύο uploads με το ίδιο όνομα).
+    """
+    candidate, index = rel_path, 1
+    stem, ext = posixpath.splitext(rel_path)
+    while candidate in used:
+        candidate = f"{stem}_{index}{ext}"
+        index += 1
+    used.add(candidate)
+    return candidate
+
+def _copy_limited(source: IO[bytes], target_path: str, max_bytes: int) -> int | None:
+    """
+    Αντιγράφει τη ροή source στο target_path σε τμήματα. Αν τα δεδομένα ξεπεράσουν τα max_bytes, το
+    αρχείο διαγράφεται και επιστρέφεται None (το μέγεθος που δηλώνει το archive δεν θεωρείται αξιόπιστο).
+    """
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    written = 0
+    with open(target_path, "wb") as target:
+        while True:
+            chunk = source.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                return written
+            written += len(chunk)
+            if written > max_bytes:
+                break
+            target.write(chunk)
+    os.remove(target_path)
+    return None
+
+# ------------------------------------------------
+# 3. Αποσυμπίεση archives και εγγραφή uploads στο workspace.
+# ------------------------------------------------
+
+class _Extraction:
+    """
+    Κοινή λογιστική των ορίων για όλα τα archives ενός upload.
+    """
+    def __init__(self, workspace: ScanWorkspace, include: list[str], used: set[str]) -> None:
+        self.workspace = workspace
+        self.include = include
+        self.used = used
+        self.files: list[str] = []
+        self.skipped: list[str] = []
+        self.bytes = 0
+
+    def add(self, prefix: str, name: str, source: IO[bytes], size: int | None) -> None:
+        rel_path = safe_member_path(name)
+        if rel_path is None:
+            logger.warning("Παράλειψη εγγραφής του archive με μη ασφαλή διαδρομή: %s", name)
+            self.skipped.append(f"{prefix}/{name}")
+            return
+        if not is_selected(rel_path, self.include):
+            return
+        rel_path = _unique_path(f"{prefix}/{rel_path}", self.used)
+        if size is not None and size > ARCHIVE_MAX_FILE_BYTES:
+            self.skipped.append(rel_path)
+            return
+        max_bytes = min(ARCHIVE_MAX_FILE_BYTES, ARCHIVE_MAX_BYTES - self.bytes)
+        written = _copy_limited(source, os.path.join(self.workspace.root, rel_path), max_bytes)
+        if written is None:
+            if max_bytes < ARCHIVE_MAX_FILE_BYTES:
+                raise ArchiveLimitError(f"Το συνολικό μέγεθος των αρχείων ξεπερνά τα "
+                                        f"{ARCHIVE_MAX_BYTES / (1024 * 1024):.3g} MB (SAST_ARCHIVE_MAX_MB).")
+            self.skipped.append(rel_path)
+            return
+        self.bytes += written
+        self.files.append(rel_path)
+
+def _check_entries(count: int, name: str) -> None:
+    if count > ARCHIVE_MAX_ENTRIES:
+        raise ArchiveLimitError(f"Το archive {name} έχει περισσότερες από {ARCHIVE_MAX_ENTRIES} εγγραφές "
+                                f"(SAST_ARCHIVE_MAX_ENTRIES).")
+
+def _extract_tar(fileobj: IO[bytes], name: str, extraction: _Extraction) -> None:
+    # Λειτουργία ροής: οι εγγραφές διαβάζονται με τη σειρά, χωρίς seek και χωρίς ευρετήριο στη μνήμη.
+    with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+        for count, member in enumerate(archive, start=1):
+            _check_entries(count, name)
+            if member.isfile():                             # Links, συσκευές και φάκελοι παραλείπονται.
+                source = archive.extractfile(member)
+                if source is not None:
+                    extraction.add(name, member.name, source, member.size)
+            archive.members.clear()                         # Το TarFile κρατά κάθε TarInfo που διάβασε.
+
+def _extract_zip(fileobj: IO[bytes], name: str, extraction: _Extraction) -> None:
+    with zipfile.ZipFile(fileobj) as archive:
+        members = archive.infolist()
+        _check_entries(len(members), name)
+        for member in members:
+            if not member.is_dir():
+                with archive.open(member) as source:
+                    extraction.add(name, member.filename, source, member.file_size)
+
+def stage_uploads(uploads: list[Any], workspace: ScanWorkspace,
+                  include: list[str] | None = None) -> dict[str, Any]:
+    """
+    Γράφει τα αρχεία ενός upload στο workspace: τα μεμονωμένα αρχεία στη ρίζα του και τα αρχεία
+    Python κάθε archive στον φάκελο <όνομα archive>/. Τα uploads είναι αντικείμενα αρχείου με όνομα
+    (name), π.χ. τα UploadedFile του Streamlit, και διαβάζονται ως ροή.
+    include: Globs των αρχείων των archives που αποσυμπιέζονται (προεπιλογή: DEFAULT_INCLUDE).
+    Επιστρέφει {"files": [σχετικές διαδρομές], "skipped": [...], "bytes": ...}. Σε archive που
+    ξεπερνά τα όρια προκαλείται ArchiveLimitError, σε κατεστραμμένο archive ValueError.
+    """
+    extraction = _Extraction(workspace, include or DEFAULT_INCLUDE, used=set())
+    for upload in uploads:
+        name = posixpath.basename(upload.name.replace("\\", "/")) or "upload"
+        upload.seek(0)
+        try:
+            if name.lower().endswith(ZIP_SUFFIXES):
+                _extract_zip(upload, name, extraction)
+            elif name.lower().endswith(TAR_SUFFIXES):
+                _extract_tar(upload, name, extraction)
+            else:
+                rel_path = _unique_path(name, extraction.used)
+                with open(os.path.join(workspace.root, rel_path), "wb") as target:
+                    shutil.copyfileobj(upload, target, COPY_CHUNK_SIZE)
+                extraction.files.append(rel_path)
+        except (tarfile.TarError, zipfile.BadZipFile, EOFError) as exc:
+            raise ValueError(f"Αδυναμία ανάγνωσης του archive {name}: {exc}") from exc
+    return {"files": extraction.files, "skipped": extraction.skipped, "bytes": extraction.bytes}
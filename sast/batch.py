@@ -0,0 +1,266 @@
+"""
+Batch mode για τα CLI-based εργαλεία (Bandit, Semgrep, Pylint).
+
+Αντί για ένα προσωρινό αρχείο και μία διεργασία ανά αρχείο, τα αρχεία μιας παρτίδας (batch)
+γράφονται μία φορά σε έναν κοινό προσωρινό φάκελο (sast.workspace), τον οποίο μοιράζονται όλα τα
+εργαλεία, και κάθε εργαλείο εκτελείται μία φορά για όλη την παρτίδα.
+Η συνδυασμένη έξοδος JSON αναλύεται σταδιακά (streaming) καθώς την παράγει το εργαλείο: κάθε εύρημα
+αντιστοιχίζεται στο αρχείο του με βάση τα πεδία filename/path και μετατρέπεται αμέσως σε Finding, στην
+ίδια μορφή με τις αντίστοιχες run_* συναρτήσεις, οπότε ούτε η έξοδος ούτε τα ακατέργαστα ευρήματα
+κρατούνται ολόκληρα στη μνήμη. Οι παρτίδες των διαφορετικών εργαλείων εκτελούνται ταυτόχρονα, ως
+εργασίες ενός event loop (sast.aiosubprocess).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable
+
+from sast.analyzers import (BANDIT_ARGS,
+                            SEMGREP_CONFIGS,
+                            PYLINT_ARGS,
+                            PYLINT_OK_RETURNCODES,
+                            semgrep_timeout_errors)
+from sast.cache import ResultCache, make_cache_key
+from sast.workspace import ScanWorkspace
+from sast.aiosubprocess import run_subprocess_json_async, run_sync
+from sast.budget import PARTIAL_STATUS, Budget, result_status, tool_deadline
+from sast.semgrep_rules import RulePackError, rule_id_restorer, semgrep_config_args, semgrep_targets
+from sast.findings import Finding, FindingBuilder, bandit_finding, semgrep_finding, pylint_finding
+from sast import metrics
+
+logger = logging.getLogger("sast_tool")
+
+# Εργαλεία που υποστηρίζουν batch mode και προεπιλεγμένο μέγεθος παρτίδας.
+BATCH_TOOLS: tuple[str, ...] = ("bandit", "semgrep", "pylint")
+DEFAULT_BATCH_SIZE: int = 200
+
+# Η Pylint δεν δίνει βαθμολογία ανά αρχείο όταν σαρώνει πολλά αρχεία μαζί (score = None), οπότε
+# τα αποτελέσματά της σε batch mode δεν αποθηκεύονται στην cache για να μην "μολύνουν" τις
+# μεμονωμένες σαρώσεις.
+CACHEABLE_BATCH_TOOLS: tuple[str, ...] = ("bandit", "semgrep")
+
+# Σε batch mode τα εργαλεία εκτελούνται πάντα ως CLI, οπότε αυτό είναι και το backend του κλειδιού της cache.
+BATCH_BACKEND: str = "subprocess"
+
+# ----------------------------------------------------------
+# 2. Βοηθητικές συναρτήσεις για προετοιμασία και διαχωρισμό.
+# ----------------------------------------------------------
+
+def _rel_key(reported_path: str | None, staging_dir: str) -> str | None:
+    """
+    Μετατρέπει τη διαδρομή που επιστρέφει ένα εργαλείο (σχετική στο cwd ή απόλυτη) στη σχετική
+    διαδρομή μορφής posix που χρησιμοποιείται ως κλειδί στο sources.
+    """
+    if not reported_path:
+        return None
+    path = reported_path if os.path.isabs(reported_path) else os.path.join(staging_dir, reported_path)
+    return os.path.relpath(os.path.normpath(path), staging_dir).replace(os.sep, "/")
+
+def _record_resources(tool: str, result: dict[str, Any]) -> None:
+    """
+    Οι μετρήσεις μιας παρτίδας αφορούν όλα τα αρχεία της, οπότε δεν αποδίδονται σε κάθε αρχείο αλλά
+    καταγράφονται μόνο στο αρχείο μετρήσεων (αν έχει οριστεί), με backend "batch".
+    """
+    if metrics.METRICS_FILE:
+        metrics.append_prometheus(metrics.METRICS_FILE, tool, {**result["extras"], "backend": "batch"})
+
+class _FindingCollector:
+    """
+    Callback on_record της run_subprocess_json_async: μετατρέπει κάθε εγγραφή σε Finding τη στιγμή που
+    αναλύεται και την προσθέτει στο αρχείο της (το FindingBuilder κάθε αρχείου δημιουργείται μία φορά,
+    από το αντίγραφό του στον φάκελο της παρτίδας).
+    """
+    def __init__(self, staging_dir: str, tool: str, per_file: dict[str, dict[str, Any]], path_field: str,
+                 convert: Callable[[FindingBuilder, dict[str, Any]], Finding],
+                 accept: Callable[[dict[str, Any]], bool] | None = None) -> None:
+        self.staging_dir = staging_dir
+        self.tool = tool
+        self.per_file = per_file
+        self.path_field = path_field
+        self.convert = convert
+        self.accept = accept
+        self._builders: dict[str, FindingBuilder] = {}
+
+    def __call__(self, _key: str, record: Any) -> None:
+        if not isinstance(record, dict) or (self.accept is not None and not self.accept(record)):
+            return
+        rel_path = _rel_key(record.get(self.path_field), self.staging_dir)
+        if rel_path not in self.per_file:
+            return
+        build = self._builders.get(rel_path)
+        if build is None:
+            with open(os.path.join(self.staging_dir, rel_path), encoding="utf-8", newline="") as staged_file:
+                build = self._builders[rel_path] = FindingBuilder(self.tool, staged_file.read())
+        self.per_file[rel_path]["results"].append(self.convert(build, record))
+
+def _error_results(rel_paths: Iterable[str], tool: str, result: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Επιστρέφει το ίδιο αποτέλεσμα σφάλματος (ή "timeout") για όλα τα αρχεία μιας αποτυχημένης παρτίδας.
+    """
+    empty: dict[str, Any] = {"bandit": {"metrics": {}}, "pylint": {"score": None}}.get(tool, {})
+    return {rel_path: {"ok": False, "error": result["error"], "status": result.get("status", "error"),
+                       "results": [], **empty}
+            for rel_path in rel_paths}
+
+# ----------------------------------------------------------
+# 3. Συναρτήσεις εκτέλεσης κάθε εργαλείου σε μία παρτίδα αρχείων.
+# ----------------------------------------------------------
+
+async def _bandit_batch(staging_dir: str, rel_paths: list[str]) -> dict[str, dict[str, Any]]:
+    per_file = {rel_path: {"ok": True, "error": None, "results": [], "metrics": {}} for rel_path in rel_paths}
+    result = await run_subprocess_json_async(["bandit", *BANDIT_ARGS, *rel_paths],
+                                             tool_label="Bandit",
+                                             install_hint="pip install Bandit",
+                                             ok_returncodes=(0, 1),
+                                             cwd=staging_dir,
+                                             on_record=_FindingCollector(staging_dir, "bandit", per_file, "filename",
+                                                                         bandit_finding))
+    _record_resources("bandit", result)
+    if not result["ok"]:
+        return _error_results(rel_paths, "bandit", result)
+
+    data = result["results"] or {}
+    # Οι μετρικές της Bandit δίνονται ήδη ανά αρχείο (κλειδί = filename) μαζί με τα "_totals".
+    for reported_path, file_metrics in (data.get("metrics") or {}).items():
+        key = _rel_key(reported_path, staging_dir) if reported_path != "_totals" else None
+        if key in per_file:
+            per_file[key]["metrics"] = {reported_path: file_metrics, "_totals": file_metrics}
+    return per_file
+
+def _read_staged(staging_dir: str, rel_paths: list[str]) -> dict[str, str]:
+    sources = {}
+    for rel_path in rel_paths:
+        with open(os.path.join(staging_dir, rel_path), encoding="utf-8", newline="") as staged_file:
+            sources[rel_path] = staged_file.read()
+    return sources
+
+async def _semgrep_batch(staging_dir: str, rel_paths: list[str]) -> dict[str, dict[str, Any]]:
+    per_file = {rel_path: {"ok": True, "error": None, "results": []} for rel_path in rel_paths}
+    # Prefilter: σαρώνονται μόνο τα αρχεία στα οποία αφορά κάποιος κανόνας, με την ένωση των κανόνων τους.
+    sources = _read_staged(staging_dir, rel_paths)
+    targets = semgrep_targets(SEMGREP_CONFIGS, sources)
+    if not targets:
+        return per_file
+    try:
+        config_args = semgrep_config_args(SEMGREP_CONFIGS, sources=[sources[key] for key in targets])
+    except RulePackError as exc:
+        return _error_results(rel_paths, "semgrep", {"error": str(exc)})
+    if config_args is None:
+        return per_file
+    cmd = ["semgrep", "scan", *config_args, "--json", *(os.path.join(".", key) for key in targets)]
+    restore = rule_id_restorer(config_args)
+    result = await run_subprocess_json_async(cmd,
+                                             tool_label="Semgrep",
+                                             install_hint="pip install Semgrep",
+                                             ok_returncodes=(0, 1),
+                                             cwd=staging_dir,
+                                             on_record=_FindingCollector(staging_dir, "semgrep", per_file, "path",
+                                                                         lambda build, issue: semgrep_finding(build, restore(issue))))
+    _record_resources("semgrep", result)
+    if not result["ok"]:
+        return _error_results(rel_paths, "semgrep", result)
+    # Κανόνες που έληξαν (εσωτερικό timeout της Semgrep): μερικά ευρήματα για το αρχείο του σφάλματος ή,
+    # αν το σφάλμα δεν αναφέρει αρχείο, για όλα τα αρχεία που σαρώθηκαν.
+    for error in semgrep_timeout_errors(result["results"] or {}):
+        rel_path = _rel_key(error.get("path"), staging_dir)
+        for key in [rel_path] if rel_path in per_file else targets:
+            per_file[key]["status"] = PARTIAL_STATUS
+    return per_file
+
+async def _pylint_batch(staging_dir: str, rel_paths: list[str]) -> dict[str, dict[str, Any]]:
+    per_file = {rel_path: {"ok": True, "error": None, "results": [], "score": None} for rel_path in rel_paths}
+    # Η έξοδος είναι πίνακας μηνυμάτων (-f json) ή αντικείμενο με "messages" (json2).
+    collect = _FindingCollector(staging_dir, "pylint", per_file, "path", pylint_finding,
+                                accept=lambda msg: "type" in msg and "message" in msg)
+    result = await run_subprocess_json_async(["pylint", *PYLINT_ARGS, *rel_paths],
+                                             tool_label="Pylint",
+                                             install_hint="pip install Pylint",
+                                             ok_returncodes=PYLINT_OK_RETURNCODES,
+                                             cwd=staging_dir,
+                                             on_record=collect,
+                                             record_keys=("messages",))
+    _record_resources("pylint", result)
+    if not result["ok"]:
+        return _error_results(rel_paths, "pylint", result)
+    return per_file
+
+BATCH_RUNNERS: dict[str, Callable[[str, list[str]], Awaitable[dict[str, dict[str, Any]]]]] = {
+    "bandit": _bandit_batch,
+    "semgrep": _semgrep_batch,
+    "pylint": _pylint_batch}
+
+# ------------------------------------------------------------------
+# 4. Ορισμός συνάρτησης εκτέλεσης των εργαλείων σε batch mode.
+# ------------------------------------------------------------------
+
+def run_tools_batched(sources: dict[str, str],
+                      tools: Iterable[str],
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      cache: ResultCache | None = None,
+                      budget: Budget | None = None) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Εκτελεί τα εργαλεία CLI (BATCH_TOOLS) σε πολλά αρχεία με μία διεργασία ανά εργαλείο και παρτίδα.
+    Οι διεργασίες των διαφορετικών εργαλείων για τα ίδια αρχεία εκτελούνται ταυτόχρονα (sast.aiosubprocess).
+    sources: Λεξικό {σχετική διαδρομή: κώδικας Python}.
+    batch_size: Μέγιστο πλήθος αρχείων ανά κλήση εργαλείου.
+    cache: Προαιρετική cache αποτελεσμάτων. Εκτελούνται μόνο τα αρχεία που δεν βρέθηκαν σε αυτήν και
+           αποθηκεύονται μόνο τα επιτυχημένα και πλήρη αποτελέσματα (όχι "partial"/"timeout").
+    budget: Προαιρετικά χρονικά όρια. Κάθε κλήση έχει όριο το όριο του εργαλείου επί το πλήθος των
+            αρχείων της παρτίδας (με ανώτατο το υπόλοιπο της σάρωσης). Σε λήξη, όλα τα αρχεία της
+            παρτίδας επιστρέφονται με status "timeout".
+    Επιστρέφει λεξικό {σχετική διαδρομή: {εργαλείο: αποτέλεσμα}} με τη μορφή των run_* συναρτήσεων.
+    """
+    selected = list(dict.fromkeys(tools))
+    budget = budget or Budget(scan_timeout=0)
+    unsupported = [tool for tool in selected if tool not in BATCH_RUNNERS]
+    if unsupported:
+        raise ValueError(f"Τα εργαλεία δεν υποστηρίζουν batch mode: {', '.join(unsupported)}")
+
+    # Κανονικοποίηση των κλειδιών ώστε να ταιριάζουν με τις διαδρομές που επιστρέφουν τα εργαλεία.
+    sources = {os.path.normpath(rel_path).replace(os.sep, "/"): code for rel_path, code in sources.items()}
+    results: dict[str, dict[str, dict[str, Any]]] = {rel_path: {} for rel_path in sources}
+
+    pending: dict[str, list[str]] = {}
+    for tool in selected:
+        pending[tool] = []
+        for rel_path, code in sources.items():
+            cached = cache.get(make_cache_key(code, tool, BATCH_BACKEND)) if cache is not None else None
+            if cached is not None:
+                results[rel_path][tool] = cached
+            else:
+                pending[tool].append(rel_path)
+
+    # Οι παρτίδες όλων των εργαλείων για την ίδια θέση εκτελούνται ταυτόχρονα σε ένα event loop.
+    step = max(1, batch_size)
+    for start in range(0, max(map(len, pending.values()), default=0), step):
+        jobs = [(tool, pending[tool][start:start + step]) for tool in selected if pending[tool][start:start + step]]
+        # Τα αρχεία γράφονται μία φορά, σε κοινό workspace για όλα τα εργαλεία της θέσης.
+        with ScanWorkspace() as workspace:
+            workspace.stage({rel_path: sources[rel_path] for _tool, chunk in jobs for rel_path in chunk})
+            batch_results = run_sync(_run_batches(workspace.root, jobs, budget))
+        for (tool, chunk), chunk_results in zip(jobs, batch_results):
+            for rel_path in chunk:
+                file_result = chunk_results[rel_path]
+                results[rel_path][tool] = file_result
+                if (cache is not None and tool in CACHEABLE_BATCH_TOOLS and file_result.get("ok")
+                        and result_status(file_result) == "ok"):
+                    cache.put(make_cache_key(sources[rel_path], tool, BATCH_BACKEND), file_result)
+    return results
+
+async def _run_batch(staging_dir: str, tool: str, chunk: list[str], budget: Budget) -> dict[str, dict[str, Any]]:
+    """
+    Μία παρτίδα ενός εργαλείου με τη δική της προθεσμία (η προθεσμία ορίζεται μέσα στην εργασία του
+    loop, οπότε δεν επηρεάζει τις άλλες παρτίδες).
+    """
+    with tool_deadline(budget.deadline_for(tool, files=len(chunk))):
+        return await BATCH_RUNNERS[tool](staging_dir, chunk)
+
+async def _run_batches(staging_dir: str, jobs: list[tuple[str, list[str]]],
+                       budget: Budget) -> list[dict[str, dict[str, Any]]]:
+    return await asyncio.gather(*(_run_batch(staging_dir, tool, chunk, budget) for tool, chunk in jobs))
@@ -0,0 +1,478 @@
+"""
+Αναπαραγώγιμη (offline) σουίτα μετρήσεων επιδόσεων για τους αναλυτές του εργαλείου SAST.
+
+Δημιουργεί ντετερμινιστικά (με seed) ένα σώμα αρχείων Python από 10 έως 50.000 γραμμές, με
+hard-coded μυστικά, eval/exec, subprocess με shell=True και logging ευαίσθητων μεταβλητών ανάμεσα σε
+"ουδέτερο" κώδικα. Για κάθε μέγεθος μετρά χρόνο (wall), χρόνο CPU (μαζί με τις θυγατρικές διεργασίες των
+εργαλείων CLI), μέγιστη μνήμη (peak RSS) και ευρήματα/δευτερόλεπτο για κάθε run_* συνάρτηση, για τον
+SecurityVisitor μόνο του (χωρίς parse) και για την πλήρη ενορχήστρωση. Κάθε μέτρηση εκτελείται σε
+ξεχωριστή διεργασία (spawn), ώστε το peak RSS να αφορά μόνο τη συγκεκριμένη μέτρηση.
+
+Τα αποτελέσματα γράφονται σε JSON. Η εντολή compare (ή το --baseline της run) τα συγκρίνει με
+προηγούμενη εκτέλεση και επισημαίνει όσες μετρήσεις χειροτέρεψαν περισσότερο από ένα όριο (%).
+
+Παράδειγμα:
+    python -m sast.benchmark run --targets custom_ast,radon,security_visitor -o bench.json
+    python -m sast.benchmark compare base.json bench.json --threshold 10
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+import statistics
+import multiprocessing
+from typing import Any, Iterable
+
+logger = logging.getLogger("sast_tool")
+
+# Μεγέθη (γραμμές) του παραγόμενου σώματος αρχείων και προεπιλεγμένο seed.
+DEFAULT_SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000, 50_000)
+DEFAULT_SEED: int = 1337
+
+# Στόχοι μέτρησης: τα εργαλεία του TOOL_RUNNERS, ο SecurityVisitor μόνος του και η πλήρης ενορχήστρωση.
+ORCHESTRATION_TARGET: str = "end_to_end"
+VISITOR_TARGET: str = "security_visitor"
+
+# Μετρικές που συγκρίνονται (μεγαλύτερη τιμή = χειρότερη επίδοση).
+COMPARED_METRICS: tuple[str, ...] = ("wall_time_s", "cpu_time_s", "peak_rss_mb")
+DEFAULT_THRESHOLD_PCT: float = 10.0
+
+# Κάτω όρια απόλυτης διαφοράς, ώστε ο θόρυβος σε πολύ σύντομες μετρήσεις να μη θεωρείται regression.
+DEFAULT_MIN_DELTA: dict[str, float] = {"wall_time_s": 0.005, "cpu_time_s": 0.005, "peak_rss_mb": 2.0}
+
+# ------------------------------------------------------
+# 2. Παραγωγή του σώματος αρχείων (corpus) για τις μετρήσεις.
+# ------------------------------------------------------
+
+_HEADER: str = '''"""Παραγόμενο αρχείο μετρήσεων ({lines} γραμμές, seed {seed})."""
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+'''
+
+# Πρότυπα μπλοκ κώδικα: (βάρος επιλογής, πρότυπο). Τα τέσσερα πρώτα ενεργοποιούν τους κανόνες του
+# SecurityVisitor και αντίστοιχους ελέγχους των Bandit/Semgrep/Pylint, το τελευταίο είναι ουδέτερο.
+_TEMPLATES: tuple[tuple[int, str], ...] = (
+    (1, '''
+def load_settings_{i}():
+    api_key = "sk_live_{token}"
+    password = "P@ss-{i}-word"
+    timeout = {small}
+    return {{"key": api_key, "password": password, "timeout": timeout}}
+'''),
+    (1, '''
+def authenticate_{i}(user, token):
+    logging.info("Σύνδεση χρήστη %s", user)
+    logging.debug("token=%s", token)
+    if not token:
+        print(token)
+        return False
+    return len(token) > {small}
+'''),
+    (1, '''
+def evaluate_{i}(expression, namespace):
+    if expression.startswith("#"):
+        return None
+    value = eval(expression, namespace)
+    exec("result_{i} = value", namespace)
+    return value
+'''),
+    (1, '''
+def run_command_{i}(cmd):
+    completed = subprocess.run(cmd, shell=True, capture_output=True, check=False)
+    logger.info("Εντολή %s: %s", cmd, completed.returncode)
+    return completed.returncode
+'''),
+    (4, '''
+class Accumulator{i}:
+    """Ουδέτερος κώδικας χωρίς ευρήματα ασφαλείας."""
+
+    def __init__(self, items):
+        self.items = list(items)
+
+    def total(self):
+        result = 0
+        for item in self.items:
+            if item % {small}:
+                result += item
+            else:
+                result -= item
+        return result
+'''),
+)
+
+def generate_source(lines: int, seed: int = DEFAULT_SEED) -> str:
+    """
+    Παράγει ντετερμινιστικά έγκυρο κώδικα Python με τουλάχιστον lines γραμμές (η τελευταία
+    συνάρτηση/κλάση ολοκληρώνεται, οπότε το πλήθος μπορεί να είναι λίγο μεγαλύτερο).
+    """
+    rng = random.Random(f"{seed}:{lines}")
+    weights = [weight for weight, _template in _TEMPLATES]
+    parts = [_HEADER.format(lines=lines, seed=seed)]
+    count = parts[0].count("\n")
+    i = 0
+    while count < lines:
+        _weight, template = rng.choices(_TEMPLATES, weights=weights)[0]
+        block = template.format(i=i, token=f"{rng.getrandbits(64):016x}", small=rng.randint(2, 9))
+        parts.append(block)
+        count += block.count("\n")
+        i += 1
+    return "".join(parts)
+
+def write_corpus(directory: str, sizes: Iterable[int] = DEFAULT_SIZES, seed: int = DEFAULT_SEED) -> list[str]:
+    """
+    Γράφει το σώμα αρχείων σε φάκελο (bench_<γραμμές>.py), π.χ. για μετρήσεις της σάρωσης
+    φακέλου με το CLI. Επιστρέφει τις διαδρομές των αρχείων.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths: list[str] = []
+    for lines in sizes:
+        path = os.path.join(directory, f"bench_{lines}.py")
+        with open(path, "w", encoding="utf-8") as corpus_file:
+            corpus_file.write(generate_source(lines, seed))
+        paths.append(path)
+    return paths
+
+# ----------------------------------------------------------
+# 3. Μέτρηση ενός στόχου (εκτελείται σε ξεχωριστή διεργασία).
+# ----------------------------------------------------------
+
+def _usage() -> tuple[float, float, float]:
+    """
+    (CPU της διεργασίας, CPU θυγατρικών, peak RSS διεργασίας σε MB). Το peak RSS των θυγατρικών δεν
+    λαμβάνεται από το RUSAGE_CHILDREN, του οποίου το ru_maxrss κληρονομεί το peak RSS αυτής της
+    διεργασίας κατά το fork (βλ. _children_peak_rss_mb).
+    Χωρίς το module resource (π.χ. Windows) οι τιμές των θυγατρικών και του RSS είναι 0.
+    """
+    try:
+        import resource
+    except ImportError:
+        return time.process_time(), 0.0, 0.0
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024   # Σε Linux το ru_maxrss δίνεται σε KB.
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time(), children.ru_utime + children.ru_stime, own.ru_maxrss / divisor
+
+def _children_peak_rss_mb(results: Iterable[dict[str, Any]]) -> float:
+    """
+    Μέγιστη μνήμη των θυγατρικών διεργασιών των εργαλείων CLI, όπως τη μέτρησε το sast.metrics
+    (VmHWM) για κάθε αποτέλεσμα. 0 αν δεν εκτελέστηκε (ή δεν μετρήθηκε) καμία θυγατρική διεργασία.
+    """
+    peaks = [(result.get("resources") or {}).get("peak_rss_mb") for result in results
+             if (result.get("resources") or {}).get("backend") == "subprocess"]
+    return max((peak for peak in peaks if peak is not None), default=0.0)
+
+def _target_runner(target: str, code: str, tools: list[str]) -> Any:
+    """
+    Επιστρέφει συνάρτηση χωρίς ορίσματα που εκτελεί μία φορά τον στόχο και επιστρέφει
+    (πλήθος ευρημάτων, σφάλμα ή None, peak RSS των θυγατρικών διεργασιών σε MB).
+    """
+    import ast
+    from sast.analyzers import SecurityVisitor
+    from sast.context import AnalysisContext
+    from sast.orchestrator import TOOL_RUNNERS, run_tools_concurrently
+
+    if target == VISITOR_TARGET:
+        tree = ast.parse(code)                                      # Το parse μένει εκτός μέτρησης.
+
+        def run_visitor() -> tuple[int, str | None, float]:
+            visitor = SecurityVisitor()
+            visitor.visit(tree)
+            return len(visitor.issues), None, 0.0
+        return run_visitor
+
+    if target == ORCHESTRATION_TARGET:
+        def run_orchestration() -> tuple[int, str | None, float]:
+            results = run_tools_concurrently(code, tools, context=AnalysisContext(code))
+            errors = [result["error"] for result in results.values() if not result.get("ok")]
+            return (sum(len(result.get("results") or []) for result in results.values()),
+                    "; ".join(str(error) for error in errors) or None,
+                    _children_peak_rss_mb(results.values()))
+        return run_orchestration
+
+    runner = TOOL_RUNNERS[target]
+
+    def run_tool() -> tuple[int, str | None, float]:
+        result = runner(code)
+        return (len(result.get("results") or []), None if result.get("ok") else str(result.get("error")),
+                _children_peak_rss_mb([result]))
+    return run_tool
+
+def measure_target(target: str, code: str, repeat: int = 3, warmup: int = 0,
+                   tools: list[str] | None = None) -> dict[str, Any]:
+    """
+    Μετρά έναν στόχο στην τρέχουσα διεργασία: διάμεσος wall/CPU χρόνος των repeat εκτελέσεων
+    (μετά από warmup εκτελέσεις εκτός μέτρησης) και μέγιστη μνήμη της διεργασίας ή των θυγατρικών της.
+    tools: Τα εργαλεία της πλήρους ενορχήστρωσης (μόνο για τον στόχο end_to_end).
+    """
+    run = _target_runner(target, code, list(tools or []))
+    for _ in range(warmup):
+        run()
+    walls: list[float] = []
+    cpus: list[float] = []
+    findings, error, children_peak_rss_mb = 0, None, 0.0
+    for _ in range(max(1, repeat)):
+        cpu_before, children_before, _rss = _usage()
+        started = time.perf_counter()
+        findings, error, child_rss = run()
+        wall = time.perf_counter() - started
+        cpu_after, children_after, _rss = _usage()
+        children_peak_rss_mb = max(children_peak_rss_mb, child_rss)
+        walls.append(wall)
+        cpus.append((cpu_after - cpu_before) + (children_after - children_before))
+    _cpu, _children_cpu, peak_rss_mb = _usage()
+    wall_time_s = statistics.median(walls)
+    return {"target": target,
+            "lines": code.count("\n"),
+            "bytes": len(code.encode("utf-8")),
+            "repeat": len(walls),
+            "ok": error is None,
+            "error": error,
+            "findings": findings,
+            "wall_time_s": round(wall_time_s, 6),
+            "wall_time_min_s": round(min(walls), 6),
+            "cpu_time_s": round(statistics.median(cpus), 6),
+            "peak_rss_mb": round(max(peak_rss_mb, children_peak_rss_mb), 2),
+            "children_peak_rss_mb": round(children_peak_rss_mb, 2),
+            "findings_per_s": round(findings / wall_time_s, 2) if wall_time_s > 0 else None}
+
+def _measure_in_child(conn: Any, target: str, lines: int, seed: int, repeat: int, warmup: int,
+                      tools: list[str]) -> None:
+    try:
+        conn.send(measure_target(target, generate_source(lines, seed), repeat, warmup, tools))
+    except Exception as exc:                                         # Το σφάλμα καταγράφεται στα αποτελέσματα.
+        conn.send({"target": target, "lines": lines, "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+    finally:
+        conn.close()
+
+def measure_isolated(target: str, lines: int, seed: int = DEFAULT_SEED, repeat: int = 3,
+                     warmup: int = 0, tools: list[str] | None = None) -> dict[str, Any]:
+    """
+    Εκτελεί τη measure_target σε νέα διεργασία (spawn), ώστε το peak RSS και τα imports των
+    εργαλείων να μην επηρεάζονται από προηγούμενες μετρήσεις.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_measure_in_child, name=f"sast-bench-{target}",
+                          args=(child_conn, target, lines, seed, repeat, warmup, list(tools or [])))
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:                                                 # Η διεργασία τερματίστηκε απρόσμενα.
+        result = {"target": target, "lines": lines, "ok": False, "error": "Η διεργασία μέτρησης τερματίστηκε απρόσμενα."}
+    process.join()
+    return result
+
+# ---------------------------------------------------
+# 4. Εκτέλεση της σουίτας και σύγκριση αποτελεσμάτων.
+# ---------------------------------------------------
+
+def all_targets() -> list[str]:
+    """
+    Όλοι οι διαθέσιμοι στόχοι: τα εργαλεία του TOOL_RUNNERS, ο SecurityVisitor και η πλήρης ενορχήστρωση.
+    """
+    from sast.orchestrator import TOOL_RUNNERS
+
+    return [*TOOL_RUNNERS, VISITOR_TARGET, ORCHESTRATION_TARGET]
+
+def _environment() -> dict[str, Any]:
+    from sast.cache import tool_version
+    from sast.inprocess import ANALYZER_BACKEND
+    from sast.orchestrator import TOOL_RUNNERS
+
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "analyzer_backend": ANALYZER_BACKEND,
+            "tool_versions": {tool: tool_version(tool) for tool in TOOL_RUNNERS}}
+
+def run_suite(targets: Iterable[str] | None = None,
+              sizes: Iterable[int] = DEFAULT_SIZES,
+              seed: int = DEFAULT_SEED,
+              repeat: int = 3,
+              warmup: int = 0,
+              tools: list[str] | None = None) -> dict[str, Any]:
+    """
+    Εκτελεί όλους τους στόχους για κάθε μέγεθος και επιστρέφει το έγγραφο αποτελεσμάτων (JSON).
+    tools: Εργαλεία της πλήρους ενορχήστρωσης (προεπιλογή: τα εργαλεία του targets, αλλιώς όλα).
+    Μη έγκυροι στόχοι προκαλούν ValueError.
+    """
+    available = all_targets()
+    targets = list(dict.fromkeys(targets or available))
+    unknown = [target for target in targets if target not in available]
+    if unknown:
+        raise ValueError(f"Άγνωστοι στόχοι μέτρησης: {', '.join(unknown)}")
+    tool_targets = [target for target in targets if target not in (VISITOR_TARGET, ORCHESTRATION_TARGET)]
+    tools = list(tools or tool_targets or available[:-2])
+    sizes = list(sizes)
+
+    started = time.time()
+    results: list[dict[str, Any]] = []
+    for lines in sizes:
+        for target in targets:
+            result = measure_isolated(target, lines, seed, repeat, warmup, tools)
+            result["size"] = lines
+            results.append(result)
+            logger.info("Μέτρηση %s (%d γραμμές): %.3fs", target, lines, result.get("wall_time_s") or 0.0)
+    return {"version": 1,
+            "created_at": started,
+            "duration_s": round(time.time() - started, 3),
+            "environment": _environment(),
+            "config": {"sizes": sizes, "seed": seed, "repeat": repeat, "warmup": warmup,
+                       "targets": targets, "end_to_end_tools": tools},
+            "results": results}
+
+def compare_results(baseline: dict[str, Any],
+                    current: dict[str, Any],
+                    threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+                    min_delta: dict[str, float] | None = None) -> list[dict[str, Any]]:
+    """
+    Συγκρίνει δύο εκτελέσεις ανά (στόχος, μέγεθος) και επιστρέφει μία εγγραφή ανά μετρική με τη
+    μεταβολή (%) και την ένδειξη regression, όταν η νέα τιμή είναι μεγαλύτερη κατά περισσότερο από
+    threshold_pct και από το απόλυτο min_delta της μετρικής. Μετρήσεις που απέτυχαν παραλείπονται.
+    """
+    min_delta = {**DEFAULT_MIN_DELTA, **(min_delta or {})}
+    previous = {(result["target"], result.get("size")): result
+                for result in baseline.get("results", []) if result.get("ok")}
+    comparisons: list[dict[str, Any]] = []
+    for result in current.get("results", []):
+        base = previous.get((result["target"], result.get("size")))
+        if base is None or not result.get("ok"):
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change_pct = (new - old) / old * 100
+            comparisons.append({
+                "target": result["target"],
+                "size": result.get("size"),
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change_pct": round(change_pct, 2),
+                "regression": change_pct > threshold_pct and new - old > min_delta.get(metric, 0.0)})
+    return comparisons
+
+def format_comparison(comparisons: list[dict[str, Any]]) -> str:
+    """
+    Πίνακας κειμένου με τις συγκρίσεις (οι regressions επισημαίνονται με "!!").
+    """
+    rows = [f"{'':2} {'target':<18} {'lines':>7} {'metric':<12} {'baseline':>12} {'current':>12} {'change':>9}"]
+    for item in comparisons:
+        rows.append(f"{'!!' if item['regression'] else '':2} {item['target']:<18} {item['size']:>7} "
+                    f"{item['metric']:<12} {item['baseline']:>12.4f} {item['current']:>12.4f} "
+                    f"{item['change_pct']:>+8.1f}%")
+    return "\n".join(rows)
+
+def format_results(document: dict[str, Any]) -> str:
+    """
+    Πίνακας κειμένου με τα αποτελέσματα μιας εκτέλεσης.
+    """
+    rows = [f"{'target':<18} {'lines':>7} {'wall (s)':>10} {'cpu (s)':>10} {'RSS (MB)':>9} "
+            f"{'findings':>9} {'findings/s':>11}"]
+    for result in document["results"]:
+        if not result.get("ok") and "wall_time_s" not in result:
+            rows.append(f"{result['target']:<18} {result.get('size', result.get('lines')):>7} σφάλμα: {result.get('error')}")
+            continue
+        rows.append(f"{result['target']:<18} {result['size']:>7} {result['wall_time_s']:>10.4f} "
+                    f"{result['cpu_time_s']:>10.4f} {result['peak_rss_mb']:>9.1f} {result['findings']:>9} "
+                    f"{result['findings_per_s'] or 0:>11.1f}" + ("" if result["ok"] else "  (σφάλμα εργαλείου)"))
+    return "\n".join(rows)
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as results_file:
+        return json.load(results_file)
+
+# -------------------------------------
+# 5. Εκτέλεση από τη γραμμή εντολών.
+# -------------------------------------
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+def _name_list(value: str | None) -> list[str] | None:
+    return [part.strip() for part in value.split(",") if part.strip()] if value else None
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m sast.benchmark",
+        description="Offline μετρήσεις επιδόσεων (χρόνος, CPU, μνήμη, ευρήματα/s) των αναλυτών SAST.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Εκτέλεση των μετρήσεων και αποθήκευση σε JSON.")
+    run.add_argument("--targets", default=None,
+                     help="Στόχοι χωρισμένοι με κόμμα (εργαλεία του TOOL_RUNNERS, "
+                          f"{VISITOR_TARGET}, {ORCHESTRATION_TARGET}). Προεπιλογή: όλοι.")
+    run.add_argument("--tools", default=None,
+                     help=f"Εργαλεία του {ORCHESTRATION_TARGET} (προεπιλογή: τα εργαλεία του --targets).")
+    run.add_argument("--sizes", type=_int_list, default=list(DEFAULT_SIZES),
+                     help=f"Μεγέθη αρχείων σε γραμμές (προεπιλογή {','.join(map(str, DEFAULT_SIZES))}).")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Seed του corpus (προεπιλογή {DEFAULT_SEED}).")
+    run.add_argument("--repeat", type=int, default=3, help="Επαναλήψεις ανά μέτρηση (διάμεσος, προεπιλογή 3).")
+    run.add_argument("--warmup", type=int, default=0, help="Εκτελέσεις προθέρμανσης εκτός μέτρησης (προεπιλογή 0).")
+    run.add_argument("-o", "--output", default=None, help="Αρχείο JSON αποτελεσμάτων.")
+    run.add_argument("--baseline", default=None, metavar="JSON",
+                     help="Σύγκριση με προηγούμενη εκτέλεση (έξοδος 1 σε regression).")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                     help=f"Όριο regression σε % (προεπιλογή {DEFAULT_THRESHOLD_PCT:g}).")
+
+    compare = commands.add_parser("compare", help="Σύγκριση δύο αρχείων αποτελεσμάτων.")
+    compare.add_argument("baseline", help="JSON της προηγούμενης εκτέλεσης.")
+    compare.add_argument("current", help="JSON της νέας εκτέλεσης.")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                         help=f"Όριο regression σε % (προεπιλογή {DEFAULT_THRESHOLD_PCT:g}).")
+
+    corpus = commands.add_parser("corpus", help="Εγγραφή του παραγόμενου corpus σε φάκελο.")
+    corpus.add_argument("directory", help="Φάκελος εξόδου.")
+    corpus.add_argument("--sizes", type=_int_list, default=list(DEFAULT_SIZES), help="Μεγέθη αρχείων σε γραμμές.")
+    corpus.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed του corpus.")
+    return parser
+
+def _report_comparison(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> int:
+    comparisons = compare_results(baseline, current, threshold)
+    print(format_comparison(comparisons))
+    regressions = [item for item in comparisons if item["regression"]]
+    print(f"Regressions πάνω από {threshold:g}%: {len(regressions)} από {len(comparisons)} μετρικές.", file=sys.stderr)
+    return 1 if regressions else 0
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+    if args.command == "corpus":
+        for path in write_corpus(args.directory, args.sizes, args.seed):
+            print(path)
+        return 0
+    if args.command == "compare":
+        return _report_comparison(_load(args.baseline), _load(args.current), args.threshold)
+
+    try:
+        document = run_suite(_name_list(args.targets), args.sizes, args.seed, args.repeat, args.warmup,
+                             _name_list(args.tools))
+    except ValueError as exc:
+        print(f"Σφάλμα: {exc}", file=sys.stderr)
+        return 2
+    print(format_results(document))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(document, output_file, ensure_ascii=False, indent=2)
+    if args.baseline:
+        return _report_comparison(_load(args.baseline), document, args.threshold)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Χρονικά όρια (budgets) ανά εργαλείο και ανά σάρωση, ακύρωση εργαλείων και όρια πόρων θυγατρικών διεργασιών.
+
+Ο orchestrator δίνει σε κάθε εργαλείο προθεσμία ίση με το μικρότερο από το όριο του εργαλείου και
+το υπόλοιπο του ορίου της σάρωσης. Η προθεσμία μεταφέρεται μέσω contextvar στο νήμα που εκτελεί το
+εργαλείο, οπότε η run_subprocess_json (και το pool ζεστών workers) τερματίζει τη θυγατρική διεργασία
+μόλις αυτή λήξει: ολόκληρη την ομάδα διεργασιών (process group), ώστε να μη μένουν ορφανές διεργασίες
+(π.χ. οι workers της Semgrep). Ένα εργαλείο που έληξε επιστρέφει αποτέλεσμα με status "timeout" και η
+σάρωση συνεχίζει με τα υπόλοιπα, ως "partial". Προαιρετικά εφαρμόζονται όρια CPU/μνήμης (rlimits)
+στις θυγατρικές διεργασίες των εργαλείων CLI.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import time
+import signal
+import logging
+import functools
+import subprocess
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator
+
+try:
+    import resource                                 # Δεν υπάρχει στα Windows: χωρίς όρια πόρων.
+except ImportError:
+    resource = None
+
+logger = logging.getLogger("sast_tool")
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, default)))
+    except ValueError:
+        logger.warning("Μη έγκυρη τιμή για το %s, χρήση της προεπιλογής %s.", name, default)
+        return default
+
+# Προεπιλεγμένα όρια σε δευτερόλεπτα (0 = χωρίς όριο). Το όριο ενός εργαλείου ορίζεται και ξεχωριστά
+# με SAST_TIMEOUT_<ΕΡΓΑΛΕΙΟ> (π.χ. SAST_TIMEOUT_SEMGREP=300).
+DEFAULT_TOOL_TIMEOUT: float = _env_seconds("SAST_TOOL_TIMEOUT", 120.0)
+DEFAULT_SCAN_TIMEOUT: float = _env_seconds("SAST_SCAN_TIMEOUT", 300.0)
+
+# Όρια πόρων των θυγατρικών διεργασιών (0 = χωρίς όριο): χρόνος CPU σε δευτερόλεπτα και μνήμη σε MB.
+CHILD_CPU_LIMIT_S: int = int(_env_seconds("SAST_CHILD_CPU_LIMIT_S", 0))
+CHILD_MEMORY_LIMIT_MB: int = int(_env_seconds("SAST_CHILD_MEMORY_LIMIT_MB", 0))
+
+# Κατάσταση αποτελέσματος εργαλείου που τερματίστηκε λόγω ορίου χρόνου και κατάσταση σάρωσης
+# στην οποία τουλάχιστον ένα εργαλείο δεν ολοκληρώθηκε.
+TIMEOUT_STATUS: str = "timeout"
+PARTIAL_STATUS: str = "partial"
+
+# Προθεσμία (time.monotonic) του εργαλείου που εκτελείται στο τρέχον νήμα/context.
+_deadline: ContextVar[float | None] = ContextVar("sast_tool_deadline", default=None)
+
+class ToolTimeoutError(TimeoutError):
+    """
+    Το εργαλείο δεν ολοκληρώθηκε μέσα στο χρονικό του όριο και η εκτέλεσή του ακυρώθηκε.
+    """
+
+# ------------------------------------------------
+# 2. Ορισμός κλάσης για τα χρονικά όρια μιας σάρωσης.
+# ------------------------------------------------
+
+class Budget:
+    """
+    Χρονικά όρια μιας σάρωσης. Η μέτρηση του ορίου της σάρωσης ξεκινά με τη δημιουργία του αντικειμένου.
+    tool_timeouts: Προαιρετικό {εργαλείο: δευτερόλεπτα}. Για τα υπόλοιπα εργαλεία ισχύει το
+                   SAST_TIMEOUT_<ΕΡΓΑΛΕΙΟ> ή το tool_timeout.
+    tool_timeout: Όριο ανά εργαλείο (None = DEFAULT_TOOL_TIMEOUT, 0 = χωρίς όριο).
+    scan_timeout: Όριο όλης της σάρωσης (None = DEFAULT_SCAN_TIMEOUT, 0 = χωρίς όριο).
+    """
+    def __init__(self,
+                 tool_timeouts: dict[str, float] | None = None,
+                 tool_timeout: float | None = None,
+                 scan_timeout: float | None = None) -> None:
+        self.tool_timeouts = dict(tool_timeouts or {})
+        self.default_tool_timeout = DEFAULT_TOOL_TIMEOUT if tool_timeout is None else tool_timeout
+        self.scan_timeout = DEFAULT_SCAN_TIMEOUT if scan_timeout is None else scan_timeout
+        self.started = time.monotonic()
+
+    def tool_timeout(self, tool: str) -> float | None:
+        """
+        Το όριο (δευτερόλεπτα) ενός εργαλείου, χωρίς το όριο της σάρωσης. None αν δεν υπάρχει όριο.
+        """
+        if tool in self.tool_timeouts:
+            return self.tool_timeouts[tool] or None
+        return _env_seconds(f"SAST_TIMEOUT_{tool.upper()}", self.default_tool_timeout) or None
+
+    def scan_remaining(self) -> float | None:
+        """
+        Υπόλοιπος χρόνος (τουλάχιστον 0) μέχρι το όριο της σάρωσης ή None αν δεν υπάρχει όριο.
+        """
+        if not self.scan_timeout:
+            return None
+        return max(0.0, self.started + self.scan_timeout - time.monotonic())
+
+    def expired(self) -> bool:
+        """
+        True αν έχει λήξει το όριο της σάρωσης.
+        """
+        return self.scan_remaining() == 0.0
+
+    def timeout_for(self, tools: Iterable[str], files: int = 1) -> float | None:
+        """
+        Όριο για διαδοχική εκτέλεση των εργαλείων σε files αρχεία που ξεκινά τώρα (π.χ. μία εργασία
+        του pool ή μία παρτίδα του batch mode): το άθροισμα των ορίων τους επί files, με ανώτατο το
+        υπόλοιπο της σάρωσης. None αν δεν ισχύει κανένα όριο.
+        """
+        timeouts = [self.tool_timeout(tool) for tool in tools]
+        candidates = [sum(timeouts) * max(1, files)] if timeouts and None not in timeouts else []
+        remaining = self.scan_remaining()
+        if remaining is not None:
+            candidates.append(remaining)
+        return min(candidates) if candidates else None
+
+    def deadline_for(self, tool: str, files: int = 1) -> float | None:
+        """
+        Απόλυτη προθεσμία (time.monotonic) για εργαλείο που ξεκινά τώρα.
+        """
+        timeout = self.timeout_for([tool], files)
+        return None if timeout is None else time.monotonic() + timeout
+
+def set_default_timeouts(tool_timeout: float | None = None, scan_timeout: float | None = None) -> None:
+    """
+    Ορίζει τα προεπιλεγμένα όρια για την τρέχουσα διεργασία και για τις διεργασίες που θα ξεκινήσουν
+    από αυτήν (π.χ. workers του CLI), μέσω των SAST_TOOL_TIMEOUT/SAST_SCAN_TIMEOUT. None = χωρίς αλλαγή.
+    """
+    global DEFAULT_TOOL_TIMEOUT, DEFAULT_SCAN_TIMEOUT
+    if tool_timeout is not None:
+        DEFAULT_TOOL_TIMEOUT = max(0.0, tool_timeout)
+        os.environ["SAST_TOOL_TIMEOUT"] = str(DEFAULT_TOOL_TIMEOUT)
+    if scan_timeout is not None:
+        DEFAULT_SCAN_TIMEOUT = max(0.0, scan_timeout)
+        os.environ["SAST_SCAN_TIMEOUT"] = str(DEFAULT_SCAN_TIMEOUT)
+
+# ------------------------------------------------------------------
+# 3. Μεταφορά της προθεσμίας στο νήμα του εργαλείου και αποτελέσματα.
+# ------------------------------------------------------------------
+
+@contextmanager
+def tool_deadline(deadline: float | None) -> Iterator[None]:
+    """
+    Ορίζει την προθεσμία του εργαλείου που εκτελείται μέσα στο μπλοκ (στο τρέχον νήμα).
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def current_timeout() -> float | None:
+    """
+    Υπόλοιπος χρόνος (δευτερόλεπτα, τουλάχιστον 0) μέχρι την προθεσμία του τρέχοντος εργαλείου ή None.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+def timeout_result(tool_label: str, timeout: float | None = None, **extra: Any) -> dict[str, Any]:
+    """
+    Τυποποιημένο αποτέλεσμα εργαλείου που τερματίστηκε λόγω ορίου χρόνου.
+    """
+    limit = f" των {timeout:.3g}s" if timeout else ""
+    return {"ok": False,
+            "status": TIMEOUT_STATUS,
+            "error": f"Το εργαλείο {tool_label} ξεπέρασε το χρονικό όριο{limit} και η εκτέλεσή του ακυρώθηκε.",
+            "results": [],
+            **extra}
+
+def result_status(result: dict[str, Any]) -> str:
+    """
+    Κατάσταση αποτελέσματος εργαλείου: "ok", "error", "timeout" ή "partial" (π.χ. ευρήματα της
+    Semgrep όταν κάποιοι κανόνες έληξαν).
+    """
+    return result.get("status") or ("ok" if result.get("ok") else "error")
+
+def scan_status(results: Iterable[dict[str, Any]]) -> str:
+    """
+    Κατάσταση σάρωσης: "partial" αν κάποιο εργαλείο έληξε ή επέστρεψε μερικά αποτελέσματα, αλλιώς "complete".
+    """
+    statuses = {result_status(result) for result in results}
+    return PARTIAL_STATUS if statuses & {TIMEOUT_STATUS, PARTIAL_STATUS} else "complete"
+
+# ------------------------------------------------------------
+# 4. Όρια πόρων και τερματισμός θυγατρικών διεργασιών.
+# ------------------------------------------------------------
+
+def child_popen_kwargs() -> dict[str, Any]:
+    """
+    Επιπλέον ορίσματα Popen ώστε η θυγατρική διεργασία να ξεκινά νέα ομάδα διεργασιών, την οποία
+    τερματίζει η kill_process_group μαζί με όσες διεργασίες ξεκίνησε το εργαλείο. Σε POSIX, αν έχουν
+    οριστεί τα CHILD_CPU_LIMIT_S/CHILD_MEMORY_LIMIT_MB, τα όρια εφαρμόζονται στη θυγατρική διεργασία πριν
+    από το exec (preexec_fn), ώστε το εργαλείο να μην εκτελείται ούτε στιγμή χωρίς αυτά. Η υπέρβαση του
+    ορίου CPU τερματίζει τη διεργασία με SIGXCPU.
+    """
+    if os.name != "posix":
+        return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+    kwargs: dict[str, Any] = {"start_new_session": True}
+    limits = _child_rlimits()
+    if limits:
+        kwargs["preexec_fn"] = functools.partial(_set_rlimits, limits)
+    return kwargs
+
+def _child_rlimits() -> list[tuple[int, tuple[int, int]]]:
+    """
+    Τα rlimits [(πόρος, (soft, hard))] των CHILD_CPU_LIMIT_S/CHILD_MEMORY_LIMIT_MB, χωρίς να ξεπερνούν
+    το τρέχον hard όριο της διεργασίας (το οποίο μια μη προνομιούχος διεργασία δεν μπορεί να αυξήσει).
+    """
+    if resource is None or not (CHILD_CPU_LIMIT_S or CHILD_MEMORY_LIMIT_MB):
+        return []
+    wanted: list[tuple[int, int, int]] = []
+    if CHILD_CPU_LIMIT_S:
+        wanted.append((resource.RLIMIT_CPU, CHILD_CPU_LIMIT_S, CHILD_CPU_LIMIT_S + 1))
+    if CHILD_MEMORY_LIMIT_MB:
+        limit = CHILD_MEMORY_LIMIT_MB * 1024 * 1024
+        wanted.append((resource.RLIMIT_AS, limit, limit))
+    limits = []
+    for which, soft, hard in wanted:
+        _current_soft, current_hard = resource.getrlimit(which)
+        if current_hard != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current_hard), min(hard, current_hard)
+        limits.append((which, (soft, hard)))
+    return limits
+
+def _set_rlimits(limits: list[tuple[int, tuple[int, int]]]) -> None:
+    # Εκτελείται στη θυγατρική διεργασία μεταξύ fork και exec: μόνο κλήσεις setrlimit, χωρίς logging
+    # ή κλειδώματα, ώστε να είναι ασφαλής και όταν η γονική διεργασία έχει πολλά νήματα.
+    for which, limit in limits:
+        resource.setrlimit(which, limit)
+
+def kill_process_group(process: subprocess.Popen) -> None:
+    """
+    Τερματίζει βίαια τη θυγατρική διεργασία και (σε POSIX) όλη την ομάδα διεργασιών της.
+    """
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+
+def describe_signal_exit(returncode: int) -> str | None:
+    """
+    Περιγραφή για κωδικό εξόδου που αντιστοιχεί σε τερματισμό από σήμα (αρνητικός σε POSIX), π.χ.
+    από το όριο CPU (SIGXCPU) ή από τον OOM killer (SIGKILL). None για κανονική έξοδο.
+    """
+    if returncode >= 0:
+        return None
+    try:
+        name = signal.Signals(-returncode).name
+    except ValueError:
+        name = str(-returncode)
+    if getattr(signal, "SIGXCPU", None) is not None and -returncode == signal.SIGXCPU:
+        return f"τερματίστηκε από το σήμα {name} (όριο χρόνου CPU {CHILD_CPU_LIMIT_S}s)"
+    return f"τερματίστηκε από το σήμα {name}"
@@ -0,0 +1,288 @@
+"""
+Μόνιμη (on-disk) cache αποτελεσμάτων ανά εργαλείο, με κλειδί βάσει περιεχομένου (content-addressed).
+
+Το κλειδί κάθε εγγραφής είναι το SHA-256 του πηγαίου κώδικα, του ονόματος του εργαλείου, της έκδοσής
+του και των ενεργών ρυθμίσεών του (π.χ. λίστα --config της Semgrep, flags της Pylint). Έτσι η ίδια
+είσοδος με τις ίδιες ρυθμίσεις δεν ξανατρέχει το εξωτερικό εργαλείο. Το μέγεθος της cache είναι
+περιορισμένο και η εκκαθάριση γίνεται με πολιτική LRU (least recently used).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict                 # Για τη διατήρηση της σειράς χρήσης (LRU).
+from functools import lru_cache
+from importlib import metadata                      # Για ανάγνωση της έκδοσης των εγκατεστημένων εργαλείων.
+from typing import Any, Callable
+
+from sast import analyzers, findings, inprocess, rules, semgrep_rules, traversal
+from sast.findings import findings_from_rows, findings_to_rows
+
+logger = logging.getLogger("sast_tool")
+
+# Προεπιλεγμένη τοποθεσία και μέγιστο μέγεθος της cache (ρυθμίζονται και από μεταβλητές περιβάλλοντος).
+DEFAULT_CACHE_DIR: str = os.getenv("SAST_CACHE_DIR",
+                                   os.path.join(os.path.expanduser("~"), ".cache", "sast_tool"))
+DEFAULT_CACHE_MAX_BYTES: int = int(os.getenv("SAST_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Όνομα πακέτου (distribution) ανά εργαλείο, για τον εντοπισμό της έκδοσής του.
+TOOL_DISTRIBUTIONS: dict[str, str | None] = {
+    "bandit": "bandit",
+    "semgrep": "semgrep",
+    "pylint": "pylint",
+    "radon": "radon",
+    "custom_ast": None}
+
+# -----------------------------------------------------------------
+# 2. Βοηθητικές συναρτήσεις για την έκδοση και τις ρυθμίσεις εργαλείων.
+# -----------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _analyzers_fingerprint() -> str:
+    """
+    Επιστρέφει hash του πηγαίου κώδικα των sast.analyzers, sast.findings, sast.inprocess, sast.rules,
+    sast.traversal και sast.semgrep_rules. Οποιαδήποτε αλλαγή στους κανόνες του SecurityVisitor, στη
+    διάσχιση του AST, στη συγχώνευση/προεπιλογή των κανόνων της Semgrep ή στην κανονικοποίηση των
+    αποτελεσμάτων ακυρώνει αυτόματα τις παλιές εγγραφές.
+    """
+    digest = hashlib.sha256()
+    for module in (analyzers, findings, inprocess, rules, traversal, semgrep_rules):
+        with open(module.__file__, "rb") as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()[:16]
+
+@lru_cache(maxsize=None)
+def _distribution_version(tool: str) -> str:
+    """
+    Η έκδοση του πακέτου του εργαλείου, "builtin" για τους εσωτερικούς αναλυτές ή "unknown".
+    """
+    distribution = TOOL_DISTRIBUTIONS.get(tool)
+    if not distribution:
+        return "builtin"
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def tool_version(tool: str) -> str:
+    """
+    Επιστρέφει την έκδοση του εργαλείου (π.χ. "bandit 1.9.2") μαζί με το fingerprint των αναλυτών.
+    Για τη Semgrep προστίθεται το hash του περιεχομένου των τοπικών (vendored) κανόνων, ώστε ένα νέο
+    vendor να ακυρώνει τις παλιές εγγραφές. Αν το εργαλείο δεν είναι εγκατεστημένο ως πακέτο Python,
+    η έκδοση είναι "unknown".
+    """
+    fingerprint = _analyzers_fingerprint()
+    if tool == "semgrep":
+        fingerprint += "+" + semgrep_rules.vendored_rules_digest(analyzers.SEMGREP_CONFIGS)
+    return f"{tool} {_distribution_version(tool)} ({fingerprint})"
+
+def tool_config(tool: str) -> dict[str, Any]:
+    """
+    Επιστρέφει τις ενεργές ρυθμίσεις του εργαλείου, όπως χρησιμοποιούνται από τις run_* συναρτήσεις.
+    """
+    configs: dict[str, dict[str, Any]] = {
+        "bandit": {"args": analyzers.BANDIT_ARGS},
+        "semgrep": {"configs": semgrep_rules.rules_identity(analyzers.SEMGREP_CONFIGS)},
+        "pylint": {"args": analyzers.PYLINT_ARGS},
+        "radon": {"mi_multi": False},
+        "custom_ast": {"secret_keywords": rules.SUSPECT_SECRET_KEYWORDS,
+                       "logging_functions": rules.LOGGING_FUNCTION_NAMES,
+                       "rules": [rule.rule_id for rule in rules.DEFAULT_RULE_ENGINE.rules]}}
+    return configs.get(tool, {})
+
+def make_cache_key(code: str, tool: str, backend: str | None = None) -> str:
+    """
+    Υπολογίζει το κλειδί της cache (SHA-256) από τον κώδικα, το εργαλείο, την έκδοση και τις ρυθμίσεις του.
+    backend: Για τα Bandit/Pylint, ο runner που εκτέλεσε (ή θα εκτελέσει) το εργαλείο ("inprocess" ή
+             "subprocess"), ώστε τα αποτελέσματα του CLI και της βιβλιοθήκης να μη μπερδεύονται. Αν
+             λείπει, χρησιμοποιείται αυτός που θα επιλέξει η run_* συνάρτηση για τον κώδικα.
+    """
+    config = tool_config(tool)
+    if tool in inprocess.INPROCESS_TOOLS:
+        config = {**config, "backend": backend or inprocess.expected_backend(tool, code)}
+    digest = hashlib.sha256()
+    digest.update(tool_version(tool).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(code.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+# -------------------------------------------------------------
+# 3. Ορισμός κλάσης για την on-disk cache με εκκαθάριση τύπου LRU.
+# -------------------------------------------------------------
+
+class ResultCache:
+    """
+    Cache αποτελεσμάτων των run_* συναρτήσεων σε φάκελο του δίσκου.
+    Κάθε εγγραφή αποθηκεύεται ως αρχείο JSON <cache_dir>/<key[:2]>/<key>.json. Ο χρόνος
+    τελευταίας χρήσης κάθε αρχείου (mtime) ενημερώνεται σε κάθε hit, ώστε η σειρά LRU να
+    διατηρείται και μεταξύ διαφορετικών εκτελέσεων του εργαλείου.
+    max_bytes: Μέγιστο συνολικό μέγεθος των εγγραφών. Όταν ξεπεραστεί, διαγράφονται οι
+               λιγότερο πρόσφατα χρησιμοποιημένες εγγραφές.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0                                               # Μετρητής επιτυχημένων αναζητήσεων.
+        self.misses = 0                                             # Μετρητής αποτυχημένων αναζητήσεων.
+        self._lock = threading.Lock()                               # Η cache χρησιμοποιείται από πολλά νήματα του orchestrator.
+        self._entries: OrderedDict[str, int] = OrderedDict()        # key -> μέγεθος αρχείου, από το παλαιότερο στο νεότερο.
+        self._total_bytes = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load_index(self) -> None:
+        """
+        Φορτώνει τις υπάρχουσες εγγραφές του φακέλου ταξινομημένες κατά χρόνο τελευταίας χρήσης.
+        """
+        found: list[tuple[float, str, int]] = []
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+        for _mtime, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Επιστρέφει το αποθηκευμένο αποτέλεσμα για το κλειδί ή None αν δεν υπάρχει (miss).
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                result = json.load(cache_file)
+            result["results"] = findings_from_rows(result.get("results") or [])
+            os.utime(path)                                          # Ενημέρωση χρόνου τελευταίας χρήσης (LRU).
+        except (OSError, ValueError, TypeError, AttributeError):      # Και αλλοιωμένες εγγραφές (JSONDecodeError).
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:                                                   # Εγγραφή που προστέθηκε από άλλη διεργασία.
+                size = os.path.getsize(path)
+                self._entries[key] = size
+                self._total_bytes += size
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """
+        Αποθηκεύει ατομικά (μέσω προσωρινού αρχείου και os.replace) το αποτέλεσμα και εκκαθαρίζει
+        τις παλαιότερες εγγραφές αν ξεπεραστεί το max_bytes.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Τα Finding αποθηκεύονται στη συμπαγή μορφή γραμμών (μία λίστα τιμών ανά εύρημα). Οι μετρήσεις
+        # πόρων ("resources") αφορούν τη συγκεκριμένη εκτέλεση, οπότε ένα hit επιστρέφεται χωρίς αυτές.
+        stored = {key: value for key, value in result.items() if key != "resources"}
+        stored["results"] = findings_to_rows(result.get("results") or [])
+        payload = json.dumps(stored, ensure_ascii=False, default=str).encode("utf-8")
+        if len(payload) > self.max_bytes:                           # Αποτέλεσμα μεγαλύτερο από όλη την cache δεν αποθηκεύεται.
+            return
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(payload)
+            os.replace(temp_path, path)
+        except OSError:
+            logger.warning("Αποτυχία εγγραφής στην cache αποτελεσμάτων: %s", path)
+            return
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(payload)
+            self._total_bytes += len(payload)
+            self._evict()
+
+    def _forget(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """
+        Διαγράφει τις λιγότερο πρόσφατα χρησιμοποιημένες εγγραφές μέχρι το μέγεθος να πέσει κάτω από το όριο.
+        """
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def run_cached(self, tool: str, code: str, runner: Callable[[str], dict[str, Any]]) -> dict[str, Any]:
+        """
+        Επιστρέφει το αποτέλεσμα του εργαλείου από την cache ή εκτελεί τη runner(code) και το αποθηκεύει.
+        Αποθηκεύονται μόνο επιτυχημένες και πλήρεις εκτελέσεις, ώστε τα προσωρινά σφάλματα (π.χ.
+        εργαλείο που δεν βρέθηκε ή έληξε) και τα μερικά αποτελέσματα να μην "κολλάνε" στην cache.
+        """
+        key = make_cache_key(code, tool)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        result = runner(code)
+        if result.get("ok") and result.get("status", "ok") == "ok":
+            # Αποθήκευση με το backend που εκτέλεσε πράγματι το εργαλείο (π.χ. το CLI μετά από αποτυχία in-process).
+            backend = (result.get("resources") or {}).get("backend")
+            self.put(make_cache_key(code, tool, backend) if backend else key, result)
+        return result
+
+    def stats(self) -> dict[str, int]:
+        """
+        Επιστρέφει τους μετρητές hit/miss και το τρέχον μέγεθος της cache.
+        """
+        with self._lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "entries": len(self._entries),
+                    "bytes": self._total_bytes}
+
+    def clear(self) -> None:
+        """
+        Διαγράφει όλες τις εγγραφές της cache και μηδενίζει τους μετρητές.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+# Κοινή (lazy) cache της διεργασίας, ώστε όλα τα σημεία εισόδου να μοιράζονται τους ίδιους μετρητές.
+_default_cache: ResultCache | None = None
+_default_cache_lock = threading.Lock()
+
+def get_default_cache() -> ResultCache:
+    """
+    Επιστρέφει την κοινή cache αποτελεσμάτων της διεργασίας (DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_BYTES).
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
@@ -0,0 +1,375 @@
+"""
+Headless σημείο εισόδου (CLI) για σάρωση ολόκληρων φακέλων/αποθετηρίων χωρίς το Streamlit.
+
+Διατρέχει τον φάκελο, εφαρμόζει τα include/exclude globs και μοιράζει τη σάρωση ανά αρχείο
+(run_* συναρτήσεις και SecurityVisitor) σε ένα pool διεργασιών ίσο με τους πυρήνες του συστήματος.
+Όλα τα αποτελέσματα γράφονται σε ένα ενιαίο JSON, ενώ στο τέλος εμφανίζεται ο συνολικός χρόνος
+και ο ρυθμός σάρωσης (αρχεία/δευτερόλεπτο). Με χρονικά όρια (--tool-timeout, --scan-timeout) τα
+εργαλεία/αρχεία που δεν ολοκληρώθηκαν αναφέρονται ως "timeout" και η σάρωση ως "partial".
+
+Παράδειγμα:
+    python -m sast /path/to/repo --tools custom_ast,radon --exclude "tests/*" -o results.json
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor          # Για παράλληλη σάρωση αρχείων σε πολλούς πυρήνες.
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from sast.orchestrator import TOOL_RUNNERS, TOOL_LABELS, DEFAULT_TOOLS
+from sast.discovery import DEFAULT_EXCLUDE, discover_files
+from sast.cache import get_default_cache, tool_version
+from sast.findings import json_default
+from sast.export import export_findings, iter_report_findings
+from sast.batch import BATCH_TOOLS, DEFAULT_BATCH_SIZE, run_tools_batched
+from sast.incremental import GitError, scan_incremental
+from sast.workers import DEFAULT_WARM_WORKERS, WarmWorkerPool
+from sast.history import DEFAULT_HISTORY_PATH, HISTORY_ENABLED, FindingsHistory
+from sast.metrics import METRICS_FILE, set_metrics_file
+from sast.pipeline import (FindingsSink,
+                           HistorySink,
+                           ReportSink,
+                           analyze_source,
+                           file_hash,
+                           read_source,
+                           skipped_results,
+                           stream_scan)
+from sast.budget import (DEFAULT_TOOL_TIMEOUT,
+                         TIMEOUT_STATUS,
+                         Budget,
+                         ToolTimeoutError,
+                         result_status,
+                         scan_status,
+                         set_default_timeouts,
+                         timeout_result)
+
+logger = logging.getLogger("sast_tool")
+
+# ---------------------------------------------------------------
+# 2. Σάρωση ενός αρχείου (εκτελείται μέσα σε κάθε worker διεργασία).
+# ---------------------------------------------------------------
+
+def scan_file(root: str,
+              rel_path: str,
+              tools: list[str],
+              use_cache: bool = True,
+              deadline: float | None = None) -> tuple[str, dict[str, Any]]:
+    """
+    Διαβάζει ένα αρχείο και εκτελεί διαδοχικά τα επιλεγμένα εργαλεία. Ο παραλληλισμός γίνεται
+    σε επίπεδο αρχείων (ProcessPoolExecutor), οπότε εδώ αρκεί σειριακή εκτέλεση.
+    deadline: Προαιρετική προθεσμία της σάρωσης (time.time()). Μετά από αυτήν το αρχείο δεν σαρώνεται
+              και τα εργαλεία του επιστρέφονται ως "timeout", ενώ πριν από αυτήν περιορίζει τα όρια των εργαλείων.
+    Επιστρέφει tuple (σχετική διαδρομή, {εργαλείο: αποτέλεσμα}).
+    """
+    if deadline is not None and deadline <= time.time():
+        return rel_path, skipped_results(tools, None)
+    code, error = read_source(root, rel_path)
+    if code is None:
+        return rel_path, {tool: error for tool in tools}
+    return analyze_source(rel_path, code, tools, use_cache, deadline)  # Ένα parse ανά αρχείο για όλους τους in-process αναλυτές.
+
+def _scan_file_star(args: tuple[str, str, list[str], bool, float | None]) -> tuple[str, dict[str, Any]]:
+    return scan_file(*args)
+
+# ------------------------------------------------------------
+# 3. Σάρωση ολόκληρου φακέλου με pool διεργασιών.
+# ------------------------------------------------------------
+
+def scan_directory(root: str,
+                   tools: list[str] | None = None,
+                   include: list[str] | None = None,
+                   exclude: list[str] | None = None,
+                   jobs: int | None = None,
+                   use_cache: bool = True,
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   pool: WarmWorkerPool | None = None,
+                   budget: Budget | None = None) -> dict[str, Any]:
+    """
+    Σαρώνει όλα τα αρχεία του φακέλου root και επιστρέφει ένα ενιαίο λεξικό (dict) αποτελεσμάτων:
+    {"root": ..., "tools": [...], "status": "complete" | "partial",
+     "files": {διαδρομή: {εργαλείο: αποτέλεσμα}}, "stats": {...}}
+    jobs: Πλήθος worker διεργασιών (προεπιλογή: πλήθος πυρήνων).
+    batch_size: Πλήθος αρχείων ανά κλήση των Bandit/Semgrep/Pylint (batch mode). Με 0 τα
+                εργαλεία αυτά εκτελούνται ξεχωριστά για κάθε αρχείο μέσα στο pool διεργασιών.
+    pool: Προαιρετικό pool ζεστών workers. Αν δοθεί, οι σαρώσεις ανά αρχείο υποβάλλονται σε αυτό
+          αντί για νέο ProcessPoolExecutor και τα εργαλεία του pool.tools δεν εκτελούνται σε batch mode.
+    budget: Προαιρετικά χρονικά όρια (προεπιλογή: τα όρια ανά εργαλείο του περιβάλλοντος, χωρίς όριο
+            σάρωσης). Μετά τη λήξη του ορίου της σάρωσης τα υπόλοιπα αρχεία δεν σαρώνονται.
+    """
+    tools = tools or DEFAULT_TOOLS
+    unknown = [tool for tool in tools if tool not in TOOL_RUNNERS]
+    if unknown:
+        raise ValueError(f"Άγνωστα εργαλεία ανάλυσης: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    budget = budget or Budget(scan_timeout=0)
+    remaining = budget.scan_remaining()
+    deadline = time.time() + remaining if remaining is not None else None    # Κοινό ρολόι με τις worker διεργασίες.
+    rel_paths = list(discover_files(root, include, exclude))
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    # Τα εργαλεία CLI εκτελούνται σε batch mode (λίγες διεργασίες για όλα τα αρχεία), ενώ τα
+    # in-process εργαλεία (Custom AST, Radon) μοιράζονται ανά αρχείο στο pool διεργασιών.
+    batch_tools = [tool for tool in tools if tool in BATCH_TOOLS] if batch_size > 0 else []
+    if pool is not None:                                    # Οι ζεστοί workers είναι ταχύτεροι από μία διεργασία ανά παρτίδα.
+        batch_tools = [tool for tool in batch_tools if tool not in pool.tools]
+        jobs = pool.workers
+    pool_tools = [tool for tool in tools if tool not in batch_tools]
+
+    files: dict[str, Any] = {rel_path: {} for rel_path in rel_paths}
+    tasks = [(root, rel_path, pool_tools, use_cache, deadline) for rel_path in rel_paths] if pool_tools else []
+    if pool is not None:
+        futures = {}
+        for _root, rel_path, task_tools, _use_cache, _deadline in tasks:
+            code, error = read_source(root, rel_path)
+            if code is None:
+                files[rel_path].update({tool: error for tool in task_tools})
+            else:
+                futures[rel_path] = pool.submit(code, task_tools, filename=rel_path, use_cache=use_cache,
+                                                timeout=budget.timeout_for(task_tools))
+        for rel_path, future in futures.items():
+            try:
+                files[rel_path].update(future.result(timeout=budget.scan_remaining()))
+            except ToolTimeoutError:                        # Ο worker ξεπέρασε το όριο της εργασίας και τερματίστηκε.
+                files[rel_path].update({tool: timeout_result(TOOL_LABELS[tool], budget.tool_timeout(tool))
+                                        for tool in pool_tools})
+            except FutureTimeoutError:                      # Έληξε το όριο της σάρωσης: οι εργασίες σε αναμονή ακυρώνονται.
+                future.cancel()
+                files[rel_path].update(skipped_results(pool_tools, budget.scan_timeout))
+            except Exception as exc:                        # Π.χ. τερματισμός του worker (WorkerCrashedError).
+                error = {"ok": False, "error": f"Σφάλμα του worker για το αρχείο {rel_path}: {exc}", "results": []}
+                files[rel_path].update({tool: error for tool in pool_tools})
+    elif jobs == 1 or len(tasks) <= 1:
+        for task in tasks:                                  # Αποφυγή κόστους εκκίνησης pool για μικρό φόρτο.
+            rel_path, file_results = _scan_file_star(task)
+            files[rel_path].update(file_results)
+    else:
+        chunksize = max(1, len(tasks) // (jobs * 4))        # Μικρά πακέτα εργασιών για καλύτερη κατανομή φόρτου.
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for rel_path, file_results in executor.map(_scan_file_star, tasks, chunksize=chunksize):
+                files[rel_path].update(file_results)
+
+    if batch_tools:
+        cache = get_default_cache() if use_cache else None
+        for start in range(0, len(rel_paths), batch_size):
+            if budget.expired():
+                for rel_path in rel_paths[start:]:
+                    files[rel_path].update(skipped_results(batch_tools, budget.scan_timeout))
+                break
+            sources: dict[str, str] = {}
+            for rel_path in rel_paths[start:start + batch_size]:
+                code, error = read_source(root, rel_path)
+                if code is None:
+                    files[rel_path].update({tool: error for tool in batch_tools})
+                else:
+                    sources[rel_path] = code
+            for rel_path, file_results in run_tools_batched(sources, batch_tools, batch_size, cache, budget).items():
+                files[rel_path].update(file_results)
+
+    # Διατήρηση της σειράς των εργαλείων όπως ζητήθηκαν, ανεξάρτητα από τον τρόπο εκτέλεσής τους.
+    files = {rel_path: {tool: file_results[tool] for tool in tools if tool in file_results}
+             for rel_path, file_results in files.items()}
+    elapsed = time.perf_counter() - started
+    findings = sum(len(result.get("results") or []) for file_results in files.values()
+                   for result in file_results.values())
+    errors = sum(1 for file_results in files.values() for result in file_results.values() if not result.get("ok"))
+    timeouts = sum(1 for file_results in files.values() for result in file_results.values()
+                   if result_status(result) == TIMEOUT_STATUS)
+    return {
+        "root": os.path.abspath(root),
+        "tools": tools,
+        "status": scan_status(result for file_results in files.values() for result in file_results.values()),
+        "files": files,
+        "stats": {
+            "files": len(files),
+            "findings": findings,
+            "errors": errors,
+            "timeouts": timeouts,
+            "jobs": jobs,
+            "wall_time_s": round(elapsed, 3),
+            "files_per_s": round(len(files) / elapsed, 2) if elapsed > 0 else None}}
+
+# -----------------------------------
+# 4. Ορισμός παραμέτρων γραμμής εντολών.
+# -----------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m sast",
+        description="Headless σάρωση φακέλου/αποθετηρίου με το AST-based εργαλείο SAST.")
+    parser.add_argument("root", help="Φάκελος προς σάρωση.")
+    parser.add_argument("--tools", default=",".join(DEFAULT_TOOLS),
+                        help=f"Εργαλεία χωρισμένα με κόμμα ({', '.join(TOOL_RUNNERS)}). "
+                             f"Προεπιλογή: {','.join(DEFAULT_TOOLS)}.")
+    parser.add_argument("--include", action="append", default=None, metavar="GLOB",
+                        help="Glob αρχείων προς σάρωση (επαναλαμβανόμενο). Προεπιλογή: *.py")
+    parser.add_argument("--exclude", action="append", default=None, metavar="GLOB",
+                        help="Glob αρχείων/φακέλων προς εξαίρεση (επαναλαμβανόμενο).")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Πλήθος worker διεργασιών (προεπιλογή: πλήθος πυρήνων).")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Αρχείο εξόδου JSON (προεπιλογή: stdout).")
+    parser.add_argument("--sarif", default=None, metavar="PATH",
+                        help="Επιπλέον εξαγωγή όλων των ευρημάτων σε SARIF 2.1.0 (π.χ. για code scanning).")
+    parser.add_argument("--jsonl", default=None, metavar="PATH",
+                        help="Επιπλέον εξαγωγή όλων των ευρημάτων σε JSON Lines (ένα εύρημα ανά γραμμή).")
+    parser.add_argument("--stream", action="store_true",
+                        help="Σάρωση με ροή για πολύ μεγάλα αποθετήρια: τα αποτελέσματα κάθε αρχείου γράφονται "
+                             "στις εξόδους (-o, --sarif, --jsonl) και στο ιστορικό μόλις ολοκληρωθεί, ώστε η "
+                             "μνήμη να εξαρτάται από το πλήθος των workers και όχι των αρχείων.")
+    parser.add_argument("--max-in-flight", type=int, default=None, metavar="N",
+                        help="Μέγιστο πλήθος αρχείων σε ανάλυση ταυτόχρονα με --stream "
+                             "(προεπιλογή: SAST_PIPELINE_IN_FLIGHT ή 2 × workers).")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Αρχεία ανά κλήση Bandit/Semgrep/Pylint (0 = μία κλήση ανά αρχείο). "
+                             f"Προεπιλογή: {DEFAULT_BATCH_SIZE}.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Απενεργοποίηση της cache αποτελεσμάτων.")
+    parser.add_argument("--warm-pool", action="store_true",
+                        help="Σάρωση μέσω pool ζεστών workers (-j workers, προεπιλογή "
+                             f"{DEFAULT_WARM_WORKERS}), με τα Bandit/Pylint προφορτωμένα.")
+    parser.add_argument("--diff", default=None, metavar="BASE[..HEAD]",
+                        help="Incremental σάρωση μόνο των αρχείων που άλλαξαν μεταξύ BASE και HEAD "
+                             "(προεπιλογή HEAD) στο αποθετήριο git του root.")
+    parser.add_argument("--baseline", default=None, metavar="JSON",
+                        help="Αποτελέσματα προηγούμενης σάρωσης του BASE, με τα οποία συγχωνεύονται "
+                             "τα αρχεία που δεν άλλαξαν (μόνο με --diff).")
+    parser.add_argument("--history-db", default=DEFAULT_HISTORY_PATH, metavar="SQLITE",
+                        help="Βάση SQLite για το ιστορικό σαρώσεων (ερωτήματα με python -m sast.history).")
+    parser.add_argument("--no-history", action="store_true", default=not HISTORY_ENABLED,
+                        help="Χωρίς καταγραφή της σάρωσης στο ιστορικό.")
+    parser.add_argument("--metrics-file", default=METRICS_FILE or None, metavar="PATH",
+                        help="Προσθήκη των μετρήσεων (χρόνος, CPU, μνήμη) κάθε εργαλείου σε αρχείο "
+                             "μορφής Prometheus (προεπιλογή: SAST_METRICS_FILE).")
+    parser.add_argument("--tool-timeout", type=float, default=DEFAULT_TOOL_TIMEOUT, metavar="SECONDS",
+                        help="Όριο χρόνου ανά εργαλείο και αρχείο (0 = χωρίς όριο). "
+                             f"Προεπιλογή: SAST_TOOL_TIMEOUT ({DEFAULT_TOOL_TIMEOUT:g}s).")
+    parser.add_argument("--scan-timeout", type=float, default=0, metavar="SECONDS",
+                        help="Όριο χρόνου όλης της σάρωσης (προεπιλογή 0 = χωρίς όριο). Τα αρχεία που "
+                             "δεν σαρώθηκαν εγκαίρως αναφέρονται ως \"timeout\" και η σάρωση ως \"partial\".")
+    return parser
+
+def _file_hashes(root: str, rel_paths: list[str]) -> dict[str, str]:
+    """
+    SHA-256 του περιεχομένου κάθε αρχείου, για την καταγραφή της σάρωσης στο ιστορικό.
+    """
+    hashes = {rel_path: file_hash(root, rel_path) for rel_path in rel_paths}
+    return {rel_path: digest for rel_path, digest in hashes.items() if digest is not None}
+
+def record_history(report: dict[str, Any], history: FindingsHistory, hash_files: bool = True) -> int:
+    """
+    Καταγράφει το αποτέλεσμα της scan_directory/scan_incremental στο ιστορικό σαρώσεων.
+    hash_files: Υπολογισμός του hash των αρχείων από το δίσκο (όχι σε incremental σαρώσεις
+                revisions, όπου το working tree μπορεί να διαφέρει από το HEAD).
+    """
+    files = report["files"]
+    return history.record_scan(files, report["tools"], source="cli", root=report["root"],
+                               file_hashes=_file_hashes(report["root"], list(files)) if hash_files else None,
+                               tool_versions={tool: tool_version(tool) for tool in report["tools"]},
+                               timings={"wall_time_s": report["stats"]["wall_time_s"]},
+                               wall_time_s=report["stats"]["wall_time_s"])
+
+def stream_to_outputs(args: argparse.Namespace, tools: list[str], exclude: list[str] | None) -> dict[str, Any]:
+    """
+    Σάρωση με ροή (--stream): η αναφορά JSON, οι εξαγωγές SARIF/JSON Lines και το ιστορικό γράφονται
+    αρχείο προς αρχείο από τη stream_scan. Επιστρέφει την αναφορά χωρίς το "files".
+    """
+    with ExitStack() as stack:
+        output = sys.stdout if args.output == "-" else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        sinks: list[Any] = [ReportSink(output)]
+        for fmt, path in (("sarif", args.sarif), ("jsonl", args.jsonl)):
+            if path:
+                sinks.append(FindingsSink(stack.enter_context(open(path, "w", encoding="utf-8")), fmt))
+        if not args.no_history:
+            sinks.append(HistorySink(FindingsHistory(args.history_db)))
+        return stream_scan(args.root, sinks, tools=tools, include=args.include, exclude=exclude,
+                           jobs=args.jobs, use_cache=not args.no_cache, batch_size=args.batch_size,
+                           budget=Budget(scan_timeout=args.scan_timeout), max_in_flight=args.max_in_flight)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Σημείο εισόδου του CLI. Επιστρέφει τον κωδικό εξόδου της διεργασίας.
+    """
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        parser.error(f"Ο φάκελος '{args.root}' δεν υπάρχει.")
+    set_metrics_file(args.metrics_file)             # Πριν ξεκινήσουν οι workers, ώστε να το κληρονομήσουν.
+    set_default_timeouts(tool_timeout=args.tool_timeout)
+    tools = [tool.strip() for tool in args.tools.split(",") if tool.strip()]
+    exclude = DEFAULT_EXCLUDE + args.exclude if args.exclude else None
+    if args.baseline and not args.diff:
+        parser.error("Η επιλογή --baseline απαιτεί και την --diff.")
+    if args.stream and (args.diff or args.warm_pool):
+        parser.error("Η επιλογή --stream δεν συνδυάζεται με τις --diff και --warm-pool.")
+    try:
+        if args.diff:
+            base, _sep, head = args.diff.partition("..")
+            baseline = None
+            if args.baseline:
+                with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+                    baseline = json.load(baseline_file)
+            report = scan_incremental(args.root, base, head or "HEAD", baseline=baseline, tools=tools,
+                                      include=args.include, exclude=exclude,
+                                      use_cache=not args.no_cache, batch_size=args.batch_size)
+        elif args.stream:
+            report = stream_to_outputs(args, tools, exclude)
+        else:
+            pool = WarmWorkerPool(workers=args.jobs or DEFAULT_WARM_WORKERS) if args.warm_pool else None
+            try:
+                report = scan_directory(args.root, tools=tools, include=args.include, exclude=exclude,
+                                        jobs=args.jobs, use_cache=not args.no_cache,
+                                        batch_size=args.batch_size, pool=pool,
+                                        budget=Budget(scan_timeout=args.scan_timeout))
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+    except (ValueError, OSError, GitError) as exc:
+        parser.error(str(exc))
+
+    if not args.stream:                             # Με --stream οι έξοδοι έχουν ήδη γραφτεί σταδιακά.
+        if not args.no_history:
+            try:
+                record_history(report, FindingsHistory(args.history_db), hash_files=not args.diff)
+            except (sqlite3.Error, OSError) as exc:            # Το ιστορικό δεν πρέπει να αποτυγχάνει τη σάρωση.
+                logger.warning("Αποτυχία καταγραφής της σάρωσης στο ιστορικό %s: %s", args.history_db, exc)
+
+        if args.output == "-":
+            json.dump(report, sys.stdout, ensure_ascii=False, indent=2, default=json_default)
+            sys.stdout.write("\n")
+        else:
+            with open(args.output, "w", encoding="utf-8") as output_file:
+                json.dump(report, output_file, ensure_ascii=False, indent=2, default=json_default)
+        for fmt, path in (("sarif", args.sarif), ("jsonl", args.jsonl)):
+            if path:
+                export_findings(iter_report_findings(report["files"]), path, fmt,
+                                tool_versions={tool: tool_version(tool) for tool in report["tools"]})
+
+    stats = report["stats"]
+    if args.diff:
+        print(f"Incremental σάρωση: {stats['rescanned_files']} από {stats['changed_files']} αλλαγμένα αρχεία "
+              f"σε {stats['wall_time_s']:.2f}s (επαναχρησιμοποιήθηκαν {stats['reused_units']} και αναλύθηκαν "
+              f"ξανά {stats['reanalyzed_units']} συναρτήσεις/κλάσεις), ευρήματα: {stats['findings']}, "
+              f"σφάλματα: {stats['errors']}.", file=sys.stderr)
+        return 0
+    print(f"Σαρώθηκαν {stats['files']} αρχεία σε {stats['wall_time_s']:.2f}s "
+          f"({stats['files_per_s'] or 0:.1f} αρχεία/s, {stats['jobs']} workers), "
+          f"ευρήματα: {stats['findings']}, σφάλματα: {stats['errors']}.", file=sys.stderr)
+    if report["status"] != "complete":
+        print(f"Μερικά αποτελέσματα: {stats['timeouts']} εκτελέσεις εργαλείων ξεπέρασαν το χρονικό όριο.",
+              file=sys.stderr)
+    return 0
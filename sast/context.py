@@ -0,0 +1,86 @@
+"""
+Κοινό πλαίσιο ανάλυσης (analysis context) για τους in-process αναλυτές.
+
+Κρατά τον αποκωδικοποιημένο πηγαίο κώδικα και ένα μοναδικό AST, ώστε ο SecurityVisitor και οι
+μετρικές της Radon να χρησιμοποιούν το ίδιο δέντρο αντί να αναλύει ο καθένας ξανά τον κώδικα.
+Οι raw μετρικές της Radon (radon.raw.analyze) κάνουν δική τους tokenization ανά λογική γραμμή και
+δεν δέχονται έτοιμη ροή tokens, οπότε το πλαίσιο δεν κρατά tokens. Καταγράφει επίσης τον χρόνο
+κάθε σταδίου (parse, αναλυτές).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import io
+import ast
+import time
+import tokenize                                     # Για την ανίχνευση κωδικοποίησης (PEP 263).
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+# -------------------------------------------
+# 2. Ορισμός κλάσης για το πλαίσιο ανάλυσης.
+# -------------------------------------------
+
+class AnalysisContext:
+    """
+    Πλαίσιο ανάλυσης ενός αρχείου Python. Το AST υπολογίζεται την πρώτη φορά που ζητείται
+    (lazy) και μία μόνο φορά, ακόμη κι αν το πλαίσιο χρησιμοποιείται ταυτόχρονα από
+    πολλά νήματα του orchestrator.
+    source: Ο αποκωδικοποιημένος πηγαίος κώδικας.
+    filename: Όνομα αρχείου για τα μηνύματα σφάλματος σύνταξης.
+    timings: Λεξικό {στάδιο: δευτερόλεπτα} για μέτρηση του κόστους κάθε σταδίου.
+    """
+    def __init__(self, source: str, filename: str = "<unknown>") -> None:
+        self.source = source
+        self.filename = filename
+        self.timings: dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._tree: ast.Module | None = None
+        self._syntax_error: SyntaxError | None = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes, filename: str = "<unknown>") -> "AnalysisContext":
+        """
+        Δημιουργεί πλαίσιο από bytes, αποκωδικοποιώντας τα με την κωδικοποίηση που δηλώνει το
+        αρχείο (BOM ή σχόλιο coding, προεπιλογή UTF-8). Σε αποτυχία προκαλεί UnicodeDecodeError
+        ή SyntaxError (μη έγκυρη δήλωση κωδικοποίησης).
+        """
+        started = time.perf_counter()
+        encoding, _lines = tokenize.detect_encoding(io.BytesIO(data).readline)
+        context = cls(data.decode(encoding), filename)
+        context.timings["decode"] = time.perf_counter() - started
+        return context
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Context manager που προσθέτει τη διάρκεια του μπλοκ στο timings[name].
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    @property
+    def tree(self) -> ast.Module:
+        """
+        Το AST του κώδικα (μία κλήση ast.parse ανά πλαίσιο). Σε σφάλμα σύνταξης προκαλεί
+        το ίδιο SyntaxError σε κάθε πρόσβαση.
+        """
+        with self._lock:
+            if self._tree is None and self._syntax_error is None:
+                with self.stage("parse"):
+                    try:
+                        self._tree = ast.parse(self.source, filename=self.filename)
+                    except SyntaxError as exc:
+                        self._syntax_error = exc
+            if self._syntax_error is not None:
+                raise self._syntax_error
+            return self._tree
@@ -0,0 +1,65 @@
+"""
+Εύρεση αρχείων προς σάρωση με βάση include/exclude globs.
+
+Κοινή λογική για όλα τα headless σημεία εισόδου (CLI, incremental σάρωση), ώστε ένα αρχείο να
+επιλέγεται με τον ίδιο τρόπο είτε προκύπτει από διάσχιση φακέλου είτε από git diff.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import fnmatch                                              # Για ταίριασμα include/exclude globs.
+from typing import Iterator
+
+# Προεπιλεγμένα globs: σαρώνονται μόνο αρχεία Python, εκτός από φακέλους εργαλείων/περιβαλλόντων.
+DEFAULT_INCLUDE: list[str] = ["*.py"]
+DEFAULT_EXCLUDE: list[str] = [".git", ".hg", ".tox", ".nox", ".venv", "venv", "__pycache__", "node_modules"]
+
+# ----------------------------------------------------------
+# 2. Εύρεση αρχείων προς σάρωση με βάση τα include/exclude globs.
+# ----------------------------------------------------------
+
+def path_matches(rel_path: str, patterns: list[str]) -> bool:
+    """
+    Ελέγχει αν η σχετική διαδρομή (μορφής posix) ή το όνομα του αρχείου ταιριάζει με κάποιο glob.
+    """
+    name = rel_path.rsplit("/", 1)[-1]
+    return any(fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+def is_selected(rel_path: str,
+                include: list[str] | None = None,
+                exclude: list[str] | None = None) -> bool:
+    """
+    Ελέγχει αν μια σχετική διαδρομή θα σαρωνόταν από τη discover_files, δηλαδή αν ταιριάζει με τα
+    include globs και ούτε η ίδια ούτε κάποιος γονικός της φάκελος ταιριάζει με τα exclude globs.
+    """
+    include = include or DEFAULT_INCLUDE
+    exclude = DEFAULT_EXCLUDE if exclude is None else exclude
+    parts = rel_path.split("/")
+    parents = ["/".join(parts[:index + 1]) for index in range(len(parts) - 1)]
+    return (path_matches(rel_path, include)
+            and not path_matches(rel_path, exclude)
+            and not any(path_matches(parent, exclude) for parent in parents))
+
+def discover_files(root: str,
+                   include: list[str] | None = None,
+                   exclude: list[str] | None = None) -> Iterator[str]:
+    """
+    Διατρέχει τον φάκελο root και επιστρέφει (generator) τις σχετικές διαδρομές των αρχείων που
+    ταιριάζουν με τα include globs και δεν ταιριάζουν με τα exclude globs. Οι φάκελοι που
+    εξαιρούνται δεν διατρέχονται καθόλου.
+    """
+    include = include or DEFAULT_INCLUDE
+    exclude = DEFAULT_EXCLUDE if exclude is None else exclude
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        # Αφαίρεση των εξαιρούμενων φακέλων επιτόπου, ώστε το os.walk να μην εισέλθει σε αυτούς.
+        dirnames[:] = sorted(d for d in dirnames if not path_matches(rel_dir + d, exclude))
+        for filename in sorted(filenames):
+            rel_path = rel_dir + filename
+            if path_matches(rel_path, include) and not path_matches(rel_path, exclude):
+                yield rel_path
@@ -0,0 +1,147 @@
+"""
+Εξαγωγή των ευρημάτων όλων των εργαλείων σε SARIF 2.1.0 και JSON Lines.
+
+Και οι δύο μορφές γράφονται σταδιακά, ένα εύρημα τη φορά, από οποιοδήποτε iterable Finding (π.χ.
+τη ροή της iter_report_findings πάνω στα αποτελέσματα μιας σάρωσης), ώστε η μνήμη να μένει σταθερή
+ακόμη και με εκατοντάδες χιλιάδες ευρήματα. Στο SARIF οι κανόνες (tool.driver.rules) συλλέγονται
+κατά την εγγραφή των results και γράφονται μετά από αυτά (η σειρά των κλειδιών ενός αντικειμένου
+JSON δεν έχει σημασία), οπότε στη μνήμη κρατείται μόνο ένας κανόνας ανά διαφορετικό rule id.
+
+Κάθε εγγραφή περιέχει το εργαλείο, τον κανόνα, τη θέση (αρχείο, γραμμή, στήλη) και τη σοβαρότητα.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import json
+from typing import Any, Iterable, Iterator, TextIO
+
+from sast.findings import Finding
+
+SARIF_SCHEMA: str = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_TOOL_NAME: str = "Python SAST Tool"
+SARIF_TOOL_URI: str = "https://github.com/PersistentAlchemist5/Python-SAST-Tool"
+EXPORT_FORMATS: tuple[str, ...] = ("sarif", "jsonl")
+
+# Αντιστοίχιση της σοβαρότητας κάθε εργαλείου στα επίπεδα του SARIF (error, warning, note).
+SARIF_LEVELS: dict[str, str] = {
+    "CRITICAL": "error", "HIGH": "error", "ERROR": "error", "FATAL": "error",
+    "MEDIUM": "warning", "WARNING": "warning",
+    "LOW": "note", "INFO": "note", "CONVENTION": "note", "REFACTOR": "note"}
+# Βαθμίδες πολυπλοκότητας της Radon (A-F).
+RADON_SARIF_LEVELS: dict[str, str] = {"A": "note", "B": "note", "C": "warning", "D": "warning",
+                                      "E": "error", "F": "error"}
+
+# -------------------------------------------------------
+# 2. Ροή ευρημάτων από τα αποτελέσματα μιας σάρωσης.
+# -------------------------------------------------------
+
+def iter_report_findings(files: dict[str, dict[str, dict[str, Any]]]) -> Iterator[Finding]:
+    """
+    Τα ευρήματα όλων των εργαλείων μιας σάρωσης (το "files" της scan_directory/scan_incremental),
+    αρχείο προς αρχείο, με συμπληρωμένη τη διαδρομή του αρχείου.
+    """
+    for rel_path, file_results in files.items():
+        for result in file_results.values():
+            for item in result.get("results") or []:
+                finding = item if isinstance(item, Finding) else Finding.from_dict(item)
+                yield finding if finding.file else finding.at(rel_path)
+
+def sarif_rule_id(finding: Finding) -> str:
+    """
+    Μοναδικό id κανόνα στο SARIF: εργαλείο/κανόνας (π.χ. bandit/B602), ώστε να μη συγκρούονται εργαλεία.
+    """
+    return f"{finding.tool}/{finding.rule_id}" if finding.rule_id else finding.tool
+
+def sarif_level(finding: Finding) -> str:
+    if finding.tool == "radon":
+        return RADON_SARIF_LEVELS.get(finding.severity.upper(), "note")
+    return SARIF_LEVELS.get(finding.severity.upper(), "warning")
+
+# ------------------------------------------------
+# 3. Σταδιακή εγγραφή σε JSON Lines και SARIF.
+# ------------------------------------------------
+
+def write_jsonl(findings: Iterable[Finding], stream: TextIO) -> int:
+    """
+    Ένα αντικείμενο JSON ανά γραμμή (πεδία της Finding.to_dict). Επιστρέφει το πλήθος των εγγραφών.
+    """
+    count = 0
+    for finding in findings:
+        stream.write(json.dumps(finding.to_dict(), ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+def _sarif_result(finding: Finding) -> dict[str, Any]:
+    location: dict[str, Any] = {"artifactLocation": {"uri": finding.file.replace("\\", "/")}}
+    if finding.line and finding.line > 0:
+        location["region"] = {"startLine": finding.line}
+    properties: dict[str, Any] = {"tool": finding.tool, "severity": finding.severity}
+    for name in ("confidence", "symbol", "column", "value"):
+        value = getattr(finding, name)
+        if value not in ("", None):
+            properties[name] = value
+    return {"ruleId": sarif_rule_id(finding),
+            "level": sarif_level(finding),
+            "message": {"text": finding.message or finding.rule_id or finding.tool},
+            "locations": [{"physicalLocation": location}],
+            "partialFingerprints": {"sastFingerprint/v1": finding.fingerprint},
+            "properties": properties}
+
+class SarifWriter:
+    """
+    Σταδιακή εγγραφή ενός SARIF run: η write() γράφει ένα εύρημα μόλις δοθεί και η close() γράφει
+    τους κανόνες και τον driver. Χρησιμοποιείται όταν τα ευρήματα δεν είναι διαθέσιμα ως ένα
+    iterable, αλλά φτάνουν αρχείο προς αρχείο (π.χ. στη σάρωση με ροή του sast.pipeline).
+    """
+    def __init__(self, stream: TextIO, tool_versions: dict[str, str] | None = None) -> None:
+        self.stream = stream
+        self.tool_versions = tool_versions
+        self.count = 0
+        self._rules: dict[str, dict[str, Any]] = {}
+        stream.write(f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": "2.1.0", "runs": [{{"results": [\n')
+
+    def write(self, finding: Finding) -> None:
+        rule_id = sarif_rule_id(finding)
+        if rule_id not in self._rules:
+            self._rules[rule_id] = {"id": rule_id,
+                                    "name": finding.symbol or finding.rule_id or finding.tool,
+                                    "shortDescription": {"text": finding.message or rule_id},
+                                    "properties": {"tool": finding.tool}}
+        if self.count:
+            self.stream.write(",\n")
+        self.stream.write(json.dumps(_sarif_result(finding), ensure_ascii=False))
+        self.count += 1
+
+    def close(self) -> int:
+        driver: dict[str, Any] = {"name": SARIF_TOOL_NAME, "informationUri": SARIF_TOOL_URI,
+                                  "rules": list(self._rules.values())}
+        if self.tool_versions:
+            driver["properties"] = {"toolVersions": self.tool_versions}
+        self.stream.write(f'\n], "tool": {{"driver": {json.dumps(driver, ensure_ascii=False)}}}}}]}}\n')
+        return self.count
+
+def write_sarif(findings: Iterable[Finding], stream: TextIO, tool_versions: dict[str, str] | None = None) -> int:
+    """
+    Ένα SARIF run με όλα τα ευρήματα, γραμμένο σταδιακά. Τα εργαλεία και οι εκδόσεις τους
+    (tool_versions) καταγράφονται στα properties του driver. Επιστρέφει το πλήθος των results.
+    """
+    writer = SarifWriter(stream, tool_versions)
+    for finding in findings:
+        writer.write(finding)
+    return writer.close()
+
+def export_findings(findings: Iterable[Finding], path: str, fmt: str,
+                    tool_versions: dict[str, str] | None = None) -> int:
+    """
+    Γράφει τα ευρήματα στο path σε μορφή fmt ("sarif" ή "jsonl"). Επιστρέφει το πλήθος των εγγραφών.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Άγνωστη μορφή εξαγωγής '{fmt}' (διαθέσιμες: {', '.join(EXPORT_FORMATS)}).")
+    with open(path, "w", encoding="utf-8") as export_file:
+        if fmt == "sarif":
+            return write_sarif(findings, export_file, tool_versions)
+        return write_jsonl(findings, export_file)
@@ -0,0 +1,239 @@
+"""
+Ενιαίο, συμπαγές μοντέλο ευρημάτων (Finding) για όλους τους αναλυτές.
+
+Κάθε run_* συνάρτηση επιστρέφει στο "results" λίστα από Finding αντί για τα ακατέργαστα λεξικά
+κάθε εργαλείου (π.χ. τα 11 κλειδιά ανά μήνυμα της Pylint). Το Finding είναι frozen dataclass με
+__slots__ (χωρίς __dict__ ανά εγγραφή) και οι επαναλαμβανόμενες συμβολοσειρές (εργαλείο, κανόνας,
+σοβαρότητα, μήνυμα) γίνονται intern, ώστε χιλιάδες όμοια μηνύματα να μοιράζονται το ίδιο αντικείμενο.
+Τα pandas DataFrames δημιουργούνται μόνο κατά την εμφάνιση, με τη findings_to_dataframe.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import sys
+import hashlib
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# --------------------------------------
+# 2. Ορισμός της εγγραφής ευρήματος.
+# --------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """
+    Κανονικοποιημένο εύρημα ενός εργαλείου ανάλυσης.
+    tool: Όνομα εργαλείου (ίδιο με το TOOL_RUNNERS, π.χ. "bandit").
+    rule_id: Αναγνωριστικό κανόνα (π.χ. "B602", "C0114", check_id της Semgrep, είδος του custom AST).
+    severity: Σοβαρότητα όπως τη δίνει το εργαλείο (π.χ. HIGH, ERROR, convention, βαθμίδα A-F της Radon).
+    confidence: Βεβαιότητα του ευρήματος ή "" αν το εργαλείο δεν τη δίνει.
+    file: Διαδρομή αρχείου ή "" όταν ο κώδικας αναλύθηκε χωρίς αρχείο (η διαδρομή είναι τότε το
+          κλειδί του αποτελέσματος, π.χ. στο "files" της scan_directory).
+    line: Γραμμή του ευρήματος (1-based) ή None.
+    message: Περιγραφή του ευρήματος.
+    fingerprint: Σταθερό hash (εργαλείο, κανόνας, μήνυμα, περιεχόμενο γραμμής) που δεν αλλάζει όταν
+                 ο κώδικας απλώς μετακινείται, για σύγκριση σαρώσεων και ιστορικό.
+    column: Στήλη (όπου υπάρχει), symbol: όνομα ελέγχου/συμβόλου, snippet: σύντομη προεπισκόπηση,
+    value: αριθμητική τιμή μετρικής (π.χ. CC της Radon).
+    """
+    tool: str
+    rule_id: str
+    severity: str
+    confidence: str
+    file: str
+    line: int | None
+    message: str
+    fingerprint: str
+    column: int | None = None
+    symbol: str = ""
+    snippet: str = ""
+    value: float | None = None
+
+    def at(self, file: str) -> "Finding":
+        """
+        Επιστρέφει αντίγραφο με τη δοσμένη διαδρομή αρχείου (το fingerprint δεν εξαρτάται από αυτήν).
+        """
+        return replace(self, file=file)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Μετατροπή σε λεξικό για έξοδο JSON (CLI, baseline).
+        """
+        return {name: getattr(self, name) for name in FINDING_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Finding":
+        """
+        Αντίστροφη της to_dict. Πεδία που λείπουν παίρνουν κενές τιμές.
+        """
+        return _make(data.get("tool") or "", data.get("rule_id") or "", data.get("severity") or "",
+                     data.get("confidence") or "", data.get("file") or "", data.get("line"),
+                     data.get("message") or "", data.get("fingerprint") or "", data.get("column"),
+                     data.get("symbol") or "", data.get("snippet") or "", data.get("value"))
+
+# Σειρά των πεδίων (και των στηλών στη συμπαγή μορφή γραμμών της cache).
+FINDING_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(Finding))
+
+def _make(tool: str, rule_id: str, severity: str, confidence: str, file: str, line: int | None,
+          message: str, fingerprint: str, column: int | None = None, symbol: str = "",
+          snippet: str = "", value: float | None = None) -> Finding:
+    intern = sys.intern
+    return Finding(intern(tool), intern(str(rule_id)), intern(str(severity)), intern(str(confidence)),
+                   intern(file), line if isinstance(line, int) else None, intern(str(message)),
+                   fingerprint, column if isinstance(column, int) else None, intern(str(symbol)),
+                   str(snippet), value)
+
+def fingerprint(tool: str, rule_id: str, message: str, line_text: str) -> str:
+    """
+    Σταθερό αναγνωριστικό ευρήματος: hash του εργαλείου, του κανόνα, του μηνύματος και του
+    περιεχομένου της γραμμής (χωρίς κενά), ανεξάρτητα από τον αριθμό γραμμής και το αρχείο.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in (tool, rule_id, message, " ".join(line_text.split())):
+        digest.update(part.encode("utf-8", errors="surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+class FindingBuilder:
+    """
+    Δημιουργεί τα Finding ενός αναλυμένου κώδικα: υπολογίζει το fingerprint από τη γραμμή του
+    κώδικα (οι γραμμές χωρίζονται μία φορά) και κάνει intern τις επαναλαμβανόμενες τιμές.
+    tool: Το εργαλείο των ευρημάτων. code: Ο κώδικας που αναλύθηκε. file: Προαιρετική διαδρομή.
+    """
+    __slots__ = ("tool", "file", "_lines")
+
+    def __init__(self, tool: str, code: str, file: str = "") -> None:
+        self.tool = tool
+        self.file = file
+        self._lines = code.splitlines()
+
+    def __call__(self, rule_id: Any, severity: Any, line: Any, message: Any, confidence: Any = "",
+                 column: Any = None, symbol: Any = "", snippet: Any = "", value: float | None = None) -> Finding:
+        rule_id, message = str(rule_id or ""), str(message or "")
+        line_text = self._lines[line - 1] if isinstance(line, int) and 0 < line <= len(self._lines) else ""
+        return _make(self.tool, rule_id, severity or "", confidence or "", self.file, line, message,
+                     fingerprint(self.tool, rule_id, message, line_text), column, symbol or "",
+                     snippet or "", value)
+
+# ----------------------------------------------------------------------
+# 3. Μετατροπή της ακατέργαστης εξόδου κάθε εργαλείου σε Finding.
+# ----------------------------------------------------------------------
+
+# Μετατροπή μίας εγγραφής της εξόδου JSON. Χρησιμοποιούνται και απευθείας, εγγραφή προς εγγραφή,
+# όταν η έξοδος ενός εργαλείου αναλύεται σταδιακά (streaming mode του batch).
+
+def bandit_finding(build: FindingBuilder, issue: dict[str, Any]) -> Finding:
+    return build(issue.get("test_id"), issue.get("issue_severity"), issue.get("line_number"),
+                 issue.get("issue_text"), confidence=issue.get("issue_confidence"),
+                 column=issue.get("col_offset"), symbol=issue.get("test_name"))
+
+def semgrep_finding(build: FindingBuilder, issue: dict[str, Any]) -> Finding:
+    extra = issue.get("extra") or {}
+    start = issue.get("start") or {}
+    return build(issue.get("check_id"), extra.get("severity"), start.get("line"),
+                 extra.get("message"), confidence=(extra.get("metadata") or {}).get("confidence"),
+                 column=start.get("col"))
+
+def pylint_finding(build: FindingBuilder, msg: dict[str, Any]) -> Finding:
+    return build(msg.get("message-id"), msg.get("type"), msg.get("line"), msg.get("message"),
+                 column=msg.get("column"), symbol=msg.get("symbol"))
+
+def bandit_findings(issues: Iterable[dict[str, Any]], code: str) -> list[Finding]:
+    """
+    Ευρήματα της Bandit (στοιχεία του "results" της εξόδου JSON ή της Issue.as_dict).
+    """
+    build = FindingBuilder("bandit", code)
+    return [bandit_finding(build, issue) for issue in issues]
+
+def semgrep_findings(issues: Iterable[dict[str, Any]], code: str) -> list[Finding]:
+    """
+    Ευρήματα της Semgrep (στοιχεία του "results" της εξόδου JSON).
+    """
+    build = FindingBuilder("semgrep", code)
+    return [semgrep_finding(build, issue) for issue in issues]
+
+def pylint_findings(messages: Iterable[dict[str, Any]], code: str) -> list[Finding]:
+    """
+    Μηνύματα της Pylint (μορφή του JSON reporter). Ως σοβαρότητα κρατείται ο τύπος του μηνύματος.
+    """
+    build = FindingBuilder("pylint", code)
+    return [pylint_finding(build, msg) for msg in messages]
+
+# Είδος μπλοκ κώδικα της Radon (ιδιότητα letter των Function/Class).
+_RADON_BLOCK_KINDS: dict[str, str] = {"F": "function", "M": "method", "C": "class"}
+
+def radon_findings(blocks: Iterable[Any], code: str) -> list[Finding]:
+    """
+    Μπλοκ κώδικα της Radon (ComplexityVisitor.blocks). Ως σοβαρότητα κρατείται η βαθμίδα (A-F)
+    και ως value η κυκλωματική πολυπλοκότητα (CC).
+    """
+    from radon.complexity import cc_rank
+
+    build = FindingBuilder("radon", code)
+    findings: list[Finding] = []
+    for block in blocks:
+        name = getattr(block, "name", "")
+        kind = _RADON_BLOCK_KINDS.get(getattr(block, "letter", ""), "")
+        complexity = getattr(block, "complexity", None)
+        rank = cc_rank(complexity) if isinstance(complexity, int) else ""
+        findings.append(build("CC", rank, getattr(block, "lineno", None),
+                              f"Κυκλωματική πολυπλοκότητα {complexity} ({kind} {name})",
+                              column=getattr(block, "col_offset", None), symbol=name, value=complexity))
+    return findings
+
+def custom_ast_findings(issues: Iterable[dict[str, Any]], code: str) -> list[Finding]:
+    """
+    Ευρήματα του SecurityVisitor (λεξικά με τα ελληνικά κλειδιά των κανόνων του sast.rules).
+    """
+    build = FindingBuilder("custom_ast", code)
+    return [build(issue.get("Είδος"), "", issue.get("Γραμμή"),
+                  issue.get("Λεπτομέρειες"), symbol=issue.get("Όνομα"),
+                  snippet=issue.get("Τιμή (Προεπισκόπηση)"))
+            for issue in issues]
+
+# --------------------------------------------------------
+# 4. Σειριοποίηση (JSON, cache) και εμφάνιση (DataFrame).
+# --------------------------------------------------------
+
+def as_findings(items: Iterable[Finding | dict[str, Any]]) -> list[Finding]:
+    """
+    Επιστρέφει λίστα Finding από Finding ή λεξικά της to_dict (π.χ. ευρήματα baseline από JSON).
+    """
+    return [item if isinstance(item, Finding) else Finding.from_dict(item) for item in items]
+
+def findings_to_rows(findings: Iterable[Finding]) -> list[list[Any]]:
+    """
+    Συμπαγής μορφή για την cache: μία λίστα τιμών ανά εύρημα, με τη σειρά του FINDING_FIELDS.
+    """
+    return [[getattr(finding, name) for name in FINDING_FIELDS] for finding in findings]
+
+def findings_from_rows(rows: Iterable[list[Any]]) -> list[Finding]:
+    """
+    Αντίστροφη της findings_to_rows.
+    """
+    return [_make(*row) for row in rows]
+
+def json_default(obj: Any) -> Any:
+    """
+    Συνάρτηση default για json.dump/json.dumps: τα Finding γράφονται ως λεξικά, τα υπόλοιπα ως str.
+    """
+    if isinstance(obj, Finding):
+        return obj.to_dict()
+    return str(obj)
+
+def findings_to_dataframe(findings: Iterable[Finding], columns: dict[str, str]) -> "pd.DataFrame":
+    """
+    Δημιουργεί DataFrame μόνο για εμφάνιση, στήλη προς στήλη (χωρίς ενδιάμεσο λεξικό ανά γραμμή).
+    columns: Λεξικό {τίτλος στήλης: πεδίο του Finding}, με τη σειρά εμφάνισης.
+    """
+    import pandas as pd
+
+    findings = list(findings)
+    return pd.DataFrame({label: [getattr(finding, name) for finding in findings]
+                         for label, name in columns.items()})
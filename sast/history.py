@@ -0,0 +1,440 @@
+"""
+Μόνιμο ιστορικό σαρώσεων και ευρημάτων σε ενσωματωμένη βάση SQLite.
+
+Κάθε σάρωση (διεπαφή ή CLI) καταγράφεται με τις εκδόσεις των εργαλείων, τους χρόνους εκτέλεσης,
+το hash κάθε αρχείου και όλα τα ευρήματά της (Finding). Η εγγραφή γίνεται μαζικά (executemany) σε
+μία συναλλαγή ανά σάρωση, ενώ τα ευρετήρια σε αρχείο, κανόνα, σοβαρότητα και χρόνο σάρωσης επιτρέπουν
+ερωτήματα τάσεων (π.χ. "νέα HIGH ευρήματα της Bandit την τελευταία εβδομάδα") απευθείας στη βάση,
+χωρίς φόρτωση όλων των εγγραφών σε pandas.
+
+Παράδειγμα:
+    python -m sast.history new --days 7 --tool bandit --severity HIGH
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import closing
+from typing import Any, Iterable
+
+from sast.findings import as_findings
+
+logger = logging.getLogger("sast_tool")
+
+# Τοποθεσία της βάσης και ενεργοποίηση της καταγραφής (ρυθμίζονται από μεταβλητές περιβάλλοντος).
+DEFAULT_HISTORY_PATH: str = os.getenv("SAST_HISTORY_DB",
+                                      os.path.join(os.path.expanduser("~"), ".local", "share",
+                                                   "sast_tool", "history.sqlite3"))
+HISTORY_ENABLED: bool = os.getenv("SAST_HISTORY", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Σχήμα της βάσης:
+#   scans: μία γραμμή ανά σάρωση (εκδόσεις εργαλείων, χρόνοι, σύνολα).
+#   scan_files: hash και σύνολα κάθε αρχείου μιας σάρωσης.
+#   scan_counts: πλήθος ευρημάτων και νέων ευρημάτων ανά (σάρωση, εργαλείο, σοβαρότητα), ώστε οι
+#                τάσεις να μη διατρέχουν τον πίνακα findings.
+#   findings: όλα τα ευρήματα κάθε σάρωσης. Ο χρόνος σάρωσης αντιγράφεται σε κάθε γραμμή (scanned_at),
+#             ώστε τα φίλτρα χρόνου να εξυπηρετούνται από τα ευρετήρια χωρίς join με τον πίνακα scans.
+#   finding_keys: μία γραμμή ανά διακριτό εύρημα (ρίζα σάρωσης, αρχείο, fingerprint) με την πρώτη και
+#                 την τελευταία σάρωση στην οποία εμφανίστηκε. Η ρίζα (το root της σάρωσης, "" για τη
+#                 διεπαφή) ξεχωρίζει αποθετήρια με ίδιες σχετικές διαδρομές (π.χ. app/main.py). Ενημερώνεται
+#                 κατά την εγγραφή, οπότε το ερώτημα "νέα ευρήματα από ..." είναι ένα range scan στο
+#                 ευρετήριο first_seen (ή root, first_seen).
+# Η σοβαρότητα συγκρίνεται χωρίς διάκριση πεζών/κεφαλαίων (HIGH/high), με την ίδια collation στα ευρετήρια.
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    source TEXT NOT NULL,
+    root TEXT NOT NULL,
+    tools TEXT NOT NULL,
+    tool_versions TEXT NOT NULL,
+    timings TEXT NOT NULL,
+    wall_time_s REAL,
+    files INTEGER NOT NULL,
+    findings INTEGER NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scan_files (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    file TEXT NOT NULL,
+    file_hash TEXT,
+    findings INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    PRIMARY KEY (scan_id, file)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scan_counts (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    tool TEXT NOT NULL,
+    severity TEXT NOT NULL COLLATE NOCASE,
+    findings INTEGER NOT NULL,
+    new_findings INTEGER NOT NULL,
+    PRIMARY KEY (scan_id, tool, severity)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    scanned_at REAL NOT NULL,
+    file TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    severity TEXT NOT NULL COLLATE NOCASE,
+    confidence TEXT NOT NULL,
+    line INTEGER,
+    message TEXT NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS finding_keys (
+    root TEXT NOT NULL,
+    file TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    severity TEXT NOT NULL COLLATE NOCASE,
+    confidence TEXT NOT NULL,
+    line INTEGER,
+    message TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    first_scan_id INTEGER NOT NULL,
+    last_seen REAL NOT NULL,
+    last_scan_id INTEGER NOT NULL,
+    PRIMARY KEY (root, file, fingerprint)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_scans_started_at ON scans(started_at);
+CREATE INDEX IF NOT EXISTS idx_scans_root ON scans(root, started_at);
+CREATE INDEX IF NOT EXISTS idx_scan_files_file ON scan_files(file, scan_id);
+CREATE INDEX IF NOT EXISTS idx_findings_scanned_at ON findings(scanned_at);
+CREATE INDEX IF NOT EXISTS idx_findings_file ON findings(file, scanned_at);
+CREATE INDEX IF NOT EXISTS idx_findings_rule ON findings(rule_id, scanned_at);
+CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity, tool, scanned_at);
+CREATE INDEX IF NOT EXISTS idx_finding_keys_first_seen ON finding_keys(first_seen);
+CREATE INDEX IF NOT EXISTS idx_finding_keys_root ON finding_keys(root, first_seen);
+CREATE INDEX IF NOT EXISTS idx_finding_keys_severity ON finding_keys(severity, tool, first_seen);
+"""
+
+# Μετάβαση από το αρχικό σχήμα, όπου το κλειδί του finding_keys ήταν (αρχείο, fingerprint): ο πίνακας
+# ξαναδημιουργείται με τη ρίζα της πρώτης σάρωσης κάθε ευρήματος (τα ευρήματα διαφορετικών αποθετηρίων που
+# είχαν ήδη συγχωνευθεί δεν μπορούν να διαχωριστούν). Εκτελείται μετά το _SCHEMA, σε μία συναλλαγή.
+_MIGRATE_FINDING_KEYS: str = """
+BEGIN;
+ALTER TABLE finding_keys RENAME TO finding_keys_v1;
+DROP INDEX IF EXISTS idx_finding_keys_first_seen;
+DROP INDEX IF EXISTS idx_finding_keys_severity;
+{schema}
+INSERT OR IGNORE INTO finding_keys (root, file, fingerprint, tool, rule_id, severity, confidence, line, message,
+                                    first_seen, first_scan_id, last_seen, last_scan_id)
+    SELECT COALESCE(s.root, ''), k.file, k.fingerprint, k.tool, k.rule_id, k.severity, k.confidence, k.line,
+           k.message, k.first_seen, k.first_scan_id, k.last_seen, k.last_scan_id
+    FROM finding_keys_v1 AS k LEFT JOIN scans AS s ON s.id = k.first_scan_id;
+DROP TABLE finding_keys_v1;
+COMMIT;
+"""
+
+# Διάρκεια ημέρας σε δευτερόλεπτα (για τα ερωτήματα "τελευταίες N ημέρες").
+_DAY_SECONDS: int = 24 * 60 * 60
+
+# ---------------------------------------------------
+# 2. Ορισμός κλάσης για το ιστορικό σαρώσεων.
+# ---------------------------------------------------
+
+class FindingsHistory:
+    """
+    Ιστορικό σαρώσεων σε αρχείο SQLite. Κάθε λειτουργία ανοίγει δική της σύνδεση, οπότε το ίδιο
+    αντικείμενο χρησιμοποιείται με ασφάλεια από πολλά νήματα (π.χ. τα reruns του Streamlit) και
+    διεργασίες. Η βάση λειτουργεί σε WAL mode, ώστε οι αναγνώσεις να μην μπλοκάρουν τις εγγραφές.
+    path: Διαδρομή του αρχείου της βάσης (δημιουργείται αν δεν υπάρχει).
+    """
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH) -> None:
+        self.path = path
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if not self._initialized:
+                if os.path.dirname(self.path):
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    columns = {row[1] for row in conn.execute("PRAGMA table_info(finding_keys)")}
+                    if columns and "root" not in columns:
+                        conn.executescript(_MIGRATE_FINDING_KEYS.format(schema=_SCHEMA))
+                    conn.executescript(_SCHEMA)
+                self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ------------------------------ Εγγραφή ------------------------------
+
+    def record_scan(self,
+                    files: dict[str, dict[str, dict[str, Any]]],
+                    tools: Iterable[str],
+                    source: str,
+                    root: str = "",
+                    file_hashes: dict[str, str] | None = None,
+                    tool_versions: dict[str, str] | None = None,
+                    timings: dict[str, float] | None = None,
+                    wall_time_s: float | None = None,
+                    started_at: float | None = None) -> int:
+        """
+        Καταγράφει μία σάρωση και όλα τα ευρήματά της σε μία συναλλαγή. Επιστρέφει το id της σάρωσης.
+        files: {διαδρομή: {εργαλείο: αποτέλεσμα}}, όπως στο "files" της scan_directory.
+        source: Σημείο εισόδου της σάρωσης (π.χ. "ui", "cli").
+        file_hashes: Προαιρετικό {διαδρομή: SHA-256 περιεχομένου}.
+        tool_versions/timings: Εκδόσεις εργαλείων και χρόνοι (π.χ. ανά εργαλείο) της σάρωσης.
+        """
+        file_hashes = file_hashes or {}
+        with ScanRecorder(self, tools, source, root=root, tool_versions=tool_versions,
+                          started_at=started_at) as recorder:
+            for path, file_results in files.items():
+                recorder.add_file(path, file_results, file_hashes.get(path))
+            return recorder.finish(timings=timings, wall_time_s=wall_time_s)
+
+    # ------------------------------ Ερωτήματα ------------------------------
+
+    @staticmethod
+    def _filters(alias: str, root: str | None = None, **values: str | None) -> tuple[str, list[Any]]:
+        """
+        Συνθήκες WHERE μόνο για τα φίλτρα που δόθηκαν (ώστε ο query planner να επιλέγει ευρετήριο).
+        root: Ρίζα σάρωσης· σε αντίθεση με τα υπόλοιπα φίλτρα, η κενή ρίζα ("", η διεπαφή) είναι έγκυρη τιμή.
+        """
+        filters = [(column, value) for column, value in values.items() if value]
+        if root is not None:
+            filters.insert(0, ("root", root))
+        return ("".join(f" AND {alias}.{column} = ?" for column, _value in filters),
+                [value for _column, value in filters])
+
+    def scans(self, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Επιστρέφει τις πιο πρόσφατες σαρώσεις (νεότερη πρώτη).
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM scans ORDER BY started_at DESC LIMIT ?", (limit,)).fetchall()
+        return [{**dict(row), "tools": json.loads(row["tools"]),
+                 "tool_versions": json.loads(row["tool_versions"]),
+                 "timings": json.loads(row["timings"])} for row in rows]
+
+    def new_findings(self,
+                     since: float,
+                     tool: str | None = None,
+                     severity: str | None = None,
+                     file: str | None = None,
+                     limit: int = 1000,
+                     root: str | None = None) -> list[dict[str, Any]]:
+        """
+        Ευρήματα που εμφανίστηκαν για πρώτη φορά από τη χρονική στιγμή since (Unix time) και μετά,
+        δηλαδή το ίδιο fingerprint δεν είχε καταγραφεί στο ίδιο αρχείο της ίδιας ρίζας σε προηγούμενη
+        σάρωση. Νεότερα πρώτα, με την πρώτη και την τελευταία φορά που καταγράφηκαν.
+        root: Μόνο τα ευρήματα μιας ρίζας σάρωσης ("" για τη διεπαφή· None για όλες).
+        """
+        clauses, params = self._filters("k", root=root, tool=tool, severity=severity, file=file)
+        query = ("SELECT root, file, tool, rule_id, severity, confidence, line, message, fingerprint,"
+                 " first_seen, last_seen FROM finding_keys AS k"
+                 f" WHERE k.first_seen >= ?{clauses} ORDER BY k.first_seen DESC LIMIT ?")
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, [since, *params, limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def trend(self,
+              since: float,
+              tool: str | None = None,
+              severity: str | None = None,
+              file: str | None = None,
+              root: str | None = None) -> list[dict[str, Any]]:
+        """
+        Τάση ανά σάρωση από τη since και μετά: πλήθος ευρημάτων και νέων ευρημάτων (πρώτη εμφάνιση)
+        κάθε σάρωσης, με τα φίλτρα εργαλείου/σοβαρότητας. Με file, μόνο οι σαρώσεις του αρχείου και με
+        root μόνο οι σαρώσεις μιας ρίζας.
+        """
+        scan_clauses, scan_params = self._filters("s", root=root)
+        if file:
+            clauses, params = self._filters("f", tool=tool, severity=severity)
+            key_clauses, key_params = self._filters("k", tool=tool, severity=severity)
+            query = ("SELECT s.id AS scan_id, s.started_at, s.source, s.root,"
+                     " (SELECT COUNT(*) FROM findings AS f WHERE f.file = sf.file AND f.scanned_at = s.started_at"
+                     f" AND f.scan_id = s.id{clauses}) AS findings,"
+                     " (SELECT COUNT(*) FROM finding_keys AS k WHERE k.root = s.root AND k.file = sf.file"
+                     f" AND k.first_scan_id = s.id{key_clauses}) AS new_findings"
+                     " FROM scan_files AS sf JOIN scans AS s ON s.id = sf.scan_id"
+                     f" WHERE sf.file = ? AND s.started_at >= ?{scan_clauses} ORDER BY s.started_at")
+            arguments = [*params, *key_params, file, since, *scan_params]
+        else:
+            clauses, params = self._filters("c", tool=tool, severity=severity)
+            query = ("SELECT s.id AS scan_id, s.started_at, s.source, s.root,"
+                     " CAST(TOTAL(c.findings) AS INTEGER) AS findings,"
+                     " CAST(TOTAL(c.new_findings) AS INTEGER) AS new_findings"
+                     f" FROM scans AS s LEFT JOIN scan_counts AS c ON c.scan_id = s.id{clauses}"
+                     f" WHERE s.started_at >= ?{scan_clauses} GROUP BY s.id ORDER BY s.started_at")
+            arguments = [*params, since, *scan_params]
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, arguments).fetchall()
+        return [dict(row) for row in rows]
+
+class ScanRecorder:
+    """
+    Σταδιακή καταγραφή μιας σάρωσης στο ιστορικό, αρχείο προς αρχείο, σε μία συναλλαγή. Στη μνήμη
+    κρατούνται μόνο τα σύνολα ανά (εργαλείο, σοβαρότητα), οπότε μπορεί να δέχεται τα αποτελέσματα
+    μιας σάρωσης με ροή (sast.pipeline) χωρίς να συγκεντρώνονται τα ευρήματα όλων των αρχείων.
+    Η finish() ολοκληρώνει τη συναλλαγή· αν δεν κληθεί (π.χ. λόγω εξαίρεσης), η close() την ακυρώνει.
+    """
+    def __init__(self,
+                 history: FindingsHistory,
+                 tools: Iterable[str],
+                 source: str,
+                 root: str = "",
+                 tool_versions: dict[str, str] | None = None,
+                 started_at: float | None = None) -> None:
+        self.started_at = time.time() if started_at is None else started_at
+        self.root = root
+        self.files = self.findings = self.errors = 0
+        self._counts: dict[tuple[str, str], list[int]] = {}     # (εργαλείο, σοβαρότητα) -> [ευρήματα, νέα]
+        self._conn: sqlite3.Connection | None = history._connect()
+        cursor = self._conn.execute(
+            "INSERT INTO scans (started_at, source, root, tools, tool_versions, timings, wall_time_s,"
+            " files, findings, errors) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.started_at, source, root, json.dumps(list(tools)), json.dumps(tool_versions or {}),
+             json.dumps({}), None, 0, 0, 0))
+        self.scan_id: int = cursor.lastrowid
+
+    def __enter__(self) -> "ScanRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add_file(self, path: str, file_results: dict[str, dict[str, Any]], file_hash: str | None = None) -> None:
+        """
+        Καταγράφει τα αποτελέσματα ({εργαλείο: αποτέλεσμα}) ενός αρχείου της σάρωσης.
+        """
+        conn = self._conn
+        # Ομαδοποίηση ανά (εργαλείο, σοβαρότητα), ώστε να μετρηθούν τα νέα ευρήματα κάθε ομάδας.
+        groups: dict[tuple[str, str], list[tuple[Any, ...]]] = {}
+        count = errors = 0
+        for result in file_results.values():
+            errors += 0 if result.get("ok") else 1
+            for finding in as_findings(result.get("results") or []):
+                groups.setdefault((finding.tool, finding.severity.upper()), []).append(
+                    (finding.file or path, finding.fingerprint, finding.tool, finding.rule_id,
+                     finding.severity, finding.confidence, finding.line, finding.message))
+                count += 1
+        conn.execute("INSERT INTO scan_files (scan_id, file, file_hash, findings, errors) VALUES (?, ?, ?, ?, ?)",
+                     (self.scan_id, path, file_hash, count, errors))
+        for group, rows in groups.items():
+            conn.executemany("INSERT INTO findings (scan_id, scanned_at, file, fingerprint, tool, rule_id,"
+                             " severity, confidence, line, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             ((self.scan_id, self.started_at, *row) for row in rows))
+            # Νέα διακριτά ευρήματα: όσα (ρίζα, αρχείο, fingerprint) δεν υπήρχαν ήδη στο finding_keys.
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO finding_keys (root, file, fingerprint, tool, rule_id, severity,"
+                             " confidence, line, message, first_seen, first_scan_id, last_seen, last_scan_id)"
+                             " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             ((self.root, *row, self.started_at, self.scan_id, self.started_at, self.scan_id)
+                              for row in rows))
+            new_findings = conn.total_changes - before
+            conn.executemany("UPDATE finding_keys SET last_seen = ?, last_scan_id = ?, line = ?"
+                             " WHERE root = ? AND file = ? AND fingerprint = ? AND last_scan_id != ?",
+                             ((self.started_at, self.scan_id, row[6], self.root, row[0], row[1], self.scan_id)
+                              for row in rows))
+            totals = self._counts.setdefault(group, [0, 0])
+            totals[0] += len(rows)
+            totals[1] += new_findings
+        self.files += 1
+        self.findings += count
+        self.errors += errors
+
+    def finish(self, timings: dict[str, float] | None = None, wall_time_s: float | None = None) -> int:
+        """
+        Γράφει τα σύνολα της σάρωσης και ολοκληρώνει τη συναλλαγή. Επιστρέφει το id της σάρωσης.
+        """
+        conn = self._conn
+        conn.executemany("INSERT INTO scan_counts (scan_id, tool, severity, findings, new_findings)"
+                         " VALUES (?, ?, ?, ?, ?)",
+                         ((self.scan_id, tool, severity, findings, new_findings)
+                          for (tool, severity), (findings, new_findings) in self._counts.items()))
+        conn.execute("UPDATE scans SET timings = ?, wall_time_s = ?, files = ?, findings = ?, errors = ?"
+                     " WHERE id = ?", (json.dumps(timings or {}), wall_time_s, self.files, self.findings,
+                                       self.errors, self.scan_id))
+        conn.commit()
+        self.close()
+        return self.scan_id
+
+    def close(self) -> None:
+        """
+        Κλείνει τη σύνδεση· μια συναλλαγή που δεν ολοκληρώθηκε με τη finish() ακυρώνεται.
+        """
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            conn.rollback()
+            conn.close()
+
+# Κοινό (lazy) ιστορικό της διεργασίας.
+_default_history: FindingsHistory | None = None
+_default_history_lock = threading.Lock()
+
+def get_default_history() -> FindingsHistory:
+    """
+    Επιστρέφει το κοινό ιστορικό σαρώσεων της διεργασίας (DEFAULT_HISTORY_PATH).
+    """
+    global _default_history
+    with _default_history_lock:
+        if _default_history is None:
+            _default_history = FindingsHistory()
+        return _default_history
+
+def days_ago(days: float) -> float:
+    """
+    Χρονική στιγμή (Unix time) πριν από days ημέρες.
+    """
+    return time.time() - days * _DAY_SECONDS
+
+# ---------------------------------------------------
+# 3. Ερωτήματα στο ιστορικό από τη γραμμή εντολών.
+# ---------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m sast.history",
+        description="Ερωτήματα στο ιστορικό σαρώσεων του εργαλείου SAST (έξοδος JSON).")
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH, help="Αρχείο της βάσης SQLite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("new", "Ευρήματα που εμφανίστηκαν για πρώτη φορά τις τελευταίες ημέρες."),
+                            ("trend", "Πλήθος ευρημάτων και νέων ευρημάτων ανά σάρωση.")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--days", type=float, default=7, help="Χρονικό παράθυρο σε ημέρες (προεπιλογή 7).")
+        command.add_argument("--tool", default=None, help="Φίλτρο εργαλείου (π.χ. bandit).")
+        command.add_argument("--severity", default=None, help="Φίλτρο σοβαρότητας (π.χ. HIGH).")
+        command.add_argument("--file", default=None, help="Φίλτρο αρχείου.")
+        command.add_argument("--root", default=None,
+                             help="Φίλτρο ρίζας σάρωσης (φάκελος που σαρώθηκε από το CLI· \"\" για τη διεπαφή).")
+    scans = commands.add_parser("scans", help="Οι πιο πρόσφατες σαρώσεις.")
+    scans.add_argument("--limit", type=int, default=20)
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    history = FindingsHistory(args.db)
+    if args.command == "scans":
+        rows = history.scans(args.limit)
+    else:
+        root = os.path.abspath(args.root) if args.root else args.root    # Όπως καταγράφεται από το CLI.
+        if args.command == "new":
+            rows = history.new_findings(days_ago(args.days), args.tool, args.severity, args.file, root=root)
+        else:
+            rows = history.trend(days_ago(args.days), args.tool, args.severity, args.file, root=root)
+    json.dump(rows, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Incremental σάρωση με βάση το git diff (π.χ. για σαρώσεις pull requests).
+
+Διαβάζει τη διαφορά base..head ενός τοπικού αποθετηρίου git και εκτελεί ξανά τους επιλεγμένους
+αναλυτές μόνο στα αρχεία που άλλαξαν. Για τον custom AST αναλυτή (SecurityVisitor) αναλύονται ξανά
+μόνο οι top-level συναρτήσεις/κλάσεις που άλλαξαν, ενώ για τις υπόλοιπες επαναχρησιμοποιούνται τα
+ευρήματα της προηγούμενης σάρωσης (baseline), με προσαρμοσμένους αριθμούς γραμμών. Τα αρχεία που
+δεν άλλαξαν διατηρούν αυτούσια τα αποτελέσματα του baseline.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import ast
+import time
+import hashlib
+import logging
+import subprocess
+from dataclasses import replace
+from typing import Any
+
+from sast.analyzers import SecurityVisitor
+from sast.batch import BATCH_TOOLS, DEFAULT_BATCH_SIZE, run_tools_batched
+from sast.cache import get_default_cache
+from sast.context import AnalysisContext
+from sast.orchestrator import TOOL_RUNNERS, DEFAULT_TOOLS, run_tools_sequentially
+from sast.discovery import is_selected
+from sast.findings import Finding, as_findings, custom_ast_findings
+from sast.budget import TIMEOUT_STATUS, result_status, scan_status
+
+logger = logging.getLogger("sast_tool")
+
+# Top-level κόμβοι των οποίων τα ευρήματα μπορούν να επαναχρησιμοποιηθούν όταν δεν άλλαξαν.
+_REUSABLE_UNITS: tuple[type[ast.AST], ...] = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# -----------------------------------------
+# 2. Βοηθητικές συναρτήσεις για το git.
+# -----------------------------------------
+
+class GitError(RuntimeError):
+    """
+    Σφάλμα κατά την εκτέλεση εντολής git (π.χ. άγνωστο revision ή φάκελος που δεν είναι αποθετήριο).
+    """
+
+def _git(repo: str, *args: str) -> bytes:
+    try:
+        result = subprocess.run(["git", "-C", repo, *args], capture_output=True)
+    except FileNotFoundError as exc:
+        raise GitError("Το git δεν βρέθηκε στο σύστημα.") from exc
+    if result.returncode != 0:
+        raise GitError(result.stderr.decode("utf-8", errors="replace").strip()
+                       or f"Αποτυχία εντολής git {' '.join(args)}")
+    return result.stdout
+
+def changed_files(repo: str, base: str, head: str | None = "HEAD") -> dict[str, str]:
+    """
+    Επιστρέφει λεξικό {διαδρομή: κατάσταση} με τα αρχεία που άλλαξαν μεταξύ base και head
+    (A: νέο, M: τροποποιημένο, D: διαγραμμένο). Οι μετονομασίες εμφανίζονται ως D + A.
+    Οι διαδρομές είναι σχετικές με τον φάκελο repo (που μπορεί να είναι υποφάκελος του αποθετηρίου),
+    όπως στη scan_directory, και αρχεία εκτός αυτού αγνοούνται.
+    head: Revision προορισμού ή None για σύγκριση με το working tree.
+    """
+    revisions = [base] if head is None else [base, head]
+    output = _git(repo, "diff", "--name-status", "--no-renames", "--relative", "-z", *revisions, "--", ".")
+    fields = output.decode("utf-8", errors="surrogateescape").split("\0")
+    changes: dict[str, str] = {}
+    for status, path in zip(fields[0::2], fields[1::2]):
+        if path:
+            changes[path] = "D" if status.startswith("D") else ("A" if status.startswith("A") else "M")
+    return changes
+
+def read_revision_file(repo: str, revision: str | None, rel_path: str) -> str:
+    """
+    Επιστρέφει το περιεχόμενο ενός αρχείου σε συγκεκριμένο revision (ή στο working tree αν revision=None).
+    """
+    if revision is None:
+        with open(f"{repo}/{rel_path}", "r", encoding="utf-8") as source_file:
+            return source_file.read()
+    return _git(repo, "show", f"{revision}:./{rel_path}").decode("utf-8")
+
+# ---------------------------------------------------------------------
+# 3. Incremental ανάλυση custom AST σε επίπεδο top-level συναρτήσεων/κλάσεων.
+# ---------------------------------------------------------------------
+
+def _unit_span(node: ast.stmt) -> tuple[int, int]:
+    """
+    Εύρος γραμμών ενός top-level κόμβου, μαζί με τους decorators του.
+    """
+    start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return start, node.end_lineno or node.lineno
+
+def _unit_layout(node: ast.stmt) -> str:
+    """
+    Hash της διάταξης μιας μονάδας: οι θέσεις όλων των κόμβων της σχετικά με την πρώτη γραμμή της.
+    Αλλάζει όταν προστίθενται ή αφαιρούνται γραμμές (π.χ. σχόλια, κενές γραμμές) μέσα στη μονάδα.
+    """
+    start, _end = _unit_span(node)
+    positions = [(child.lineno - start, child.col_offset, (child.end_lineno or child.lineno) - start,
+                  child.end_col_offset) for child in ast.walk(node) if hasattr(child, "lineno")]
+    return hashlib.sha256(repr(positions).encode("utf-8")).hexdigest()[:16]
+
+def _unit_key(node: ast.stmt) -> tuple[str, str, str, str]:
+    """
+    Κλειδί ταυτοποίησης μιας top-level μονάδας: είδος, όνομα, το ast.dump χωρίς θέσεις και η
+    σχετική διάταξη των γραμμών της. Μια μονάδα που απλώς μετακινήθηκε θεωρείται αμετάβλητη
+    (τα ευρήματά της μετατοπίζονται όλα κατά το ίδιο πλήθος γραμμών), ενώ αν άλλαξε η διάταξη
+    μέσα της αναλύεται ξανά.
+    """
+    return type(node).__name__, getattr(node, "name", ""), ast.dump(node), _unit_layout(node)
+
+def incremental_custom_ast(old_code: str,
+                           new_code: str,
+                           old_issues: list[Finding | dict[str, Any]],
+                           context: AnalysisContext | None = None) -> tuple[dict[str, Any], dict[str, int]]:
+    """
+    Εκτελεί τον SecurityVisitor μόνο στις top-level μονάδες του new_code που άλλαξαν σε σχέση με το
+    old_code και επαναχρησιμοποιεί τα old_issues (ευρήματα του baseline για το old_code, ως Finding ή
+    ως λεξικά της έξοδου JSON) για τις υπόλοιπες, μετατοπίζοντας τις γραμμές τους. Το fingerprint
+    τους δεν αλλάζει, αφού εξαρτάται από το περιεχόμενο και όχι από τον αριθμό της γραμμής. Οι top-level εντολές εκτός συναρτήσεων/κλάσεων
+    αναλύονται πάντα ξανά (είναι φθηνές).
+    Επιστρέφει (αποτέλεσμα στη μορφή της run_custom_ast_analysis, στατιστικά reused/reanalyzed).
+    """
+    context = context or AnalysisContext(new_code)
+    try:
+        new_tree = context.tree
+        old_tree = ast.parse(old_code)
+    except SyntaxError as exc:
+        return ({"ok": False, "error": f"Σφάλμα σύνταξης κατά την ανάλυση AST: {exc}", "results": []},
+                {"reused_units": 0, "reanalyzed_units": 0})
+
+    # Αντιστοίχιση των ευρημάτων του baseline στις αμετάβλητες μονάδες του παλιού αρχείου.
+    old_units: dict[tuple[str, str, str, str], list[tuple[int, int]]] = {}
+    for node in old_tree.body:
+        if isinstance(node, _REUSABLE_UNITS):
+            old_units.setdefault(_unit_key(node), []).append(_unit_span(node))
+
+    old_findings = as_findings(old_issues)
+    issues: list[Finding] = []
+    stats = {"reused_units": 0, "reanalyzed_units": 0}
+    with context.stage("custom_ast"):
+        for node in new_tree.body:
+            spans = old_units.get(_unit_key(node)) if isinstance(node, _REUSABLE_UNITS) else None
+            if spans:
+                old_start, old_end = spans.pop(0)
+                new_start, _new_end = _unit_span(node)
+                shift = new_start - old_start
+                for issue in old_findings:
+                    if issue.line is not None and old_start <= issue.line <= old_end:
+                        issues.append(replace(issue, line=issue.line + shift))
+                stats["reused_units"] += 1
+            else:
+                visitor = SecurityVisitor()
+                visitor.visit(node)
+                issues.extend(custom_ast_findings(visitor.issues, context.source))
+                if isinstance(node, _REUSABLE_UNITS):
+                    stats["reanalyzed_units"] += 1
+    return {"ok": True, "error": None, "results": issues}, stats
+
+# -------------------------------------------------------------
+# 4. Ορισμός συνάρτησης για incremental σάρωση ενός αποθετηρίου.
+# -------------------------------------------------------------
+
+def scan_incremental(repo: str,
+                     base: str,
+                     head: str | None = "HEAD",
+                     baseline: dict[str, Any] | None = None,
+                     tools: list[str] | None = None,
+                     include: list[str] | None = None,
+                     exclude: list[str] | None = None,
+                     use_cache: bool = True,
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> dict[str, Any]:
+    """
+    Σαρώνει μόνο τα αρχεία που άλλαξαν μεταξύ base και head και τα συγχωνεύει με το baseline.
+    baseline: Προηγούμενο αποτέλεσμα της scan_directory/scan_incremental για το base (ή None,
+              οπότε επιστρέφονται μόνο τα αρχεία που άλλαξαν).
+    Επιστρέφει λεξικό στη μορφή της scan_directory, με επιπλέον στατιστικά για τα αρχεία/μονάδες.
+    """
+    tools = tools or DEFAULT_TOOLS
+    unknown = [tool for tool in tools if tool not in TOOL_RUNNERS]
+    if unknown:
+        raise ValueError(f"Άγνωστα εργαλεία ανάλυσης: {', '.join(unknown)}")
+    started = time.perf_counter()
+    changes = {path: status for path, status in changed_files(repo, base, head).items()
+               if is_selected(path, include, exclude)}
+    baseline_files: dict[str, Any] = dict((baseline or {}).get("files", {}))
+
+    files: dict[str, dict[str, Any]] = {path: results for path, results in baseline_files.items()
+                                        if path not in changes}
+    sources: dict[str, str] = {}
+    for path, status in changes.items():
+        if status == "D":
+            continue                                        # Διαγραμμένα αρχεία αφαιρούνται από το αποτέλεσμα.
+        try:
+            sources[path] = read_revision_file(repo, head, path)
+        except (OSError, UnicodeDecodeError, GitError) as exc:
+            error = {"ok": False, "error": f"Αδυναμία ανάγνωσης του αρχείου {path}: {exc}", "results": []}
+            files[path] = {tool: error for tool in tools}
+
+    cache = get_default_cache() if use_cache else None
+    batch_tools = [tool for tool in tools if tool in BATCH_TOOLS] if batch_size > 0 else []
+    unit_stats = {"reused_units": 0, "reanalyzed_units": 0}
+    for path, code in sources.items():
+        context = AnalysisContext(code, filename=path)
+        other_tools = [tool for tool in tools if tool not in batch_tools and tool != "custom_ast"]
+        file_results = run_tools_sequentially(code, other_tools, cache=cache, context=context)
+        if "custom_ast" in tools:
+            previous = baseline_files.get(path, {}).get("custom_ast")
+            if changes[path] == "M" and previous and previous.get("ok"):
+                try:
+                    old_code = read_revision_file(repo, base, path)
+                except (UnicodeDecodeError, GitError):
+                    old_code = None
+                if old_code is not None:
+                    result, stats = incremental_custom_ast(old_code, code, previous["results"], context)
+                    file_results["custom_ast"] = result
+                    unit_stats = {key: unit_stats[key] + stats[key] for key in unit_stats}
+            if "custom_ast" not in file_results:            # Νέο αρχείο ή χωρίς baseline: πλήρης ανάλυση.
+                file_results.update(run_tools_sequentially(code, ["custom_ast"], cache=cache, context=context))
+        files[path] = file_results
+
+    if batch_tools and sources:
+        for path, batch_results in run_tools_batched(sources, batch_tools, batch_size, cache).items():
+            files[path].update(batch_results)
+
+    files = {path: {tool: results[tool] for tool in tools if tool in results}
+             for path, results in sorted(files.items())}
+    elapsed = time.perf_counter() - started
+    findings = sum(len(result.get("results") or []) for file_results in files.values()
+                   for result in file_results.values())
+    errors = sum(1 for file_results in files.values() for result in file_results.values() if not result.get("ok"))
+    timeouts = sum(1 for file_results in files.values() for result in file_results.values()
+                   if result_status(result) == TIMEOUT_STATUS)
+    return {
+        "root": repo,
+        "tools": tools,
+        "base": base,
+        "head": head,
+        "status": scan_status(result for file_results in files.values() for result in file_results.values()),
+        "files": files,
+        "stats": {
+            "files": len(files),
+            "changed_files": len(changes),
+            "rescanned_files": len(sources),
+            "findings": findings,
+            "errors": errors,
+            "timeouts": timeouts,
+            **unit_stats,
+            "wall_time_s": round(elapsed, 3)}}
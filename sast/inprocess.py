@@ -0,0 +1,189 @@
+"""
+In-process backend για τα Bandit και Pylint.
+
+Αντί για νέα διεργασία (εκκίνηση interpreter, import του εργαλείου, προσωρινό αρχείο, σειριοποίηση
+και ξανά ανάγνωση JSON), τα δύο εργαλεία καλούνται απευθείας ως βιβλιοθήκες Python: η Bandit μέσω του
+BanditManager με τον κώδικα σε μνήμη (όπως στο `bandit -`) και η Pylint μέσω του pylint.lint.Run με
+CollectingReporter. Οι συναρτήσεις επιστρέφουν την ίδια μορφή λεξικού με τις run_* συναρτήσεις του
+sast.analyzers ή None, αν το in-process backend δεν είναι διαθέσιμο, ώστε ο καλών να χρησιμοποιήσει
+το CLI του εργαλείου (subprocess) ως εφεδρική λύση.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import io
+import os
+import logging
+import threading
+import importlib.util
+from functools import lru_cache
+from typing import Any
+
+from sast.findings import FindingBuilder, bandit_findings
+from sast.workspace import ScanWorkspace
+
+logger = logging.getLogger("sast_tool")
+
+# Backend εκτέλεσης των Bandit/Pylint: "inprocess" (προεπιλογή, με εφεδρικό το subprocess) ή "subprocess".
+ANALYZER_BACKEND: str = os.getenv("SAST_ANALYZER_BACKEND", "inprocess").strip().lower()
+
+# Τα δύο εργαλεία κρατούν καθολική κατάσταση (π.χ. την cache modules του astroid), οπότε δεν
+# εκτελούνται ταυτόχρονα από πολλά νήματα του orchestrator. Ως pure-Python κώδικας περιορίζονται
+# ούτως ή άλλως από το GIL, άρα η σειριοποίηση δεν κοστίζει σε χρόνο.
+_BANDIT_LOCK = threading.Lock()
+_PYLINT_LOCK = threading.Lock()
+
+# Όνομα "αρχείου" με το οποίο η Bandit αναγνωρίζει κώδικα χωρίς αρχείο στο δίσκο (όπως στο `bandit -`).
+BANDIT_STDIN_NAME: str = "<stdin>"
+
+# Ο έλεγχος B613 (trojansource) ξαναδιαβάζει το αρχείο από το δίσκο, οπότε δεν εκτελείται in-process.
+# Αναφέρει μόνο κώδικα με χαρακτήρες ελέγχου κατεύθυνσης (bidi), ο οποίος στέλνεται στο CLI.
+_BANDIT_FILE_ONLY_TESTS: frozenset[str] = frozenset({"B613"})
+_BIDI_CHARACTERS: tuple[str, ...] = ("\u202a", "\u202b", "\u202c", "\u202d", "\u202e",
+                                     "\u2066", "\u2067", "\u2068", "\u2069", "\u200f")
+
+# ------------------------------------------------------------
+# 2. Ορισμός συνάρτησης για in-process εκτέλεση της Bandit.
+# ------------------------------------------------------------
+
+class _StdinModuleNameFilter(logging.Filter):
+    """
+    Η Bandit προειδοποιεί σε κάθε σάρωση ότι δεν βρίσκει όνομα module για το "<stdin>". Στο CLI το
+    μήνυμα χανόταν στο stderr της διεργασίας, οπότε in-process αγνοείται.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not (record.levelno == logging.WARNING and BANDIT_STDIN_NAME in record.getMessage())
+
+logging.getLogger("bandit.core.node_visitor").addFilter(_StdinModuleNameFilter())
+
+def bandit_reads_file(code: str) -> bool:
+    """
+    True αν ο κώδικας αφορά τον έλεγχο B613, ο οποίος ξαναδιαβάζει το αρχείο από τον δίσκο, οπότε η
+    Bandit πρέπει να τον λάβει ως αρχείο (ούτε in-process ούτε από stdin).
+    """
+    return any(char in code for char in _BIDI_CHARACTERS)
+
+def run_bandit_inprocess(code: str) -> dict[str, Any] | None:
+    """
+    Τρέχει τη Bandit στον κώδικα χωρίς νέα διεργασία και χωρίς προσωρινό αρχείο. Επιστρέφει λεξικό
+    στη μορφή της run_bandit_on_code (ok, error, results, metrics) ή None αν η Bandit δεν μπορεί να
+    εκτελεστεί in-process (π.χ. δεν είναι εγκατεστημένη στο ίδιο περιβάλλον).
+    """
+    try:
+        from bandit.core import config as b_config
+        from bandit.core import manager as b_manager
+    except ImportError:
+        return None
+    if bandit_reads_file(code):
+        return None
+
+    try:
+        with _BANDIT_LOCK:
+            manager = b_manager.BanditManager(b_config.BanditConfig(), "file", quiet=True,
+                                              profile={"exclude": set(_BANDIT_FILE_ONLY_TESTS)})
+            manager.files_list = [BANDIT_STDIN_NAME]
+            # Η _parse_file είναι το ίδιο σημείο που χρησιμοποιεί η run_tests της Bandit για το stdin.
+            manager._parse_file(BANDIT_STDIN_NAME, io.BytesIO(code.encode("utf-8")), manager.files_list)
+            manager.metrics.aggregate()
+            issues = [issue.as_dict() for issue in manager.get_issue_list()]
+            metrics = manager.metrics.data
+    except Exception:                   # Οποιοδήποτε απρόοπτο σφάλμα της βιβλιοθήκης => εφεδρικό subprocess.
+        logger.exception("Αποτυχία in-process εκτέλεσης της Bandit, χρήση του CLI.")
+        return None
+
+    # Ίδια σειρά με τον JSON formatter της Bandit (ταξινόμηση ανά αρχείο, σταθερή ως προς τη γραμμή).
+    issues.sort(key=lambda item: item["filename"])
+    return {"ok": True, "error": None, "results": bandit_findings(issues, code), "metrics": metrics}
+
+# ------------------------------------------------------------
+# 3. Ορισμός συνάρτησης για in-process εκτέλεση της Pylint.
+# ------------------------------------------------------------
+
+def _without_output_format(args: list[str]) -> list[str]:
+    """
+    Αφαιρεί την επιλογή μορφής εξόδου (-f/--output-format), αφού τα μηνύματα συλλέγονται από reporter.
+    """
+    cleaned: list[str] = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+        elif arg in ("-f", "--output-format"):
+            skip_next = True
+        elif not arg.startswith("--output-format="):
+            cleaned.append(arg)
+    return cleaned
+
+def run_pylint_inprocess(code: str, args: list[str], workspace: ScanWorkspace | None = None) -> dict[str, Any] | None:
+    """
+    Τρέχει την Pylint στον κώδικα μέσα στην ίδια διεργασία. Επιστρέφει λεξικό στη μορφή της
+    run_pylint_on_code (ok, error, results, score) ή None αν η Pylint δεν είναι διαθέσιμη in-process.
+    args: Οι επιλογές της Pylint (π.χ. PYLINT_ARGS). Η μορφή εξόδου αγνοείται.
+    Η Pylint χρειάζεται διαδρομή αρχείου για το όνομα του module, οπότε ο κώδικας γράφεται στο κοινό
+    workspace της σάρωσης (ή σε ένα μόνο για αυτή την κλήση), αλλά το κόστος εκκίνησης και import (το
+    μεγαλύτερο μέρος του χρόνου) αποφεύγεται.
+    Σε αντίθεση με την έξοδο JSON του CLI, εδώ επιστρέφεται και η βαθμολογία (score).
+    """
+    try:
+        from astroid import MANAGER
+        from pylint.lint import Run
+        from pylint.reporters import CollectingReporter
+    except ImportError:
+        return None
+
+    own_workspace = workspace is None
+    workspace = workspace or ScanWorkspace(code)
+    try:
+        source_path = workspace.source_path()
+        reporter = CollectingReporter()
+        with _PYLINT_LOCK:
+            try:
+                run = Run([*_without_output_format(args), "--persistent=n", source_path],
+                          reporter=reporter, exit=False)
+            finally:
+                # Το astroid κρατά κάθε module που αναλύθηκε. Τα προσωρινά modules αφαιρούνται, ώστε η
+                # μνήμη να μη μεγαλώνει σε μακροχρόνιες διεργασίες (Streamlit, workers).
+                MANAGER.astroid_cache.pop(os.path.splitext(os.path.basename(source_path))[0], None)
+    except SystemExit as exc:           # Η Pylint τερματίζει με sys.exit σε λάθος επιλογές.
+        return {"ok": False, "error": f"Μη έγκυρες επιλογές Pylint (κωδικός {exc.code}).", "results": [], "score": None}
+    except Exception:
+        logger.exception("Αποτυχία in-process εκτέλεσης της Pylint, χρήση του CLI.")
+        return None
+    finally:
+        if own_workspace:
+            workspace.close()
+
+    # Τα Finding δημιουργούνται απευθείας από τα Message της Pylint, χωρίς ενδιάμεσο λεξικό JSON.
+    build = FindingBuilder("pylint", code)
+    messages = [build(message.msg_id, message.category, message.line, message.msg,
+                      column=message.column, symbol=message.symbol)
+                for message in reporter.messages]
+    note = getattr(run.linter.stats, "global_note", None)
+    score = f"{note:.2f}" if isinstance(note, (int, float)) and run.linter.config.score else None
+    return {"ok": True, "error": None, "results": messages, "score": score}
+
+# ------------------------------------------------------------
+# 4. Backend που θα εκτελέσει κάθε εργαλείο (για το κλειδί της cache).
+# ------------------------------------------------------------
+
+# Εργαλεία με in-process backend (και το CLI ως εφεδρικό).
+INPROCESS_TOOLS: tuple[str, ...] = ("bandit", "pylint")
+
+@lru_cache(maxsize=None)
+def _importable(package: str) -> bool:
+    return importlib.util.find_spec(package) is not None
+
+def expected_backend(tool: str, code: str) -> str:
+    """
+    Το backend ("inprocess" ή "subprocess") με το οποίο η run_* συνάρτηση ενός από τα INPROCESS_TOOLS θα
+    εκτελέσει τον κώδικα: το CLI αν ζητηθεί SAST_ANALYZER_BACKEND=subprocess, αν το πακέτο δεν είναι
+    εγκατεστημένο στο ίδιο περιβάλλον ή αν ο κώδικας πρέπει να δοθεί στη Bandit ως αρχείο (B613).
+    """
+    if ANALYZER_BACKEND != "inprocess" or not _importable(tool):
+        return "subprocess"
+    if tool == "bandit" and bandit_reads_file(code):
+        return "subprocess"
+    return "inprocess"
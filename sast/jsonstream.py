@@ -0,0 +1,215 @@
+"""
+Σταδιακή (streaming) ανάλυση της εξόδου JSON των εργαλείων CLI.
+
+Ο JsonRecordParser δέχεται την stdout ενός εργαλείου σε τμήματα (feed) και επιστρέφει μία-μία τις
+εγγραφές των πινάκων που ζητούνται (π.χ. το "results" της Bandit/Semgrep ή τον πίνακα μηνυμάτων της
+Pylint), χωρίς να κρατά ποτέ ολόκληρη την έξοδο ή το αποκωδικοποιημένο έγγραφο στη μνήμη. Κάθε
+τιμή αποκωδικοποιείται με το json.JSONDecoder.raw_decode μόλις είναι διαθέσιμη ολόκληρη, οπότε
+η μνήμη εξαρτάται από το μέγεθος της μεγαλύτερης εγγραφής και όχι από το πλήθος τους. Τα υπόλοιπα
+μέλη του εγγράφου (π.χ. "errors", "metrics") συγκεντρώνονται στο document.
+
+Ο parser δεν διαβάζει ο ίδιος από τη ροή, οπότε τον τροφοδοτεί είτε η JsonRecordStream από ένα
+(blocking) αρχείο/pipe είτε ο asyncio runner (sast.aiosubprocess) καθώς φτάνουν τα δεδομένα.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import re
+import json
+import time
+import codecs
+from typing import Any, BinaryIO, Iterable, Iterator
+
+# Μέγεθος κάθε ανάγνωσης από το pipe.
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Πρώτος χαρακτήρας ενός αριθμού JSON και χαρακτήρες που μπορούν να ακολουθούν έναν ολοκληρωμένο αριθμό.
+_NUMBER_START: str = "-0123456789"
+_NUMBER_END: tuple[str, ...] = (" ", "\t", "\n", "\r", ",", "]", "}")
+
+class JsonStreamError(ValueError):
+    """
+    Η έξοδος δεν είναι έγκυρο JSON (ή διακόπηκε πριν ολοκληρωθεί).
+    """
+
+# ---------------------------------------------------------------
+# 2. Σταδιακός αναλυτής εγγραφών ενός εγγράφου JSON (push parser).
+# ---------------------------------------------------------------
+
+# Σήμα του εσωτερικού generator ότι χρειάζονται περισσότερα δεδομένα.
+_NEED_DATA = object()
+
+class JsonRecordParser:
+    """
+    Σταδιακός αναλυτής: η feed(τμήμα bytes) επιστρέφει τα ζεύγη (κλειδί, εγγραφή) που ολοκληρώθηκαν
+    με το τμήμα αυτό· η close() δηλώνει το τέλος της εξόδου (και επιστρέφει όσα απέμειναν).
+    record_keys: Μέλη του εξωτερικού αντικειμένου των οποίων τα στοιχεία επιστρέφονται ένα-ένα. Αν το
+                 έγγραφο είναι πίνακας, επιστρέφονται τα στοιχεία του με κλειδί "".
+    Μετά την close():
+        document: Το έγγραφο χωρίς τις εγγραφές (οι πίνακες των record_keys είναι κενοί), ή None αν
+                  η έξοδος ήταν κενή.
+        bytes_read / records / decode_s: Bytes που δόθηκαν, πλήθος εγγραφών και χρόνος αποκωδικοποίησης.
+    Σφάλματα της εξόδου προκαλούν JsonStreamError.
+    """
+
+    def __init__(self, record_keys: Iterable[str] = ("results",)) -> None:
+        self.record_keys = frozenset(record_keys)
+        self.document: Any = None
+        self.bytes_read = 0
+        self.records = 0
+        self.decode_s = 0.0
+        self._text = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._done = False
+        self._events = self._parse()
+
+    def feed(self, chunk: bytes) -> Iterator[tuple[str, Any]]:
+        if self._pos > DEFAULT_CHUNK_SIZE and self._pos * 2 > len(self._buffer):
+            self._buffer = self._buffer[self._pos:]         # Απόρριψη όσων έχουν ήδη αναλυθεί.
+            self._pos = 0
+        if chunk:
+            self.bytes_read += len(chunk)
+            self._buffer += self._text.decode(chunk)
+        return self._resume()
+
+    def close(self) -> Iterator[tuple[str, Any]]:
+        self._eof = True
+        self._buffer += self._text.decode(b"", final=True)
+        return self._resume()
+
+    def _resume(self) -> Iterator[tuple[str, Any]]:
+        while not self._done:
+            event = next(self._events, None)
+            if event is None:
+                self._done = True
+            elif event is _NEED_DATA:
+                if not self._eof:
+                    return
+            else:
+                yield event
+
+    def _peek(self) -> Iterator[Any]:
+        """
+        Ο επόμενος χαρακτήρας μετά από κενά (χωρίς να καταναλωθεί) ή "" στο τέλος της εξόδου.
+        """
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ""
+            yield _NEED_DATA
+
+    def _expect(self, allowed: str) -> Iterator[Any]:
+        char = yield from self._peek()
+        if not char or char not in allowed:
+            raise JsonStreamError(f"Αναμενόταν ένα από {allowed!r} στη θέση {self.bytes_read}, "
+                                  f"βρέθηκε {char or 'τέλος εξόδου'!r}.")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Iterator[Any]:
+        """
+        Αποκωδικοποιεί την επόμενη ολοκληρωμένη τιμή JSON. Αν η τιμή δεν έχει φτάσει ολόκληρη,
+        περιμένει περισσότερα δεδομένα (τουλάχιστον διπλάσια κάθε φορά, ώστε μια μεγάλη τιμή να μην
+        αναλύεται ξανά από την αρχή για κάθε τμήμα).
+        """
+        yield from self._peek()
+        while True:
+            started = time.perf_counter()
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                error: json.JSONDecodeError | None = exc
+            else:
+                error = None
+            finally:
+                self.decode_s += time.perf_counter() - started
+            # Ένας αριθμός ολοκληρώνεται μόνο με τον επόμενο χαρακτήρα (κενό, ",", "]", "}") ή με το τέλος
+            # της εξόδου· αλλιώς μπορεί να συνεχίζεται στο επόμενο τμήμα (π.χ. "0." + "5", "1e" + "5").
+            if error is None and (self._eof or self._buffer[self._pos] not in _NUMBER_START
+                                  or self._buffer[end:end + 1] in _NUMBER_END):
+                self._pos = end
+                return value
+            if self._eof:
+                raise JsonStreamError(f"Μη έγκυρη έξοδος JSON: {error}") from error
+            target = 2 * (len(self._buffer) - self._pos) + DEFAULT_CHUNK_SIZE
+            while len(self._buffer) - self._pos < target and not self._eof:
+                yield _NEED_DATA
+
+    def _array(self, key: str) -> Iterator[Any]:
+        yield from self._expect("[")
+        if (yield from self._peek()) == "]":
+            self._pos += 1
+            return
+        while True:
+            record = yield from self._value()
+            self.records += 1
+            yield key, record
+            if (yield from self._expect(",]")) == "]":
+                return
+
+    def _parse(self) -> Iterator[Any]:
+        first = yield from self._peek()
+        if first == "[":
+            self.document = []
+            yield from self._array("")
+        elif first == "{":
+            self.document = {}
+            self._pos += 1
+            if (yield from self._peek()) == "}":
+                self._pos += 1
+            else:
+                while True:
+                    key = yield from self._value()
+                    if not isinstance(key, str):
+                        raise JsonStreamError(f"Μη έγκυρο κλειδί αντικειμένου JSON: {key!r}")
+                    yield from self._expect(":")
+                    if key in self.record_keys and (yield from self._peek()) == "[":
+                        self.document[key] = []
+                        yield from self._array(key)
+                    else:
+                        self.document[key] = yield from self._value()
+                    if (yield from self._expect(",}")) == "}":
+                        break
+        elif first:
+            self.document = yield from self._value()
+        if (yield from self._peek()):
+            raise JsonStreamError("Μη έγκυρη έξοδος JSON: επιπλέον δεδομένα μετά το τέλος του εγγράφου.")
+
+# ---------------------------------------------------------------
+# 3. Ανάγνωση εγγραφών από blocking ροή bytes (π.χ. process.stdout).
+# ---------------------------------------------------------------
+
+class JsonRecordStream:
+    """
+    Iterator ζευγών (κλειδί, εγγραφή) από ροή bytes, μέσω ενός JsonRecordParser. Μετά την εξάντλησή
+    του, τα document, bytes_read, records και decode_s είναι αυτά του parser.
+    """
+
+    def __init__(self, stream: BinaryIO, record_keys: Iterable[str] = ("results",),
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.parser = JsonRecordParser(record_keys)
+        self._read = getattr(stream, "read1", stream.read)  # read1: ό,τι είναι διαθέσιμο, χωρίς αναμονή για όλο το chunk.
+        self._chunk_size = chunk_size
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("document", "bytes_read", "records", "decode_s"):
+            return getattr(self.parser, name)
+        raise AttributeError(name)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        while True:
+            chunk = self._read(self._chunk_size)
+            if not chunk:
+                yield from self.parser.close()
+                return
+            yield from self.parser.feed(chunk)
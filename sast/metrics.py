@@ -0,0 +1,237 @@
+"""
+Μετρήσεις κόστους (χρόνος, CPU, μνήμη, έξοδος) ανά εκτέλεση εργαλείου ανάλυσης.
+
+Κάθε run_* συνάρτηση του sast.analyzers τυλίγεται με τον decorator instrumented, ο οποίος καταγράφει
+στο κλειδί "resources" του αποτελέσματος τον χρόνο (wall), τον χρόνο CPU user/system του νήματος που
+εκτέλεσε το εργαλείο και, για τα εργαλεία CLI, της θυγατρικής διεργασίας (rusage μέσω os.wait4), τη
+μνήμη (για τις θυγατρικές διεργασίες η μέγιστη, το VmHWM τους όσο εκτελούνται· in-process η μεταβολή
+της RSS της τρέχουσας διεργασίας κατά την κλήση), τα bytes της εξόδου stdout και τον χρόνο
+αποκωδικοποίησης του JSON.
+Προαιρετικά (SAST_METRICS_FILE) οι μετρήσεις προστίθενται σε αρχείο με τη μορφή κειμένου του Prometheus.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import time
+import logging
+import functools
+import subprocess
+from typing import Any, Callable
+
+try:
+    import resource                                 # Δεν υπάρχει στα Windows: μετρώνται μόνο χρόνοι.
+except ImportError:
+    resource = None
+
+logger = logging.getLogger("sast_tool")
+
+# Αρχείο μετρήσεων Prometheus (κενό = απενεργοποιημένο). Ρυθμίζεται και από το CLI (--metrics-file).
+METRICS_FILE: str = os.getenv("SAST_METRICS_FILE", "")
+
+# Διάστημα (s) μεταξύ δύο δειγμάτων της μέγιστης μνήμης μιας θυγατρικής διεργασίας (child_peak_rss_mb).
+RSS_SAMPLE_INTERVAL_S: float = 0.02
+
+# Μετρήσεις (κλειδί του "resources" -> όνομα και περιγραφή στο Prometheus, συντελεστής μονάδας).
+_PROMETHEUS_METRICS: tuple[tuple[str, str, str, float], ...] = (
+    ("wall_time_s", "sast_tool_wall_seconds", "Χρόνος εκτέλεσης του εργαλείου.", 1.0),
+    ("cpu_user_s", "sast_tool_cpu_user_seconds", "Χρόνος CPU (user) του εργαλείου.", 1.0),
+    ("cpu_system_s", "sast_tool_cpu_system_seconds", "Χρόνος CPU (system) του εργαλείου.", 1.0),
+    ("peak_rss_mb", "sast_tool_peak_rss_bytes", "Μέγιστη μνήμη (RSS) της θυγατρικής διεργασίας του εργαλείου.", 1024 * 1024),
+    ("rss_delta_mb", "sast_tool_rss_delta_bytes", "Μεταβολή της μνήμης (RSS) της διεργασίας κατά την in-process εκτέλεση.", 1024 * 1024),
+    ("stdout_bytes", "sast_tool_stdout_bytes", "Bytes εξόδου JSON που αναλύθηκαν.", 1.0),
+    ("json_decode_s", "sast_tool_json_decode_seconds", "Χρόνος αποκωδικοποίησης του JSON.", 1.0),
+)
+
+# ------------------------------------------------------
+# 2. Μετρήσεις πόρων νήματος και θυγατρικών διεργασιών.
+# ------------------------------------------------------
+
+def _rss_mb(maxrss: int) -> float:
+    # Το ru_maxrss δίνεται σε KB στο Linux και σε bytes στο macOS.
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+def thread_cpu_times() -> tuple[float, float]:
+    """
+    Χρόνος CPU (user, system) του τρέχοντος νήματος. Όπου δεν υποστηρίζεται το RUSAGE_THREAD
+    (π.χ. macOS, Windows) επιστρέφεται ο συνολικός χρόνος CPU του νήματος ως user.
+    """
+    if resource is not None and hasattr(resource, "RUSAGE_THREAD"):
+        usage = resource.getrusage(resource.RUSAGE_THREAD)
+        return usage.ru_utime, usage.ru_stime
+    return time.thread_time(), 0.0
+
+def process_peak_rss_mb() -> float:
+    """
+    Μέγιστη μνήμη (RSS) της τρέχουσας διεργασίας σε MB (0 αν δεν είναι διαθέσιμη).
+    """
+    if resource is None:
+        return 0.0
+    return _rss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def process_rss_mb() -> float | None:
+    """
+    Τρέχουσα μνήμη (RSS) της διεργασίας σε MB, από το /proc/self/statm (None εκτός Linux).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def child_peak_rss_mb(pid: int) -> float | None:
+    """
+    Μέγιστη μνήμη (VmHWM) μιας θυγατρικής διεργασίας που εκτελείται ακόμη, σε MB, από το
+    /proc/<pid>/status (Linux). Το VmHWM αφορά τη μνήμη της διεργασίας μετά το exec, σε αντίθεση με
+    το ru_maxrss του os.wait4 που κληρονομεί το peak RSS της γονικής διεργασίας κατά το fork.
+    Επιστρέφει None αν δεν είναι διαθέσιμη (άλλο λειτουργικό ή η διεργασία έχει ήδη τερματίσει).
+    """
+    try:
+        with open(f"/proc/{pid}/status", "rb") as status:
+            for line in status:
+                if line.startswith(b"VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def wait_with_rusage(process: subprocess.Popen, peak_rss_mb: float | None = None) -> dict[str, float]:
+    """
+    Περιμένει τον τερματισμό μιας θυγατρικής διεργασίας και επιστρέφει τη δική της κατανάλωση CPU
+    (cpu_user_s, cpu_system_s) μέσω os.wait4, ανεξάρτητα από άλλες διεργασίες που εκτελούνται
+    ταυτόχρονα από άλλα νήματα. Χωρίς os.wait4 (Windows) επιστρέφεται κενό λεξικό.
+    peak_rss_mb: Η μέγιστη μνήμη της διεργασίας όπως μετρήθηκε όσο εκτελούνταν (child_peak_rss_mb).
+                 Το ru_maxrss δεν χρησιμοποιείται, επειδή περιέχει το peak RSS της γονικής διεργασίας.
+    """
+    if not hasattr(os, "wait4") or process.returncode is not None:
+        process.wait()
+        return {}
+    try:
+        _pid, status, usage = os.wait4(process.pid, 0)
+    except ChildProcessError:                       # Η διεργασία έχει ήδη συλλεχθεί από αλλού.
+        process.wait()
+        return {}
+    process.returncode = os.waitstatus_to_exitcode(status)
+    resources = {"cpu_user_s": usage.ru_utime, "cpu_system_s": usage.ru_stime}
+    if peak_rss_mb is not None:
+        resources["peak_rss_mb"] = peak_rss_mb
+    return resources
+
+# ---------------------------------------------------------
+# 3. Decorator για τις run_* συναρτήσεις των αναλυτών.
+# ---------------------------------------------------------
+
+def instrumented(tool: str) -> Callable[[Callable[..., dict[str, Any]]], Callable[..., dict[str, Any]]]:
+    """
+    Decorator που προσθέτει στο αποτέλεσμα μιας run_* συνάρτησης το λεξικό "resources":
+        backend: "subprocess" αν εκτελέστηκε εξωτερική εντολή (με "resources" από τη
+                 run_subprocess_json), αλλιώς "inprocess". Η run_* συνάρτηση μπορεί να το ορίσει η ίδια
+                 στα δικά της "resources" (π.χ. "skipped" όταν το εργαλείο δεν εκτελέστηκε καθόλου).
+        wall_time_s: Συνολικός χρόνος της κλήσης (μαζί με προσωρινά αρχεία και μετατροπές).
+        cpu_user_s / cpu_system_s: CPU του νήματος και της θυγατρικής διεργασίας (αν υπάρχει).
+        peak_rss_mb: Μέγιστη μνήμη της θυγατρικής διεργασίας (None αν δεν μετρήθηκε, π.χ. εκτός Linux ή
+                     σε διεργασία που τερμάτισε πριν από το πρώτο δείγμα, και πάντα None in-process).
+        rss_delta_mb: In-process, η μεταβολή της RSS της τρέχουσας διεργασίας από την αρχή ως το τέλος της
+                      κλήσης (None για εξωτερική εντολή ή εκτός Linux). Επηρεάζεται και από άλλα νήματα που
+                      εκτελούνται ταυτόχρονα, οπότε δεν συγκρίνεται με το peak_rss_mb των θυγατρικών διεργασιών.
+        stdout_bytes / json_decode_s: Μέγεθος και χρόνος αποκωδικοποίησης της εξόδου JSON (0 in-process).
+    Αν έχει οριστεί αρχείο μετρήσεων, οι τιμές προστίθενται σε αυτό (append_prometheus).
+    """
+    def decorator(runner: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+        @functools.wraps(runner)
+        def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            rss_before = process_rss_mb()
+            user_before, system_before = thread_cpu_times()
+            started = time.perf_counter()
+            result = runner(*args, **kwargs)
+            wall_time_s = time.perf_counter() - started
+            user_after, system_after = thread_cpu_times()
+            rss_after = process_rss_mb()
+
+            child = result.get("resources") or {}
+            backend = child.get("backend") or ("subprocess" if child else "inprocess")
+            in_process = backend != "subprocess" and rss_before is not None and rss_after is not None
+            resources = {
+                "backend": backend,
+                "wall_time_s": wall_time_s,
+                "cpu_user_s": user_after - user_before + child.get("cpu_user_s", 0.0),
+                "cpu_system_s": system_after - system_before + child.get("cpu_system_s", 0.0),
+                "peak_rss_mb": child.get("peak_rss_mb") if backend == "subprocess" else None,
+                "rss_delta_mb": rss_after - rss_before if in_process else None,
+                "stdout_bytes": child.get("stdout_bytes", 0),
+                "json_decode_s": child.get("json_decode_s", 0.0)}
+            result = {**result, "resources": resources}
+            if METRICS_FILE:
+                append_prometheus(METRICS_FILE, tool, resources)
+            return result
+        return wrapper
+    return decorator
+
+# ------------------------------------------
+# 4. Εμφάνιση και εξαγωγή των μετρήσεων.
+# ------------------------------------------
+
+def format_resources(resources: dict[str, Any] | None) -> str:
+    """
+    Σύντομη περιγραφή των μετρήσεων για εμφάνιση (π.χ. δίπλα στο πλήθος ευρημάτων στη διεπαφή).
+    Χωρίς μετρήσεις (π.χ. αποτέλεσμα από την cache) επιστρέφεται κενό string.
+    """
+    if not resources:
+        return ""
+    parts = [f"{resources.get('wall_time_s', 0.0) * 1000:.0f} ms",
+             f"CPU {resources.get('cpu_user_s', 0.0) * 1000:.0f}+{resources.get('cpu_system_s', 0.0) * 1000:.0f} ms"]
+    if resources.get("peak_rss_mb"):
+        parts.append(f"RSS {resources['peak_rss_mb']:.0f} MB")
+    elif resources.get("rss_delta_mb") is not None:
+        parts.append(f"ΔRSS {resources['rss_delta_mb']:+.1f} MB")
+    if resources.get("stdout_bytes"):
+        parts.append(f"stdout {resources['stdout_bytes'] / 1024:.1f} KB "
+                     f"(JSON {resources.get('json_decode_s', 0.0) * 1000:.1f} ms)")
+    return f"{resources.get('backend', '')}: " + " · ".join(parts)
+
+def set_metrics_file(path: str | None) -> None:
+    """
+    Ορίζει (ή απενεργοποιεί με None/"") το αρχείο μετρήσεων για την τρέχουσα διεργασία και για τις
+    διεργασίες που θα ξεκινήσουν από αυτήν (π.χ. workers του CLI), μέσω του SAST_METRICS_FILE.
+    """
+    global METRICS_FILE
+    METRICS_FILE = path or ""
+    if METRICS_FILE:
+        os.environ["SAST_METRICS_FILE"] = METRICS_FILE
+    else:
+        os.environ.pop("SAST_METRICS_FILE", None)
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def append_prometheus(path: str, tool: str, resources: dict[str, Any], timestamp: float | None = None) -> None:
+    """
+    Προσθέτει τις μετρήσεις μιας εκτέλεσης στο αρχείο, σε μορφή κειμένου Prometheus με χρονοσφραγίδα
+    (ms) ανά δείγμα και ετικέτες tool/backend. Οι γραμμές HELP/TYPE γράφονται μόνο σε νέο αρχείο.
+    Η εγγραφή γίνεται με ένα write σε O_APPEND, ώστε να είναι ασφαλής από πολλές διεργασίες. Σφάλματα
+    εγγραφής καταγράφονται ως προειδοποίηση και δεν επηρεάζουν τη σάρωση.
+    """
+    stamp = int((time.time() if timestamp is None else timestamp) * 1000)
+    labels = f'tool="{_label(tool)}",backend="{_label(str(resources.get("backend", "")))}"'
+    lines: list[str] = []
+    try:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size == 0:
+                for _key, name, help_text, _scale in _PROMETHEUS_METRICS:
+                    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for key, name, _help_text, scale in _PROMETHEUS_METRICS:
+                value = resources.get(key)
+                if value is not None:
+                    lines.append(f"{name}{{{labels}}} {value * scale:.9g} {stamp}")
+            os.write(fd, ("\n".join(lines) + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        logger.warning("Αποτυχία εγγραφής μετρήσεων στο %s: %s", path, exc)
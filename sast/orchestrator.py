@@ -0,0 +1,256 @@
+"""
+Ενορχήστρωση (orchestration) των αναλυτών του εργαλείου SAST.
+
+Εκκινεί όλα τα επιλεγμένα εργαλεία παράλληλα, με περιορισμένο αριθμό workers, και συγκεντρώνει
+τα τυποποιημένα αποτελέσματά τους. Έτσι η συνολική σάρωση διαρκεί όσο το πιο αργό εργαλείο και
+όχι όσο το άθροισμα όλων. Κάθε εργαλείο εκτελείται με προθεσμία (sast.budget): εργαλείο που την
+ξεπερνά αναφέρεται ως "timeout" και δεν καθυστερεί τα αποτελέσματα των υπολοίπων. Δεν εξαρτάται από
+το Streamlit, οπότε καλείται και από άλλα σημεία εισόδου.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait     # Για παράλληλη εκτέλεση των εργαλείων σε νήματα.
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from sast.analyzers import (run_bandit_on_code,
+                            run_semgrep_on_code,
+                            run_pylint_on_code,
+                            run_radon_on_code,
+                            run_custom_ast_analysis)
+from sast.cache import ResultCache
+from sast.context import AnalysisContext
+from sast.workspace import ScanWorkspace
+from sast.budget import Budget, ToolTimeoutError, timeout_result, tool_deadline
+
+if TYPE_CHECKING:
+    from sast.workers import WarmWorkerPool
+
+logger = logging.getLogger("sast_tool")
+
+# ---------------------------------------------------------
+# 2. Μητρώο εργαλείων (όνομα εργαλείου -> συνάρτηση run_*).
+# ---------------------------------------------------------
+
+# Η σειρά του λεξικού είναι και η σειρά εμφάνισης των αποτελεσμάτων.
+TOOL_RUNNERS: dict[str, Callable[[str], dict[str, Any]]] = {
+    "bandit": run_bandit_on_code,
+    "semgrep": run_semgrep_on_code,
+    "pylint": run_pylint_on_code,
+    "radon": run_radon_on_code,
+    "custom_ast": run_custom_ast_analysis}
+
+# Ονόματα εργαλείων για εμφάνιση σε μηνύματα.
+TOOL_LABELS: dict[str, str] = {
+    "bandit": "Bandit",
+    "semgrep": "Semgrep",
+    "pylint": "Pylint",
+    "radon": "Radon",
+    "custom_ast": "Custom AST (SecurityVisitor)"}
+
+# In-process εργαλεία που δέχονται κοινό AnalysisContext (ένα parse ανά αρχείο για όλα).
+CONTEXT_TOOLS: tuple[str, ...] = ("radon", "custom_ast")
+
+# Εργαλεία που διαβάζουν τον κώδικα από αρχείο και δέχονται κοινό ScanWorkspace (μία εγγραφή ανά σάρωση).
+WORKSPACE_TOOLS: tuple[str, ...] = ("bandit", "semgrep", "pylint")
+
+# Προεπιλεγμένα εργαλεία για headless σαρώσεις (CLI, incremental), όπου τα εργαλεία CLI είναι προαιρετικά.
+DEFAULT_TOOLS: list[str] = ["custom_ast", "radon"]
+
+# Προεπιλεγμένο όριο workers: ένα νήμα ανά εργαλείο.
+DEFAULT_MAX_WORKERS: int = len(TOOL_RUNNERS)
+
+# Επιπλέον αναμονή μετά την προθεσμία ενός εργαλείου, ώστε τα εργαλεία CLI να προλάβουν να τερματίσουν
+# τη διεργασία τους και να επιστρέψουν το δικό τους αποτέλεσμα "timeout" (μαζί με τις μετρήσεις πόρων).
+DEADLINE_GRACE_S: float = 1.0
+
+# ------------------------------------------------------------------
+# 3. Ορισμός συναρτήσεων για παράλληλη εκτέλεση των επιλεγμένων εργαλείων.
+# ------------------------------------------------------------------
+
+def _error_result(tool: str, exc: Exception) -> dict[str, Any]:
+    return {"ok": False,
+            "error": f"Σφάλμα κατά την εκτέλεση του {TOOL_LABELS[tool]}: {exc}",
+            "results": []}
+
+def _timed(runner: Callable[[str], dict[str, Any]],
+           code: str,
+           tool: str | None = None,
+           budget: Budget | None = None,
+           deadlines: dict[str, tuple[float, float | None]] | None = None) -> tuple[dict[str, Any], float]:
+    """
+    Εκτελεί τη runner(code) και επιστρέφει (αποτέλεσμα, διάρκεια σε δευτερόλεπτα). Αν δοθεί budget,
+    η προθεσμία του εργαλείου υπολογίζεται τη στιγμή που ξεκινά και καταγράφεται στο deadlines ως
+    (έναρξη, προθεσμία), ώστε ο orchestrator να γνωρίζει πότε να σταματήσει να το περιμένει.
+    """
+    started = time.perf_counter()
+    deadline = budget.deadline_for(tool) if budget is not None and tool is not None else None
+    if deadlines is not None and tool is not None:
+        deadlines[tool] = (time.monotonic(), deadline)
+    with tool_deadline(deadline):
+        result = runner(code)
+    return result, time.perf_counter() - started
+
+def _expired_result(tool: str, deadlines: dict[str, tuple[float, float | None]], now: float) -> tuple[dict[str, Any], float]:
+    """
+    Αποτέλεσμα "timeout" για εργαλείο που δεν ολοκληρώθηκε εγκαίρως (ή δεν ξεκίνησε πριν λήξει η σάρωση).
+    """
+    started, deadline = deadlines.get(tool, (now, None))
+    timeout = deadline - started if deadline is not None else None
+    return timeout_result(TOOL_LABELS[tool], timeout), now - started
+
+def iter_tool_results(code: str,
+                      tools: Iterable[str],
+                      max_workers: int | None = None,
+                      cache: ResultCache | None = None,
+                      context: AnalysisContext | None = None,
+                      pool: WarmWorkerPool | None = None,
+                      budget: Budget | None = None) -> Iterator[tuple[str, dict[str, Any], float]]:
+    """
+    Εκτελεί παράλληλα τα επιλεγμένα εργαλεία και επιστρέφει (yield) tuples (εργαλείο, αποτέλεσμα,
+    διάρκεια σε δευτερόλεπτα) με τη σειρά που ολοκληρώνεται κάθε εργαλείο. Έτσι ο καλών (π.χ. το
+    Streamlit UI) εμφανίζει τα αποτελέσματα των γρήγορων αναλυτών χωρίς να περιμένει τους πιο αργούς.
+    Οι παράμετροι έχουν την ίδια σημασία με τη run_tools_concurrently. Μη έγκυρα ονόματα
+    εργαλείων προκαλούν ValueError πριν ξεκινήσει οποιαδήποτε εκτέλεση.
+    Εργαλείο που δεν ολοκληρώνεται μέσα στην προθεσμία του (συν DEADLINE_GRACE_S) επιστρέφεται με
+    status "timeout": τα εργαλεία CLI και οι ζεστοί workers τερματίζονται, ενώ για τα in-process
+    εργαλεία, που δεν διακόπτονται με ασφάλεια, ο orchestrator απλώς σταματά να τα περιμένει.
+    """
+    selected = list(dict.fromkeys(tools))                     # Αφαίρεση διπλοεγγραφών με διατήρηση της σειράς.
+    unknown = [tool for tool in selected if tool not in TOOL_RUNNERS]
+    if unknown:
+        raise ValueError(f"Άγνωστα εργαλεία ανάλυσης: {', '.join(unknown)}")
+    if not selected:
+        return
+
+    context = context or AnalysisContext(code)
+    workspace = ScanWorkspace(code)
+    budget = budget or Budget()
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(selected)))
+    scan_deadline = budget.started + budget.scan_timeout if budget.scan_timeout else None
+    deadlines: dict[str, tuple[float, float | None]] = {}    # Εργαλείο -> (έναρξη, προθεσμία), από το νήμα του.
+
+    # Το executor δεν χρησιμοποιείται ως context manager: στο τέλος δεν περιμένουμε τα in-process
+    # εργαλεία που έληξαν, και ακυρώνονται όσα δεν έχουν ξεκινήσει.
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sast-tool")
+    try:
+        futures: dict[Future, str] = {}
+        for tool in selected:
+            runner = TOOL_RUNNERS[tool]
+            if tool in CONTEXT_TOOLS:
+                runner = partial(runner, context=context)
+            elif pool is not None and tool in pool.tools:
+                runner = partial(pool.run_tool, tool)
+            elif tool in WORKSPACE_TOOLS:
+                runner = partial(runner, workspace=workspace)
+            if cache is not None:
+                runner = partial(cache.run_cached, tool, runner=runner)
+            futures[executor.submit(_timed, runner, code, tool, budget, deadlines)] = tool
+        pending = set(futures)
+        while pending:
+            # Αναμονή μέχρι να ολοκληρωθεί κάποιο εργαλείο ή να λήξει η πλησιέστερη προθεσμία.
+            limits = [deadlines[futures[future]][1] for future in pending
+                      if futures[future] in deadlines and deadlines[futures[future]][1] is not None]
+            if scan_deadline is not None:
+                limits.append(scan_deadline)
+            timeout = max(0.0, min(limits) + DEADLINE_GRACE_S - time.monotonic()) if limits else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                tool = futures[future]
+                try:
+                    result, elapsed = future.result()
+                except ToolTimeoutError:                       # Ο ζεστός worker τερματίστηκε λόγω ορίου χρόνου.
+                    result, elapsed = _expired_result(tool, deadlines, time.monotonic())
+                except Exception as exc:                       # Απρόοπτο σφάλμα μέσα σε κάποια run_* συνάρτηση.
+                    logger.exception("Σφάλμα κατά την παράλληλη εκτέλεση του %s", TOOL_LABELS[tool])
+                    result, elapsed = _error_result(tool, exc), 0.0
+                yield tool, result, elapsed
+
+            now = time.monotonic()
+            scan_expired = scan_deadline is not None and now >= scan_deadline + DEADLINE_GRACE_S
+            for future in list(pending):
+                tool = futures[future]
+                deadline = deadlines.get(tool, (now, None))[1]
+                if scan_expired or (deadline is not None and now >= deadline + DEADLINE_GRACE_S):
+                    pending.discard(future)
+                    future.cancel()
+                    logger.warning("Το %s ξεπέρασε το χρονικό όριο, συνέχεια χωρίς αυτό.", TOOL_LABELS[tool])
+                    result, elapsed = _expired_result(tool, deadlines, now)
+                    yield tool, result, elapsed
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Τα εργαλεία CLI που έληξαν έχουν ήδη τερματιστεί· όσα in-process συνεχίζουν έχουν διαβάσει τον κώδικα.
+        workspace.close()
+
+def run_tools_concurrently(code: str,
+                           tools: Iterable[str],
+                           max_workers: int | None = None,
+                           cache: ResultCache | None = None,
+                           context: AnalysisContext | None = None,
+                           pool: WarmWorkerPool | None = None,
+                           budget: Budget | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Εκτελεί παράλληλα τα επιλεγμένα εργαλεία (tools) σε string Python κώδικα και επιστρέφει
+    λεξικό (dict) της μορφής {όνομα εργαλείου: αποτέλεσμα της αντίστοιχης run_* συνάρτησης}.
+    Τα εργαλεία CLI (Bandit, Semgrep, Pylint) περνούν τον περισσότερο χρόνο σε αναμονή
+    εξωτερικών διεργασιών, οπότε αρκεί ένα pool νημάτων.
+    tools: Ονόματα εργαλείων από το TOOL_RUNNERS (π.χ. ["bandit", "radon"]).
+    max_workers: Μέγιστος αριθμός ταυτόχρονων εργαλείων (προεπιλογή DEFAULT_MAX_WORKERS).
+    cache: Προαιρετική cache αποτελεσμάτων. Αν δοθεί, τα εργαλεία εκτελούνται μόνο σε miss.
+    context: Προαιρετικό κοινό πλαίσιο ανάλυσης για τα CONTEXT_TOOLS. Αν δοθεί, ο καλών μπορεί
+             να διαβάσει μετά την εκτέλεση τους χρόνους ανά στάδιο από το context.timings.
+    pool: Προαιρετικό pool ζεστών workers (sast.workers). Τα εργαλεία του pool.tools εκτελούνται σε
+          αυτό αντί για την τρέχουσα διεργασία, παράλληλα μεταξύ τους.
+    budget: Προαιρετικά χρονικά όρια (προεπιλογή Budget() με τα όρια του περιβάλλοντος). Εργαλεία που
+            τα ξεπερνούν επιστρέφονται με status "timeout" και η σάρωση θεωρείται "partial".
+    Μη έγκυρα ονόματα εργαλείων προκαλούν ValueError.
+    """
+    selected = list(dict.fromkeys(tools))
+    results = {tool: result for tool, result, _elapsed in
+               iter_tool_results(code, selected, max_workers, cache, context, pool, budget)}
+    # Τα αποτελέσματα επιστρέφονται με τη σειρά επιλογής ώστε η έξοδος να είναι ντετερμινιστική.
+    return {tool: results[tool] for tool in selected}
+
+# ------------------------------------------------------------------
+# 4. Ορισμός συνάρτησης για σειριακή εκτέλεση των εργαλείων σε ένα αρχείο.
+# ------------------------------------------------------------------
+
+def run_tools_sequentially(code: str,
+                           tools: Iterable[str],
+                           cache: ResultCache | None = None,
+                           context: AnalysisContext | None = None,
+                           budget: Budget | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Εκτελεί διαδοχικά τα επιλεγμένα εργαλεία σε string Python κώδικα, με την ίδια μορφή
+    αποτελεσμάτων με τη run_tools_concurrently. Χρησιμοποιείται όταν ο παραλληλισμός γίνεται
+    σε επίπεδο αρχείων (π.χ. pool διεργασιών του CLI), οπότε ένα pool νημάτων ανά αρχείο θα ήταν περιττό.
+    budget: Προαιρετικά χρονικά όρια. Προεπιλογή τα όρια ανά εργαλείο του περιβάλλοντος, χωρίς όριο
+            σάρωσης (αυτό εφαρμόζεται από τον καλώντα, σε επίπεδο αρχείων).
+    """
+    context = context or AnalysisContext(code)
+    budget = budget or Budget(scan_timeout=0)
+    results: dict[str, dict[str, Any]] = {}
+    with ScanWorkspace(code) as workspace:
+        for tool in dict.fromkeys(tools):
+            if tool not in TOOL_RUNNERS:
+                raise ValueError(f"Άγνωστο εργαλείο ανάλυσης: {tool}")
+            runner = TOOL_RUNNERS[tool]
+            if tool in CONTEXT_TOOLS:
+                runner = partial(runner, context=context)
+            elif tool in WORKSPACE_TOOLS:
+                runner = partial(runner, workspace=workspace)
+            try:
+                with tool_deadline(budget.deadline_for(tool)):
+                    results[tool] = cache.run_cached(tool, code, runner) if cache is not None else runner(code)
+            except ToolTimeoutError:
+                results[tool] = timeout_result(TOOL_LABELS[tool], budget.tool_timeout(tool))
+            except Exception as exc:
+                logger.exception("Σφάλμα κατά την εκτέλεση του %s", TOOL_LABELS[tool])
+                results[tool] = _error_result(tool, exc)
+    return results
@@ -0,0 +1,363 @@
+"""
+Σάρωση πολύ μεγάλων αποθετηρίων με ροή (streaming pipeline) και φραγμένη μνήμη.
+
+Η scan_directory επιστρέφει ένα λεξικό με τα αποτελέσματα όλων των αρχείων, οπότε η μνήμη της
+αυξάνεται με το μέγεθος του αποθετηρίου. Εδώ κάθε αρχείο περνά από τα στάδια
+    εύρεση (discover_files) → ανάγνωση → parse/ανάλυση → εγγραφή (sinks) → απόρριψη
+ως generators: ένα αρχείο διαβάζεται μόνο όταν υπάρχει ελεύθερη θέση στο παράθυρο των εργασιών σε
+εξέλιξη (max_in_flight), τα αποτελέσματά του γράφονται στα sinks (αναφορά JSON, SARIF, JSON Lines,
+ιστορικό) μόλις ολοκληρωθούν όλα τα εργαλεία του και στη συνέχεια δεν κρατείται καμία αναφορά στον
+κώδικα, στο AST ή στα ευρήματά του. Η μέγιστη μνήμη εξαρτάται έτσι από το max_in_flight (προεπιλογή
+2 × workers) και το batch_size, όχι από το πλήθος των αρχείων.
+
+Παράδειγμα:
+    python -m sast . --stream --jsonl findings.jsonl -o report.json
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Any, Iterator, TextIO
+
+from sast.orchestrator import TOOL_RUNNERS, TOOL_LABELS, DEFAULT_TOOLS, run_tools_sequentially
+from sast.discovery import discover_files
+from sast.context import AnalysisContext
+from sast.cache import get_default_cache, tool_version
+from sast.batch import BATCH_TOOLS, DEFAULT_BATCH_SIZE, run_tools_batched
+from sast.budget import Budget, TIMEOUT_STATUS, result_status, scan_status, timeout_result
+from sast.findings import json_default
+from sast.export import EXPORT_FORMATS, SarifWriter, iter_report_findings, write_jsonl
+from sast.history import FindingsHistory, ScanRecorder
+from sast.metrics import process_peak_rss_mb
+
+logger = logging.getLogger("sast_tool")
+
+# Μέγιστο πλήθος αρχείων σε ανάλυση ταυτόχρονα (0 = 2 × πλήθος workers).
+PIPELINE_MAX_IN_FLIGHT: int = int(os.getenv("SAST_PIPELINE_IN_FLIGHT", "0"))
+
+# ---------------------------------------------------------------
+# 2. Στάδια ενός αρχείου: ανάγνωση και ανάλυση (parse + εργαλεία).
+# ---------------------------------------------------------------
+
+def read_source(root: str, rel_path: str) -> tuple[str | None, dict[str, Any] | None]:
+    """
+    Διαβάζει ένα αρχείο ως UTF-8. Επιστρέφει (κώδικας, None) ή (None, αποτέλεσμα σφάλματος).
+    """
+    try:
+        with open(os.path.join(root, rel_path), "r", encoding="utf-8") as source_file:
+            return source_file.read(), None
+    except (OSError, UnicodeDecodeError) as exc:
+        return None, {"ok": False, "error": f"Αδυναμία ανάγνωσης του αρχείου {rel_path}: {exc}", "results": []}
+
+def file_hash(root: str, rel_path: str) -> str | None:
+    """
+    SHA-256 του περιεχομένου ενός αρχείου (για το ιστορικό σαρώσεων) ή None αν δεν διαβάζεται.
+    """
+    try:
+        with open(os.path.join(root, rel_path), "rb") as source_file:
+            return hashlib.sha256(source_file.read()).hexdigest()
+    except OSError:
+        return None
+
+def skipped_results(tools: list[str], scan_timeout: float | None) -> dict[str, dict[str, Any]]:
+    """
+    Αποτελέσματα "timeout" για εργαλεία που δεν εκτελέστηκαν επειδή έληξε το όριο της σάρωσης.
+    """
+    limit = f" των {scan_timeout:.3g}s" if scan_timeout else ""
+    return {tool: timeout_result(TOOL_LABELS[tool], scan_timeout,
+                                 error=f"Η σάρωση ξεπέρασε το χρονικό όριο{limit} πριν εκτελεστεί το {TOOL_LABELS[tool]}.")
+            for tool in tools}
+
+def analyze_source(rel_path: str,
+                   code: str,
+                   tools: list[str],
+                   use_cache: bool = True,
+                   deadline: float | None = None) -> tuple[str, dict[str, Any]]:
+    """
+    Εκτελεί διαδοχικά τα εργαλεία σε έναν κώδικα, με ένα κοινό AST (AnalysisContext) για τους
+    in-process αναλυτές. Το AST υπάρχει μόνο όσο διαρκεί η κλήση.
+    deadline: Προαιρετική προθεσμία της σάρωσης (time.time()). Μετά από αυτήν τα εργαλεία επιστρέφονται
+              ως "timeout", ενώ πριν από αυτήν περιορίζει τα όρια των εργαλείων.
+    Επιστρέφει tuple (σχετική διαδρομή, {εργαλείο: αποτέλεσμα}).
+    """
+    remaining = deadline - time.time() if deadline is not None else None
+    if remaining is not None and remaining <= 0:
+        return rel_path, skipped_results(tools, None)
+    cache = get_default_cache() if use_cache else None
+    context = AnalysisContext(code, filename=rel_path)
+    budget = Budget(scan_timeout=remaining or 0)
+    return rel_path, run_tools_sequentially(code, tools, cache=cache, context=context, budget=budget)
+
+# ------------------------------------------------------------------
+# 3. Pipeline με φραγμένο πλήθος αρχείων σε εξέλιξη (generator).
+# ------------------------------------------------------------------
+
+def pipeline_limits(jobs: int | None = None, max_in_flight: int | None = None) -> tuple[int, int]:
+    """
+    Πλήθος workers (προεπιλογή: πλήθος πυρήνων) και μέγιστο πλήθος αρχείων σε ανάλυση ταυτόχρονα.
+    """
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    return jobs, max(1, max_in_flight or PIPELINE_MAX_IN_FLIGHT or 2 * jobs)
+
+def iter_scan(root: str,
+              tools: list[str] | None = None,
+              include: list[str] | None = None,
+              exclude: list[str] | None = None,
+              jobs: int | None = None,
+              use_cache: bool = True,
+              batch_size: int = DEFAULT_BATCH_SIZE,
+              budget: Budget | None = None,
+              max_in_flight: int | None = None) -> Iterator[tuple[str, dict[str, dict[str, Any]]]]:
+    """
+    Σαρώνει τα αρχεία του root και επιστρέφει (generator) ένα tuple (σχετική διαδρομή, {εργαλείο:
+    αποτέλεσμα}) για κάθε αρχείο μόλις ολοκληρωθούν όλα τα εργαλεία του, με σειρά ολοκλήρωσης.
+    Τα in-process εργαλεία (και όσα δεν εκτελούνται σε batch mode) τρέχουν ανά αρχείο σε pool
+    διεργασιών, με το πολύ max_in_flight αρχεία σε αναμονή ή εκτέλεση: όταν το παράθυρο είναι γεμάτο,
+    η ανάγνωση του επόμενου αρχείου περιμένει (backpressure). Τα Bandit/Semgrep/Pylint εκτελούνται
+    ανά batch_size αρχεία, όπως στη scan_directory. Στη μνήμη υπάρχουν έτσι το πολύ
+    max_in_flight + batch_size αρχεία (κώδικας και μερικά αποτελέσματα).
+    Οι υπόλοιπες παράμετροι είναι ίδιες με της scan_directory.
+    """
+    tools = tools or DEFAULT_TOOLS
+    unknown = [tool for tool in tools if tool not in TOOL_RUNNERS]
+    if unknown:
+        raise ValueError(f"Άγνωστα εργαλεία ανάλυσης: {', '.join(unknown)}")
+
+    budget = budget or Budget(scan_timeout=0)
+    remaining = budget.scan_remaining()
+    deadline = time.time() + remaining if remaining is not None else None    # Κοινό ρολόι με τις worker διεργασίες.
+    jobs, max_in_flight = pipeline_limits(jobs, max_in_flight)
+    batch_tools = [tool for tool in tools if tool in BATCH_TOOLS] if batch_size > 0 else []
+    pool_tools = [tool for tool in tools if tool not in batch_tools]
+    cache = get_default_cache() if use_cache and batch_tools else None
+
+    partial: dict[str, dict[str, Any]] = {}                 # Αποτελέσματα των αρχείων σε εξέλιξη.
+    parts: dict[str, int] = {}                              # Τμήματα (pool/batch) που εκκρεμούν ανά αρχείο.
+    ready: deque[tuple[str, dict[str, Any]]] = deque()      # Ολοκληρωμένα αρχεία προς εγγραφή.
+    batch: dict[str, str] = {}                              # Κώδικας των αρχείων της επόμενης παρτίδας.
+    in_flight: set[Future] = set()
+
+    def complete(rel_path: str, file_results: dict[str, Any]) -> None:
+        partial[rel_path].update(file_results)
+        parts[rel_path] -= 1
+        if not parts[rel_path]:
+            del parts[rel_path]
+            results = partial.pop(rel_path)
+            # Διατήρηση της σειράς των εργαλείων όπως ζητήθηκαν.
+            ready.append((rel_path, {tool: results[tool] for tool in tools if tool in results}))
+
+    def run_batch() -> None:
+        rel_paths = list(batch)
+        if budget.expired():
+            batch_results = {rel_path: skipped_results(batch_tools, budget.scan_timeout) for rel_path in rel_paths}
+        else:
+            batch_results = run_tools_batched(batch, batch_tools, batch_size, cache, budget)
+        batch.clear()
+        for rel_path in rel_paths:
+            complete(rel_path, batch_results.get(rel_path, {}))
+
+    def collect(block: bool) -> None:
+        if in_flight:
+            done, _pending = wait(in_flight, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                complete(*future.result())
+
+    # Με έναν worker (ή χωρίς εργαλεία ανά αρχείο) η ανάλυση γίνεται στη διεργασία του generator.
+    executor = ProcessPoolExecutor(max_workers=jobs) if pool_tools and jobs > 1 else None
+    try:
+        for rel_path in discover_files(root, include, exclude):
+            code, error = read_source(root, rel_path)
+            partial[rel_path] = {}
+            if code is None:
+                parts[rel_path] = 1
+                complete(rel_path, {tool: error for tool in tools})
+            else:
+                parts[rel_path] = bool(pool_tools) + bool(batch_tools)
+                if pool_tools and executor is None:
+                    complete(*analyze_source(rel_path, code, pool_tools, use_cache, deadline))
+                elif pool_tools:
+                    in_flight.add(executor.submit(analyze_source, rel_path, code, pool_tools, use_cache, deadline))
+                if batch_tools:
+                    batch[rel_path] = code
+                    if len(batch) >= batch_size:
+                        run_batch()
+            code = None                                 # Ο κώδικας μένει μόνο στην εργασία ή στην παρτίδα.
+            collect(block=len(in_flight) >= max_in_flight)
+            while ready:
+                yield ready.popleft()
+        if batch:
+            run_batch()
+        while in_flight or ready:
+            while ready:
+                yield ready.popleft()
+            collect(block=True)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+# ------------------------------------------------------------
+# 4. Sinks: εγγραφή των αποτελεσμάτων κάθε αρχείου μόλις παραχθούν.
+# ------------------------------------------------------------
+
+# Κάθε sink έχει τις μεθόδους start(report), emit(rel_path, file_results) και close(report). Το report
+# περιέχει στη start() τα "root" και "tools" και στη close() επιπλέον τα "status" και "stats".
+
+class ReportSink:
+    """
+    Η αναφορά JSON της scan_directory, γραμμένη σταδιακά (ένα αρχείο του "files" ανά γραμμή).
+    """
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._count = 0
+
+    def start(self, report: dict[str, Any]) -> None:
+        self.stream.write(f'{{"root": {json.dumps(report["root"], ensure_ascii=False)}, '
+                          f'"tools": {json.dumps(report["tools"])}, "files": {{')
+
+    def emit(self, rel_path: str, file_results: dict[str, Any]) -> None:
+        self.stream.write(",\n  " if self._count else "\n  ")
+        self.stream.write(f"{json.dumps(rel_path, ensure_ascii=False)}: "
+                          f"{json.dumps(file_results, ensure_ascii=False, default=json_default)}")
+        self._count += 1
+
+    def close(self, report: dict[str, Any]) -> None:
+        self.stream.write(f'\n}}, "status": {json.dumps(report["status"])}, '
+                          f'"stats": {json.dumps(report["stats"])}}}\n')
+
+class FindingsSink:
+    """
+    Τα ευρήματα όλων των αρχείων σε SARIF ("sarif") ή JSON Lines ("jsonl"), με τη διαδρομή του αρχείου.
+    """
+    def __init__(self, stream: TextIO, fmt: str) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Άγνωστη μορφή εξαγωγής '{fmt}' (διαθέσιμες: {', '.join(EXPORT_FORMATS)}).")
+        self.stream = stream
+        self.fmt = fmt
+        self._sarif: SarifWriter | None = None
+
+    def start(self, report: dict[str, Any]) -> None:
+        if self.fmt == "sarif":
+            self._sarif = SarifWriter(self.stream, tool_versions={tool: tool_version(tool) for tool in report["tools"]})
+
+    def emit(self, rel_path: str, file_results: dict[str, Any]) -> None:
+        findings = iter_report_findings({rel_path: file_results})
+        if self._sarif is None:
+            write_jsonl(findings, self.stream)
+        else:
+            for finding in findings:
+                self._sarif.write(finding)
+
+    def close(self, report: dict[str, Any]) -> None:
+        if self._sarif is not None:
+            self._sarif.close()
+
+class HistorySink:
+    """
+    Καταγραφή της σάρωσης στο ιστορικό (ScanRecorder), αρχείο προς αρχείο. Ένα σφάλμα της βάσης
+    απενεργοποιεί την καταγραφή χωρίς να διακόπτει τη σάρωση.
+    """
+    def __init__(self, history: FindingsHistory, source: str = "cli", hash_files: bool = True) -> None:
+        self.history = history
+        self.source = source
+        self.hash_files = hash_files
+        self.scan_id: int | None = None
+        self._root = ""
+        self._recorder: ScanRecorder | None = None
+
+    def _failed(self, exc: Exception) -> None:
+        logger.warning("Αποτυχία καταγραφής της σάρωσης στο ιστορικό %s: %s", self.history.path, exc)
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def start(self, report: dict[str, Any]) -> None:
+        self._root = report["root"]
+        try:
+            self._recorder = ScanRecorder(self.history, report["tools"], self.source, root=report["root"],
+                                          tool_versions={tool: tool_version(tool) for tool in report["tools"]})
+        except (sqlite3.Error, OSError) as exc:
+            self._failed(exc)
+
+    def emit(self, rel_path: str, file_results: dict[str, Any]) -> None:
+        if self._recorder is not None:
+            try:
+                self._recorder.add_file(rel_path, file_results,
+                                        file_hash(self._root, rel_path) if self.hash_files else None)
+            except (sqlite3.Error, OSError) as exc:
+                self._failed(exc)
+
+    def close(self, report: dict[str, Any]) -> None:
+        if self._recorder is not None:
+            wall_time_s = report["stats"]["wall_time_s"]
+            try:
+                self.scan_id = self._recorder.finish(timings={"wall_time_s": wall_time_s}, wall_time_s=wall_time_s)
+            except (sqlite3.Error, OSError) as exc:
+                self._failed(exc)
+
+# ---------------------------------------------------
+# 5. Σάρωση με ροή προς τα sinks.
+# ---------------------------------------------------
+
+def stream_scan(root: str,
+                sinks: list[Any],
+                tools: list[str] | None = None,
+                include: list[str] | None = None,
+                exclude: list[str] | None = None,
+                jobs: int | None = None,
+                use_cache: bool = True,
+                batch_size: int = DEFAULT_BATCH_SIZE,
+                budget: Budget | None = None,
+                max_in_flight: int | None = None) -> dict[str, Any]:
+    """
+    Σαρώνει τον φάκελο root μέσω της iter_scan και γράφει τα αποτελέσματα κάθε αρχείου στα sinks
+    μόλις παραχθούν. Επιστρέφει την αναφορά της scan_directory χωρίς το "files":
+    {"root": ..., "tools": [...], "status": ..., "stats": {...}}, όπου τα stats περιέχουν επιπλέον
+    το max_in_flight και τη μέγιστη μνήμη (peak_rss_mb) της κύριας διεργασίας.
+    """
+    started = time.perf_counter()
+    tools = tools or DEFAULT_TOOLS
+    jobs, max_in_flight = pipeline_limits(jobs, max_in_flight)
+    report: dict[str, Any] = {"root": os.path.abspath(root), "tools": tools}
+    for sink in sinks:
+        sink.start(report)
+
+    files = findings = errors = timeouts = 0
+    status = "complete"
+    for rel_path, file_results in iter_scan(root, tools, include, exclude, jobs, use_cache, batch_size,
+                                            budget, max_in_flight):
+        for sink in sinks:
+            sink.emit(rel_path, file_results)
+        results = file_results.values()
+        files += 1
+        findings += sum(len(result.get("results") or []) for result in results)
+        errors += sum(1 for result in results if not result.get("ok"))
+        timeouts += sum(1 for result in results if result_status(result) == TIMEOUT_STATUS)
+        if scan_status(results) != "complete":
+            status = scan_status(results)
+
+    elapsed = time.perf_counter() - started
+    report["status"] = status
+    report["stats"] = {
+        "files": files,
+        "findings": findings,
+        "errors": errors,
+        "timeouts": timeouts,
+        "jobs": jobs,
+        "max_in_flight": max_in_flight,
+        "wall_time_s": round(elapsed, 3),
+        "files_per_s": round(files / elapsed, 2) if elapsed > 0 else None,
+        "peak_rss_mb": round(process_peak_rss_mb(), 1)}
+    for sink in sinks:
+        sink.close(report)
+    return report
@@ -0,0 +1,157 @@
+"""
+Συγκεντρωτική αναφορά ευρημάτων σε μορφή κειμένου, με ροή (streaming) ανά ενότητα.
+
+Η αναφορά δεν συναρμολογείται ως ενιαίο string: η iter_findings_report παράγει διαδοχικά τμήματα
+(επικεφαλίδες, πηγαίος κώδικας, CSV ευρημάτων ανά δέσμη γραμμών απευθείας από τα Finding, χωρίς
+DataFrame), η write_report τα γράφει σε αρχείο και η read_preview διαβάζει μόνο την αρχή του για
+προεπισκόπηση. Ο πηγαίος κώδικας μπορεί να παραλειφθεί ή να περικοπεί σε N γραμμές.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import io
+import os
+import csv
+import tempfile
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from sast.findings import Finding
+
+# Μέγεθος προεπισκόπησης της αναφοράς στη διεπαφή (KB) και γραμμές CSV ανά τμήμα της ροής.
+REPORT_PREVIEW_KB: int = int(os.getenv("SAST_REPORT_PREVIEW_KB", "64"))
+REPORT_CHUNK_ROWS: int = 1000
+
+# Ενότητες ευρημάτων με τη σειρά της αναφοράς: (εργαλείο, επικεφαλίδα, μήνυμα χωρίς ευρήματα).
+REPORT_SECTIONS: tuple[tuple[str, str, str], ...] = (
+    ("bandit", "=== Ευρήματα Bandit ===",
+     "Δεν υπάρχουν ευρήματα από τη Bandit ή η βιβλιοθήκη δεν εκτελέστηκε."),
+    ("semgrep", "=== Ευρήματα Semgrep ===",
+     "Δεν υπάρχουν ευρήματα από τη Semgrep ή η βιβλιοθήκη δεν εκτελέστηκε."),
+    ("pylint", "=== Ευρήματα Pylint ===",
+     "Δεν υπάρχουν ευρήματα από την Pylint ή η βιβλιοθήκη δεν εκτελέστηκε."),
+    ("radon", "=== Ευρήματα Radon ===",
+     "Δεν υπάρχουν ευρήματα από τη Radon ή η βιβλιοθήκη δεν εκτελέστηκε."),
+    ("custom_ast", "=== Ευρήματα Custom AST Αναλυτή (SecurityVisitor) ===",
+     "Δεν υπάρχουν ευρήματα από τον Custom AST Αναλυτή ή η ανάλυση δεν εκτελέστηκε."))
+
+# ------------------------------------------------------
+# 2. Παραγωγή της αναφοράς ως ροή τμημάτων κειμένου.
+# ------------------------------------------------------
+
+def _iter_source(code: str, max_lines: int | None) -> Iterator[str]:
+    """
+    Ο πηγαίος κώδικας σε τμήματα των REPORT_CHUNK_ROWS γραμμών, περικομμένος σε max_lines γραμμές.
+    """
+    lines = io.StringIO(code)
+    limit = None if max_lines is None else max(max_lines, 0)
+    emitted = 0
+    last_line = "\n"
+    while limit is None or emitted < limit:
+        size = REPORT_CHUNK_ROWS if limit is None else min(REPORT_CHUNK_ROWS, limit - emitted)
+        chunk = list(islice(lines, size))
+        if not chunk:
+            break
+        emitted += len(chunk)
+        last_line = chunk[-1]
+        yield "".join(chunk)
+    if not last_line.endswith("\n"):
+        yield "\n"
+    remaining = sum(1 for _line in lines)
+    if remaining:
+        yield f"... (παραλείφθηκαν {remaining} γραμμές κώδικα)\n"
+
+def _iter_csv(columns: dict[str, str], findings: Iterable[Finding]) -> Iterator[str]:
+    """
+    Τα ευρήματα ως CSV (ίδιες στήλες με τους πίνακες της διεπαφής), ανά REPORT_CHUNK_ROWS γραμμές.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(list(columns))
+    rows = 0
+    for finding in findings:
+        writer.writerow(["" if value is None else value
+                         for value in (getattr(finding, name) for name in columns.values())])
+        rows += 1
+        if rows % REPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def iter_findings_report(
+    filename: str,
+    code: str,
+    tables: dict[str, tuple[dict[str, str], list[Finding]] | None],
+    bandit_metrics: dict[str, Any] | None = None,
+    pylint_score: str | None = None,
+    radon_mi: float | None = None,
+    include_source: bool = True,
+    max_source_lines: int | None = None,
+) -> Iterator[str]:
+    """
+    Παράγει τη συγκεντρωτική αναφορά ενότητα προς ενότητα:
+    1. Τον πηγαίο κώδικα που αναλύθηκε (αν include_source, περικομμένο σε max_source_lines γραμμές).
+    2. Τα ευρήματα κάθε βιβλιοθήκης ως CSV. tables: {εργαλείο: (στήλες {τίτλος: πεδίο}, ευρήματα)}.
+    3. Τις μετρικές Bandit/Pylint/Radon.
+    """
+    yield "=== Συγκεντρωτική Αναφορά AST-based SAST εργαλείου ανάλυσης κώδικα Python ===\n\n"
+    yield f"Όνομα αρχείου: {filename}\n\n"
+
+    if include_source:
+        yield "=== Πηγαίος Κώδικας Python που αναλύθηκε ===\n"
+        yield from _iter_source(code, max_source_lines)
+        yield "\n"
+
+    for tool, title, empty_message in REPORT_SECTIONS:
+        yield f"{title}\n"
+        table = tables.get(tool)
+        if table is not None and table[1]:
+            yield from _iter_csv(*table)
+        else:
+            yield f"{empty_message}\n"
+        if tool == "bandit" and bandit_metrics:
+            yield f"\nΜετρικές Bandit: {bandit_metrics}\n"
+        elif tool == "pylint" and pylint_score:
+            yield f"Συνολική βαθμολογία Pylint: {pylint_score}\n"
+        elif tool == "radon" and radon_mi is not None:
+            yield f"Δείκτης Συντηρησιμότητας (MI) Radon: {radon_mi}\n"
+        yield "\n"
+
+# ------------------------------------------------
+# 3. Εγγραφή σε αρχείο και ανάγνωση προεπισκόπησης.
+# ------------------------------------------------
+
+def write_report(chunks: Iterable[str], path: str | None = None) -> str:
+    """
+    Γράφει τα τμήματα της αναφοράς στο path (ή σε νέο προσωρινό αρχείο) και επιστρέφει τη διαδρομή.
+    Στη μνήμη βρίσκεται κάθε στιγμή μόνο ένα τμήμα.
+    """
+    if path is None:
+        fd, path = tempfile.mkstemp(prefix="sast_report_", suffix=".txt")
+        os.close(fd)
+    with open(path, "w", encoding="utf-8", newline="") as report_file:
+        for chunk in chunks:
+            report_file.write(chunk)
+    return path
+
+def read_preview(path: str, limit_kb: int = REPORT_PREVIEW_KB) -> tuple[str, bool]:
+    """
+    Επιστρέφει τα πρώτα limit_kb KB της αναφοράς και αν αυτή περικόπηκε.
+    """
+    limit = max(limit_kb, 0) * 1024
+    with open(path, "rb") as report_file:
+        head = report_file.read(limit + 1)
+    truncated = len(head) > limit
+    # Η αποκοπή μπορεί να πέσει στη μέση χαρακτήρα UTF-8, ο οποίος απλώς παραλείπεται.
+    return head[:limit].decode("utf-8", errors="ignore"), truncated
+
+def read_report(path: str) -> bytes:
+    """
+    Ολόκληρη η αναφορά, μόνο τη στιγμή της λήψης (deferred data του st.download_button).
+    """
+    with open(path, "rb") as report_file:
+        return report_file.read()
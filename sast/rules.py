@@ -0,0 +1,290 @@
+"""
+Δηλωτική (declarative) rule engine για τον προσαρμοσμένο AST αναλυτή (SecurityVisitor).
+
+Κάθε κανόνας δηλώνει τους τύπους κόμβων AST και τα ονόματα κλήσεων που τον ενδιαφέρουν. Οι κανόνες
+μεταγλωττίζονται σε ευρετήριο αποστολής (τύπος κόμβου -> hash map ονόματος κλήσης -> κανόνες), ώστε
+για κάθε κόμβο να εκτελούνται μόνο οι κανόνες που μπορούν να ταιριάξουν. Ο έλεγχος για ύποπτες
+λέξεις-κλειδιά γίνεται με έναν προμεταγλωττισμένο matcher πολλαπλών μοτίβων αντί για εμφωλευμένα any().
+Έτσι η προσθήκη νέων κανόνων δεν πολλαπλασιάζει το κόστος ανά κόμβο.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import re
+import ast
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, NamedTuple
+
+# -----------------------------------------------------------------------------------
+# 2. Ορισμός global λιστών με λέξεις κλειδιά για χρήση στον custom AST αναλυτή κώδικα.
+# -----------------------------------------------------------------------------------
+
+# Λέξεις κλειδιά που υποδηλώνουν πιθανές "ευαίσθητες" μεταβλητές (π.χ. password, token κλπ).
+SUSPECT_SECRET_KEYWORDS: list[str] = [
+                           "password",
+                           "passwd",
+                           "pwd",
+                           "secret",
+                           "token",
+                           "key",
+                           "apikey",
+                           "api_key",
+                           "auth",
+                           "credential"]
+
+# Συνηθισμένα ονόματα logging συναρτήσεων (logging.info, logger.error κλπ).
+LOGGING_FUNCTION_NAMES : list[str] = [
+                          "print",
+                          "logging.debug",
+                          "logging.info",
+                          "logging.warning",
+                          "logging.error",
+                          "logging.critical",
+                          "logging.exception",
+                          "logging.log"]
+
+# Συναρτήσεις του subprocess που εκτελούν εξωτερικές εντολές.
+SUBPROCESS_FUNCTION_NAMES: list[str] = ["run", "Popen", "call", "check_call", "check_output"]
+
+# Επικίνδυνες συναρτήσεις εκτέλεσης κώδικα.
+DANGEROUS_FUNCTION_NAMES: list[str] = ["eval", "exec"]
+
+# -------------------------------------------------------------
+# 3. Matcher πολλαπλών λέξεων-κλειδιών με μία μεταγλωττισμένη regex.
+# -------------------------------------------------------------
+
+class KeywordMatcher:
+    """
+    Ελέγχει αν ένα όνομα (σε πεζά) περιέχει κάποια από τις λέξεις-κλειδιά, με μία προμεταγλωττισμένη
+    regex εναλλαγής (alternation) αντί για any(k in name for k in keywords). Τα αποτελέσματα
+    κρατούνται ανά όνομα, αφού τα ίδια αναγνωριστικά εμφανίζονται πολλές φορές σε ένα αρχείο.
+    """
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords))
+        # Οι μεγαλύτερες λέξεις πρώτες, ώστε η regex να μην σταματά σε μικρότερα προθέματα.
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+        self._memo: dict[str, bool] = {}
+
+    def matches(self, name: str) -> bool:
+        """
+        Επιστρέφει True αν το name (χωρίς διάκριση πεζών-κεφαλαίων) περιέχει κάποια λέξη-κλειδί.
+        """
+        found = self._memo.get(name)
+        if found is None:
+            found = self._pattern is not None and self._pattern.search(name.lower()) is not None
+            if len(self._memo) < 65536:                     # Άνω όριο μνήμης για πολύ μεγάλα αρχεία.
+                self._memo[name] = found
+        return found
+
+# ---------------------------------------------
+# 4. Ορισμός κανόνων και πληροφοριών αντιστοίχισης.
+# ---------------------------------------------
+
+class MatchInfo(NamedTuple):
+    """
+    Πληροφορίες που υπολογίζονται μία φορά ανά κόμβο και δίνονται σε κάθε κανόνα.
+    func_name: Όνομα της καλούμενης συνάρτησης/μεθόδου (π.χ. "info" για logger.info()).
+    full_name: Πλήρες όνομα για κλήσεις obj.method() (π.χ. "logging.info"), αλλιώς None.
+    base_name: Όνομα του αντικειμένου για κλήσεις obj.method() (π.χ. "subprocess"), αλλιώς None.
+    secrets: Matcher ύποπτων λέξεων-κλειδιών του engine.
+    """
+    func_name: str | None
+    full_name: str | None
+    base_name: str | None
+    secrets: KeywordMatcher
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Δηλωτικός κανόνας του custom AST αναλυτή.
+    rule_id: Μοναδικό αναγνωριστικό του κανόνα.
+    node_types: Τύποι κόμβων AST στους οποίους εφαρμόζεται ο κανόνας.
+    check: Συνάρτηση (node, info) που επιστρέφει τα ευρήματα (λίστα λεξικών) για τον κόμβο.
+    call_names: Πλήρη ονόματα κλήσεων (full_name, π.χ. "logging.info") που ενεργοποιούν τον κανόνα.
+    func_names: Απλά ονόματα συναρτήσεων (func_name, π.χ. "eval") που ενεργοποιούν τον κανόνα.
+    Αν δεν δοθούν ούτε call_names ούτε func_names, ο κανόνας εκτελείται για κάθε κόμβο των node_types.
+    """
+    rule_id: str
+    node_types: tuple[type[ast.AST], ...]
+    check: Callable[[Any, MatchInfo], list[dict[str, Any]]]
+    call_names: frozenset[str] = field(default_factory=frozenset)
+    func_names: frozenset[str] = field(default_factory=frozenset)
+
+# -----------------------------------------------------
+# 5. Υλοποίηση των ενσωματωμένων κανόνων του SecurityVisitor.
+# -----------------------------------------------------
+
+def _check_hardcoded_secret(node: ast.Assign, info: MatchInfo) -> list[dict[str, Any]]:
+    """
+    Ελέγχει αναθέσεις (Assign) για hard-coded μυστικά σε ύποπτες μεταβλητές.
+    """
+    issues: list[dict[str, Any]] = []
+    # Έλεγχος αν η τιμή που ανατίθεται είναι σταθερή συμβολοσειρά (hard-coded string).
+    if not (isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)):
+        return issues
+    for target in node.targets:
+        # Έλεγχος αν το όνομα της μεταβλητής περιέχει κάποια από τις ύποπτες λέξεις-κλειδιά.
+        if isinstance(target, ast.Name) and info.secrets.matches(target.id):
+            var_name = target.id
+            value_str = node.value.value
+            value_preview = (value_str if len(value_str) <= 50 else value_str[:47] + "...")     # Προεπισκόπηση της τιμής (περιορισμένη σε 50 χαρακτήρες).
+            issues.append({
+                "Είδος": "Hard-coded secret",
+                "Όνομα": var_name,
+                "Γραμμή": node.lineno,
+                "Λεπτομέρειες": f"Ανάθεση σταθερής συμβολοσειράς σε μεταβλητή με όνομα '{var_name}'.",
+                "Τιμή (Προεπισκόπηση)": value_preview,
+                })
+    return issues
+
+def _check_sensitive_logging(node: ast.Call, info: MatchInfo) -> list[dict[str, Any]]:
+    """
+    Ελέγχει κλήσεις logging συναρτήσεων με ορίσματα μεταβλητές που ίσως περιέχουν ευαίσθητα δεδομένα.
+    """
+    issues: list[dict[str, Any]] = []
+    for arg in node.args:                       # Έλεγχος όλων των ορισμάτων της συνάρτησης.
+        if isinstance(arg, ast.Name) and info.secrets.matches(arg.id):
+            issues.append(
+                {"Είδος": "Logging ενδεχομένως ευαίσθητης μεταβλητής",
+                 "Όνομα": arg.id,
+                 "Γραμμή": node.lineno,
+                 "Λεπτομέρειες": (f"Κλήση logging συνάρτησης '{info.full_name or info.func_name}'με όρισμα "
+                 f"τη μεταβλητή '{arg.id}', η οποία ίσως περιέχει ευαίσθητα δεδομένα."),
+                 "Τιμή (Προεπισκόπηση)": ""})
+    return issues
+
+def _check_subprocess_shell(node: ast.Call, info: MatchInfo) -> list[dict[str, Any]]:
+    """
+    Ελέγχει κλήσεις subprocess με shell=True (πιθανό command injection).
+    """
+    issues: list[dict[str, Any]] = []
+    for kw in node.keywords:
+        if kw.arg == "shell" and isinstance(kw.value, ast.Constant) and kw.value.value is True:
+            issues.append(
+                    {"Είδος": "Πιθανό Command Injection",
+                     "Όνομα": f"{info.base_name}.{info.func_name}",
+                     "Γραμμή": node.lineno,
+                     "Λεπτομέρειες": (f"Κλήση της συνάρτησης '{info.base_name}.{info.func_name}' με παράμετρο shell=True, "
+                                      "που μπορεί να οδηγήσει σε command injection εάν τα ορίσματα δεν έχουν ελεγχθεί σωστά."),
+                    "Τιμή (Προεπισκόπηση)": ""})
+    return issues
+
+def _check_dangerous_function(node: ast.Call, info: MatchInfo) -> list[dict[str, Any]]:
+    """
+    Γενική επισήμανση για χρήση επικίνδυνων συναρτήσεων eval/exec.
+    """
+    return [{"Είδος": "Χρήση επικίνδυνης συνάρτησης",
+             "Όνομα": info.func_name,
+             "Γραμμή": node.lineno,
+             "Λεπτομέρειες": (f"Κλήση της συνάρτησης '{info.func_name}', η οποία μπορεί να οδηγήσει σε "
+             "εκτέλεση κακόβουλου κώδικα ή έγχυση κώδικα."),
+             "Τιμή (Προεπισκόπηση)": ""}]
+
+# Ενσωματωμένοι κανόνες, με τη σειρά που εφαρμόζονται σε κάθε κόμβο.
+DEFAULT_RULES: list[Rule] = [
+    Rule("hardcoded-secret", (ast.Assign,), _check_hardcoded_secret),
+    Rule("sensitive-logging", (ast.Call,), _check_sensitive_logging,
+         call_names=frozenset(LOGGING_FUNCTION_NAMES)),
+    Rule("subprocess-shell-true", (ast.Call,), _check_subprocess_shell,
+         call_names=frozenset(f"subprocess.{name}" for name in SUBPROCESS_FUNCTION_NAMES)),
+    Rule("dangerous-function", (ast.Call,), _check_dangerous_function,
+         func_names=frozenset(DANGEROUS_FUNCTION_NAMES)),
+]
+
+# ----------------------------------------------------------------
+# 6. Μεταγλώττιση των κανόνων σε ευρετήριο αποστολής (dispatch index).
+# ----------------------------------------------------------------
+
+class _NodeIndex:
+    """
+    Κανόνες ενός τύπου κόμβου: hash maps ανά full_name/func_name και κανόνες χωρίς φίλτρο ονόματος.
+    Κάθε κανόνας αποθηκεύεται μαζί με τη θέση του στη λίστα κανόνων, ώστε η σειρά των ευρημάτων
+    να είναι ίδια με τη σειρά δήλωσης των κανόνων.
+    """
+    __slots__ = ("by_call_name", "by_func_name", "unfiltered")
+
+    def __init__(self) -> None:
+        self.by_call_name: dict[str, list[tuple[int, Rule]]] = {}
+        self.by_func_name: dict[str, list[tuple[int, Rule]]] = {}
+        self.unfiltered: list[tuple[int, Rule]] = []
+
+class RuleEngine:
+    """
+    Μεταγλωττισμένη rule engine: τύπος κόμβου -> hash map ονόματος κλήσης -> κανόνες.
+    rules: Λίστα κανόνων (προεπιλογή DEFAULT_RULES). Νέοι κανόνες προστίθενται ως RuleEngine(DEFAULT_RULES + [...]).
+    secret_keywords: Λέξεις-κλειδιά για τον matcher ύποπτων ονομάτων.
+    """
+    def __init__(self,
+                 rules: Iterable[Rule] | None = None,
+                 secret_keywords: Iterable[str] | None = None) -> None:
+        self.rules: list[Rule] = list(DEFAULT_RULES if rules is None else rules)
+        self.secrets = KeywordMatcher(SUSPECT_SECRET_KEYWORDS if secret_keywords is None else secret_keywords)
+        self._index: dict[type[ast.AST], _NodeIndex] = {}
+        for position, rule in enumerate(self.rules):
+            for node_type in rule.node_types:
+                node_index = self._index.setdefault(node_type, _NodeIndex())
+                for name in rule.call_names:
+                    node_index.by_call_name.setdefault(name, []).append((position, rule))
+                for name in rule.func_names:
+                    node_index.by_func_name.setdefault(name, []).append((position, rule))
+                if not rule.call_names and not rule.func_names:
+                    node_index.unfiltered.append((position, rule))
+
+    @property
+    def node_types(self) -> frozenset[type[ast.AST]]:
+        """
+        Οι τύποι κόμβων για τους οποίους υπάρχει τουλάχιστον ένας κανόνας.
+        """
+        return frozenset(self._index)
+
+    def _match_info(self, node: ast.AST) -> MatchInfo:
+        """
+        Υπολογίζει μία φορά τα ονόματα κλήσης του κόμβου (αν πρόκειται για ast.Call).
+        """
+        func_name: str | None = None                    # Όνομα συνάρτησης που καλείται.
+        full_name: str | None = None                    # Όνομα αντικειμένου αν η συνάρτηση είναι μέθοδος (π.χ. logger.info -> logger).
+        base_name: str | None = None                    # Όνομα αντικειμένου για κλήσεις obj.method() (π.χ. subprocess).
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name):             # Περίπτωση απλής συνάρτησης μορφής func(), π.χ. eval().
+                func_name = node.func.id
+            elif isinstance(node.func, ast.Attribute):      # Περίπτωση μεθόδου μορφής obj.method(), π.χ. logger.info().
+                func_name = node.func.attr
+                if isinstance(node.func.value, ast.Name):   # Αν το value είναι Name, τότε η κλήση θα είναι μορφής "logging.info".
+                    base_name = node.func.value.id
+                    full_name = f"{base_name}.{func_name}"
+                else:
+                    full_name = func_name
+        return MatchInfo(func_name, full_name, base_name, self.secrets)
+
+    def match(self, node: ast.AST) -> list[dict[str, Any]]:
+        """
+        Εφαρμόζει στον κόμβο μόνο τους κανόνες του ευρετηρίου που μπορούν να ταιριάξουν και
+        επιστρέφει τα ευρήματά τους.
+        """
+        node_index = self._index.get(type(node))
+        if node_index is None:
+            return []
+        info = self._match_info(node)
+        candidates = list(node_index.unfiltered)
+        if info.full_name is not None:
+            candidates += node_index.by_call_name.get(info.full_name, ())
+        if info.func_name is not None:
+            candidates += node_index.by_func_name.get(info.func_name, ())
+        if not candidates:
+            return []
+        if len(candidates) > 1:
+            candidates.sort(key=lambda item: item[0])       # Σειρά δήλωσης των κανόνων.
+        issues: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        for position, rule in candidates:
+            if position not in seen:                        # Κανόνας που ταιριάζει και σε full_name και σε func_name.
+                seen.add(position)
+                issues.extend(rule.check(node, info))
+        return issues
+
+# Κοινή engine με τους ενσωματωμένους κανόνες.
+DEFAULT_RULE_ENGINE = RuleEngine()
@@ -0,0 +1,514 @@
+"""
+Τοπικά (vendored) rule packs της Semgrep για σαρώσεις χωρίς πρόσβαση στο δίκτυο.
+
+Τα rulesets του registry (SEMGREP_CONFIGS, π.χ. p/python) κατεβαίνουν μία φορά σε τοπικό φάκελο με
+την εντολή "vendor" (ή εισάγονται από αρχεία με την "import" σε air-gapped μηχανήματα). Πριν από τη
+σάρωση συγχωνεύονται σε ένα ενιαίο αρχείο κανόνων χωρίς διπλότυπα (οι packs μοιράζονται πολλούς
+κανόνες), το οποίο αποθηκεύεται με κλειδί το hash του περιεχομένου τους. Κάθε κλήση της Semgrep
+χρησιμοποιεί αυτό το αρχείο, χωρίς λήψη κανόνων, metrics και έλεγχο έκδοσης μέσω δικτύου, οπότε οι
+σαρώσεις είναι ταχύτερες και ντετερμινιστικές.
+
+Με τοπικούς κανόνες γίνεται επιπλέον προεπιλογή (prefilter) ανά αρχείο: από τα patterns κάθε κανόνα
+εξάγονται τα ονόματα που πρέπει να εμφανίζονται στον κώδικα (π.χ. subprocess, pickle, yaml) και η
+Semgrep καλείται μόνο με τους κανόνες που μπορούν να ταιριάξουν, ή καθόλου αν δεν ταιριάζει κανένας.
+
+Παράδειγμα:
+    python -m sast.semgrep_rules vendor
+    python -m sast.semgrep_rules import p/python python-rules.yml
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import re
+import sys
+import json
+import glob
+import keyword
+import hashlib
+import logging
+import argparse
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+import yaml
+
+logger = logging.getLogger("sast_tool")
+
+# Φάκελος των τοπικών κανόνων και τρόπος επιλογής τους (ρυθμίζονται από μεταβλητές περιβάλλοντος):
+#   auto: τοπικοί κανόνες αν έχουν γίνει vendor όλοι οι packs, αλλιώς το registry.
+#   local: μόνο τοπικοί κανόνες (σφάλμα αν λείπουν), π.χ. σε air-gapped runners.
+#   registry: πάντα τα rulesets του registry μέσω δικτύου (η προηγούμενη συμπεριφορά).
+SEMGREP_RULES_DIR: str = os.getenv("SAST_SEMGREP_RULES_DIR",
+                                   os.path.join(os.path.expanduser("~"), ".local", "share",
+                                                "sast_tool", "semgrep_rules"))
+SEMGREP_RULES_MODE: str = os.getenv("SAST_SEMGREP_RULES", "auto").strip().lower()
+SEMGREP_REGISTRY_URL: str = os.getenv("SAST_SEMGREP_REGISTRY", "https://semgrep.dev/c/")
+
+# Προεπιλογή κανόνων ανά αρχείο (μόνο με τοπικούς κανόνες· απενεργοποίηση με SAST_SEMGREP_PREFILTER=0).
+SEMGREP_PREFILTER: bool = os.getenv("SAST_SEMGREP_PREFILTER", "1").strip().lower() not in ("0", "false", "no")
+
+# Επιπλέον ορίσματα της Semgrep με τοπικούς κανόνες: καμία σύνδεση για metrics ή έλεγχο νέας έκδοσης.
+LOCAL_SEMGREP_ARGS: list[str] = ["--metrics", "off", "--disable-version-check"]
+
+class RulePackError(RuntimeError):
+    """
+    Οι τοπικοί κανόνες της Semgrep λείπουν, δεν κατέβηκαν ή δεν είναι έγκυρο αρχείο κανόνων.
+    """
+
+# ------------------------------------------------------
+# 2. Λήψη (vendor) και εισαγωγή των rule packs.
+# ------------------------------------------------------
+
+def pack_path(config: str, rules_dir: str | None = None) -> str:
+    """
+    Διαδρομή του τοπικού αντιγράφου ενός ruleset (π.χ. p/python -> packs/p__python.yml).
+    """
+    name = re.sub(r"[^A-Za-z0-9._-]+", "__", config).strip("_") or "rules"
+    return os.path.join(rules_dir or SEMGREP_RULES_DIR, "packs", f"{name}.yml")
+
+def _parse_pack(payload: bytes, source: str) -> list[dict[str, Any]]:
+    """
+    Αναλύει ένα αρχείο κανόνων (YAML ή JSON) και επιστρέφει τη λίστα "rules".
+    """
+    try:
+        data = yaml.safe_load(payload)
+    except yaml.YAMLError as exc:
+        raise RulePackError(f"Μη έγκυρο αρχείο κανόνων Semgrep ({source}): {exc}") from exc
+    rules = data.get("rules") if isinstance(data, dict) else None
+    if not isinstance(rules, list):
+        raise RulePackError(f"Το αρχείο κανόνων Semgrep ({source}) δεν περιέχει λίστα \"rules\".")
+    return [rule for rule in rules if isinstance(rule, dict)]
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def fetch_rule_pack(config: str, timeout: float = 60.0) -> bytes:
+    """
+    Κατεβάζει ένα ruleset από το registry της Semgrep (π.χ. p/python). Αν το config είναι τοπικό
+    αρχείο, διαβάζεται από τον δίσκο.
+    """
+    if os.path.isfile(config):
+        with open(config, "rb") as rules_file:
+            return rules_file.read()
+    request = urllib.request.Request(SEMGREP_REGISTRY_URL + config, headers={"Accept": "application/x-yaml"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.read()
+    except (urllib.error.URLError, OSError) as exc:
+        raise RulePackError(f"Αποτυχία λήψης του ruleset {config} από το registry της Semgrep: {exc}") from exc
+
+def import_rule_pack(config: str, source_path: str, rules_dir: str | None = None) -> str:
+    """
+    Εισάγει ως τοπικό αντίγραφο του ruleset config ένα αρχείο κανόνων που κατέβηκε αλλού (π.χ. σε
+    μηχάνημα με πρόσβαση στο δίκτυο). Επιστρέφει τη διαδρομή του pack.
+    """
+    with open(source_path, "rb") as source_file:
+        payload = source_file.read()
+    _parse_pack(payload, source_path)                       # Έλεγχος εγκυρότητας πριν από την αντικατάσταση.
+    target = pack_path(config, rules_dir)
+    _write_atomic(target, payload)
+    return target
+
+def vendor_rule_packs(configs: Iterable[str], rules_dir: str | None = None, timeout: float = 60.0) -> str:
+    """
+    Κατεβάζει όλα τα rulesets στον τοπικό φάκελο και δημιουργεί το συγχωνευμένο αρχείο κανόνων.
+    Ένα pack αντικαθίσταται μόνο αφού κατέβει ολόκληρο και ελεγχθεί. Επιστρέφει τη διαδρομή του
+    συγχωνευμένου αρχείου.
+    """
+    configs = list(configs)
+    for config in configs:
+        payload = fetch_rule_pack(config, timeout)
+        rules = _parse_pack(payload, config)
+        _write_atomic(pack_path(config, rules_dir), payload)
+        logger.info("Vendor του ruleset %s: %d κανόνες.", config, len(rules))
+    return merged_ruleset(configs, rules_dir)
+
+# ------------------------------------------------------------------
+# 3. Συγχώνευση των packs σε ένα αρχείο κανόνων (cache ανά περιεχόμενο).
+# ------------------------------------------------------------------
+
+def merge_rules(packs: Iterable[list[dict[str, Any]]]) -> tuple[list[dict[str, Any]], int]:
+    """
+    Συγχωνεύει τους κανόνες πολλών packs κρατώντας την πρώτη εμφάνιση κάθε id, καθώς και κάθε
+    κανόνα με διαφορετικό περιεχόμενο (όχι ίδια patterns με άλλο id, που θα έδιναν διπλά ευρήματα).
+    Επιστρέφει (κανόνες, πλήθος διπλοτύπων που αφαιρέθηκαν).
+    """
+    merged: list[dict[str, Any]] = []
+    seen_ids: set[str] = set()
+    seen_bodies: set[str] = set()
+    duplicates = 0
+    for rules in packs:
+        for rule in rules:
+            rule_id = str(rule.get("id", ""))
+            body = json.dumps({key: value for key, value in rule.items() if key != "id"},
+                              sort_keys=True, default=str)
+            if rule_id in seen_ids or body in seen_bodies:
+                duplicates += 1
+                continue
+            seen_ids.add(rule_id)
+            seen_bodies.add(body)
+            merged.append(rule)
+    return merged, duplicates
+
+# Συγχωνευμένο αρχείο ανά (διαδρομή, mtime, μέγεθος) των packs, ώστε κάθε σάρωση να κοστίζει μόνο stat().
+_merged_memo: dict[tuple[Any, ...], str] = {}
+_merged_lock = threading.Lock()
+
+def merged_ruleset(configs: Iterable[str], rules_dir: str | None = None) -> str:
+    """
+    Επιστρέφει τη διαδρομή του συγχωνευμένου αρχείου κανόνων για τα configs, δημιουργώντας το αν
+    χρειάζεται. Το όνομά του περιέχει το hash του περιεχομένου των packs (merged-<hash>.json), οπότε
+    ένα νέο vendor δημιουργεί νέο αρχείο (και νέα κλειδιά στην cache αποτελεσμάτων) και τα παλιά
+    διαγράφονται. Προκαλεί RulePackError αν κάποιο pack δεν έχει γίνει vendor.
+    """
+    rules_dir = rules_dir or SEMGREP_RULES_DIR
+    paths = [(config, pack_path(config, rules_dir)) for config in configs]
+    missing = [config for config, path in paths if not os.path.isfile(path)]
+    if missing:
+        raise RulePackError(f"Δεν υπάρχουν τοπικοί κανόνες Semgrep για: {', '.join(missing)}. "
+                            f"Εκτελέστε: python -m sast.semgrep_rules vendor")
+    stats = tuple((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for _config, path in paths)
+    with _merged_lock:
+        cached = _merged_memo.get(stats)
+        if cached is not None and os.path.isfile(cached):
+            return cached
+
+        payloads = []
+        digest = hashlib.sha256()
+        for config, path in paths:
+            with open(path, "rb") as pack_file:
+                payload = pack_file.read()
+            payloads.append((config, payload))
+            digest.update(config.encode("utf-8") + b"\0" + payload + b"\0")
+        target = os.path.join(rules_dir, f"merged-{digest.hexdigest()[:16]}.json")
+        if not os.path.isfile(target):
+            rules, duplicates = merge_rules(_parse_pack(payload, config) for config, payload in payloads)
+            # Το JSON είναι έγκυρο YAML για τη Semgrep και γράφεται/διαβάζεται ταχύτερα.
+            _write_atomic(target, json.dumps({"rules": rules}, ensure_ascii=False, default=str).encode("utf-8"))
+            stem = os.path.splitext(os.path.basename(target))[0]
+            for stale in glob.glob(os.path.join(rules_dir, "merged-*.json")):
+                if stale != target:
+                    os.remove(stale)
+            for stale in glob.glob(os.path.join(rules_dir, "subsets", "merged-*.json")):
+                if not os.path.basename(stale).startswith(stem + "-"):
+                    os.remove(stale)
+            logger.info("Συγχωνευμένοι κανόνες Semgrep: %d (αφαιρέθηκαν %d διπλότυποι) στο %s.",
+                        len(rules), duplicates, target)
+        _merged_memo[stats] = target
+        return target
+
+# ---------------------------------------------------------------
+# 4. Προεπιλογή (prefilter) των κανόνων που αφορούν κάθε αρχείο.
+# ---------------------------------------------------------------
+
+# Απαίτηση ενός κανόνα για τα ονόματα του κώδικα: None (ταιριάζει πάντα), frozenset (όλα τα ονόματα
+# πρέπει να υπάρχουν) ή ("all" | "any", απαιτήσεις) για τους τελεστές patterns / pattern-either.
+Requirement = Any
+
+_NAME_RE = re.compile(r"[^\W\d]\w*")
+_STRING_RE = re.compile(r"(\"\"\"|\'\'\'|\"|\')(?:\\.|(?!\1).)*?\1", re.DOTALL)
+_TYPED_METAVAR_RE = re.compile(r"\(\s*[^\W\d][\w.]*(?:\[[^\]]*\])?\s+(\$\w+)\s*\)")
+_METAVAR_RE = re.compile(r"\$(?:\.\.\.)?\w+")
+_KEYWORDS: frozenset[str] = frozenset(keyword.kwlist) | frozenset(keyword.softkwlist)
+# Γλώσσες κανόνων που εφαρμόζονται σε αρχεία Python (οι υπόλοιποι κανόνες των packs δεν ταιριάζουν ποτέ).
+_PYTHON_LANGUAGES: frozenset[str] = frozenset({"python", "python2", "python3", "py", "generic", "regex", "none"})
+
+def source_names(code: str) -> frozenset[str]:
+    """
+    Ευρετήριο ονομάτων ενός αρχείου: όλα τα αναγνωριστικά του κειμένου (imports, κλήσεις, attributes,
+    ακόμη και μέσα σε strings/σχόλια). Είναι υπερσύνολο των ονομάτων του token stream, ώστε η
+    προεπιλογή να μην απορρίπτει ποτέ κανόνα που θα μπορούσε να ταιριάξει.
+    """
+    return frozenset(_NAME_RE.findall(code))
+
+def _pattern_names(pattern: Any) -> Requirement:
+    """
+    Ονόματα που πρέπει να υπάρχουν στον κώδικα για να ταιριάξει ένα pattern: τα αναγνωριστικά του
+    εκτός από metavariables ($X), τύπους typed metavariables, λέξεις-κλειδιά και περιεχόμενο strings.
+    """
+    if not isinstance(pattern, str):
+        return None
+    text = _STRING_RE.sub(" ", pattern)
+    text = _TYPED_METAVAR_RE.sub(r"\1", text)
+    text = _METAVAR_RE.sub(" ", text)
+    names = frozenset(_NAME_RE.findall(text)) - _KEYWORDS
+    return names or None
+
+def _formula_requirement(node: Any) -> Requirement:
+    """
+    Απαίτηση ενός τελεστή Semgrep. Μόνο οι θετικοί τελεστές (pattern, pattern-inside, patterns,
+    pattern-either) περιορίζουν τον κανόνα· οι αρνητικοί, τα pattern-regex και όσοι δεν αναγνωρίζονται
+    θεωρούνται ότι ταιριάζουν πάντα.
+    """
+    if not isinstance(node, dict):
+        return None
+    parts: list[Requirement] = []
+    for key, value in node.items():
+        if key in ("pattern", "pattern-inside"):
+            parts.append(_pattern_names(value))
+        elif key == "patterns" and isinstance(value, list):
+            parts.extend(_formula_requirement(child) for child in value)
+        elif key == "pattern-either" and isinstance(value, list):
+            alternatives = [_formula_requirement(child) for child in value]
+            parts.append(None if not alternatives or None in alternatives else ("any", tuple(alternatives)))
+    parts = [part for part in parts if part is not None]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else ("all", tuple(parts))
+
+def _rule_requirement(rule: dict[str, Any]) -> Requirement:
+    if rule.get("mode") != "taint":
+        return _formula_requirement(rule)
+    # Ένα εύρημα taint χρειάζεται τουλάχιστον μία πηγή και μία καταβόθρα (sink) στον κώδικα.
+    parts = []
+    for key in ("pattern-sources", "pattern-sinks"):
+        specs = rule.get(key)
+        alternatives = [_formula_requirement(spec) for spec in specs] if isinstance(specs, list) else [None]
+        if alternatives and None not in alternatives:
+            parts.append(("any", tuple(alternatives)))
+    return ("all", tuple(parts)) if parts else None
+
+def _satisfied(requirement: Requirement, names: frozenset[str]) -> bool:
+    if requirement is None:
+        return True
+    if isinstance(requirement, frozenset):
+        return requirement <= names
+    operator, parts = requirement
+    check = all if operator == "all" else any
+    return check(_satisfied(part, names) for part in parts)
+
+def _is_python_rule(rule: dict[str, Any]) -> bool:
+    languages = rule.get("languages")
+    if not isinstance(languages, list) or not languages:
+        return True
+    return any(str(language).lower() in _PYTHON_LANGUAGES for language in languages)
+
+@lru_cache(maxsize=4)
+def _rule_index(merged_path: str) -> tuple[tuple[dict[str, Any], Requirement], ...]:
+    """
+    Κανόνες Python του συγχωνευμένου αρχείου μαζί με την απαίτησή τους (υπολογίζεται μία φορά ανά αρχείο).
+    """
+    with open(merged_path, "rb") as merged_file:
+        rules = json.load(merged_file).get("rules", [])
+    return tuple((rule, _rule_requirement(rule)) for rule in rules if _is_python_rule(rule))
+
+def _prefilter_ruleset(configs: list[str]) -> str | None:
+    """
+    Το συγχωνευμένο αρχείο στο οποίο εφαρμόζεται η προεπιλογή, ή None αν αυτή είναι ανενεργή ή
+    χρησιμοποιούνται τα rulesets του registry (τα patterns τους δεν είναι διαθέσιμα τοπικά).
+    """
+    if not SEMGREP_PREFILTER or SEMGREP_RULES_MODE == "registry":
+        return None
+    try:
+        return merged_ruleset(configs)
+    except RulePackError:
+        return None
+
+def select_rules(merged_path: str, names: frozenset[str]) -> list[dict[str, Any]]:
+    """
+    Κανόνες του συγχωνευμένου αρχείου που μπορούν να ταιριάξουν σε κώδικα με τα ονόματα names.
+    """
+    return [rule for rule, requirement in _rule_index(merged_path) if _satisfied(requirement, names)]
+
+def _subset_ruleset(merged_path: str, rules: list[dict[str, Any]]) -> str:
+    """
+    Αρχείο με υποσύνολο των κανόνων (subsets/merged-<hash>-<hash των ids>.json). Τα αρχεία αυτά
+    επαναχρησιμοποιούνται μεταξύ σαρώσεων και διαγράφονται όταν αλλάξει το συγχωνευμένο αρχείο.
+    """
+    rule_ids = "\0".join(str(rule.get("id", "")) for rule in rules)
+    stem = os.path.splitext(os.path.basename(merged_path))[0]
+    target = os.path.join(os.path.dirname(merged_path), "subsets",
+                          f"{stem}-{hashlib.sha256(rule_ids.encode('utf-8')).hexdigest()[:16]}.json")
+    if not os.path.isfile(target):
+        _write_atomic(target, json.dumps({"rules": rules}, ensure_ascii=False, default=str).encode("utf-8"))
+    return target
+
+def semgrep_targets(configs: Iterable[str], sources: dict[str, str]) -> list[str]:
+    """
+    Τα κλειδιά του sources (διαδρομές ή ονόματα αρχείων) στα οποία εφαρμόζεται τουλάχιστον ένας
+    κανόνας. Χωρίς προεπιλογή επιστρέφονται όλα.
+    """
+    merged = _prefilter_ruleset(list(configs))
+    if merged is None:
+        return list(sources)
+    return [key for key, code in sources.items() if select_rules(merged, source_names(code))]
+
+# ---------------------------------------------------------
+# 5. Ορίσματα της Semgrep ανάλογα με τον τρόπο επιλογής κανόνων.
+# ---------------------------------------------------------
+
+def semgrep_config_args(configs: Iterable[str], sources: Iterable[str] | None = None) -> list[str] | None:
+    """
+    Ορίσματα --config (και, με τοπικούς κανόνες, LOCAL_SEMGREP_ARGS) για μια κλήση της Semgrep.
+    Στη λειτουργία "local" προκαλεί RulePackError αν οι τοπικοί κανόνες λείπουν.
+    Αν δοθούν οι κώδικες που θα σαρωθούν (sources), με τοπικούς κανόνες χρησιμοποιείται μόνο το
+    υποσύνολο που μπορεί να ταιριάξει σε αυτούς· αν δεν ταιριάζει κανένας κανόνας επιστρέφεται None
+    και η Semgrep δεν χρειάζεται να εκτελεστεί.
+    """
+    configs = list(configs)
+    if SEMGREP_RULES_MODE != "registry":
+        try:
+            merged = merged_ruleset(configs)
+        except RulePackError:
+            if SEMGREP_RULES_MODE == "local":
+                raise
+        else:
+            if sources is None or not SEMGREP_PREFILTER:
+                return ["--config", merged, *LOCAL_SEMGREP_ARGS]
+            names = frozenset().union(*(source_names(code) for code in sources))
+            rules = select_rules(merged, names)
+            if not rules:
+                return None
+            if len(rules) == len(_rule_index(merged)) and len(rules) == len(_local_rule_ids(merged)):
+                return ["--config", merged, *LOCAL_SEMGREP_ARGS]
+            return ["--config", _subset_ruleset(merged, rules), *LOCAL_SEMGREP_ARGS]
+    args: list[str] = []
+    for config in configs:                                  # Ένα --config ανά ruleset του registry.
+        args += ["--config", config]
+    return args
+
+@lru_cache(maxsize=64)
+def _local_rule_ids(merged_path: str) -> frozenset[str]:
+    # Το όνομα του αρχείου περιέχει το hash των κανόνων, οπότε η διαδρομή αρκεί ως κλειδί.
+    with open(merged_path, "rb") as merged_file:
+        return frozenset(str(rule.get("id", "")) for rule in json.load(merged_file).get("rules", []))
+
+def rule_id_restorer(config_args: list[str]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """
+    Με τοπικό αρχείο κανόνων η Semgrep προσθέτει στο check_id κάθε ευρήματος τη διαδρομή του φακέλου
+    (π.χ. "home.user.rules.python.lang..."). Επιστρέφει συνάρτηση που επαναφέρει (in place) το αρχικό
+    id του κανόνα σε ένα εύρημα, ώστε τα ευρήματα (και τα fingerprints του ιστορικού) να είναι ίδια
+    με αυτά των rulesets του registry.
+    """
+    merged = [arg for arg in config_args if arg.endswith(".json") and os.path.isfile(arg)]
+    if not merged:
+        return lambda issue: issue
+    rule_ids = _local_rule_ids(merged[0])
+
+    def restore(issue: dict[str, Any]) -> dict[str, Any]:
+        check_id = str(issue.get("check_id", ""))
+        if check_id in rule_ids:
+            return issue
+        for index, char in enumerate(check_id):
+            if char == "." and check_id[index + 1:] in rule_ids:
+                issue["check_id"] = check_id[index + 1:]
+                break
+        return issue
+    return restore
+
+def restore_rule_ids(results: list[dict[str, Any]], config_args: list[str]) -> list[dict[str, Any]]:
+    """
+    Εφαρμόζει τη rule_id_restorer σε όλα τα ευρήματα μιας εξόδου της Semgrep.
+    """
+    restore = rule_id_restorer(config_args)
+    for issue in results:
+        restore(issue)
+    return results
+
+def rules_identity(configs: Iterable[str]) -> list[str]:
+    """
+    Ταυτότητα των κανόνων που θα χρησιμοποιηθούν, για το κλειδί της cache αποτελεσμάτων: το όνομα
+    του συγχωνευμένου αρχείου (περιέχει το hash των κανόνων) ή τα ονόματα των rulesets του registry.
+    """
+    configs = list(configs)
+    try:
+        args = semgrep_config_args(configs) or []
+    except RulePackError:                                   # Η σάρωση θα αποτύχει, οπότε δεν θα αποθηκευτεί.
+        return configs
+    local = [os.path.basename(arg) for arg in args if arg.endswith(".json")]
+    return local or configs
+
+_digest_memo: dict[tuple[Any, ...], str] = {}
+
+def vendored_rules_digest(configs: Iterable[str], rules_dir: str | None = None) -> str:
+    """
+    Hash του περιεχομένου των τοπικών packs για τα configs (όσα λείπουν μετρούν ως απόντα), για το
+    fingerprint της cache αποτελεσμάτων. Υπολογίζεται ξανά μόνο όταν αλλάξει κάποιο αρχείο (mtime, μέγεθος).
+    """
+    paths = [(config, pack_path(config, rules_dir)) for config in configs]
+    stats = []
+    for _config, path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats.append((path, None, None))
+        else:
+            stats.append((path, stat.st_mtime_ns, stat.st_size))
+    key = tuple(stats)
+    cached = _digest_memo.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    for config, path in paths:
+        try:
+            with open(path, "rb") as pack_file:
+                payload = pack_file.read()
+        except OSError:
+            payload = b"-"
+        digest.update(config.encode("utf-8") + b"\0" + payload + b"\0")
+    _digest_memo[key] = digest.hexdigest()[:16]
+    return _digest_memo[key]
+
+# ---------------------------------------------
+# 6. Διαχείριση των κανόνων από τη γραμμή εντολών.
+# ---------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m sast.semgrep_rules",
+        description="Τοπικά (offline) rule packs της Semgrep για το εργαλείο SAST.")
+    parser.add_argument("--dir", default=SEMGREP_RULES_DIR, help="Φάκελος των τοπικών κανόνων.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    vendor = commands.add_parser("vendor", help="Λήψη των rulesets από το registry και συγχώνευσή τους.")
+    vendor.add_argument("--config", action="append", default=None,
+                        help="Ruleset προς λήψη (επαναλαμβανόμενο). Προεπιλογή: τα SEMGREP_CONFIGS.")
+    vendor.add_argument("--timeout", type=float, default=60.0, help="Όριο χρόνου λήψης ανά ruleset.")
+    importer = commands.add_parser("import", help="Εισαγωγή αρχείου κανόνων που κατέβηκε σε άλλο μηχάνημα.")
+    importer.add_argument("config", help="Όνομα του ruleset (π.χ. p/python).")
+    importer.add_argument("file", help="Αρχείο κανόνων YAML/JSON.")
+    commands.add_parser("status", help="Κατάσταση των τοπικών κανόνων (έξοδος JSON).")
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    from sast.analyzers import SEMGREP_CONFIGS
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "vendor":
+            print(vendor_rule_packs(args.config or SEMGREP_CONFIGS, args.dir, args.timeout))
+            return 0
+        if args.command == "import":
+            import_rule_pack(args.config, args.file, args.dir)
+            if all(os.path.isfile(pack_path(config, args.dir)) for config in SEMGREP_CONFIGS):
+                print(merged_ruleset(SEMGREP_CONFIGS, args.dir))
+            return 0
+        packs = {config: os.path.isfile(pack_path(config, args.dir)) for config in SEMGREP_CONFIGS}
+        merged = merged_ruleset(SEMGREP_CONFIGS, args.dir) if all(packs.values()) else None
+        json.dump({"mode": SEMGREP_RULES_MODE, "dir": args.dir, "packs": packs, "merged": merged},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return 0
+    except (RulePackError, OSError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Ενιαία διάσχιση (single walk) του AST για πολλαπλά σύνολα κανόνων.
+
+Αντί κάθε επισκέπτης (ast.NodeVisitor) να διατρέχει αναδρομικά όλο το δέντρο, ο TraversalDriver
+διατρέχει το δέντρο μία φορά, επαναληπτικά (με στοίβα, χωρίς αναδρομή) και αποστέλλει κάθε κόμβο
+σε όλους τους καταχωρημένους handlers (π.χ. RuleEngine). Υποδέντρα που δεν μπορούν να περιέχουν
+κόμβους κάποιου ενεργού κανόνα παραλείπονται. Έτσι το στάδιο του custom AST παραμένει γραμμικό ως
+προς το μέγεθος του δέντρου ανεξάρτητα από το πλήθος των συνόλων κανόνων, και δεν προκαλείται
+RecursionError σε βαθιά εμφωλευμένο (π.χ. αυτόματα παραγόμενο) κώδικα.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import ast
+from typing import Any, Iterable, Protocol
+
+# Τύποι κόμβων που δεν περιέχουν άλλους ουσιαστικούς κόμβους (π.χ. Load/Store, τελεστές, alias).
+_TERMINAL_TYPES: tuple[type[ast.AST], ...] = (ast.expr_context, ast.operator, ast.boolop,
+                                              ast.cmpop, ast.unaryop, ast.alias)
+
+# Τύποι κόμβων που μπορούν να εμφανιστούν μέσα σε μια έκφραση (ast.expr). Οι εκφράσεις δεν
+# περιέχουν ποτέ εντολές (ast.stmt), οπότε αν κανένας ενεργός κανόνας δεν αφορά αυτούς τους
+# τύπους, τα υποδέντρα εκφράσεων παραλείπονται ολόκληρα.
+_EXPR_SUBTREE_TYPES: tuple[type[ast.AST], ...] = (ast.expr, ast.comprehension, ast.keyword,
+                                                  ast.arguments, ast.arg) + _TERMINAL_TYPES
+
+# -------------------------------------
+# 2. Διεπαφή (protocol) των rule handlers.
+# -------------------------------------
+
+class RuleHandler(Protocol):
+    """
+    Ό,τι μπορεί να καταχωρηθεί στον TraversalDriver: δηλώνει τους τύπους κόμβων που το
+    ενδιαφέρουν και επιστρέφει τα ευρήματα για έναν κόμβο (όπως η RuleEngine).
+    """
+    @property
+    def node_types(self) -> frozenset[type[ast.AST]]: ...
+
+    def match(self, node: ast.AST) -> list[dict[str, Any]]: ...
+
+class VisitorRuleSet:
+    """
+    Προσαρμογέας (adapter) για υπάρχοντες επισκέπτες τύπου ast.NodeVisitor με μεθόδους visit_<Τύπος>
+    και λίστα self.issues (όπως ο αρχικός SecurityVisitor). Οι μέθοδοι visit_* καλούνται από τον
+    driver για κάθε σχετικό κόμβο, ενώ η generic_visit του επισκέπτη απενεργοποιείται, ώστε να μην
+    ξεκινά δεύτερη αναδρομική διάσχιση.
+    """
+    def __init__(self, visitor: ast.NodeVisitor) -> None:
+        self.visitor = visitor
+        if not hasattr(visitor, "issues"):
+            visitor.issues = []
+        visitor.generic_visit = lambda node: None             # Η διάσχιση γίνεται μόνο από τον driver.
+        self._methods: dict[type[ast.AST], Any] = {}
+        for attr in dir(type(visitor)):
+            node_type = getattr(ast, attr[len("visit_"):], None) if attr.startswith("visit_") else None
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                self._methods[node_type] = getattr(visitor, attr)
+
+    @property
+    def node_types(self) -> frozenset[type[ast.AST]]:
+        return frozenset(self._methods)
+
+    def match(self, node: ast.AST) -> list[dict[str, Any]]:
+        method = self._methods.get(type(node))
+        if method is None:
+            return []
+        before = len(self.visitor.issues)
+        method(node)
+        return self.visitor.issues[before:]
+
+# ------------------------------------------------------------
+# 3. Ορισμός κλάσης για την ενιαία, επαναληπτική διάσχιση του AST.
+# ------------------------------------------------------------
+
+class TraversalDriver:
+    """
+    Διατρέχει το AST μία φορά (preorder, όπως ο ast.NodeVisitor) και αποστέλλει κάθε κόμβο σε
+    όλους τους handlers που ενδιαφέρονται για τον τύπο του, με τη σειρά καταχώρησής τους.
+    handlers: Αρχική λίστα handlers (RuleEngine, VisitorRuleSet ή οτιδήποτε υλοποιεί το RuleHandler).
+    """
+    def __init__(self, handlers: Iterable[RuleHandler] = ()) -> None:
+        self.handlers: list[RuleHandler] = []
+        self._dispatch: dict[type[ast.AST], list[RuleHandler]] = {}
+        self._descend_expr = False
+        self._descend_terminal = False
+        for handler in handlers:
+            self.register(handler)
+
+    def register(self, handler: RuleHandler) -> None:
+        """
+        Καταχωρεί έναν handler και ενημερώνει τον πίνακα αποστολής και τους κανόνες παράλειψης υποδέντρων.
+        """
+        self.handlers.append(handler)
+        for node_type in handler.node_types:
+            self._dispatch.setdefault(node_type, []).append(handler)
+            self._descend_expr = self._descend_expr or issubclass(node_type, _EXPR_SUBTREE_TYPES)
+            self._descend_terminal = self._descend_terminal or issubclass(node_type, _TERMINAL_TYPES)
+
+    def walk(self, tree: ast.AST) -> list[dict[str, Any]]:
+        """
+        Εκτελεί τη διάσχιση και επιστρέφει όλα τα ευρήματα με τη σειρά εμφάνισης των κόμβων.
+        """
+        issues: list[dict[str, Any]] = []
+        dispatch = self._dispatch
+        # Τύποι παιδιών που δεν χρειάζεται να μπουν στη στοίβα (δεν περιέχουν κόμβους ενεργών κανόνων).
+        skipped: tuple[type[ast.AST], ...] = ()
+        if not self._descend_terminal:
+            skipped += _TERMINAL_TYPES
+        if not self._descend_expr:
+            skipped += (ast.expr,)
+        stack: list[ast.AST] = [tree]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node = pop()
+            handlers = dispatch.get(type(node))
+            if handlers:
+                for handler in handlers:
+                    issues.extend(handler.match(node))
+            # Τα παιδιά μπαίνουν στη στοίβα σε αντίστροφη σειρά (πεδία και στοιχεία λιστών), ώστε να
+            # επισκέπτονται με τη σειρά του ast.NodeVisitor.generic_visit / ast.iter_child_nodes.
+            for name in reversed(node._fields):
+                value = getattr(node, name, None)
+                if isinstance(value, list):
+                    for item in reversed(value):
+                        if isinstance(item, ast.AST) and not isinstance(item, skipped):
+                            push(item)
+                elif isinstance(value, ast.AST) and not isinstance(value, skipped):
+                    push(value)
+        return issues
@@ -0,0 +1,356 @@
+"""
+Pool μόνιμων ("ζεστών") worker διεργασιών για τους αναλυτές Bandit και Pylint.
+
+Κάθε worker φορτώνει μία φορά τις βιβλιοθήκες (imports της Pylint/astroid, plugins της Bandit) και
+εκτελεί μια σάρωση προθέρμανσης. Στη συνέχεια δέχεται εργασίες σάρωσης μέσω ενός τοπικού pipe
+(multiprocessing.Pipe) και εκτελεί τα εργαλεία in-process, χωρίς το κόστος ψυχρής εκκίνησης ανά σάρωση.
+Οι workers ανακυκλώνονται (τερματίζονται και αντικαθίστανται) μετά από N εργασίες ή όταν η μνήμη τους
+ξεπεράσει ένα όριο, ώστε τυχόν διαρροές μνήμης των βιβλιοθηκών (π.χ. caches του astroid) να μη
+συσσωρεύονται. Worker που ξεπερνά το χρονικό όριο μιας εργασίας τερματίζεται και αντικαθίσταται.
+Χρησιμοποιείται από το Streamlit UI (μέσω του orchestrator) και από το CLI (--warm-pool).
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import sys
+import queue
+import random
+import atexit
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+from typing import Any, Iterable
+
+from sast.budget import ToolTimeoutError, current_timeout
+
+logger = logging.getLogger("sast_tool")
+
+# Εργαλεία που ωφελούνται από ζεστούς workers (ακριβά imports/plugins) και εκτελούνται μέσω του pool.
+WARM_TOOLS: tuple[str, ...] = ("bandit", "pylint")
+
+# Προεπιλογές (ρυθμίζονται και από μεταβλητές περιβάλλοντος). Με SAST_WARM_POOL=0 το Streamlit UI
+# εκτελεί τα εργαλεία στη δική του διεργασία, χωρίς pool.
+WARM_POOL_ENABLED: bool = os.getenv("SAST_WARM_POOL", "1") != "0"
+DEFAULT_WARM_WORKERS: int = int(os.getenv("SAST_WARM_WORKERS", "2"))
+DEFAULT_MAX_JOBS_PER_WORKER: int = int(os.getenv("SAST_WORKER_MAX_JOBS", "200"))
+DEFAULT_MAX_WORKER_RSS_MB: int = int(os.getenv("SAST_WORKER_MAX_RSS_MB", "512"))
+
+# Ο αντικαταστάτης ενός worker αρχίζει να προθερμαίνεται όταν απομένουν τόσες εργασίες (τουλάχιστον μία)
+# ή όταν η μνήμη του worker φτάσει αυτό το ποσοστό του ορίου, ώστε να είναι έτοιμος στην ανακύκλωση.
+STANDBY_JOBS_FRACTION: float = 0.1
+STANDBY_RSS_FRACTION: float = 0.8
+
+# Μικρός κώδικας προθέρμανσης: ενεργοποιεί τα plugins της Bandit και τα brains/checkers της Pylint.
+_WARMUP_SOURCE: str = 'import subprocess\n\ndef warm_up(cmd):\n    """Warm-up."""\n    return subprocess.call(cmd, shell=True)\n'
+
+class WorkerCrashedError(RuntimeError):
+    """
+    Ο worker τερματίστηκε απρόσμενα (π.χ. από τον OOM killer) κατά την εκτέλεση μιας εργασίας.
+    """
+
+# ------------------------------------------------------
+# 2. Κώδικας που εκτελείται μέσα σε κάθε worker διεργασία.
+# ------------------------------------------------------
+
+def _rss_bytes() -> int:
+    """
+    Τρέχουσα μνήμη (RSS) της διεργασίας σε bytes. Σε συστήματα χωρίς /proc επιστρέφεται η μέγιστη
+    RSS μέσω του resource (ή 0 αν δεν είναι διαθέσιμη, π.χ. στα Windows).
+    """
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024   # Σε Linux η τιμή δίνεται σε KB.
+
+def _worker_main(conn: Connection, preload: tuple[str, ...], max_jobs: int, max_rss_bytes: int) -> None:
+    """
+    Βρόχος ενός worker: προθέρμανση, αναφορά ετοιμότητας και εκτέλεση εργασιών μέχρι την ανακύκλωση.
+    Κάθε εργασία είναι tuple (κώδικας, εργαλεία, όνομα αρχείου, χρήση cache) και η απάντηση
+    tuple ((κατάσταση, αποτελέσματα ή μήνυμα σφάλματος), αν ο worker αποσύρεται, μνήμη σε bytes).
+    """
+    from sast.cache import get_default_cache
+    from sast.context import AnalysisContext
+    from sast.orchestrator import run_tools_sequentially
+
+    logging.basicConfig(level=logging.WARNING)
+    run_tools_sequentially(_WARMUP_SOURCE, preload)
+    conn.send(("ready", os.getpid()))
+
+    completed = 0
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):                         # Ο γονέας έκλεισε το pipe.
+            break
+        if job is None:                                     # Κανονικός τερματισμός.
+            break
+        code, tools, filename, use_cache = job
+        try:
+            cache = get_default_cache() if use_cache else None
+            reply: tuple[str, Any] = ("ok", run_tools_sequentially(code, tools, cache=cache,
+                                                                   context=AnalysisContext(code, filename)))
+        except Exception as exc:
+            reply = ("error", f"{type(exc).__name__}: {exc}")
+        completed += 1
+        rss_bytes = _rss_bytes()
+        retire = completed >= max_jobs or (max_rss_bytes > 0 and rss_bytes >= max_rss_bytes)
+        conn.send((reply, retire, rss_bytes))
+        if retire:
+            break
+    conn.close()
+
+# ----------------------------------------------
+# 3. Ορισμός κλάσης για το pool ζεστών workers.
+# ----------------------------------------------
+
+class _Worker:
+    """
+    Μια worker διεργασία, το άκρο του pipe προς αυτήν και οι εργασίες που της έχουν σταλεί.
+    """
+    __slots__ = ("process", "conn", "max_jobs", "completed", "rss_bytes")
+
+    def __init__(self, process: multiprocessing.process.BaseProcess, conn: Connection, max_jobs: int) -> None:
+        self.process = process
+        self.conn = conn
+        self.max_jobs = max_jobs
+        self.completed = 0
+        self.rss_bytes = 0
+
+    def near_recycle(self, max_rss_bytes: int) -> bool:
+        """
+        True αν ο worker πλησιάζει την ανακύκλωση: απομένουν λίγες εργασίες (STANDBY_JOBS_FRACTION του
+        ορίου, τουλάχιστον μία) ή η μνήμη του έφτασε το STANDBY_RSS_FRACTION του max_rss_bytes.
+        """
+        lead = max(1, int(self.max_jobs * STANDBY_JOBS_FRACTION))
+        return (self.completed >= self.max_jobs - lead
+                or (max_rss_bytes > 0 and self.rss_bytes >= max_rss_bytes * STANDBY_RSS_FRACTION))
+
+class WarmWorkerPool:
+    """
+    Pool μόνιμων worker διεργασιών. Κάθε worker εξυπηρετείται από ένα νήμα του γονέα, το οποίο παίρνει
+    εργασίες από κοινή ουρά, τις στέλνει μέσω pipe και ολοκληρώνει το αντίστοιχο Future.
+    workers: Πλήθος worker διεργασιών.
+    max_jobs_per_worker: Ανακύκλωση ενός worker μετά από τόσες εργασίες.
+    max_rss_mb: Ανακύκλωση ενός worker όταν η μνήμη του ξεπεράσει τα τόσα MB (0 = χωρίς όριο).
+    tools: Εργαλεία που προθερμαίνονται και που ο orchestrator στέλνει στο pool.
+    """
+    def __init__(self,
+                 workers: int = DEFAULT_WARM_WORKERS,
+                 max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+                 max_rss_mb: int = DEFAULT_MAX_WORKER_RSS_MB,
+                 tools: Iterable[str] = WARM_TOOLS) -> None:
+        self.workers = max(1, workers)
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.max_rss_bytes = max(0, max_rss_mb) * 1024 * 1024
+        self.tools: tuple[str, ...] = tuple(tools)
+        self.recycled = 0                                   # Πλήθος ανακυκλώσεων (όριο εργασιών/μνήμης).
+        self.crashed = 0                                    # Πλήθος απρόσμενων τερματισμών workers.
+        self.timed_out = 0                                  # Πλήθος workers που τερματίστηκαν λόγω ορίου χρόνου.
+        # Το "spawn" αποφεύγει fork μιας διεργασίας με πολλά νήματα (Streamlit) και λειτουργεί και στα Windows.
+        self._mp = multiprocessing.get_context("spawn")
+        self._jobs: queue.Queue[tuple[Future, tuple[Any, ...], float | None] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._serve, name=f"sast-warm-worker-{index}", daemon=True)
+                         for index in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _start(self) -> _Worker:
+        """
+        Ξεκινά έναν νέο worker χωρίς να περιμένει την προθέρμανσή του.
+        """
+        parent_conn, child_conn = self._mp.Pipe()
+        # Τυχαία μείωση του ορίου εργασιών έως 25%, ώστε οι workers να μην ανακυκλώνονται όλοι ταυτόχρονα.
+        max_jobs = self.max_jobs_per_worker - random.randrange(self.max_jobs_per_worker // 4 + 1)
+        process = self._mp.Process(target=_worker_main,
+                                   args=(child_conn, self.tools, max_jobs, self.max_rss_bytes),
+                                   name="sast-warm-worker",
+                                   daemon=True)
+        process.start()
+        child_conn.close()                                  # Ο γονέας κρατά μόνο το δικό του άκρο του pipe.
+        return _Worker(process, parent_conn, max_jobs)
+
+    def _ready(self, worker: _Worker | None) -> _Worker | None:
+        """
+        Περιμένει την προθέρμανση ενός worker που ξεκίνησε (ή ξεκινά έναν νέο αν worker=None).
+        Σε αποτυχία επιστρέφει None, οπότε γίνεται νέα προσπάθεια στην επόμενη εργασία.
+        """
+        try:
+            worker = worker or self._start()
+            worker.conn.recv()                              # ("ready", pid) μετά την προθέρμανση.
+            return worker
+        except (EOFError, OSError):
+            logger.warning("Αποτυχία εκκίνησης worker του pool, νέα προσπάθεια στην επόμενη εργασία.")
+            self._discard(worker)
+            return None
+
+    def _serve(self) -> None:
+        """
+        Νήμα εξυπηρέτησης ενός worker: εκτέλεση εργασιών από την ουρά και ανακύκλωση όταν χρειάζεται.
+        Όταν ο worker πλησιάζει το όριο εργασιών ή μνήμης του (_Worker.near_recycle), ο αντικαταστάτης
+        του ξεκινά να προθερμαίνεται παράλληλα, ώστε η ανακύκλωση να μην καθυστερεί τις σαρώσεις. Αν η απάντηση δεν
+        έρθει μέσα στο όριο χρόνου της εργασίας, ο worker τερματίζεται βίαια και το Future αποτυγχάνει
+        με ToolTimeoutError.
+        """
+        worker = self._ready(None)                          # Προθέρμανση πριν από την πρώτη εργασία.
+        standby: _Worker | None = None
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            future, job, timeout = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if worker is None:
+                    worker = self._ready(standby)
+                    standby = None
+                    if worker is None:
+                        raise OSError("worker startup failed")
+                worker.conn.send(job)
+                worker.completed += 1
+                if standby is None and worker.near_recycle(self.max_rss_bytes):
+                    standby = self._start()
+                if timeout is not None and not worker.conn.poll(timeout):
+                    worker.process.kill()                   # Η εργασία ξεπέρασε το όριο: ο worker δεν διακόπτεται αλλιώς.
+                    self._discard(worker)
+                    with self._lock:
+                        self.timed_out += 1
+                    logger.warning("Worker του pool ξεπέρασε το όριο των %.1fs και τερματίστηκε.", timeout)
+                    future.set_exception(ToolTimeoutError(f"Η εργασία ξεπέρασε το χρονικό όριο των {timeout:.3g}s."))
+                    worker = self._ready(standby)
+                    standby = None
+                    continue
+                (status, payload), retire, worker.rss_bytes = worker.conn.recv()
+            except (EOFError, OSError):                     # Ο worker πέθανε: το Future αποτυγχάνει και ο worker αντικαθίσταται.
+                exitcode = self._discard(worker)
+                with self._lock:
+                    self.crashed += 1
+                logger.warning("Απρόσμενος τερματισμός worker του pool (κωδικός εξόδου %s).", exitcode)
+                future.set_exception(WorkerCrashedError(f"Ο worker τερματίστηκε απρόσμενα (κωδικός εξόδου {exitcode})."))
+                worker = self._ready(standby)
+                standby = None
+                continue
+            if status == "ok":
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+            if not retire and standby is None and worker.near_recycle(self.max_rss_bytes):
+                standby = self._start()                     # Η μνήμη πλησιάζει το όριο.
+            if retire:
+                with self._lock:
+                    self.recycled += 1
+                self._discard(worker)
+                worker = self._ready(standby)               # Ανακύκλωση (όριο εργασιών ή μνήμης).
+                standby = None
+        for remaining in (worker, standby):
+            if remaining is not None:
+                try:
+                    remaining.conn.send(None)
+                except OSError:
+                    pass
+                self._discard(remaining)
+
+    @staticmethod
+    def _discard(worker: _Worker | None) -> int | None:
+        """
+        Κλείνει το pipe ενός worker και περιμένει τον τερματισμό του (ή τον τερματίζει βίαια).
+        Επιστρέφει τον κωδικό εξόδου της διεργασίας.
+        """
+        if worker is None:
+            return None
+        process = worker.process
+        worker.conn.close()
+        process.join(timeout=5)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        return process.exitcode
+
+    def submit(self,
+               code: str,
+               tools: Iterable[str],
+               filename: str = "<unknown>",
+               use_cache: bool = False,
+               timeout: float | None = None) -> Future:
+        """
+        Υποβάλλει μια εργασία σάρωσης και επιστρέφει Future με λεξικό {εργαλείο: αποτέλεσμα}, στη μορφή
+        της run_tools_sequentially. Με use_cache=True ο worker χρησιμοποιεί την κοινή cache του δίσκου.
+        timeout: Προαιρετικό όριο (δευτερόλεπτα) από τη στιγμή που ο worker παραλαμβάνει την εργασία.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Το pool workers έχει τερματιστεί.")
+            self._jobs.put((future, (code, list(tools), filename, use_cache), timeout))
+        return future
+
+    def run_tool(self, tool: str, code: str) -> dict[str, Any]:
+        """
+        Εκτελεί ένα εργαλείο σε έναν ζεστό worker και επιστρέφει το αποτέλεσμά του, με την υπογραφή
+        των run_* συναρτήσεων (για χρήση ως runner από τον orchestrator και την cache). Ισχύει η
+        προθεσμία του εργαλείου που ορίζει ο orchestrator (ToolTimeoutError αν ξεπεραστεί).
+        """
+        return self.submit(code, [tool], timeout=current_timeout()).result()[tool]
+
+    def stats(self) -> dict[str, int]:
+        """
+        Επιστρέφει το πλήθος workers, εργασιών σε αναμονή, ανακυκλώσεων, απρόσμενων τερματισμών και
+        τερματισμών λόγω ορίου χρόνου.
+        """
+        with self._lock:
+            return {"workers": self.workers,
+                    "queued": self._jobs.qsize(),
+                    "recycled": self.recycled,
+                    "crashed": self.crashed,
+                    "timed_out": self.timed_out}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Τερματίζει τους workers αφού ολοκληρωθούν οι εργασίες που βρίσκονται ήδη στην ουρά.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _thread in self._threads:
+                self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "WarmWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+# Κοινό (lazy) pool της διεργασίας, ώστε π.χ. οι διαδοχικές εκτελέσεις του Streamlit script να
+# χρησιμοποιούν τους ίδιους ζεστούς workers.
+_default_pool: WarmWorkerPool | None = None
+_default_pool_lock = threading.Lock()
+
+def get_default_pool() -> WarmWorkerPool:
+    """
+    Επιστρέφει το κοινό pool ζεστών workers της διεργασίας (δημιουργείται στην πρώτη κλήση).
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WarmWorkerPool()
+            atexit.register(_default_pool.shutdown, False)
+        return _default_pool
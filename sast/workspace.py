@@ -0,0 +1,114 @@
+"""
+Κοινός χώρος εργασίας (workspace) μιας σάρωσης για τα εργαλεία που διαβάζουν αρχεία.
+
+Η Semgrep (και η Pylint in-process) χρειάζονται τον κώδικα σε αρχείο. Αντί κάθε εργαλείο να γράφει
+και να διαγράφει το δικό του προσωρινό αρχείο, ο ScanWorkspace γράφει τον κώδικα μία φορά, την πρώτη
+φορά που ζητείται, σε έναν προσωρινό φάκελο που μοιράζονται όλα τα εργαλεία της σάρωσης και
+διαγράφεται στο τέλος της. Ο φάκελος δημιουργείται σε μνήμη (/dev/shm), όπου είναι διαθέσιμη, ή στον
+φάκελο SAST_WORKSPACE_DIR. Τα εργαλεία CLI που διαβάζουν από stdin (Bandit, Pylint) δεν τον χρειάζονται.
+"""
+
+# ------------------------------------
+# 1. Εισαγωγή απαραίτητων βιβλιοθηκών:
+# ------------------------------------
+
+from __future__ import annotations
+import os
+import shutil
+import logging
+import tempfile
+import threading
+from functools import lru_cache
+
+logger = logging.getLogger("sast_tool")
+
+# Φάκελος των workspaces. Αν δεν οριστεί, χρησιμοποιείται το /dev/shm (tmpfs) ή ο φάκελος του tempfile.
+WORKSPACE_DIR: str = os.getenv("SAST_WORKSPACE_DIR", "")
+RAM_WORKSPACE_DIR: str = "/dev/shm"
+
+# Όνομα του αρχείου του κώδικα μέσα στο workspace (και στο stdin της Pylint). Σταθερό ώστε τα
+# ευρήματα που εξαρτώνται από το όνομα του module να μην αλλάζουν από σάρωση σε σάρωση.
+SOURCE_FILENAME: str = "source.py"
+
+# ---------------------------------------------
+# 2. Επιλογή φακέλου και κλάση του workspace.
+# ---------------------------------------------
+
+@lru_cache(maxsize=1)
+def workspace_root() -> str | None:
+    """
+    Ο φάκελος στον οποίο δημιουργούνται τα workspaces: το SAST_WORKSPACE_DIR, αλλιώς το /dev/shm αν
+    υπάρχει και είναι εγγράψιμο, αλλιώς None (ο προεπιλεγμένος φάκελος του tempfile).
+    """
+    if WORKSPACE_DIR:
+        os.makedirs(WORKSPACE_DIR, exist_ok=True)
+        return WORKSPACE_DIR
+    if os.path.isdir(RAM_WORKSPACE_DIR) and os.access(RAM_WORKSPACE_DIR, os.W_OK | os.X_OK):
+        return RAM_WORKSPACE_DIR
+    return None
+
+class ScanWorkspace:
+    """
+    Προσωρινός φάκελος μιας σάρωσης. Ο φάκελος και το αρχείο του κώδικα δημιουργούνται την πρώτη
+    φορά που ζητούνται (lazy) και μία μόνο φορά, ακόμη κι αν τα ζητούν ταυτόχρονα πολλά νήματα του
+    orchestrator. Χρησιμοποιείται ως context manager ή κλείνει με την close().
+    code: Ο κώδικας της σάρωσης ενός αρχείου (source_path), αν υπάρχει.
+    """
+    def __init__(self, code: str | None = None) -> None:
+        self.code = code
+        self._lock = threading.Lock()
+        self._root: str | None = None
+        self._source_path: str | None = None
+
+    def __enter__(self) -> "ScanWorkspace":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def root(self) -> str:
+        """
+        Ο φάκελος του workspace.
+        """
+        with self._lock:
+            if self._root is None:
+                self._root = tempfile.mkdtemp(prefix="sast_ws_", dir=workspace_root())
+            return self._root
+
+    def source_path(self) -> str:
+        """
+        Η διαδρομή του αρχείου με τον κώδικα της σάρωσης (γράφεται μία φορά).
+        """
+        if self.code is None:
+            raise ValueError("Το workspace δεν έχει κώδικα σάρωσης.")
+        root = self.root
+        with self._lock:
+            if self._source_path is None:
+                path = os.path.join(root, SOURCE_FILENAME)
+                with open(path, "w", encoding="utf-8", newline="") as source_file:
+                    source_file.write(self.code)
+                self._source_path = path
+            return self._source_path
+
+    def stage(self, sources: dict[str, str]) -> None:
+        """
+        Γράφει πολλά αρχεία στο workspace, διατηρώντας τη σχετική διαδρομή τους (batch mode).
+        """
+        root = self.root
+        for rel_path, code in sources.items():
+            target = os.path.join(root, rel_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w", encoding="utf-8", newline="") as staged_file:
+                staged_file.write(code)
+
+    def close(self) -> None:
+        """
+        Διαγράφει τον φάκελο και όλα τα αρχεία του.
+        """
+        with self._lock:
+            root, self._root, self._source_path = self._root, None, None
+        if root is not None:
+            shutil.rmtree(root, ignore_errors=True)
+            if os.path.exists(root):
+                logger.warning("Αποτυχία διαγραφής του προσωρινού φακέλου %s.", root)
@@ -4,17 +4,14 @@
 
 from __future__ import annotations  # Για χρήση μοντέρων λειτουργιών στα type hints.
 import streamlit as st              # Για δημιουργία web εφαρμογών.
-import subprocess                   # Για εκτέλεση εξωτερικών εντολών (CLI εργαλείων).
-import tempfile                     # Για δημιουργία προσωρινών αρχείων.
 import os                           # Για διάφορες λειτουργίες του συστήματος - διαχείριση των αρχείων.
-import json                         # Για επεξεργασία JSON δεδομένων (π.χ. ανάγνωση/γραφή).
+import io                           # Για την εξαγωγή SARIF/JSON Lines σε buffer κατά τη λήψη.
 import pandas as pd                 # Για επεξεργασία και ανάλυση δεδομένων (π.χ δημιουργία πινάκων).
-import ast                          # Για ανάλυση και επεξεργασία Python κώδικα μέσω AST (Abstract Syntax Tree).
 import logging                      # Για καταγραφή συμβάντων, σφαλμάτων και παρακολούθηση της ροής εκτέλεσης.
-from typing import Any              # Type hints για καλύτερη αναγνωσιμότητα κώδικα.
+import hashlib                      # Για το hash του αναλυμένου κώδικα στο ιστορικό σαρώσεων.
+import sqlite3                      # Για τα σφάλματα της βάσης του ιστορικού σαρώσεων.
+from typing import Any, Iterator    # Type hints για καλύτερη αναγνωσιμότητα κώδικα.
 from dotenv import load_dotenv      # Για φόρτωση μεταβλητών περιβάλλοντος (π.χ. API keys) από αρχεία μορφής .env
-from radon.complexity import cc_visit           # Αφορά στον εντοπισμό μπλοκ κώδικα και στην κυκλική πολυπλοκότητα (Cyclomatic Complexity).
-from radon.metrics import mi_visit              # Αφορά στον υπολογισμό του δείκτη συντηρησιμότητας (Maintainability Index).
 
 load_dotenv()                       # Φορτώνει το αρχείο .env για να διαβαστεί το API key αργότερα.
 
@@ -26,562 +23,78 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(na
 format="%(asctime)s [%(levelname)s] %(name)s - %(messages)s",
 logger = logging.getLogger("sast_tool")
 
-# ---------------------------------------------------
-# 3. Βοηθητική συνάρτηση για τα CLI-based εργαλεία
-# ---------------------------------------------------
-
-def run_subprocess_json(cmd: list[str],
-                         tool_label: str,
-                         ok_returncodes: tuple[int, ...] = (0,1),
-                         install_hint: str | None = None) -> dict[str,Any]:
-    """
-    Εκτελεί μια εντολή CLI και αναλύει την έξοδο JSON. Η συνάρτηση διαχειρίζεται αυτόματα
-    τα σφάλματα εκτέλεσης  και αποκωδικοποίησης JSON. Επιστρέφει ένα τυποποιημένο λεξικό
-    με τη μορφή:
-    {"ok": boolean, αν η εκτέλεση του εργαλείου ήταν επιτυχής.
-     "error": μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
-     "results": Any, καθώς πρόκειται για τα ευρήματα ως raw δεδομένα JSON  του εργαλείου.
-     "extras": Λεξικό (dict) για επιπλέον στοιχεία εάν χρειαστεί.
-    }
-    tool_label: Όνομα του εργαλείου για την εμφάνιση των μηνυμάτων (π.χ. "Bandit")
-    install_hint: Προαιρετική οδηγία εγκατάστασης (π.χ. "pip install bandit")
-    """
-    # Προσπάθεια εκτέλεσης της εντολής cmd μέσω subprocess.run
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace")
-    except FileNotFoundError:           # Σε περίπτωση που η εντολή δεν βρεθεί στο PATH.
-        error_msg = f"Το εργαλείο {tool_label} δεν βρέθηκε στο σύστημα."
-        if install_hint:
-            error_msg += f"Εγκαταστήστε το με την εντολή: {install_hint}"
-        return {
-            "ok": False,
-            "error": error_msg,                      
-            "results": [],
-            "extras": {}}
-        
-    except Exception as exc:            # Σε περίπτωση οπιουδήποτε άλλου απρόοπτου σφάλματος κατά την εκτέλεση της subprocess.
-        logger.exception("Σφάλμα κατά την εκτέλεση subprocess για %s: %s", tool_label, cmd)
-        return {
-            "ok": False,
-            "error": (f"Σφάλμα κατά την εκτέλεση του {tool_label}: {exc}"),                                            
-            "results": [],
-            "extras": {}}
-        
-    # Καθαρισμός των εξόδων από τις stdout και stderr.
-    stdout_str: str = (result.stdout or "").strip()
-    stderr_str: str = (result.stderr or "").strip()
-    
-    # Επιτρεπτοί κωδικοί επιστροφής : 0 (επιτυχία) και 1 (ευρήματα)
-    if result.returncode not in ok_returncodes:
-        err = stderr_str or f"Μη αναμενόμενος κωδικός επιστροφής από {tool_label}: {result.returncode}"
-        return {
-            "ok": False, 
-            "error": err, 
-            "results": [], 
-            "extras": {}}
-    
-    # Εάν δεν υπάρχει καθόλου έξοδος στο stdout, αυτό είναι ένδειξη κάποιου προβλήματος.
-    if not stdout_str:
-        return{
-               "ok": False,
-               "error": stderr_str or f"Κενή έξοδος από το εργαλείο {tool_label}.",
-               "results": [],
-               "extras": {}}                    
-               
-    # Προσπάθεια μετατροπής της JSON εξόδου σε λεξικό ή λίστα της Python.
-    try:
-        data = json.loads(stdout_str)
-    except json.JSONDecodeError as exc:
-        logger.exception("Αδυναμία ανάγνωσης της JSON εξόδου από %s: %s", tool_label, stdout_str[:200])
-        return{"ok": False,
-               "error": f"Αδυναμία ανάγνωσης της JSON εξόδου του {tool_label}: {exc}",
-               "results": [],
-               "extras": {}}
-    # Επιτυχής εκτέλεση οπότε επιστρέφονται τα δεδομένα.
-    return {"ok": True, "error": None, "results": data, "extras": {}}
-   
-
-# ---------------------------------------------------------------------------
-# 4. Ορισμός συνάρτησης για εκτέλεση βιβλιοθήκης Bandit σε κώδικα Python.
-# ---------------------------------------------------------------------------
-
-def run_bandit_on_code(code: str) -> dict[str, Any]:
-    """
-    Τρέχει τη βιβλιοθήκη Bandit σε string Python κώδικα και επιστρέφει λεξικό (dict) 
-    με τα ακόλουθα κλειδιά (αποτελέσματα):
-         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
-         2. error: μήνυμα σφάλματος σε μορφή string ή None αν προκύψει πρόβλημα.
-         3. results: λίστα με τα ευρήματα της ανάλυσης (list[dict]).
-         4. metrics: Λεξικο με τυχόν μετρικές που δίνει το Bandit (dict).
-    """
-    # Αρχικοποίηση μεταβλητής για το προσωρινό αρχείο.
-    temp_file_path: str | None = None
-    
-    try:   
-
-    # Δημιουργία προσωρινού αρχείου για αποθήκευση του κώδικα Python.
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(code)                                # Εγγραφή του κώδικα στο προσωρινό αρχείο.
-            temp_file_path = temp_file.name                      # Αποθήκευση της διαδρομής του προσωρινού αρχείου.  
-
-        # Ορισμός εντολής CLI για τη Bandit με:
-        # -f json: μορφή εξόδου JSON
-        # -q: Quiet mode για λιγότερα μηνύματα στην κονσόλα.
-        cmd = ["bandit", "-f", "json", "-q", temp_file_path]
-
-        # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
-        result = run_subprocess_json(cmd,
-                                     tool_label="Bandit",
-                                     install_hint="pip install Bandit", 
-                                     ok_returncodes=(0, 1))  
-
-        # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
-        if not result["ok"]:
-            return{
-                "ok": False,
-                "error": result["error"],
-                "results": [],
-                "metrics": {}}
-        # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Bandit.
-        data = result["results"] or {}
-        return {
-            "ok": True,
-            "error": None,
-            "results": data.get("results", []),
-            "metrics": data.get("metrics", {})}
-    # Αυτό το μπλοκ εκτελείται πάντα ώστε να διαγραφεί το προσωρινό αρχείο και να μην γεμίζει η μνήμη.
-    finally:      
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except OSError:
-                logger.warning("Αποτυχία διαγραφής προσωρινού αρχείου Bandit.")                                  
-                                     
-# ----------------------------------------------------------------------------
-# 5. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Semgrep σε κώδικα Python.
-# ----------------------------------------------------------------------------
-
-def run_semgrep_on_code(code: str) -> dict[str, Any]:
-    """
-    Τρέχει τη βιβλιοθήκη Semgrep σε string Python κώδικα χρησιμοποιώντας το ruleset p/python
-    και επιστρέφει λεξικό (dict) με τα ακόλουθα κλειδιά (αποτελέσματα):
-         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
-         2. error: μήνυμα σφάλματος ή None αν υπήρξε πρόβλημα.
-         3. results: λίστα με τα ευρήματα της ανάλυσης (list[dict]).
-    """
-    # Αρχικοποίηση μεταβλητής για το προσωρινό αρχείο.
-    temp_file_path: str | None = None
-    
-    try:   
-        # Δημιουργία προσωρινού αρχείου για αποθήκευση του κώδικα Python.
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(code)                                # Εγγραφή του κώδικα στο προσωρινό αρχείο.
-            temp_file_path = temp_file.name                      # Αποθήκευση της διαδρομής του προσωρινού αρχείου.  
-
-        # Ορισμός εντολής CLI για τη Semgrep με:
-        # --config auto: αυτόματη εύρεση κανόνων.
-        # --json: μορφή εξόδου JSON        
-        cmd = ["semgrep", "scan", "--config", "p/security-audit", 
-               "--config", "p/owasp-top-ten", "--config", "p/python", "--json", temp_file_path]
-
-        # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
-        result = run_subprocess_json(cmd,
-                                     tool_label="Semgrep",
-                                     install_hint="pip install Semgrep",
-                                     ok_returncodes=(0, 1)) 
-
-        # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
-        if not result["ok"]:
-            return{
-                "ok": False,
-                "error": result["error"],
-                "results": []}
-        
-        # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Semgrep.
-        data = result["results"] or {}
-        return {
-            "ok": True,
-            "error": None,
-            "results": data.get("results", [])}
-    # Αυτό το μπλοκ εκτελείται πάντα ώστε να διαγραφεί το προσωρινό αρχείο και να μην γεμίζει η μνήμη.
-    finally:        
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except OSError:
-                logger.warning("Αποτυχία διαγραφής προσωρινού αρχείου Semgrep.")   
-
-# ------------------------------------------------------------------------------------------------------
-# 6. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Pylint - στατικής ανάλυσης ποιότητας κώδικα Python.
-# ------------------------------------------------------------------------------------------------------
-
-def run_pylint_on_code(code: str) -> dict[str, Any]:
-    """
-    Τρέχει τη βιβλιοθήκη Pylint σε string Python κώδικα και επιστρέφει λεξικό (dict) 
-    με τα ακόλουθα κλειδιά (αποτελέσματα):
-         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
-         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
-         3. results: λίστα με μηνύματα της Pylint (list[dict]).
-         4. score: συνολική αξιολόγηση κώδικα (string ή None).
-    Χρησιμοποιείται το CLI του Pylint με έξοδο σε μορφή JSON.
-    """
-    # Αρχικοποίηση μεταβλητής για το προσωρινό αρχείο.
-    temp_file_path: str | None = None
-    
-    try:   
-        # Δημιουργία προσωρινού αρχείου για αποθήκευση του κώδικα Python.
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(code)                                # Εγγραφή του κώδικα στο προσωρινό αρχείο.
-            temp_file_path = temp_file.name                      # Αποθήκευση της διαδρομής του προσωρινού αρχείου.  
-
-        # Ορισμός εντολής CLI για τη Semgrep με:
-        # --json: μορφή εξόδου JSON   
-        # --score: υπολογισμός βαθμολογίας κώδικα.     
-        cmd = ["pylint", "-f", "json", "--score=y", temp_file_path]
-
-        # Κλήση της βοηθητικής συνάρτησης για εκτέλεση της εντολής.
-        result = run_subprocess_json(cmd,
-                                     tool_label="Pylint",
-                                     install_hint="pip install Pylint",
-                                     ok_returncodes=(0, 1, 2, 4, 8, 16)) 
-
-        # Αν η εκτέλεση απέτυχε, επιστρέφεται το σφάλμα.
-        if not result["ok"]:
-            return{
-                "ok": False,
-                "error": result["error"],
-                "results": [],
-                "score": None}
-        
-        # Ανάκτηση της JSON εξόδου επιστρέφοντας λεξικό με τα ευρήματα του Semgrep.
-        data = result["results"]
-        messages: list[dict[str, Any]] = []          # Λίστα για αποθήκευση των επιμέρους μηνυμάτων του Pylint (warnings, errors).
-        score_text: str | None = None                # Κείμενο ή αριθμός με τη συνολική βαθμολογία.
-
-        # Η μορφή εξόδου του JSON της Pylint ανάλογα με την έκδοση μπορεί να επιστρέψει είτε λίστα, είτε λεξικό.
-        # Αν η έξοδος είναι λίστα JSON αντικειμένων.
-        if isinstance(data, list):
-            for item in data:
-                if not isinstance(item, dict):                  # Αν το στοιχείο δεν είναι λεξικό, παραλείπεται για να αποφευχθεί σφάλμα.
-                    continue
-                if "type" in item and "message" in item:        # Αν το λεξικό έχει τα κλειδιά "type" και "message", θεωρείται κανονικό 
-                    messages.append(item)                       # μήνυμα Pylint, οπότε προστίθεται στη λίστα των μηνυμάτων.
-                if "score" in item and score_text is None:      # Αν το λεξικό περιέχει κλειδί "score" και δεν έχει ήδη οριστεί τιμή στο score_text,
-                    score_text = str(item.get("score"))         # τότε αποθηκεύεται στο score_text η βαθμολογία ως string.
-
-        # Αν η έξοδος είναι λεξικό με κλειδί messages (πιθανή περίπτωση σε κάποιες εκδόσεις).
-        elif isinstance(data, dict):
-            for msg in data.get("messages", []):                # Λήψη της λίστας μηνυμάτων από το κλειδί "messages" (αν δεν υπάρχει, λαμβάνεται κενή λίστα).
-                if isinstance(msg, dict):                       # Προστίθενται μόνο τα μηνύματα που είναι λεξικά.
-                    messages.append(msg)
-            if "score" in data:                                 # Αν το λεξικό περιέχει κλειδί "score",
-                score_text = str(data.get("score"))             # τότε αποθηκεύεται στο score_text η βαθμολογία ως string.
-
-        # Επιστροφή των αποτελεσμάτων.
-        return {
-            "ok": True,
-            "error": None,
-            "results": messages,
-            "score": score_text}      
-    # Αυτό το μπλοκ εκτελείται πάντα ώστε να διαγραφεί το προσωρινό αρχείο και να μην γεμίζει η μνήμη.
-    finally:        
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except OSError:
-                logger.warning("Αποτυχία διαγραφής προσωρινού αρχείου Pylint.")   
-
 # ---------------------------------------------------------------------------
-# 7. Ορισμός συνάρτησης για εκτέλεση της βιβλιοθήκης Radon ως προς τον έλεγχο 
-# της κυκλωματικής πολυπλοκότητας (CC) και δείκτη συντηρησιμότητας (ΜΙ).
+# 3. Εισαγωγή του orchestrator των αναλυτών (Bandit, Semgrep, Pylint, Radon, SecurityVisitor)
+# από το πακέτο sast, ώστε οι αναλυτές να είναι διαθέσιμοι και εκτός Streamlit.
 # ---------------------------------------------------------------------------
 
-def run_radon_on_code(code: str) -> dict[str,Any]:
-    """
-    Τρέχει τη βιβλιοθήκη Radon σε string Python κώδικα και επιστρέφει λεξικό (dict) 
-    με τα ακόλουθα κλειδιά (αποτελέσματα):
-         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
-         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
-         3. results: λίστα με μπλοκ κώδικα και την κυκλωματική πολυπλοκότητά τους.
-         4. mi: δείκτης συντηρησιμότητας (float ή None).
-    Χρησιμοποιεί το API του Radon (cc_visit, cc_rank, mi_visit).
-    """
-   
-    try:        
-        cc_blocks = cc_visit(code)                    # Επιστροφή λίστας με μπλοκ κώδικα (functions, methods, classes) και την κυκλωματική πολυπλοκότητά τους.
-        mi_score = mi_visit(code, multi=False)        # Υπολογισμός του δείκτη συντηρησιμότητας (Maintainability Index). 
-    except Exception as exc:
-        return {                           
-            "ok": False,
-            "error": f"Σφάλμα κατά την ανάλυση με τη βιβλιοθήκη Radon: {exc}",
-            "results": [],
-            "mi": None
-        }
-    issues: list[dict[str, Any]]= []                                       # Λίστα για αποθήκευση των αποτελεσμάτων.
-    # Για κάθε μπλοκ επιστρέφονται name, type, lineno, complexity (CC) και rank (A-F)
-    for block in cc_blocks:
-        issues.append({                                                    # Προσθήκη λεξικού με τα στοιχεία του μπλοκ κώδικα στη λίστα αποτελεσμάτων.
-            "Όνομα": getattr(block, "name", ""),
-            "Τύπος": getattr(block, "kind", getattr(block, "type", "")),
-            "Γραμμή": getattr(block, "lineno", None),
-            "CC": getattr(block, "complexity", None),
-            "Βαθμίδα": getattr(block, "rank", None)})
-        
-    # Επιστροφή των αποτελεσμάτων.
-    return {
-        "ok": True,
-        "error": None,
-        "results": issues,
-        "mi": float(mi_score) if mi_score is not None else None}
-
-# -----------------------------------------------------------------------------------
-# 8. Ορισμός global λιστών με λέξεις κλειδιά για χρήση στον custom AST αναλυτή κώδικα.
-# -----------------------------------------------------------------------------------
-
-
-# Λέξεις κλειδιά που υποδηλώνουν πιθανές "ευαίσθητες" μεταβλητές (π.χ. password, token κλπ).
-SUSPECT_SECRET_KEYWORDS: list[str] = [
-                           "password", 
-                           "passwd", 
-                           "pwd", 
-                           "secret", 
-                           "token", 
-                           "key", 
-                           "apikey",
-                           "api_key", 
-                           "auth", 
-                           "credential"] 
-
-# Συνηθισμένα ονόματα logging συναρτήσεων (logging.info, logger.error κλπ).
-LOGGING_FUNCTION_NAMES : list[str] = [
-                          "print", 
-                          "logging.debug",
-                          "logging.info", 
-                          "logging.warning", 
-                          "logging.error", 
-                          "logging.critical", 
-                          "logging.exception", 
-                          "logging.log"]
-
-# --------------------------------------------------------------------------------
-# 9. Ορισμός συνάρτησης εκτέλεσης custom AST αναλυτή κώδικα με χρήση SecurityVisitor.
-# --------------------------------------------------------------------------------
-
-class SecurityVisitor(ast.NodeVisitor):
-    """
-    Προσαρμοσμένος επισκέπτης (Visitor) AST για ανίχνευση:        
-        1. hard-coded μυστικών σε μεταβλητές με ύποπτα ονόματα,
-        2. logging ενδεχομένως ευαίσθητων μεταβλητών που μοιάζουν με μυστικά (π.χ. password),
-        3. χρήση επικίνδυνων συναρτήσεων όπως eval/exec,
-        4. κλήσεων subprocess χωρίς κατάλληλο χειρισμό εισόδο, π.χ. χρήση shell=True (πιθανό command injection).
-    """
-    def __init__(self)-> None:
-        super().__init__()
-        self.issues: list[dict[str, Any]] = []              # Λίστα για αποθήκευση των ευρημάτων ασφαλείας.
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        """
-        Ελέγχει αναθέσεις (Assign) για hard-coded μυστικά σε ύποπτες μεταβλητές.
-
-        """
-        # Έλεγχος για ανάθεση τιμών σε μεταβλητές με ύποπτα ονόματα όπως password, token κλπ.
-        for target in node.targets:
-            if isinstance(target, ast.Name):         # Αν ο στόχος της ανάθεσης είναι απλή μεταβλητή.       
-                var_name = target.id
-                lower_name = var_name.lower()        # Μετατροπή του ονόματος σε πεζά για ευκολότερο έλεγχο.
-                # Έλεγχος αν το όνομα της μεταβλητής περιέχει κάποια από τις ύποπτες λέξεις-κλειδιά.
-                if any(k in lower_name for k in SUSPECT_SECRET_KEYWORDS):
-                    if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):          # Έλεγχος αν η τιμή που ανατίθεται είναι σταθερή συμβολοσειρά (hard-coded string).
-                        value_str = node.value.value
-                        value_preview = (value_str if len(value_str) <= 50 else value_str[:47] + "...")     # Προεπισκόπηση της τιμής (περιορισμένη σε 50 χαρακτήρες).
-                        # Καταγραφή του ευρήματος.
-                        self.issues.append({
-                            "Είδος": "Hard-coded secret",
-                            "Όνομα": var_name,
-                            "Γραμμή": node.lineno,
-                            "Λεπτομέρειες": f"Ανάθεση σταθερής συμβολοσειράς σε μεταβλητή με όνομα '{var_name}'.",
-                            "Τιμή (Προεπισκόπηση)": value_preview,
-                            })
-
-        # Συνέχεια της επίσκεψης στα υπόλοιπα nodes.
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:
-        """
-        Ελέγχει κλήσεις συναρτήσεων (Call) για logging ευαίσθητων μεταβλητών 
-        και χρήση επικίνδυνων συναρτήσεων.
-        
-        """
-        func_name: str | None = None                    # Όνομα συνάρτησης που καλείται.
-        full_name: str | None = None                    # Όνομα αντικειμένου αν η συνάρτηση είναι μέθοδος (π.χ. logger.info -> logger).
-        if isinstance(node.func, ast.Name):             # Περίπτωση απλής συνάρτησης μορφής func(), π.χ. eval().
-            func_name = node.func.id
-        elif isinstance(node.func, ast.Attribute):      # Περίπτωση μεθόδου μορφής obj.method(), π.χ. logger.info().
-            func_name = node.func.attr
-            if isinstance(node.func.value, ast.Name):   # Αν το value είναι Name, τότε η κλήση θα είναι μορφής "logging.info".
-                full_name = f"{node.func.value.id}.{node.func.attr}"
-            else:
-                full_name = node.func.attr
-
-        # Έλεγχος για logging ευαίσθητων μεταβλητών.
-        if full_name in LOGGING_FUNCTION_NAMES:
-            for arg in node.args:                       # Έλεγχος όλων των ορισμάτων της συνάρτησης.
-                if isinstance(arg, ast.Name):           # Αν το όρισμα είναι όνομα μεταβλητής, εξετάζεται αν περιέχει ευαίσθητα δεδομένα.                    
-                    lower_name = arg.id.lower()
-                    if any(k in lower_name for k in SUSPECT_SECRET_KEYWORDS):
-                        self.issues.append(
-                            {"Είδος": "Logging ενδεχομένως ευαίσθητης μεταβλητής",
-                             "Όνομα": arg.id,
-                             "Γραμμή": node.lineno,
-                             "Λεπτομέρειες": (f"Κλήση logging συνάρτησης '{full_name or func_name}'με όρισμα "
-                             f"τη μεταβλητή '{arg.id}', η οποία ίσως περιέχει ευαίσθητα δεδομένα."),
-                             "Τιμή (Προεπισκόπηση)": ""})    
-
-        # Έλεγχος για κλήσεις subprocess με shell=True (πιθανό command injection).
-        basic_obj_name = None
-        # έλεγχος εάν καλείται κάτι από το module subprocess.
-        if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
-            basic_obj_name = node.func.value.id           # όπως π.χ. subprocess.            
-        if basic_obj_name == "subprocess" and func_name in ("run", "Popen", "call", "check_call", "check_output"):
-            for kw in node.keywords:
-                if kw.arg == "shell" and isinstance(kw.value, ast.Constant) and kw.value.value is True:       
-                    self.issues.append(
-                            {"Είδος": "Πιθανό Command Injection",
-                             "Όνομα": f"{basic_obj_name}.{func_name}",
-                             "Γραμμή": node.lineno,
-                             "Λεπτομέρειες": (f"Κλήση της συνάρτησης '{basic_obj_name}.{func_name}' με παράμετρο shell=True, "
-                                              "που μπορεί να οδηγήσει σε command injection εάν τα ορίσματα δεν έχουν ελεγχθεί σωστά."),
-                            "Τιμή (Προεπισκόπηση)": ""})
-                    
-        # Γενική επισήμανση για χρήση επικίνδυνων συναρτήσεων eval/exec.
-        if func_name in ("eval", "exec"):
-            self.issues.append(
-                {"Είδος": "Χρήση επικίνδυνης συνάρτησης",
-                 "Όνομα": func_name,
-                 "Γραμμή": node.lineno,
-                 "Λεπτομέρειες": (f"Κλήση της συνάρτησης '{func_name}', η οποία μπορεί να οδηγήσει σε "
-                 "εκτέλεση κακόβουλου κώδικα ή έγχυση κώδικα."),
-                 "Τιμή (Προεπισκόπηση)": ""})
-
-        self.generic_visit(node)                         # Συνέχεια της επίσκεψης στα υπόλοιπα nodes.
-        
-# Ορισμός συνάρτησης για εκτέλεση του custom AST αναλυτή.
-def run_custom_ast_analysis(code: str) -> dict[str, Any]:
-    """
-    Εκτελεί τον προσαρμοσμένο AST αναλυτή (SecurityVisitor) σε string Python κώδικα και 
-    επιστρέφει λεξικό (dict) με τα ακόλουθα κλειδιά (αποτελέσματα):
-         1. ok: boolean αν η εκτέλεση ήταν επιτυχής.
-         2. error: μήνυμα σφάλματος σε μορφή string ή None αν υπήρξε πρόβλημα.
-         3. results: λίστα με τα ευρήματα της ανάλυσης (list[dict]).
-
-    """
-    try:
-        tree = ast.parse(code)                  # Μετατροπή του κώδικα σε AST tree.
-    except SyntaxError as exc:                  # Σε περίπτωση σφάλματος σύνταξης στον κώδικα.
-            return {
-                "ok": False,
-                "error": f"Σφάλμα σύνταξης κατά την ανάλυση AST: {exc}",
-                "results": []}
-    
-    visitor = SecurityVisitor()                # Δημιουργία instance του επισκέπτη.
-    visitor.visit(tree)                        # Επίσκεψη του AST με τον επισκέπτη.
-
-    # Επιστροφή των αποτελεσμάτων.
-    return {
-        "ok": True,
-        "error": None,
-        "results": visitor.issues}  
+from sast.orchestrator import iter_tool_results, TOOL_LABELS     # Παράλληλη εκτέλεση των επιλεγμένων βιβλιοθηκών.
+from sast.cache import get_default_cache, tool_version     # Μόνιμη cache αποτελεσμάτων ανά εργαλείο.
+from sast.context import AnalysisContext                   # Κοινό AST για Radon και SecurityVisitor.
+from sast.workers import WARM_POOL_ENABLED, WARM_TOOLS, get_default_pool    # Ζεστοί workers για Bandit/Pylint.
+from sast.findings import Finding, findings_to_dataframe       # Ενιαίο μοντέλο ευρημάτων όλων των βιβλιοθηκών.
+from sast.history import HISTORY_ENABLED, days_ago, get_default_history   # Ιστορικό σαρώσεων σε SQLite.
+from sast.metrics import format_resources                   # Κόστος (χρόνος, CPU, μνήμη) κάθε βιβλιοθήκης.
+from sast.budget import TIMEOUT_STATUS, PARTIAL_STATUS, result_status, scan_status    # Χρονικά όρια και μερικά αποτελέσματα.
+from sast.report import iter_findings_report, write_report, read_preview, read_report, REPORT_PREVIEW_KB   # Αναφορά με ροή.
+from sast.export import iter_report_findings, write_jsonl, write_sarif   # Εξαγωγή σε SARIF και JSON Lines.
+from sast.archive import UPLOAD_INCLUDE, UPLOAD_TYPES, is_archive, stage_uploads   # Πολλά αρχεία και archives zip/tar.
+from sast.workspace import ScanWorkspace                   # Προσωρινός φάκελος με τα αρχεία ενός upload.
+from sast.cli import scan_directory                        # Παράλληλη σάρωση όλων των αρχείων ενός upload.
 
 # --------------------------------------------------------------------------------         
-# 9. Συνάρτηση για δημιουργία συγκεντρωτικής αναφοράς (report) ευρημάτων ανάλυσης.
+# 4. Συνάρτηση για δημιουργία συγκεντρωτικής αναφοράς (report) ευρημάτων ανάλυσης.
 # --------------------------------------------------------------------------------
 
-def create_libr_findings_report(                          # Δημιουργία συγκεντρωτικής αναφοράς (report) με ενιαίο κείμενο.
+def create_libr_findings_report(                          # Δημιουργία συγκεντρωτικής αναφοράς (report) ως ροή κειμένου.
     filename: str,
     code: str,
-    df_bandit: pd.DataFrame | None,
-    df_semgrep: pd.DataFrame | None,
-    df_pylint: pd.DataFrame | None,
-    df_radon: pd.DataFrame | None,
-    df_custom_ast: pd.DataFrame | None,
+    findings: dict[str, list[Finding]],
     bandit_metrics: dict[str, Any] | None,
     pylint_score: str | None,
     radon_mi: float | None,
-)-> str:
+    include_source: bool = True,
+    max_source_lines: int | None = None,
+)-> Iterator[str]:
     """
-    Δημιουργεί μία συγκεντρωτική αναφορά (report) με ενιαίο κείμενο ου περιλαμβάνει:
-    1. Τον πηγαίο κώδικα που αναλύθηκε.
-    2. Τα ευρήματα από όλες τις βιβλιοθήκες που επιλέχθηκαν για ανάλυση κώδικα.
+    Δημιουργεί τη συγκεντρωτική αναφορά (report) ενότητα προς ενότητα (sast.report), η οποία περιλαμβάνει:
+    1. Τον πηγαίο κώδικα που αναλύθηκε (προαιρετικά, ολόκληρο ή τις πρώτες max_source_lines γραμμές).
+    2. Τα ευρήματα από όλες τις βιβλιοθήκες που επιλέχθηκαν για ανάλυση κώδικα, ως CSV.
     3. Τις μετρικές Bandit/Pylint/Radon κλπ.
-    
+    Τα ευρήματα γράφονται απευθείας από τα Finding, χωρίς ενδιάμεσα DataFrames και ενιαίο string.
     """
-    lines: list[str] = []                           # Λίστα για αποθήκευση των γραμμών της αναφοράς.
-
-    lines.append("=== Συγκεντρωτική Αναφορά AST-based SAST εργαλείου ανάλυσης κώδικα Python ===")
-    lines.append("")
-    lines.append(f"Όνομα αρχείου: {filename}")
-    lines.append("")
-
-    lines.append("=== Πηγαίος Κώδικας Python που αναλύθηκε ===")
-    lines.append(code)
-    lines.append("")
-
-    # Ενότητα βιβλιοθήκης Bandit.
-    lines.append("=== Ευρήματα Bandit ===")
-    if df_bandit is not None and not df_bandit.empty:
-        lines.append(df_bandit.to_csv(index=False))
-    else:
-        lines.append("Δεν υπάρχουν ευρήματα από τη Bandit ή η βιβλιοθήκη δεν εκτελέστηκε.")
-    lines.append("")
-    if bandit_metrics:
-        lines.append(f"Μετρικές Bandit: {bandit_metrics}")
-        lines.append("")
-    
-    # Ενότητα βιβλιοθήκης Semgrep.
-    lines.append("=== Ευρήματα Semgrep ===")
-    if df_semgrep is not None and not df_semgrep.empty:
-        lines.append(df_semgrep.to_csv(index=False))
-    else:
-        lines.append("Δεν υπάρχουν ευρήματα από τη Semgrep ή η βιβλιοθήκη δεν εκτελέστηκε.")
-    lines.append("")
-
-    # Ενότητα βιβλιοθήκης Pylint.
-    lines.append("=== Ευρήματα Pylint ===")
-    if df_pylint is not None and not df_pylint.empty:
-        lines.append(df_pylint.to_csv(index=False))
-    else:
-        lines.append("Δεν υπάρχουν ευρήματα από την Pylint ή η βιβλιοθήκη δεν εκτελέστηκε.")
-    if pylint_score:
-        lines.append(f"Συνολική βαθμολογία Pylint: {pylint_score}")
-    lines.append("")
-
-    # Ενότητα βιβλιοθήκης Radon.
-    lines.append("=== Ευρήματα Radon ===")
-    if df_radon is not None and not df_radon.empty:
-        lines.append(df_radon.to_csv(index=False))
-    else:
-        lines.append("Δεν υπάρχουν ευρήματα από τη Radon ή η βιβλιοθήκη δεν εκτελέστηκε.")
-    if radon_mi is not None:
-        lines.append(f"Δείκτης Συντηρησιμότητας (MI) Radon: {radon_mi}")
-    lines.append("")
-
-    # Ενότητα προσαρμοσμένου (Custom) AST αναλυτή.
-    lines.append("=== Ευρήματα Custom AST Αναλυτή (SecurityVisitor) ===")
-    if df_custom_ast is not None and not df_custom_ast.empty:
-        lines.append(df_custom_ast.to_csv(index=False))
+    tables = {tool: (TOOL_COLUMNS[tool], sorted_findings(tool, findings[tool]))
+              for tool in TOOL_COLUMNS if findings.get(tool) is not None}
+    return iter_findings_report(filename, code, tables,
+                                bandit_metrics=bandit_metrics,
+                                pylint_score=pylint_score,
+                                radon_mi=radon_mi,
+                                include_source=include_source,
+                                max_source_lines=max_source_lines)
+
+def export_scan_findings(files: dict[str, dict[str, dict[str, Any]]], fmt: str) -> bytes:
+    """
+    Τα ευρήματα όλων των αρχείων και βιβλιοθηκών μιας σάρωσης ({αρχείο: {βιβλιοθήκη: αποτέλεσμα}}) σε
+    SARIF ("sarif") ή JSON Lines ("jsonl"). Καλείται μόνο τη στιγμή της λήψης (deferred data του st.download_button).
+    """
+    findings = iter_report_findings(files)
+    tools = dict.fromkeys(tool for file_results in files.values() for tool in file_results)
+    buffer = io.StringIO()
+    if fmt == "sarif":
+        write_sarif(findings, buffer, tool_versions={tool: tool_version(tool) for tool in tools})
     else:
-        lines.append("Δεν υπάρχουν ευρήματα από τον Custom AST Αναλυτή ή η ανάλυση δεν εκτελέστηκε.")
-    lines.append("")
+        write_jsonl(findings, buffer)
+    return buffer.getvalue().encode("utf-8")
 
-    return "\n".join(lines)                         # Επιστροφή της αναφοράς ως ενιαίο κείμενο.
+def export_analysis_findings(analysis: dict[str, Any], fmt: str) -> bytes:
+    """
+    Τα ευρήματα όλων των βιβλιοθηκών της ανάλυσης ενός αρχείου σε SARIF ή JSON Lines.
+    """
+    return export_scan_findings({analysis["filename"]: {tool: {"results": tool_findings}
+                                                        for tool, tool_findings in analysis["findings"].items()}}, fmt)
 
 # -----------------------------------------------------------------
-# 10. Ορισμός συνάρτησης για δημιουργία σύνοψης των ευρημάτων ανάλυσης.
+# 5. Ορισμός συνάρτησης για δημιουργία σύνοψης των ευρημάτων ανάλυσης.
 # -----------------------------------------------------------------
 
 def create_analysis_summary(
@@ -657,7 +170,7 @@ def create_analysis_summary(
     return "\n".join(lines)                                                # Επιστροφή της σύνοψης ως ενιαίο κείμενο.
 
 # ------------------------------------------------------------------------------
-# 11. Ενσωμάτωση OpenAI-ChatGPT και ορισμός συνάρτησεων για αρχικοποίηση του client της OpenAI και κλήση του ChatGPT API 
+# 6. Ενσωμάτωση OpenAI-ChatGPT και ορισμός συνάρτησεων για αρχικοποίηση του client της OpenAI και κλήση του ChatGPT API 
 # ώστε να παρέχει προτάσεις βελτίωσης της ασφάλειας του κώδικα.
 # ------------------------------------------------------------------------------
 
@@ -742,7 +255,291 @@ def ask_chatgpt_for_sec_advice(summary_text: str) -> tuple[bool,str]:
         return False, f"Παρουσιάστηκε σφάλμα κατά την κλήση του OpenAI API: {exc}"
                                                                                                                
 # ---------------------------------------------------------------------------
-# 12. Ρυθμίσεις της σελίδας Streamlit (τίτλος καρτέλας, διάταξη σελίδας κλπ).
+# 7. Συναρτήσεις εμφάνισης των αποτελεσμάτων κάθε βιβλιοθήκης. Καλούνται μόλις ολοκληρωθεί η
+# αντίστοιχη βιβλιοθήκη, ώστε τα αποτελέσματα να εμφανίζονται χωρίς αναμονή των πιο αργών.
+# Κάθε συνάρτηση επιστρέφει λεξικό με τα ευρήματα (Finding), το σφάλμα και τις επιπλέον μετρικές.
+# ---------------------------------------------------------------------------
+
+# Στήλες εμφάνισης ανά βιβλιοθήκη: {τίτλος στήλης: πεδίο του Finding}. Τα DataFrames δημιουργούνται
+# από τα Finding μόνο τη στιγμή της εμφάνισης και δεν αποθηκεύονται στο session_state.
+TOOL_COLUMNS: dict[str, dict[str, str]] = {
+    "bandit": {"ID": "rule_id", "Όνομα Ελέγχου": "symbol", "Severity": "severity",
+               "Confidence": "confidence", "Γραμμή": "line", "Μήνυμα": "message"},
+    "semgrep": {"Rule ID": "rule_id", "Severity": "severity", "Γραμμή": "line", "Μήνυμα": "message"},
+    "pylint": {"Τύπος": "severity", "Γραμμή": "line", "Στήλη": "column", "Message ID": "rule_id",
+               "Symbol": "symbol", "Μήνυμα": "message"},
+    "radon": {"Όνομα": "symbol", "Γραμμή": "line", "CC": "value", "Βαθμίδα": "severity", "Μήνυμα": "message"},
+    "custom_ast": {"Είδος": "rule_id", "Όνομα": "symbol", "Γραμμή": "line", "Λεπτομέρειες": "message",
+                   "Τιμή (Προεπισκόπηση)": "snippet"}}
+
+# Σειρά σοβαρότητας/βεβαιότητας της Bandit για την ταξινόμηση.
+BANDIT_LEVEL_ORDER: dict[str, int] = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
+
+# Κλειδί ταξινόμησης των ευρημάτων ανά βιβλιοθήκη (η ταξινόμηση γίνεται στα Finding, πριν το DataFrame).
+TOOL_SORT_KEYS: dict[str, Any] = {
+    # Κατά σοβαρότητα (Severity) και βεβαιότητα (Confidence), σε φθίνουσα σειρά.
+    "bandit": lambda finding: (-BANDIT_LEVEL_ORDER.get(finding.severity, -1),
+                               -BANDIT_LEVEL_ORDER.get(finding.confidence, -1)),
+    # Κατά γραμμή σε αύξουσα σειρά (η σοβαρότητα ταξινομείται στη συνέχεια σε φθίνουσα).
+    "semgrep": lambda finding: finding.line or 0,
+    # Κατά τύπο μηνύματος και γραμμή κώδικα.
+    "pylint": lambda finding: (finding.severity, finding.line or 0),
+    # Κατά κυκλωματική πολυπλοκότητα (CC), σε φθίνουσα σειρά.
+    "radon": lambda finding: -(finding.value or 0),
+    # Κατά γραμμή κώδικα.
+    "custom_ast": lambda finding: finding.line or 0}
+
+def sorted_findings(tool: str, findings: list[Finding]) -> list[Finding]:
+    """
+    Τα ευρήματα μιας βιβλιοθήκης με τη σειρά εμφάνισης (πίνακες της διεπαφής και αναφορά).
+    """
+    ordered = sorted(findings, key=TOOL_SORT_KEYS[tool])
+    if tool == "semgrep":
+        ordered.sort(key=lambda finding: finding.severity, reverse=True)
+    return ordered
+
+def findings_frame(tool: str, findings: list[Finding] | None) -> pd.DataFrame | None:
+    """
+    Δημιουργεί το DataFrame εμφάνισης των ευρημάτων μιας βιβλιοθήκης (None αν δεν επιλέχθηκε).
+    """
+    if findings is None:
+        return None
+    return findings_to_dataframe(sorted_findings(tool, findings), TOOL_COLUMNS[tool])
+
+def show_resources(tool_results: dict[str, Any]) -> None:
+    """
+    Εμφανίζει δίπλα στο πλήθος ευρημάτων το κόστος εκτέλεσης της βιβλιοθήκης (χρόνος, CPU, μνήμη,
+    έξοδος JSON). Τα αποτελέσματα από την cache δεν έχουν μετρήσεις.
+    """
+    resources_text = format_resources(tool_results.get("resources"))
+    st.caption(f"Κόστος εκτέλεσης: {resources_text}" if resources_text else "Αποτέλεσμα από την cache αποτελεσμάτων.")
+
+def render_bandit_results(bandit_results: dict[str, Any]) -> dict[str, Any]:
+    st.subheader("Αποτελέσματα ανάλυσης με τη βιβλιοθήκη Bandit:")
+    bandit_error: str | None = None
+    issues: list[Finding] = []
+    bandit_metrics: dict[str, Any] | None = None
+
+    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
+    if not bandit_results["ok"]:
+        bandit_error = bandit_results.get("error") or "Άγνωστο σφάλμα"
+        st.error(f"Σφάλμα κατά την εκτέλεση του Bandit: {bandit_error}")
+    else:
+        issues = bandit_results.get("results", [])                       # Λήψη ευρημάτων από τα αποτελέσματα.
+        bandit_metrics = bandit_results.get("metrics", {})               # Λήψη μετρικών από τα αποτελέσματα.
+        st.write(f"Συνολικά ευρήματα Bandit: {len(issues)}")
+        show_resources(bandit_results)
+        if bandit_metrics:
+            st.write("Μετρικές Bandit:", bandit_metrics)
+
+    if issues:
+        # Ταξινόμηση κατά σοβαρότητα (Severity) - βεβαιότητα (Confidence) και εμφάνιση ως DataFrame.
+        st.dataframe(findings_frame("bandit", issues), use_container_width=True)
+    elif bandit_error is None:
+        st.info("H βιβλιοθήκη Bandit δεν εντόπισε ευπάθειες ή κενά ασφαλείας στον κώδικα του αρχείου.")
+    else:
+        st.info("Τα αποτελέσματα της Bandit δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
+    return {"findings": issues, "error": bandit_error, "metrics": bandit_metrics}
+
+def render_semgrep_results(semgrep_results: dict[str, Any]) -> dict[str, Any]:
+    st.subheader("Αποτελέσματα ανάλυσης με τη βιβλιοθήκη Semgrep:")
+    semgrep_error: str | None = None
+    sg_issues: list[Finding] = []
+
+    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
+    if not semgrep_results["ok"]:
+        semgrep_error = semgrep_results.get("error") or "Άγνωστο σφάλμα."
+        st.error(f"Σφάλμα κατά την εκτέλεση του Semgrep: {semgrep_error}")
+    else:
+        sg_issues = semgrep_results.get("results", [])                      # Λήψη ευρημάτων από τα αποτελέσματα.
+        st.write(f"Συνολικά ευρήματα Semgrep: {len(sg_issues)}")
+        show_resources(semgrep_results)
+
+    if sg_issues:
+        # Ταξινόμηση κατά σοβαρότητα (Severity) σε φθίνουσα και Γραμμή σε αύξουσα.
+        st.dataframe(findings_frame("semgrep", sg_issues), use_container_width=True)
+    elif semgrep_error is None:
+        st.info("H βιβλιοθήκη Semgrep δεν εντόπισε ευπάθειες ή κενά ασφαλείας στον κώδικα του αρχείου.")
+    else:
+        st.info("Τα αποτελέσματα της Semgrep δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
+    return {"findings": sg_issues, "error": semgrep_error}
+
+def render_pylint_results(pylint_results: dict[str, Any]) -> dict[str, Any]:
+    st.subheader("Αποτελέσματα στατικής ανάλυσης με τη βιβλιοθήκη Pylint:")
+    pylint_error: str | None = None
+    pylint_messages: list[Finding] = []
+    pylint_score: str | None = None
+
+    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
+    if not pylint_results["ok"]:
+        pylint_error = pylint_results.get("error") or "Άγνωστο σφάλμα"
+        st.error(f"Σφάλμα κατά την εκτέλεση του Pylint: {pylint_error}")
+    else:
+        pylint_messages = pylint_results.get("results", [])                  # Λήψη ευρημάτων από τα αποτελέσματα.
+        pylint_score = pylint_results.get("score")                           # Λήψη συνολικής βαθμολογίας.
+
+        if pylint_score:
+            st.write(f"Συνολική βαθμολογία Pylint: {pylint_score}")
+        st.write(f"Συνολικά μηνύματα Pylint: {len(pylint_messages)}")
+        show_resources(pylint_results)
+
+    if pylint_messages:
+        # Ταξινόμηση των μηνυμάτων κατά τύπο (type) και γραμμή κώδικα.
+        st.dataframe(findings_frame("pylint", pylint_messages), use_container_width=True)
+    elif pylint_error is None:
+        st.info("H βιβλιοθήκη Pylint δεν εντόπισε προβλήματα ποιότητας κώδικα ή code smells στο αρχείο.")
+    else:
+        st.info("Τα αποτελέσματα της Pylint δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
+    return {"findings": pylint_messages, "error": pylint_error, "score": pylint_score}
+
+def render_radon_results(radon_results: dict[str, Any]) -> dict[str, Any]:
+    st.subheader("Αποτελέσματα ανάλυσης πολυπλοκότητας με τη βιβλιοθήκη Radon:")
+    radon_error: str | None = None
+    radon_issues: list[Finding] = []
+    radon_mi: float | None = None
+
+    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
+    if not radon_results["ok"]:
+        radon_error = radon_results.get("error") or "Άγνωστο σφάλμα."
+        st.error(f"Σφάλμα κατά την εκτέλεση του Radon: {radon_error}")
+    else:
+        radon_issues = radon_results.get("results", [])                          # Λήψη ευρημάτων από τα αποτελέσματα.
+        radon_mi = radon_results.get("mi")                                       # Λήψη δείκτη συντηρησιμότητας (MI).
+
+        if radon_mi is not None:
+            st.write(f"Δείκτης συντηρησιμότητας (MI): {radon_mi:.2f}")
+        st.write(f"Συνολικά μπλοκ κώδικα που αναλύθηκαν για κυκλωματική πολυπλοκότητα (CC): {len(radon_issues)}")
+        show_resources(radon_results)
+
+    if radon_issues:
+        # Ταξινόμηση των μπλοκ κώδικα κατά κυκλωματική πολυπλοκότητα (CC).
+        st.dataframe(findings_frame("radon", radon_issues), use_container_width=True)
+    elif radon_error is None:
+        st.info("H βιβλιοθήκη Radon δεν εντόπισε μπλοκ κώδικα με μετρήσιμη κυκλωματική πολυπλοκότητα.")
+    else:
+        st.info("Τα αποτελέσματα της Radon δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
+    return {"findings": radon_issues, "error": radon_error, "mi": radon_mi}
+
+def render_custom_ast_results(custom_ast_results: dict[str, Any]) -> dict[str, Any]:
+    st.subheader("Αποτελέσματα προσαρμοσμένης ανάλυσης AST (SecurityVisitor):")
+    custom_ast_error: str | None = None
+    ast_issues: list[Finding] = []
+
+    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
+    if not custom_ast_results["ok"]:
+        custom_ast_error = custom_ast_results.get("error") or "Άγνωστο σφάλμα."
+        st.error(f"Σφάλμα κατά την εκτέλεση της προσαρμοσμένης ανάλυσης AST: {custom_ast_error}")
+    else:
+        ast_issues = custom_ast_results.get("results", [])                          # Λήψη ευρημάτων από τα αποτελέσματα.
+        st.write(f"Συνολικά ευρήματα προσαρμοσμένης ανάλυσης AST: {len(ast_issues)}")
+        show_resources(custom_ast_results)
+
+    if ast_issues:
+        # Ταξινόμηση των ευρημάτων κατά γραμμή κώδικα.
+        st.dataframe(findings_frame("custom_ast", ast_issues), use_container_width=True)
+    elif custom_ast_error is None:
+        st.info("Η προσαρμοσμένη ανάλυση AST (SecurityVisitor) δεν εντόπισε ευρήματα στον κώδικα του αρχείου.")
+    else:
+        st.info("Τα αποτελέσματα της προσαρμοσμένης ανάλυσης AST δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
+    return {"findings": ast_issues, "error": custom_ast_error}
+
+# Συνάρτηση εμφάνισης ανά βιβλιοθήκη (ίδια ονόματα με το TOOL_RUNNERS του orchestrator).
+TOOL_RENDERERS: dict[str, Any] = {
+    "bandit": render_bandit_results,
+    "semgrep": render_semgrep_results,
+    "pylint": render_pylint_results,
+    "radon": render_radon_results,
+    "custom_ast": render_custom_ast_results}
+
+# Στήλες του συνολικού πίνακα ευρημάτων μιας σάρωσης πολλών αρχείων.
+UPLOAD_COLUMNS: dict[str, str] = {"Αρχείο": "file", "Βιβλιοθήκη": "tool", "ID": "rule_id", "Severity": "severity",
+                                  "Γραμμή": "line", "Μήνυμα": "message"}
+
+def scan_uploads(uploads: list[Any], tools: list[str], pool: Any | None) -> dict[str, Any]:
+    """
+    Σάρωση πολλών αρχείων ή archives: τα αρχεία γράφονται (τα archives αποσυμπιέζονται ως ροή) σε
+    έναν προσωρινό φάκελο και σαρώνονται παράλληλα με τη scan_directory. Επιστρέφεται η αναφορά της
+    scan_directory (μόνο ευρήματα, όχι ο κώδικας), ενώ ο φάκελος διαγράφεται αμέσως μετά τη σάρωση.
+    Σε archive που ξεπερνά τα όρια ή δεν διαβάζεται προκαλείται ValueError (ή ArchiveLimitError).
+    """
+    with ScanWorkspace() as workspace:
+        staged = stage_uploads(uploads, workspace)
+        report = scan_directory(workspace.root, tools, include=UPLOAD_INCLUDE, pool=pool)
+        report["skipped"] = staged["skipped"]
+        # Καταγραφή στο ιστορικό όσο τα αρχεία υπάρχουν ακόμη (για το hash του περιεχομένου τους).
+        if HISTORY_ENABLED:
+            try:
+                file_hashes: dict[str, str] = {}
+                for rel_path in report["files"]:
+                    with open(os.path.join(workspace.root, rel_path), "rb") as source_file:
+                        file_hashes[rel_path] = hashlib.sha256(source_file.read()).hexdigest()
+                get_default_history().record_scan(
+                    report["files"], tools, source="ui", file_hashes=file_hashes,
+                    tool_versions={tool: tool_version(tool) for tool in tools},
+                    timings={"wall_time_s": report["stats"]["wall_time_s"]},
+                    wall_time_s=report["stats"]["wall_time_s"])
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Αποτυχία καταγραφής της σάρωσης στο ιστορικό: %s", exc)
+    return report
+
+def render_upload_scan(report: dict[str, Any]) -> None:
+    """
+    Εμφανίζει τα αποτελέσματα μιας σάρωσης πολλών αρχείων: συνολική εικόνα (ευρήματα ανά αρχείο και
+    βιβλιοθήκη, πίνακας όλων των ευρημάτων, εξαγωγή) και αποτελέσματα ανά αρχείο.
+    """
+    files: dict[str, dict[str, dict[str, Any]]] = report["files"]
+    tools: list[str] = report["tools"]
+    stats = report["stats"]
+    st.caption(f"Αρχεία: {stats['files']} · Ευρήματα: {stats['findings']} · Σφάλματα: {stats['errors']} · "
+               f"Χρόνος σάρωσης: {stats['wall_time_s']:.2f} s ({stats['files_per_s'] or 0} αρχεία/s)")
+    if report["status"] != "complete":
+        st.warning("Μερικά αποτελέσματα: κάποιες βιβλιοθήκες δεν ολοκληρώθηκαν μέσα στο χρονικό όριο.")
+    if report.get("skipped"):
+        st.warning("Παραλείφθηκαν αρχεία με μη ασφαλή διαδρομή ή μέγεθος πάνω από το όριο "
+                   "(SAST_ARCHIVE_MAX_FILE_MB): " + ", ".join(report["skipped"]))
+    if not files:
+        st.info("Δεν βρέθηκαν αρχεία Python (.py ή .txt) στα αρχεία που ανέβηκαν.")
+        return
+
+    overview_tab, per_file_tab = st.tabs(["Σύνολο ευρημάτων όλων των αρχείων", "Αποτελέσματα ανά αρχείο"])
+
+    with overview_tab:
+        st.subheader("Ευρήματα ανά αρχείο και βιβλιοθήκη:")
+        counts = pd.DataFrame(
+            {TOOL_LABELS[tool]: [len(result.get("results") or []) if result.get("ok") else None
+                                 for result in (file_results.get(tool, {}) for file_results in files.values())]
+             for tool in tools},
+            index=pd.Index(list(files), name="Αρχείο"))
+        st.dataframe(counts, use_container_width=True)
+
+        st.subheader("Όλα τα ευρήματα:")
+        st.dataframe(findings_to_dataframe(iter_report_findings(files), UPLOAD_COLUMNS), use_container_width=True)
+
+        sarif_column, jsonl_column = st.columns(2)
+        with sarif_column:
+            st.download_button(
+                label="Λήψη ευρημάτων σε SARIF",
+                data=lambda: export_scan_findings(files, "sarif"),
+                file_name="sast_findings_upload.sarif",
+                mime="application/sarif+json",
+                on_click="ignore")
+        with jsonl_column:
+            st.download_button(
+                label="Λήψη ευρημάτων σε JSON Lines",
+                data=lambda: export_scan_findings(files, "jsonl"),
+                file_name="sast_findings_upload.jsonl",
+                mime="application/x-ndjson",
+                on_click="ignore")
+
+    with per_file_tab:
+        selected_file = st.selectbox("Αρχείο", list(files), key="upload_file")
+        file_results = files[selected_file]
+        for tool_tab, tool in zip(st.tabs([TOOL_LABELS[tool] for tool in file_results]), file_results):
+            with tool_tab:
+                TOOL_RENDERERS[tool](file_results[tool])
+
+# ---------------------------------------------------------------------------
+# 8. Ρυθμίσεις της σελίδας Streamlit (τίτλος καρτέλας, διάταξη σελίδας κλπ).
 # ---------------------------------------------------------------------------
 
 st.set_page_config(                                                 # Βασική ρύθμιση της σελίδας Streamlit  
@@ -766,7 +563,7 @@ st.divider()
 
 # Αρχικοποίηση state για τα ευρήματα-ChatGPT.
 if "analysis_results" not in st.session_state:
-    st.session_state.analysis_results = None                      # Θα κρατά όλες τις πληροφορίες (DataFrames, μετρικές κλπ) μετά την ανάλυση
+    st.session_state.analysis_results = None                      # Θα κρατά όλες τις πληροφορίες (ευρήματα, μετρικές κλπ) μετά την ανάλυση
 
 if "chatgpt_advice" not in st.session_state:
     st.session_state.chatgpt_advice = ""                          # Τελευταία απάντηση-συμβουλές του ChatGPT                            
@@ -774,15 +571,39 @@ if "chatgpt_advice" not in st.session_state:
 if "chatgpt_error" not in st.session_state:
     st.session_state.chatgpt_error = ""                           # Τελευταίο μήνυμα σφάλματος από το ChatGPT.
 
+if "summary_report" not in st.session_state:
+    st.session_state.summary_report = None                        # Αρχείο της συγκεντρωτικής αναφοράς {"options", "path"}.
+
+if "upload_scan" not in st.session_state:
+    st.session_state.upload_scan = None                           # Αναφορά της σάρωσης πολλών αρχείων/archives.
+
+def discard_summary_report() -> None:
+    """
+    Διαγράφει το αρχείο της προηγούμενης συγκεντρωτικής αναφοράς (νέα ανάλυση ή νέες επιλογές).
+    """
+    report = st.session_state.summary_report
+    st.session_state.summary_report = None
+    if report and os.path.exists(report["path"]):
+        try:
+            os.remove(report["path"])
+        except OSError:
+            logger.warning("Αποτυχία διαγραφής του αρχείου της αναφοράς %s.", report["path"])
+
 st.divider()
 
 # Προσθήκη σύντομης οδηγία για το επόμενο βήμα του χρήστη.
-st.write("Επιλέξτε ένα αρχείο με κώδικα Python που θέλετε να αναλύσετε παρακάτω:")
+st.write("Επιλέξτε ένα ή περισσότερα αρχεία με κώδικα Python (ή archives zip/tar) που θέλετε να αναλύσετε παρακάτω:")
 
 # -------------------------------------------------------------
 # Δημιουργία κουμπιού (Button) για την επιλογή/φόρτωση αρχείου.
 # -------------------------------------------------------------
-uploaded_file = st.file_uploader("Επιλέξτε αρχείο με κώδικα Python (.py ή .txt)", type=["py", "txt"])
+uploaded_files = st.file_uploader("Επιλέξτε αρχεία με κώδικα Python (.py ή .txt) ή archives (.zip, .tar, .tar.gz, .tar.bz2, .tar.xz)",
+                                  type=UPLOAD_TYPES, accept_multiple_files=True) or []
+
+# Ένα μεμονωμένο αρχείο αναλύεται όπως πριν (αναλυτικά αποτελέσματα και ChatGPT), ενώ πολλά αρχεία ή
+# archives σαρώνονται παράλληλα με τη scan_directory (αποτελέσματα ανά αρχείο και συνολικά).
+multi_upload: bool = len(uploaded_files) > 1 or any(is_archive(upload.name) for upload in uploaded_files)
+uploaded_file = uploaded_files[0] if uploaded_files and not multi_upload else None
 
 file_content: str = ""
 filename: str = ""
@@ -802,12 +623,15 @@ if uploaded_file is not None:                                              # Α
         with st.expander("Προεπισκόπηση πηγαίου κώδικα του ανεβασμένου αρχείου", expanded=False):   # Εμφάνιση περιεχομένου του αρχείου σε πλαίσιο κειμένου.
             st.code(file_content, language="python")    
         st.divider()  
+elif multi_upload:                                                         # Πολλά αρχεία ή archives:
+    st.success(f"Φορτώθηκαν {len(uploaded_files)} αρχεία: " + ", ".join(upload.name for upload in uploaded_files))
+    st.divider()
 
     # ------------------------------------------------------
     # Επιλογή βιβλιοθήκης για ανάλυση κώδικα από τον χρήστη.
     # ------------------------------------------------------
-if not file_content:                                                   # Αν δεν έχει ανέβει-διαβαστεί ο κώδικας ενημερώνεται ο χρήστης.
-    st.info("Παρακαλώ ανεβάστε ένα αρχείο .py ή .txt για να ξεκινήσει η ανάλυση.")
+if not file_content and not multi_upload:                              # Αν δεν έχει ανέβει-διαβαστεί ο κώδικας ενημερώνεται ο χρήστης.
+    st.info("Παρακαλώ ανεβάστε ένα αρχείο .py ή .txt (ή ένα archive zip/tar) για να ξεκινήσει η ανάλυση.")
 else:
     st.subheader("Επιλογή βιβλιοθηκών ανάλυσης κώδικα:")
 
@@ -849,289 +673,113 @@ else:
         effective_pylint = use_pylint or run_all
         effective_radon = use_radon or run_all
         effective_custom_ast = use_custom_ast or run_all
+
+        selected_tools: list[str] = [tool for tool, enabled in (("bandit", effective_bandit),
+                                                                ("semgrep", effective_semgrep),
+                                                                ("pylint", effective_pylint),
+                                                                ("radon", effective_radon),
+                                                                ("custom_ast", effective_custom_ast)) if enabled]
+        # Το pool ζεστών workers παραμένει ενεργό ανάμεσα στις εκτελέσεις του script, οπότε
+        # μόνο η πρώτη σάρωση πληρώνει το κόστος φόρτωσης των Bandit/Pylint.
+        worker_pool = (get_default_pool() if WARM_POOL_ENABLED and any(tool in WARM_TOOLS for tool in selected_tools)
+                       else None)
         
         # Αν δεν έχει επιλεγεί καμία βιβλιοθήκη, εμφάνιση προειδοποίησης στον χρήστη.
-        if not any(
-            [effective_bandit, effective_semgrep, effective_pylint, effective_radon, effective_custom_ast]
-        ):
+        if not selected_tools:
             st.warning("Παρακαλώ επιλέξτε τουλάχιστον μία βιβλιοθήκη ανάλυσης κώδικα για να συνεχίσετε.")
+        elif multi_upload:
+            # Πολλά αρχεία ή archives: αποσυμπίεση σε προσωρινό φάκελο και παράλληλη σάρωση όλων των αρχείων.
+            with st.spinner("Αποσυμπίεση και παράλληλη σάρωση των αρχείων....."):
+                try:
+                    st.session_state.upload_scan = scan_uploads(uploaded_files, selected_tools, worker_pool)
+                except ValueError as exc:                       # Όρια archive (ArchiveLimitError) ή κατεστραμμένο archive.
+                    st.session_state.upload_scan = None
+                    st.error(f"Αδυναμία σάρωσης των αρχείων: {exc}")
         else:
-            # Αρχικοποίηση μεταβλητών (Dataframes) για αποθήκευση ευρημάτων ανάλυσης και μετρικών, ώστε να χρησιμοποιηθούν 
-            # στο tab με το σύνολο των ευρημάτων.            
-            df_bandit: pd.DataFrame | None = None            # DataFrame για αποθήκευση αποτελεσμάτων Bandit.
-            df_semgrep: pd.DataFrame | None = None           # DataFrame για αποθήκευση αποτελεσμάτων Semgrep.
-            df_pylint: pd.DataFrame | None = None            # DataFrame για αποθήκευση αποτελεσμάτων Pylint.
-            df_radon: pd.DataFrame | None = None             # DataFrame για αποθήκευση αποτελεσμάτων Radon.
-            df_custom_ast: pd.DataFrame | None = None        # DataFrame για αποθήκευση αποτελεσμάτων Custom AST αναλυτή.
-
-            bandit_metrics: dict[str, Any] | None = None     # Μετρικές Bandit.
-            pylint_score: str | None = None                  # Συνολική βαθμολογία Pylint.
-            radon_mi: float | None = None                    # Δείκτης συντηρησιμότητας Radon.
-
-            # Αποθήκευση των μηνυμάτων σφάλματος ανά βιβλιοθήκη.
-            bandit_error: str | None = None
-            semgrep_error: str | None = None
-            pylint_error: str | None = None
-            radon_error: str | None = None
-            custom_ast_error: str | None = None
-
-            # ----------------------------
-            # Εκτέλεση βιβλιοθήκης Bandit.
-            # ----------------------------
-
-            if effective_bandit:
-                st.subheader("Αποτελέσματα ανάλυσης με τη βιβλιοθήκη Bandit:")
-                with st.spinner("Εκτέλεση ανάλυσης με τη βιβλιοθήκη Bandit.....Παρακαλώ περιμένετε"):
-                    bandit_results = run_bandit_on_code(file_content)                
-                
-                # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
-                if not bandit_results["ok"]:
-                    bandit_error = bandit_results.get("error") or "Άγνωστο σφάλμα"
-                    st.error(f"Σφάλμα κατά την εκτέλεση του Bandit: {bandit_error}")
-                    df_bandit = pd.DataFrame()
-                    bandit_metrics = None
-                else:
-                    issues = bandit_results.get("results", [])                       # Λήψη ευρημάτων από τα αποτελέσματα.
-                    bandit_metrics = bandit_results.get("metrics", {})               # Λήψη μετρικών από τα αποτελέσματα.
-                    st.write(f"Συνολικά ευρήματα Bandit: {len(issues)}")
-                    if bandit_metrics:
-                        st.write("Μετρικές Bandit:", bandit_metrics)                           
-
-                    if issues:
-                        # Δημιουργία λίστας λεξικών για κάθε εύρημα, μορφή κατάλληλη για DataFrame.
-                        rows: list[dict[str, Any]]= []
-                        for issue in issues:
-                            rows.append({
-                                    "ID": issue.get("test_id"),
-                                    "Όνομα Ελέγχου": issue.get("test_name"),
-                                    "Severity": issue.get("issue_severity"),
-                                    "Confidence": issue.get("issue_confidence"),
-                                    "Γραμμή": issue.get("line_number"),
-                                    "Αρχείο": issue.get("filename"),
-                                    "Μήνυμα": issue.get("issue_text")})
-                            
-                        # Μετατροπή της λίστας σε pandas DataFrame για εμφάνιση.
-                        df_bandit = pd.DataFrame(rows)
-                            
-                        # Ταξινόμηση των ευρημάτων κατά σοβαρότητα (Severity) - βεβαιότητα (Confidence).
-                        if not df_bandit.empty:
-                            severity_order = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
-                            confidence_order = {"LOW": 0, "MEDIUM": 1, "HIGH": 2}
-                            # Δημιουργία προσωρινών στηλών για την ταξινόμηση.
-                            df_bandit["SeverityOrder"] = df_bandit["Severity"].map(severity_order).fillna(-1)
-                            df_bandit["ConfidenceOrder"] = df_bandit["Confidence"].map(confidence_order).fillna(-1)
-                            df_bandit = df_bandit.sort_values(by=["SeverityOrder", "ConfidenceOrder"], ascending=[False, False])
-                            # Αφαίρεση βοηθητικών στηλών πριν την εμφάνιση.
-                            df_bandit = df_bandit.drop(columns=["SeverityOrder", "ConfidenceOrder"])                       
-                    else:
-                        df_bandit = pd.DataFrame()
-
-                if df_bandit is not None and not df_bandit.empty:
-                    st.dataframe(df_bandit, use_container_width=True)
-                elif df_bandit is not None:                        
-                    st.info("H βιβλιοθήκη Bandit δεν εντόπισε ευπάθειες ή κενά ασφαλείας στον κώδικα του αρχείου.")
-                else:
-                    st.info("Τα αποτελέσματα της Bandit δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")
-                                                                
-            # -----------------------------
-            # Εκτέλεση βιβλιοθήκης Semgrep.
-            # -----------------------------
-
-            if effective_semgrep:
-                st.subheader("Αποτελέσματα ανάλυσης με τη βιβλιοθήκη Semgrep:") 
-                with st.spinner("Εκτέλεση ανάλυσης με τη βιβλιοθήκη Semgrep.....Παρακαλώ περιμένετε"):                                       
-                    semgrep_results = run_semgrep_on_code(file_content)                 # Κλήση της συνάρτησης ανάλυσης με Semgrep.
-                    
-                # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
-                if not semgrep_results["ok"]:
-                    semgrep_error = semgrep_results.get("error") or "Άγνωστο σφάλμα."
-                    st.error(f"Σφάλμα κατά την εκτέλεση του Semgrep: {semgrep_error}")
-                    df_semgrep = pd.DataFrame()
-                else:
-                    sg_issues = semgrep_results.get("results", [])                      # Λήψη ευρημάτων από τα αποτελέσματα.
-                    st.write(f"Συνολικά ευρήματα Semgrep: {len(sg_issues)}")
-
-                    # Έλεγχος αν υπάρχουν ευρήματα.
-                    if sg_issues:                            
-                        rows: list[dict[str, Any]]= []                                  # Δημιουργία λίστας λεξικών για κάθε εύρημα.
-                        for issue in sg_issues:
-                            extra = issue.get("extra", {})
-                            start = issue.get("start", {})
-                                
-                            rows.append({
-                                    "Rule ID": issue.get("check_id"),
-                                    "Severity": extra.get("severity"),
-                                    "Γραμμή": start.get("line"),
-                                    "Αρχείο": issue.get("path"),
-                                    "Μήνυμα": extra.get("message")})
-                            
-                        # Μετατροπή της λίστας σε pandas DataFrame για εμφάνιση.
-                        df_semgrep = pd.DataFrame(rows)
-                            
-                        # Ταξινόμηση των ευρημάτων κατά σοβαρότητα (Severity) σε φθίνουσα και Γραμμή σε αύξουσα.
-                        if not df_semgrep.empty:
-                            df_semgrep = df_semgrep.sort_values(by=["Severity", "Γραμμή"], ascending=[False, True])       
-                    else:
-                            df_semgrep = pd.DataFrame()
-                            
-
-                if df_semgrep is not None and not df_semgrep.empty:
-                    st.dataframe(df_semgrep, use_container_width=True)
-                elif df_semgrep is not None:                        
-                    st.info("H βιβλιοθήκη Semgrep δεν εντόπισε ευπάθειες ή κενά ασφαλείας στον κώδικα του αρχείου.")
-                else:
-                    st.info("Τα αποτελέσματα της Semgrep δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")         
-
-            # ----------------------------
-            # Εκτέλεση βιβλιοθήκης Pylint.
-            # ----------------------------
-
-            if effective_pylint:
-                st.subheader("Αποτελέσματα στατικής ανάλυσης με τη βιβλιοθήκη Pylint:")
-                with st.spinner("Εκτέλεση ανάλυσης με τη βιβλιοθήκη Semgrep.....Παρακαλώ περιμένετε"):            
-                    pylint_results = run_pylint_on_code(file_content)                    # Κλήση της συνάρτησης ανάλυσης με Pylint.
-                    
-                # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
-                if not pylint_results["ok"]:
-                    pylint_error = pylint_results.get("error") or "Άγνωστο σφάλμα"
-                    st.error(f"Σφάλμα κατά την εκτέλεση του Pylint: {pylint_error}")
-                    df_pylint = pd.DataFrame()
-                    pylint_score = None
-                else:
-                    pylint_messages = pylint_results.get("results", [])                  # Λήψη ευρημάτων από τα αποτελέσματα.
-                    pylint_score = pylint_results.get("score")                           # Λήψη συνολικής βαθμολογίας.
-
-                    if pylint_score:
-                        st.write(f"Συνολική βαθμολογία Pylint: {pylint_score}")
-                    st.write(f"Συνολικά μηνύματα Pylint: {len(pylint_messages)}")
-                        
-
-                    # Έλεγχος αν υπάρχουν ευρήματα.
-                    if pylint_messages:                            
-                        rows: list[dict[str, Any]]= []                                   # Δημιουργία λίστας λεξικών για κάθε μήνυμα.       
-                        for msg in pylint_messages:
-                            rows.append({
-                                    "Τύπος": msg.get("type"),
-                                    "Module": msg.get("module"),
-                                    "Γραμμή": msg.get("line"),
-                                    "Στήλη": msg.get("column"),
-                                    "Αρχείο": msg.get("path"),
-                                    "Message ID": msg.get("message-id"),
-                                    "Symbol": msg.get("symbol"),
-                                    "Μήνυμα": msg.get("message")})
-                            
-                        # Μετατροπή της λίστας σε pandas DataFrame για εμφάνιση.
-                        df_pylint = pd.DataFrame(rows)
-                            
-                        # Ταξινόμηση των μηνυμάτων κατά τύπο (type) και γραμμή κώδικα.
-                        if not df_pylint.empty:
-                            df_pylint = df_pylint.sort_values(by=["Τύπος", "Γραμμή"], ascending=[True, True]) 
-
-                    else:
-                        df_pylint = pd.DataFrame()
-                       
-                    
-                    if df_pylint is not None and not df_pylint.empty:
-                        st.dataframe(df_pylint, use_container_width=True)
-                    elif df_pylint is not None:                        
-                        st.info("H βιβλιοθήκη Pylint δεν εντόπισε προβλήματα ποιότητας κώδικα ή code smells στο αρχείο.") 
-                    else:
-                        st.info("Τα αποτελέσματα της Pylint δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")  
-
-            # ------------------------------------------------
-            # Radon Tab - Αν έχει επιλεγεί η βιβλιοθήκη Radon.
-            # ------------------------------------------------
-
-            if effective_radon:
-                st.subheader("Αποτελέσματα ανάλυσης πολυπλοκότητας με τη βιβλιοθήκη Radon:")
-                with st.spinner("Εκτέλεση ανάλυσης με τη βιβλιοθήκη Radon...Παρακαλώ περιμένετε"):                                       
-                    radon_results = run_radon_on_code(file_content)                              # Κλήση της συνάρτησης ανάλυσης με Radon.
-                    
-                # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
-                if not radon_results["ok"]:
-                    radon_error = radon_results.get("error") or "Άγνωστο σφάλμα."
-                    st.error(f"Σφάλμα κατά την εκτέλεση του Radon: {radon_error}")
-                    df_radon = pd.DataFrame()
-                    radon_mi = None
-                else:
-                        radon_issues = radon_results.get("results", [])                          # Λήψη ευρημάτων από τα αποτελέσματα.
-                        radon_mi = radon_results.get("mi")                                       # Λήψη δείκτη συντηρησιμότητας (MI).
-                        
-                        if radon_mi is not None:
-                            st.write(f"Δείκτης συντηρησιμότητας (MI): {radon_mi:.2f}")
-                        st.write(f"Συνολικά μπλοκ κώδικα που αναλύθηκαν για κυκλωματική πολυπλοκότητα (CC): {len(radon_issues)}")
-                        # Έλεγχος αν υπάρχουν ευρήματα.
-                        if radon_issues:
-                            # Μετατροπή της λίστας σε pandas DataFrame για εμφάνιση.
-                            df_radon = pd.DataFrame(radon_issues)
-                            
-                            # Ταξινόμηση των μπλοκ κώδικα κατά κυκλωματική πολυπλοκότητα (CC).
-                            if not df_radon.empty:
-                                df_radon = df_radon.sort_values(by=["CC"], ascending=False)  
-                        else:
-                            df_radon = pd.DataFrame()
-                            
-                    
-                if df_radon is not None and not df_radon.empty:
-                    st.dataframe(df_radon, use_container_width=True)
-                elif df_radon is not None:                        
-                    st.info("H βιβλιοθήκη Radon δεν εντόπισε μπλοκ κώδικα με μετρήσιμη κυκλωματική πολυπλοκότητα.")
-                else:
-                    st.info("Τα αποτελέσματα της Radon δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.")  
-                        
-            # --------------------------------------------------------------------
-            # Custom AST Rules Tab - Αν έχει επιλεγεί η προσαρμοσμένη ανάλυση AST.
-            # --------------------------------------------------------------------
-
-            if effective_custom_ast:
-                st.subheader("Αποτελέσματα προσαρμοσμένης ανάλυσης AST (SecurityVisitor):")
-                with st.spinner("Εκτέλεση προσαρμοσμένης ανάλυσης AST...Παρακαλώ περιμένετε"):                   
-                        custom_ast_results = run_custom_ast_analysis(file_content)              # Κλήση της συνάρτησης προσαρμοσμένης ανάλυσης AST.
-                    # Έλεγχος αν η εκτέλεση ήταν επιτυχής.
-                if not custom_ast_results["ok"]:
-                    custom_ast_error = custom_ast_results.get("error") or "Άγνωστο σφάλμα."
-                    st.error(f"Σφάλμα κατά την εκτέλεση της προσαρμοσμένης ανάλυσης AST: {custom_ast_error}")
-                    df_custom_ast = pd.DataFrame()
-                else:
-                    ast_issues = custom_ast_results.get("results", [])                          # Λήψη ευρημάτων από τα αποτελέσματα.
-                    st.write(f"Συνολικά ευρήματα προσαρμοσμένης ανάλυσης AST: {len(ast_issues)}")
-
-                    # Έλεγχος αν υπάρχουν ευρήματα.
-                    if ast_issues:
-                        rows: list[dict[str, Any]]= []                                          # Δημιουργία λίστας λεξικών για κάθε εύρημα.
-                        for issue in ast_issues:
-                            rows.append({
-                                    "Είδος": issue.get("Είδος"),
-                                    "Όνομα": issue.get("Όνομα"),
-                                    "Γραμμή": issue.get("Γραμμή"),
-                                    "Λεπτομέρειες": issue.get("Λεπτομέρειες"),
-                                    "Τιμή (Προεπισκόπηση)": issue.get("Τιμή (Προεπισκόπηση)", " ")})
-                        # Μετατροπή της λίστας σε pandas DataFrame για εμφάνιση.
-                        df_custom_ast = pd.DataFrame(rows)
-
-                        # Ταξινόμηση των ευρημάτων κατά είδος και γραμμή κώδικα.
-                        if not df_custom_ast.empty:
-                            df_custom_ast = df_custom_ast.sort_values(by=["Γραμμή"], ascending=[True])
-                            
-                    else:
-                        df_custom_ast = pd.DataFrame()
-
-                if df_custom_ast is not None and not df_custom_ast.empty:
-                    st.dataframe(df_custom_ast, use_container_width=True)
-                elif df_custom_ast is not None:                        
-                    st.info("Η προσαρμοσμένη ανάλυση AST (SecurityVisitor) δεν εντόπισε ευρήματα στον κώδικα του αρχείου.")
-                else:
-                    st.info("Τα αποτελέσματα της προσαρμοσμένης ανάλυσης AST δεν είναι διαθέσιμα λόγω σφάλματος κατά την εκτέλεση.") 
+            # ------------------------------------------------------------------------------
+            # Παράλληλη εκτέλεση όλων των επιλεγμένων βιβλιοθηκών μέσω του orchestrator. Τα
+            # αποτελέσματα κάθε βιβλιοθήκης εμφανίζονται μόλις αυτή ολοκληρωθεί (στη θέση της
+            # βάσει της σειράς επιλογής), μαζί με πρόοδο, χρόνους και τρέχοντα σύνολα ευρημάτων.
+            # ------------------------------------------------------------------------------
+
+            result_cache = get_default_cache()
+            analysis_context = AnalysisContext(file_content, filename=filename)
+
+            progress_bar = st.progress(0.0, text="Παράλληλη εκτέλεση των επιλεγμένων βιβλιοθηκών ανάλυσης.....")
+            status_slot = st.empty()                                     # Βιβλιοθήκες σε εξέλιξη και χρόνοι όσων ολοκληρώθηκαν.
+            summary_slot = st.empty()                                    # Τρέχοντα σύνολα ευρημάτων.
+            tool_slots = {tool: st.container() for tool in selected_tools}   # Σταθερή θέση για κάθε βιβλιοθήκη.
+            tool_outcomes: dict[str, dict[str, Any]] = {}
+            scan_results: dict[str, dict[str, Any]] = {}                 # Αποτελέσματα για το ιστορικό σαρώσεων.
+            tool_timings: dict[str, float] = {}
+            finding_counts: dict[str, int | str | None] = {}            # None για βιβλιοθήκη που απέτυχε.
+
+            for tool, tool_results, elapsed in iter_tool_results(file_content, selected_tools, cache=result_cache,
+                                                                 context=analysis_context, pool=worker_pool):
+                with tool_slots[tool]:
+                    tool_outcomes[tool] = TOOL_RENDERERS[tool](tool_results)
+                scan_results[tool] = tool_results
+                tool_timings[tool] = elapsed
+                finding_counts[tool] = len(tool_results.get("results") or []) if tool_results.get("ok") else None
+                if result_status(tool_results) == TIMEOUT_STATUS:
+                    finding_counts[tool] = "λήξη χρόνου"
+                pending = [TOOL_LABELS[name] for name in selected_tools if name not in tool_timings]
+                progress_bar.progress(len(tool_timings) / len(selected_tools),
+                                      text=(f"Σε εξέλιξη: {', '.join(pending)}" if pending
+                                            else "Η ανάλυση ολοκληρώθηκε."))
+                status_slot.caption("Χρόνοι εκτέλεσης: " + ", ".join(
+                    f"{TOOL_LABELS[name]}: {seconds * 1000:.0f} ms" for name, seconds in tool_timings.items()))
+                summary_slot.markdown("**Ευρήματα μέχρι στιγμής:** " + " · ".join(
+                    f"{TOOL_LABELS[name]}: {'σφάλμα' if finding_counts[name] is None else finding_counts[name]}"
+                    for name in selected_tools if name in finding_counts))
+
+            # Βιβλιοθήκες που ξεπέρασαν το χρονικό τους όριο δεν καθυστερούν τις υπόλοιπες: η σάρωση
+            # ολοκληρώνεται με μερικά αποτελέσματα και ο χρήστης ενημερώνεται για το ποιες λείπουν.
+            if scan_status(scan_results.values()) != "complete":
+                incomplete = [TOOL_LABELS[name] for name, result in scan_results.items()
+                              if result_status(result) in (TIMEOUT_STATUS, PARTIAL_STATUS)]
+                st.warning("Μερικά αποτελέσματα: οι βιβλιοθήκες " + ", ".join(incomplete) +
+                           " δεν ολοκληρώθηκαν μέσα στο χρονικό όριο (SAST_TOOL_TIMEOUT/SAST_SCAN_TIMEOUT).")
+
+            cache_stats = result_cache.stats()
+            st.caption(f"Cache αποτελεσμάτων: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                       f"({cache_stats['entries']} εγγραφές)")
+            if analysis_context.timings:                                 # Χρόνοι ανά στάδιο της in-process ανάλυσης.
+                st.caption("Χρόνοι σταδίων ανάλυσης: " + ", ".join(
+                    f"{stage}: {seconds * 1000:.1f} ms" for stage, seconds in analysis_context.timings.items()))
+
+            # Καταγραφή της σάρωσης στο ιστορικό (εκδόσεις, χρόνοι, hash κώδικα και ευρήματα). Ένα
+            # σφάλμα της βάσης δεν πρέπει να διακόπτει την εμφάνιση των αποτελεσμάτων.
+            if HISTORY_ENABLED:
+                try:
+                    get_default_history().record_scan(
+                        {filename: scan_results}, selected_tools, source="ui",
+                        file_hashes={filename: hashlib.sha256(file_content.encode("utf-8", errors="surrogatepass")).hexdigest()},
+                        tool_versions={tool: tool_version(tool) for tool in selected_tools},
+                        timings=tool_timings, wall_time_s=sum(tool_timings.values()))
+                except (sqlite3.Error, OSError) as exc:
+                    logger.warning("Αποτυχία καταγραφής της σάρωσης στο ιστορικό: %s", exc)
+
+            # Συγκέντρωση των ευρημάτων (Finding), μετρικών και σφαλμάτων ανά βιβλιοθήκη, ώστε να
+            # χρησιμοποιηθούν στο tab με το σύνολο των ευρημάτων (χωρίς κλειδί για όσες δεν επιλέχθηκαν).
+            empty_outcome: dict[str, Any] = {}
+            findings: dict[str, list[Finding]] = {tool: outcome["findings"] for tool, outcome in tool_outcomes.items()}
+
+            bandit_metrics: dict[str, Any] | None = tool_outcomes.get("bandit", empty_outcome).get("metrics")
+            pylint_score: str | None = tool_outcomes.get("pylint", empty_outcome).get("score")
+            radon_mi: float | None = tool_outcomes.get("radon", empty_outcome).get("mi")
+
+            bandit_error: str | None = tool_outcomes.get("bandit", empty_outcome).get("error")
+            semgrep_error: str | None = tool_outcomes.get("semgrep", empty_outcome).get("error")
+            pylint_error: str | None = tool_outcomes.get("pylint", empty_outcome).get("error")
+            radon_error: str | None = tool_outcomes.get("radon", empty_outcome).get("error")
+            custom_ast_error: str | None = tool_outcomes.get("custom_ast", empty_outcome).get("error")
 
             # Αποθήκευση ευρημάτων και errors στο session_state.
             st.session_state.analysis_results = {
                 "filename": filename,
                 "code": file_content,
-                "df_bandit": df_bandit,
-                "df_semgrep": df_semgrep,
-                "df_pylint": df_pylint,
-                "df_radon": df_radon,
-                "df_custom_ast": df_custom_ast,
+                "findings": findings,
                 "bandit_metrics": bandit_metrics,
                 "pylint_score": pylint_score,
                 "radon_mi": radon_mi,
@@ -1144,6 +792,7 @@ else:
             # Μηδενισμός τελευταίας απάντησης του ChatGPT ώστε να είναι διαθέσιμα για νέα ανάλυση.
             st.session_state.chatgpt_advice = ""
             st.session_state.chatgpt_error = ""
+            discard_summary_report()
 
     # ------------------------------------------------------------------------------------------------------
     # Δημιουργία δυναμικών tabs ανάλογα με τις επιλεγμένες βιβλιοθήκες ώστε να παρουσιαστούν τα αποτελέσματα 
@@ -1151,23 +800,30 @@ else:
     # ------------------------------------------------------------------------------------------------------
 
     analysis = st.session_state.analysis_results
+    upload_scan = st.session_state.upload_scan
+
+    if multi_upload and upload_scan is not None:
+        render_upload_scan(upload_scan)
 
-    if analysis is not None:                      
+    elif analysis is not None and not multi_upload:
 
         tabs_labels: list[str] = []
         # Δημιουργία δυναμικών tabs ανάλογα με ποια
 
-        if analysis["df_bandit"] is not None or analysis.get("bandit_error"):
+        if "bandit" in analysis["findings"] or analysis.get("bandit_error"):
             tabs_labels.append("Bandit")
-        if analysis["df_semgrep"] is not None or analysis.get("semgrep_error"):
+        if "semgrep" in analysis["findings"] or analysis.get("semgrep_error"):
             tabs_labels.append("Semgrep")
-        if analysis["df_pylint"] is not None or analysis.get("pylint_error"):
+        if "pylint" in analysis["findings"] or analysis.get("pylint_error"):
             tabs_labels.append("Pylint")
-        if analysis["df_radon"] is not None or analysis.get("radon_error"):
+        if "radon" in analysis["findings"] or analysis.get("radon_error"):
             tabs_labels.append("Radon")
-        if analysis["df_custom_ast"] is not None or analysis.get("custom_ast_error"):
+        if "custom_ast" in analysis["findings"] or analysis.get("custom_ast_error"):
             tabs_labels.append("Custom AST Rules")
         
+        if HISTORY_ENABLED:
+            tabs_labels.append("Ιστορικό ευρημάτων")
+
         # Τελευταίο tab για τη συγκεντρωτική αναφορά και το ChatGPT.
         tabs_labels.append("Σύνολο ευρημάτων ανάλυσης (Summary Report)")
 
@@ -1176,58 +832,100 @@ else:
 
         # Επανεμφάνιση των DataFrames ανά βιβλιοθήκη
 
-        if analysis["df_bandit"] is not None or analysis.get("bandit_error"):
+        if "bandit" in analysis["findings"] or analysis.get("bandit_error"):
             with tabs[tab_index]:
                 st.subheader("Ευρήματα ανάλυσης με τη βιβλιοθήκη Bandit:")
                 if analysis.get("bandit_error"):
                     st.info(f"Η εκτέλεση της βιβλιοθήκης Bandit απέτυχε: "
                     f"{analysis['bandit_error']}")
-                if analysis["df_bandit"] is not None:
-                    st.dataframe(analysis["df_bandit"], use_container_width=True)
+                if "bandit" in analysis["findings"]:
+                    st.dataframe(findings_frame("bandit", analysis["findings"]["bandit"]), use_container_width=True)
             tab_index +=1
 
-        if analysis["df_semgrep"] is not None or analysis.get("semgrep_error"):
+        if "semgrep" in analysis["findings"] or analysis.get("semgrep_error"):
             with tabs[tab_index]:
                 st.subheader("Ευρήματα ανάλυσης με τη βιβλιοθήκη Semgrep:")
                 if analysis.get("semgrep_error"):
                     st.info(f"Η εκτέλεση της βιβλιοθήκης Semgrep απέτυχε: "
                     f"{analysis['semgrep_error']}")
-                if analysis["df_semgrep"] is not None:
-                    st.dataframe(analysis["df_semgrep"], use_container_width=True)
+                if "semgrep" in analysis["findings"]:
+                    st.dataframe(findings_frame("semgrep", analysis["findings"]["semgrep"]), use_container_width=True)
             tab_index +=1
 
-        if analysis["df_pylint"] is not None or analysis.get("pylint_error"):
+        if "pylint" in analysis["findings"] or analysis.get("pylint_error"):
             with tabs[tab_index]:
                 st.subheader("Ευρήματα στατικής ανάλυσης με τη βιβλιοθήκη Pylint:")
                 if analysis.get("pylint_error"):
                     st.info(f"Η εκτέλεση της βιβλιοθήκης Pylint απέτυχε: "
                     f"{analysis['pylint_error']}")
-                if analysis["df_pylint"] is not None:
-                    st.dataframe(analysis["df_pylint"], use_container_width=True)
+                if "pylint" in analysis["findings"]:
+                    st.dataframe(findings_frame("pylint", analysis["findings"]["pylint"]), use_container_width=True)
                     if analysis["pylint_score"]:
                         st.info(f"Συνολική βαθμολογία Pylint: {analysis['pylint_score']}")
             tab_index +=1
 
-        if analysis["df_radon"] is not None or analysis.get("radon_error"):
+        if "radon" in analysis["findings"] or analysis.get("radon_error"):
             with tabs[tab_index]:
                 st.subheader("Ευρήματα ανάλυσης πολυπλοκότητας με τη βιβλιοθήκη Radon:")
                 if analysis.get("radon_error"):
                     st.info(f"Η εκτέλεση της βιβλιοθήκης Radon απέτυχε: "
                     f"{analysis['radon_error']}")
-                if analysis["df_radon"] is not None:
-                    st.dataframe(analysis["df_radon"], use_container_width=True)
+                if "radon" in analysis["findings"]:
+                    st.dataframe(findings_frame("radon", analysis["findings"]["radon"]), use_container_width=True)
                     if analysis["radon_mi"] is not None:
                         st.info(f"Δείκτης συντηρησιμότητας (MI): {analysis['radon_mi']:.2f}")
             tab_index +=1
 
-        if analysis["df_custom_ast"] is not None or analysis.get("custom_ast_error"):
+        if "custom_ast" in analysis["findings"] or analysis.get("custom_ast_error"):
             with tabs[tab_index]:
                 st.subheader("Ευρήματα προσαρμοσμένης ανάλυσης με τη βιβλιοθήκη AST (SecurityVisitor):")
                 if analysis.get("custom_ast_error"):
                     st.info(f"Η εκτέλεση της βιβλιοθήκης AST (SecurityVisitor) απέτυχε: "
                     f"{analysis['custom_ast_error']}")
-                if analysis["df_custom_ast"] is not None:
-                    st.dataframe(analysis["df_custom_ast"], use_container_width=True)
+                if "custom_ast" in analysis["findings"]:
+                    st.dataframe(findings_frame("custom_ast", analysis["findings"]["custom_ast"]), use_container_width=True)
+            tab_index +=1
+
+        # -------------------------------------------------------------------------------
+        # Tab ιστορικού: νέα ευρήματα και τάση ανά σάρωση, απευθείας από τη βάση SQLite.
+        # -------------------------------------------------------------------------------
+
+        if HISTORY_ENABLED:
+            with tabs[tab_index]:
+                st.subheader("Ιστορικό ευρημάτων σαρώσεων:")
+                hist_col_1, hist_col_2, hist_col_3 = st.columns(3)
+                with hist_col_1:
+                    history_tool = st.selectbox("Βιβλιοθήκη", ["Όλες", *TOOL_LABELS], key="history_tool",
+                                                format_func=lambda name: TOOL_LABELS.get(name, name))
+                with hist_col_2:
+                    history_severity = st.text_input("Σοβαρότητα (κενό για όλες)", value="HIGH", key="history_severity")
+                with hist_col_3:
+                    history_days = st.number_input("Τελευταίες ημέρες", min_value=1, value=7, key="history_days")
+                history_only_file = st.checkbox(f"Μόνο το αρχείο {analysis['filename']}", key="history_only_file")
+
+                history_filters = {"tool": None if history_tool == "Όλες" else history_tool,
+                                   "severity": history_severity.strip() or None,
+                                   "file": analysis["filename"] if history_only_file else None,
+                                   "root": "" if history_only_file else None}   # Ρίζα των σαρώσεων της διεπαφής.
+                try:
+                    history = get_default_history()
+                    since = days_ago(history_days)
+                    new_rows = history.new_findings(since, **history_filters, limit=500)
+                    trend_rows = history.trend(since, **history_filters)
+                except (sqlite3.Error, OSError) as exc:
+                    st.info(f"Το ιστορικό σαρώσεων δεν είναι διαθέσιμο: {exc}")
+                else:
+                    st.markdown(f"**Νέα ευρήματα των τελευταίων {history_days} ημερών:** {len(new_rows)}")
+                    if new_rows:
+                        df_new = pd.DataFrame(new_rows)
+                        df_new["first_seen"] = pd.to_datetime(df_new["first_seen"], unit="s")
+                        st.dataframe(df_new[["first_seen", "file", "tool", "rule_id", "severity", "line", "message"]],
+                                     use_container_width=True)
+                    if trend_rows:
+                        df_trend = pd.DataFrame(trend_rows)
+                        df_trend["started_at"] = pd.to_datetime(df_trend["started_at"], unit="s")
+                        st.markdown("**Ευρήματα και νέα ευρήματα ανά σάρωση:**")
+                        st.line_chart(df_trend.set_index("started_at")[["findings", "new_findings"]])
             tab_index +=1
 
         # ---------------------------------------------------------------------------
@@ -1237,57 +935,85 @@ else:
         with tabs[tab_index]:
             st.subheader("Σύνολο ευρημάτων ανάλυσης (Summary Report):")
             
-            # Πραγματοποίηση ελέγχου εάν υπάρχει έστω ένα DataFrame με ευρήματα.
-            has_any_findings = any(df is not None and not df.empty
-                                   for df in [
-                                       analysis["df_bandit"],
-                                       analysis["df_semgrep"],
-                                       analysis["df_pylint"],
-                                       analysis["df_radon"],
-                                       analysis["df_custom_ast"]])
+            # Πραγματοποίηση ελέγχου εάν υπάρχει έστω ένα εύρημα.
+            has_any_findings = any(analysis["findings"].values())
             
             if not has_any_findings:
                 st.info("Δεν υπάρχουν διαθέσιμα ευρήματα από τις επιλεγμένες βιβλιοθήκες ανάλυσης κώδικα. "
                          "Ελέγξτε ότι τουλάχιστον μία βιβλιοθήκη έχει εκτελεστεί και έχει εντοπιστεί κάποιο εύρημα.")
             else:
-                # Δημιουργία της συγκεντρωτικής αναφοράς για λήψη από το χρήστη.
-                summary_report = create_libr_findings_report(
-                        filename=analysis["filename"],
-                        code=analysis["code"],
-                        df_bandit=analysis["df_bandit"],
-                        df_semgrep=analysis["df_semgrep"],
-                        df_pylint=analysis["df_pylint"],
-                        df_radon=analysis["df_radon"],
-                        df_custom_ast=analysis["df_custom_ast"],
-                        bandit_metrics=analysis["bandit_metrics"],
-                        pylint_score=analysis["pylint_score"],
-                        radon_mi=analysis["radon_mi"])
+                # Επιλογή για τον πηγαίο κώδικα μέσα στην αναφορά (ολόκληρος, περικομμένος ή καθόλου).
+                source_option = st.selectbox(
+                    "Πηγαίος κώδικας στην αναφορά:",
+                    options=["full", "head", "none"],
+                    format_func={"full": "Ολόκληρος",
+                                 "head": "Μόνο οι πρώτες 200 γραμμές",
+                                 "none": "Χωρίς πηγαίο κώδικα"}.get)
+
+                # Η αναφορά γράφεται σε αρχείο με ροή μία φορά ανά ανάλυση/επιλογή, όχι σε κάθε rerun.
+                report = st.session_state.summary_report
+                if report is None or report["options"] != source_option or not os.path.exists(report["path"]):
+                    discard_summary_report()
+                    report_path = write_report(create_libr_findings_report(
+                            filename=analysis["filename"],
+                            code=analysis["code"],
+                            findings=analysis["findings"],
+                            bandit_metrics=analysis["bandit_metrics"],
+                            pylint_score=analysis["pylint_score"],
+                            radon_mi=analysis["radon_mi"],
+                            include_source=source_option != "none",
+                            max_source_lines=200 if source_option == "head" else None))
+                    report = st.session_state.summary_report = {"options": source_option, "path": report_path}
                 
-                # Δημιουργία κουμπιού για λήψη της αναφοράς ως αρχείο κειμένου.
+                # Δημιουργία κουμπιού για λήψη της αναφοράς ως αρχείο κειμένου (το αρχείο διαβάζεται μόνο κατά τη λήψη).
                 st.download_button(
                     label="Λήψη Αναφοράς ευρημάτων ανάλυσης - κώδικα ως αρχείο κειμένου",
-                    data=summary_report,
+                    data=lambda: read_report(report["path"]),
                     file_name=f"sast_summary_report_{uploaded_file.name.replace('.', '_')}.txt",
-                    mime="text/plain")
-
-                # Εμφάνιση της αναφοράς σε πλαίσιο κειμένου.
+                    mime="text/plain",
+                    on_click="ignore")
+
+                # Εξαγωγή των ευρημάτων για code scanning dashboards (SARIF) και data pipelines (JSON Lines).
+                export_name = uploaded_file.name.replace('.', '_')
+                sarif_column, jsonl_column = st.columns(2)
+                with sarif_column:
+                    st.download_button(
+                        label="Λήψη ευρημάτων σε SARIF",
+                        data=lambda: export_analysis_findings(analysis, "sarif"),
+                        file_name=f"sast_findings_{export_name}.sarif",
+                        mime="application/sarif+json",
+                        on_click="ignore")
+                with jsonl_column:
+                    st.download_button(
+                        label="Λήψη ευρημάτων σε JSON Lines",
+                        data=lambda: export_analysis_findings(analysis, "jsonl"),
+                        file_name=f"sast_findings_{export_name}.jsonl",
+                        mime="application/x-ndjson",
+                        on_click="ignore")
+
+                # Εμφάνιση μόνο της αρχής της αναφοράς σε πλαίσιο κειμένου.
+                preview, truncated = read_preview(report["path"], REPORT_PREVIEW_KB)
                 st.text_area(
                     label="Συγκεντρωτική Αναφορά Ευρημάτων Ανάλυσης:",
-                    value=summary_report,
+                    value=preview,
                     height=400)
+                if truncated:
+                    st.caption(f"Εμφανίζονται τα πρώτα {REPORT_PREVIEW_KB} KB της αναφοράς· η λήψη περιέχει ολόκληρη την αναφορά.")
                 
                 st.markdown("---")
 
                 # Δημιουργία κουμπιού για την κλήση του ChatGPT με είσοδο της σύνοψης ανάλυσης- του κώδικα
                 if st.button("Λήψη προτάσεων βελτίωσης του κώδικα από το ChatGPT"):
+                    # Τα DataFrames της σύνοψης δημιουργούνται μόνο εδώ, από τα ευρήματα του session_state.
+                    frames = {tool: findings_frame(tool, analysis["findings"].get(tool)) for tool in TOOL_COLUMNS}
                     summary_text = create_analysis_summary(
                         filename=analysis["filename"],
                         code=analysis["code"],
-                        df_bandit=analysis["df_bandit"],
-                        df_semgrep=analysis["df_semgrep"],
-                        df_pylint=analysis["df_pylint"],
-                        df_radon=analysis["df_radon"],
-                        df_custom_ast=analysis["df_custom_ast"],
+                        df_bandit=frames["bandit"],
+                        df_semgrep=frames["semgrep"],
+                        df_pylint=frames["pylint"],
+                        df_radon=frames["radon"],
+                        df_custom_ast=frames["custom_ast"],
                         bandit_metrics=analysis["bandit_metrics"],
                         pylint_score=analysis["pylint_score"],
                         radon_mi=analysis["radon_mi"])
@@ -0,0 +1,75 @@
+"""
+Έλεγχοι της incremental σάρωσης (sast.incremental): επαναχρησιμοποίηση ευρημάτων ανά μονάδα και
+διαδρομές του git diff σε υποφάκελο του αποθετηρίου.
+
+Εκτέλεση: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from sast.analyzers import run_custom_ast_analysis
+from sast.incremental import changed_files, incremental_custom_ast, read_revision_file
+
+OLD_CODE: str = "def handler(data):\n    value = data.strip()\n    return eval(value)\n"
+
+def finding_lines(old_code: str, new_code: str) -> tuple[list[int], dict[str, int]]:
+    """
+    Γραμμές των ευρημάτων της incremental ανάλυσης του new_code (με baseline το old_code) και στατιστικά.
+    """
+    baseline = run_custom_ast_analysis(old_code)["results"]
+    result, stats = incremental_custom_ast(old_code, new_code, baseline)
+    return sorted(issue.line for issue in result["results"]), stats
+
+class UnitReuseTests(unittest.TestCase):
+    def test_moved_unit_is_reused_with_shifted_lines(self) -> None:
+        lines, stats = finding_lines(OLD_CODE, "import os\n\n\n" + OLD_CODE)
+        self.assertEqual(lines, [6])
+        self.assertEqual(stats, {"reused_units": 1, "reanalyzed_units": 0})
+
+    def test_lines_inserted_inside_unit_are_reanalyzed(self) -> None:
+        new_code = ("def handler(data):\n    value = data.strip()\n"
+                    "    # Σχόλιο που μετατοπίζει το eval.\n\n    return eval(value)\n")
+        lines, stats = finding_lines(OLD_CODE, new_code)
+        self.assertEqual(lines, [5])
+        self.assertEqual(stats, {"reused_units": 0, "reanalyzed_units": 1})
+
+    def test_lines_removed_inside_unit_are_reanalyzed(self) -> None:
+        old_code = "def handler(data):\n\n    # Σχόλιο.\n    return eval(data)\n"
+        lines, _stats = finding_lines(old_code, "def handler(data):\n    return eval(data)\n")
+        self.assertEqual(lines, [2])
+
+@unittest.skipUnless(shutil.which("git"), "Το git δεν είναι εγκατεστημένο.")
+class ChangedFilesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.repo, True)
+        os.makedirs(os.path.join(self.repo, "sub"))
+        self._write("sub/a.py", "x = 1\n")
+        self._write("other.py", "y = 1\n")
+        self._git("init", "-q")
+        self._git("add", "-A")
+        self._git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "base")
+        self._write("sub/a.py", "x = 2\n")
+        self._write("other.py", "y = 2\n")
+
+    def _write(self, rel_path: str, content: str) -> None:
+        with open(os.path.join(self.repo, rel_path), "w", encoding="utf-8") as source_file:
+            source_file.write(content)
+
+    def _git(self, *args: str) -> None:
+        subprocess.run(["git", "-C", self.repo, *args], check=True, capture_output=True)
+
+    def test_paths_are_relative_to_scanned_subdirectory(self) -> None:
+        root = os.path.join(self.repo, "sub")
+        self.assertEqual(changed_files(root, "HEAD", None), {"a.py": "M"})
+        self.assertEqual(read_revision_file(root, "HEAD", "a.py"), "x = 1\n")
+
+    def test_repository_root_lists_all_changes(self) -> None:
+        self.assertEqual(changed_files(self.repo, "HEAD", None), {"other.py": "M", "sub/a.py": "M"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Έλεγχοι του σταδιακού αναλυτή JSON (sast.jsonstream) σε κάθε δυνατό όριο τμήματος της εξόδου.
+
+Εκτέλεση: python -m unittest discover -s tests
+"""
+
+import json
+import unittest
+
+from sast.jsonstream import JsonRecordParser, JsonStreamError
+
+# Έγγραφα με αριθμούς (δεκαδικά, εκθετικά, αρνητικά) σε κάθε θέση όπου μπορεί να κοπεί ένα τμήμα.
+DOCUMENTS: tuple[str, ...] = (
+    '[0.5]',
+    '[1234, -0.25, 1e5, 2.5E-3, 0]',
+    '{"a": 1e5}',
+    '{"results": [{"line": 12, "score": 0.75}, {"line": 3400}], "errors": [], "version": 1.25}',
+    '{"results": [], "metrics": {"loc": 1024, "ratio": -1.5e-2}}',
+    '[12]\n',
+    '42',
+)
+
+def parse_chunks(chunks: list[bytes], record_keys: tuple[str, ...] = ("results",)) -> tuple[list, object]:
+    """
+    Τροφοδοτεί τον parser με τα τμήματα και επιστρέφει (εγγραφές, document).
+    """
+    parser = JsonRecordParser(record_keys)
+    records = []
+    for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+    return records, parser.document
+
+def reassemble(records: list, document: object, record_keys: tuple[str, ...] = ("results",)) -> object:
+    """
+    Το πλήρες έγγραφο από τις εγγραφές και το document του parser (για σύγκριση με το json.loads).
+    """
+    if isinstance(document, list):
+        return [record for _key, record in records]
+    if isinstance(document, dict):
+        full = dict(document)
+        for key in record_keys:
+            if key in full:
+                full[key] = [record for record_key, record in records if record_key == key]
+        return full
+    return document
+
+class ChunkBoundaryTests(unittest.TestCase):
+    def test_every_split_point(self) -> None:
+        for text in DOCUMENTS:
+            data = text.encode("utf-8")
+            for split in range(len(data) + 1):
+                with self.subTest(document=text, split=split):
+                    records, document = parse_chunks([data[:split], data[split:]])
+                    self.assertEqual(reassemble(records, document), json.loads(text))
+
+    def test_one_byte_chunks(self) -> None:
+        for text in DOCUMENTS:
+            with self.subTest(document=text):
+                data = text.encode("utf-8")
+                records, document = parse_chunks([data[i:i + 1] for i in range(len(data))])
+                self.assertEqual(reassemble(records, document), json.loads(text))
+
+    def test_fraction_and_exponent_split(self) -> None:
+        self.assertEqual(parse_chunks([b"[0.", b"5]"])[0], [("", 0.5)])
+        self.assertEqual(parse_chunks([b'{"a": 1e', b"5}"])[1], {"a": 1e5})
+
+    def test_number_split_between_digits_is_not_truncated(self) -> None:
+        self.assertEqual(parse_chunks([b"[12", b"34]"])[0], [("", 1234)])
+        self.assertEqual(parse_chunks([b"12", b"34"])[1], 1234)
+
+    def test_multibyte_character_split(self) -> None:
+        data = '{"results": [{"message": "κωδικός"}]}'.encode("utf-8")
+        for split in range(len(data) + 1):
+            with self.subTest(split=split):
+                records, _document = parse_chunks([data[:split], data[split:]])
+                self.assertEqual(records, [("results", {"message": "κωδικός"})])
+
+    def test_invalid_and_truncated_output(self) -> None:
+        for chunks in ([b"[0.]"], [b"[1x]"], [b'{"results": [1, 2'], [b"[1] 2"]):
+            with self.subTest(chunks=chunks):
+                with self.assertRaises(JsonStreamError):
+                    parse_chunks(chunks)
+
+    def test_empty_output(self) -> None:
+        self.assertEqual(parse_chunks([b""]), ([], None))
+
+if __name__ == "__main__":
+    unittest.main()